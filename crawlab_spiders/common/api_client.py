@@ -4,11 +4,12 @@ This client provides methods to trigger scraper jobs and monitor their status
 from Crawlab spiders.
 """
 
+import json
 import os
 import time
 import logging
 from dataclasses import dataclass
-from typing import Any, Callable, Optional, TypeVar
+from typing import Any, Callable, Iterator, Optional, TypeVar
 from urllib.parse import urljoin
 
 import requests
@@ -52,6 +53,8 @@ class LegalScraperAPIClient:
     DEFAULT_TIMEOUT = 30
     DEFAULT_POLL_INTERVAL = 10
     MAX_POLL_ATTEMPTS = 360  # 1 hour with 10s intervals
+    # The server sends a keepalive every 15s; a silent stream is treated as dead.
+    EVENT_STREAM_READ_TIMEOUT = 60
 
     def __init__(
         self,
@@ -500,6 +503,7 @@ class LegalScraperAPIClient:
         source: str,
         limit: int = 100,
         level: Optional[str] = None,
+        since: Optional[int] = None,
     ) -> dict:
         """Get logs for a scraper source.
 
@@ -507,13 +511,17 @@ class LegalScraperAPIClient:
             source: Source name ('scjn', 'bjv', 'cas', 'dof')
             limit: Maximum number of log entries to return
             level: Optional log level filter ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+            since: Only return entries after this sequence id (the previous
+                response's 'next_since')
 
         Returns:
-            Dict containing 'logs' list with log entries
+            Dict containing 'logs' list with log entries and 'next_since'
         """
         params = {"limit": limit}
         if level:
             params["level"] = level
+        if since is not None:
+            params["since"] = since
 
         try:
             return self._request("GET", f"/api/{source}/logs", params=params)
@@ -524,6 +532,82 @@ class LegalScraperAPIClient:
                 return {"logs": [], "error": "Logs endpoint not available"}
             raise
 
+    def stream_events(
+        self,
+        source: str,
+        since: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[dict]:
+        """Yield events from the per-source SSE stream, reconnecting on drops.
+
+        Reconnects resume from the last seen sequence number, so no status
+        change or log line is missed or repeated.
+
+        Args:
+            source: Source name ('scjn', 'bjv', 'cas', 'dof') or 'all'
+            since: Resume after this sequence number (None = start with a snapshot)
+            deadline: ``time.monotonic()`` value after which the stream stops
+
+        Yields:
+            Event dicts with 'seq', 'source', 'kind' and 'data'
+
+        Raises:
+            LegalScraperAPIError: If the stream endpoint rejects the request
+        """
+        url = urljoin(self.base_url, f"/api/events/{source.lower()}")
+        last_seq = since
+        while deadline is None or time.monotonic() < deadline:
+            headers = {"Accept": "text/event-stream"}
+            if last_seq is not None:
+                headers["Last-Event-ID"] = str(last_seq)
+            try:
+                with self._session.get(
+                    url,
+                    headers=headers,
+                    stream=True,
+                    timeout=(self.timeout, self.EVENT_STREAM_READ_TIMEOUT),
+                ) as response:
+                    if response.status_code >= 400:
+                        raise LegalScraperAPIError(
+                            f"Event stream unavailable: HTTP {response.status_code}",
+                            response.status_code,
+                        )
+                    data_lines: list[str] = []
+                    for line in response.iter_lines(decode_unicode=True):
+                        if deadline is not None and time.monotonic() >= deadline:
+                            return
+                        if line:
+                            if line.startswith("data:"):
+                                data_lines.append(line[5:].strip())
+                            continue
+                        if not data_lines:
+                            continue
+                        event = json.loads("\n".join(data_lines))
+                        data_lines = []
+                        if event.get("kind") != "snapshot":
+                            last_seq = event.get("seq", last_seq)
+                        yield event
+            except requests.exceptions.RequestException as e:
+                logger.warning("Event stream for %s dropped, reconnecting: %s", source, e)
+                time.sleep(1)
+
+    @staticmethod
+    def _is_other_job(status: dict, job_id: str) -> bool:
+        """True when ``status`` names a job other than ``job_id``."""
+        other = status.get("job_id")
+        return bool(other) and str(other) != str(job_id)
+
+    def _job_result(self, source: str, job_id: str, status: dict) -> JobResult:
+        downloaded_count, error_count = self._extract_progress(source, status)
+        return JobResult(
+            job_id=job_id,
+            source=source,
+            status=status.get("status", "unknown").lower(),
+            downloaded_count=downloaded_count,
+            error_count=error_count,
+            embedding_status=self.get_embedding_status(job_id),
+        )
+
     def wait_for_completion(
         self,
         source: str,
@@ -533,62 +617,87 @@ class LegalScraperAPIClient:
     ) -> JobResult:
         """Wait for a scraper job to complete.
 
-        Polls the status endpoint until the job reaches a terminal state
-        (completed, failed, or cancelled).
+        Follows the per-source event stream and only fetches the status
+        endpoint again once the job reaches a terminal state (completed,
+        failed, or cancelled). Falls back to polling the status endpoint
+        when the API has no event stream. States reported for a different
+        job id (such as the previous job's final state, which the source
+        keeps until the new job announces itself) are ignored.
 
         Args:
             source: Source name ('scjn', 'bjv', 'cas', 'dof')
             job_id: The job ID to monitor
-            poll_interval: Seconds between status polls
-            max_attempts: Maximum number of poll attempts
+            poll_interval: Seconds between status polls (polling fallback)
+            max_attempts: Maximum number of poll attempts; together with
+                poll_interval this bounds the total wait
 
         Returns:
             JobResult with final status and metrics
 
         Raises:
-            TimeoutError: If max_attempts is exceeded
+            TimeoutError: If the job does not finish in time
         """
         terminal_states = {"completed", "failed", "cancelled", "idle"}
-        attempts = 0
+        deadline = time.monotonic() + max_attempts * poll_interval
 
         logger.info(
-            "Waiting for %s job %s to complete (poll_interval=%ds, max_attempts=%d)",
+            "Waiting for %s job %s to complete (timeout=%ds)",
             source,
             job_id,
-            poll_interval,
-            max_attempts,
+            max_attempts * poll_interval,
         )
 
-        while attempts < max_attempts:
-            status = self.get_status(source)
-            current_state = status.get("status", "unknown").lower()
+        status = self.get_status(source)
+        if (
+            status.get("status", "unknown").lower() in terminal_states
+            and not self._is_other_job(status, job_id)
+        ):
+            return self._job_result(source, job_id, status)
 
-            logger.info(
-                "Job %s status: %s (attempt %d/%d)",
-                job_id,
-                current_state,
-                attempts + 1,
-                max_attempts,
+        try:
+            for event in self.stream_events(source, deadline=deadline):
+                kind = event.get("kind")
+                data = event.get("data") or {}
+                if kind in {"snapshot", "resync"}:
+                    data = data.get("status") or {}
+                elif kind != "status":
+                    continue
+                if self._is_other_job(data, job_id):
+                    continue
+                current_state = str(data.get("status") or "").lower()
+                if current_state:
+                    logger.info("Job %s status: %s", job_id, current_state)
+                if current_state in terminal_states:
+                    return self._job_result(source, job_id, self.get_status(source))
+        except LegalScraperAPIError as e:
+            logger.warning("Falling back to status polling for %s: %s", source, e)
+            return self._poll_for_completion(
+                source, job_id, poll_interval, deadline, terminal_states
             )
 
-            if current_state in terminal_states:
-                downloaded_count, error_count = self._extract_progress(source, status)
-                return JobResult(
-                    job_id=job_id,
-                    source=source,
-                    status=current_state,
-                    downloaded_count=downloaded_count,
-                    error_count=error_count,
-                    embedding_status=self.get_embedding_status(job_id),
-                )
-
-            attempts += 1
-            time.sleep(poll_interval)
-
         raise TimeoutError(
             f"Job {job_id} did not complete within {max_attempts * poll_interval} seconds"
         )
 
+    def _poll_for_completion(
+        self,
+        source: str,
+        job_id: str,
+        poll_interval: int,
+        deadline: float,
+        terminal_states: set[str],
+    ) -> JobResult:
+        """Poll the status endpoint until a terminal state or the deadline."""
+        while time.monotonic() < deadline:
+            status = self.get_status(source)
+            current_state = status.get("status", "unknown").lower()
+            logger.info("Job %s status: %s", job_id, current_state)
+            if current_state in terminal_states and not self._is_other_job(status, job_id):
+                return self._job_result(source, job_id, status)
+            time.sleep(poll_interval)
+
+        raise TimeoutError(f"Job {job_id} did not complete before the deadline")
+
     # -------------------------------------------------------------------------
     # Job Control
     # -------------------------------------------------------------------------
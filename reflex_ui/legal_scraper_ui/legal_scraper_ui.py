@@ -4,6 +4,8 @@ Legal Scraper Command Center - Modern Dashboard UI.
 A professional dashboard for controlling multi-source legal document scraping.
 Built with Reflex + Radix UI theming for dark/light mode support.
 """
+import asyncio
+import json
 import os
 from datetime import datetime
 from typing import Any, Dict, List
@@ -14,6 +16,11 @@ import reflex as rx
 
 API_BASE_URL = os.getenv("SCRAPER_API_BASE_URL", "http://api:8000")
 
+# Event stream sources per tab; the DOF tab follows the generic job service.
+EVENT_STREAM_SOURCES = {"scjn": "scjn", "bjv": "bjv", "dof": "jobs"}
+EVENT_STREAM_RETRY_SECONDS = 3
+MAX_LOG_ENTRIES = 500
+
 
 class AppState(rx.State):
     """Application state management."""
@@ -47,6 +54,10 @@ class AppState(rx.State):
     log_filter: str = "all"
     log_search: str = ""
 
+    # Event stream: bumping the generation stops the running follower
+    stream_generation: int = 0
+    _stream_progress: Dict[str, Any] = {}
+
     # DOF config
     mode: str = "today"
     start_date: str = ""
@@ -170,6 +181,7 @@ class AppState(rx.State):
         self.logged_in = True
         self.login_password = ""
         await self.refresh()
+        return AppState.follow_events
 
     async def logout(self):
         """Handle user logout."""
@@ -179,6 +191,7 @@ class AppState(rx.State):
             pass
         self.logged_in = False
         self.token = ""
+        self.stream_generation += 1
         self.status_message = ""
         self.logs = []
         self.progress_history = []
@@ -193,55 +206,139 @@ class AppState(rx.State):
             if self.source == "scjn":
                 status = await self._api_request("get", "/api/scjn/status")
                 logs = await self._api_request("get", "/api/scjn/logs")
-                progress = status.get("progress") or {}
-                downloaded = progress.get("downloaded_count", 0)
-                pending = progress.get("pending_count", 0)
-                total = downloaded + pending
-                self.downloaded_count = downloaded
-                self.processed_count = downloaded
-                self.progress_percent = int((downloaded / total) * 100) if total else 0
-                self.progress_text = f"{downloaded} / {total}"
             elif self.source == "bjv":
                 status = await self._api_request("get", "/api/bjv/status")
                 logs = await self._api_request("get", "/api/bjv/logs")
-                progress = status.get("progress") or {}
-                downloaded = progress.get("libros_descargados", 0)
-                pending = progress.get("libros_pendientes", 0)
-                total = downloaded + pending
-                self.downloaded_count = downloaded
-                self.processed_count = downloaded
-                self.progress_percent = int((downloaded / total) * 100) if total else 0
-                self.progress_text = f"{downloaded} / {total}"
             else:
                 status = await self._api_request("get", "/api/status")
                 logs = await self._api_request("get", "/api/logs")
-                progress = status.get("progress") or {}
-                percent = int(progress.get("percentage", 0))
-                processed = progress.get("processed_items", 0)
-                total = progress.get("total_items", 0)
-                self.downloaded_count = processed
-                self.processed_count = processed
-                self.progress_percent = percent
-                self.progress_text = f"{processed} / {total}"
 
+            self._stream_progress = dict(status.get("progress") or {})
+            self._apply_progress()
             self.status = status.get("status", "idle")
             self.job_id = status.get("job_id") or ""
             self.error_count = status.get("error_count", 0)
-            self.logs = logs.get("logs", [])
-
-            # Update progress history for chart
-            now = datetime.now().strftime("%H:%M")
-            if not self.progress_history or self.progress_history[-1].get("time") != now:
-                self.progress_history.append({
-                    "time": now,
-                    "progress": self.progress_percent,
-                })
-                if len(self.progress_history) > 30:
-                    self.progress_history = self.progress_history[-30:]
+            self.logs = logs.get("logs", [])[-MAX_LOG_ENTRIES:]
 
         except ValueError as exc:
             self.status_message = str(exc)
 
+    def _apply_progress(self):
+        """Derive the progress counters for the current source."""
+        progress = self._stream_progress
+        if self.source == "scjn":
+            downloaded = progress.get("downloaded_count", 0)
+            total = downloaded + progress.get("pending_count", 0)
+            self.downloaded_count = downloaded
+            self.processed_count = downloaded
+            self.progress_percent = int((downloaded / total) * 100) if total else 0
+            self.progress_text = f"{downloaded} / {total}"
+        elif self.source == "bjv":
+            downloaded = progress.get("libros_descargados", 0)
+            total = downloaded + progress.get("libros_pendientes", 0)
+            self.downloaded_count = downloaded
+            self.processed_count = downloaded
+            self.progress_percent = int((downloaded / total) * 100) if total else 0
+            self.progress_text = f"{downloaded} / {total}"
+        else:
+            processed = progress.get("processed_items", 0)
+            total = progress.get("total_items", 0)
+            self.downloaded_count = processed
+            self.processed_count = processed
+            self.progress_percent = int(progress.get("percentage", 0))
+            self.progress_text = f"{processed} / {total}"
+
+        # Update progress history for chart
+        now = datetime.now().strftime("%H:%M")
+        if not self.progress_history or self.progress_history[-1].get("time") != now:
+            self.progress_history.append({
+                "time": now,
+                "progress": self.progress_percent,
+            })
+            if len(self.progress_history) > 30:
+                self.progress_history = self.progress_history[-30:]
+
+    def _apply_event(self, event: Dict[str, Any]):
+        """Merge one stream event into the dashboard state."""
+        kind = event.get("kind")
+        data = event.get("data") or {}
+        if kind in ("snapshot", "resync"):
+            self._stream_progress = dict(data.get("progress") or {})
+            self._apply_progress()
+            data = data.get("status") or {}
+            kind = "status"
+        if kind == "status":
+            if "status" in data:
+                self.status = data["status"]
+            if "job_id" in data:
+                self.job_id = data["job_id"] or ""
+        elif kind == "progress":
+            self._stream_progress = {**self._stream_progress, **data}
+            self._apply_progress()
+            errors = data.get("error_count", data.get("errores", data.get("failed_items")))
+            if errors is not None:
+                self.error_count = errors
+        elif kind == "log":
+            self.logs = (self.logs + [data])[-MAX_LOG_ENTRIES:]
+
+    @rx.event(background=True)
+    async def follow_events(self):
+        """Follow the API event stream for the selected source until it changes."""
+        async with self:
+            if not self.logged_in:
+                return
+            self.stream_generation += 1
+            generation = self.stream_generation
+            url = f"{self.api_base_url}/api/events/{EVENT_STREAM_SOURCES.get(self.source, 'jobs')}"
+            token = self.token
+
+        last_seq = None
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=60)
+        while True:
+            async with self:
+                if not self.logged_in or self.stream_generation != generation:
+                    return
+            headers = {"Authorization": f"Bearer {token}", "Accept": "text/event-stream"}
+            if last_seq is not None:
+                headers["Last-Event-ID"] = str(last_seq)
+            try:
+                async with aiohttp.ClientSession(timeout=timeout) as session:
+                    async with session.get(url, headers=headers) as resp:
+                        if resp.status == 401:
+                            async with self:
+                                self.logged_in = False
+                                self.token = ""
+                            return
+                        if resp.status >= 400:
+                            raise aiohttp.ClientError(f"HTTP {resp.status}")
+                        async for raw_line in resp.content:
+                            line = raw_line.decode("utf-8").strip()
+                            if not line.startswith("data:"):
+                                continue
+                            event = json.loads(line[5:])
+                            if event.get("kind") != "snapshot":
+                                last_seq = event.get("seq", last_seq)
+                            async with self:
+                                if self.stream_generation != generation:
+                                    return
+                                self._apply_event(event)
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                pass
+            await asyncio.sleep(EVENT_STREAM_RETRY_SECONDS)
+
+    async def change_source(self, value: str):
+        """Switch source tabs and follow the new source's events."""
+        self.source = value
+        self.logs = []
+        self.progress_history = []
+        await self.refresh()
+        return AppState.follow_events
+
+    async def on_load(self):
+        await self.refresh()
+        if self.logged_in:
+            return AppState.follow_events
+
     async def start_job(self):
         """Start a scraping job."""
         self.status_message = ""
@@ -721,7 +818,7 @@ def _source_tabs() -> rx.Component:
             rx.tabs.content(_scjn_config(), value="scjn"),
             rx.tabs.content(_bjv_config(), value="bjv"),
             value=AppState.source,
-            on_change=AppState.set_source,
+            on_change=AppState.change_source,
         ),
         background=rx.color("gray", 2),
         border_radius="12px",
@@ -999,7 +1096,9 @@ def index() -> rx.Component:
             }
             """
         ),
-        rx.moment(interval=5000, on_change=AppState.refresh, display="none"),
+        # Live updates arrive over the event stream; this slow poll only
+        # reconciles anything missed while the stream was reconnecting.
+        rx.moment(interval=60000, on_change=AppState.refresh, display="none"),
         _header(),
         rx.cond(AppState.logged_in, _dashboard(), _login()),
         min_height="100vh",
@@ -1025,4 +1124,4 @@ app = rx.App(
         "https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap",
     ],
 )
-app.add_page(index, title="Legal Scraper | Command Center", on_load=AppState.refresh)
+app.add_page(index, title="Legal Scraper | Command Center", on_load=AppState.on_load)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of CAS actor message throughput.
+
+Pushes discovered awards through a coordinator → scraper → fragmentador
+chain and reports messages per second. The scraper stub returns a canned
+award instantly and the fragmentador gets empty text, so the numbers measure
+mailbox and dispatch overhead rather than browsing or chunking.
+
+Each award costs five messages: LaudoDescubiertoCAS, ScrapearLaudoCAS,
+LaudoScrapeadoCAS, FragmentarLaudoCAS and FragmentosListosCAS.
+
+Usage:
+    python scripts/benchmark_cas_actor_chain.py
+    python scripts/benchmark_cas_actor_chain.py --awards 20000 --rounds 5
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.infrastructure.actors.cas_base_actor import CASBaseActor
+from src.infrastructure.actors.cas_coordinator_actor import CASCoordinatorActor
+from src.infrastructure.actors.cas_fragmentador_actor import CASFragmentadorActor
+from src.infrastructure.actors.cas_messages import (
+    LaudoDescubiertoCAS,
+    LaudoScrapeadoCAS,
+    ScrapearLaudoCAS,
+)
+
+MESSAGES_PER_AWARD = 5
+
+
+class _InstantScraper(CASBaseActor):
+    """Scraper stub that answers every request with the same award."""
+
+    def __init__(self, supervisor: CASBaseActor):
+        super().__init__(actor_id="bench-scraper", supervisor=supervisor)
+        self._laudo = SimpleNamespace(
+            id="bench-laudo",
+            numero_caso=SimpleNamespace(valor="CAS 2024/A/0001"),
+            resumen="",
+            texto_completo="",
+        )
+
+    async def handle_scrapear_laudo_cas(self, msg: ScrapearLaudoCAS) -> None:
+        await self._supervisor.tell(LaudoScrapeadoCAS(laudo=self._laudo))
+
+
+async def run_round(awards: int) -> float:
+    """Push ``awards`` through the chain; return elapsed seconds."""
+    coordinator = CASCoordinatorActor()
+    coordinator._scraper_actor = _InstantScraper(supervisor=coordinator)
+    coordinator._fragmentador_actor = CASFragmentadorActor(supervisor=coordinator)
+    for actor in (coordinator._fragmentador_actor, coordinator._scraper_actor, coordinator):
+        await actor.start()
+
+    started = time.perf_counter()
+    for index in range(awards):
+        await coordinator.tell(LaudoDescubiertoCAS(numero_caso=str(index), url=""))
+    while coordinator.estadisticas.laudos_fragmentados < awards:
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - started
+
+    await coordinator.stop()
+    return elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--awards", type=int, default=5000, help="Awards per round (default: 5000)")
+    parser.add_argument("--rounds", type=int, default=3, help="Measured rounds (default: 3)")
+    args = parser.parse_args()
+
+    # Warm-up round so imports and allocator growth are not measured.
+    await run_round(min(args.awards, 500))
+
+    rates = []
+    for round_number in range(1, args.rounds + 1):
+        elapsed = await run_round(args.awards)
+        rate = args.awards * MESSAGES_PER_AWARD / elapsed
+        rates.append(rate)
+        print(f"round {round_number}: {elapsed:.3f}s, {rate:,.0f} msg/s")
+
+    print(f"median: {statistics.median(rates):,.0f} msg/s "
+          f"({args.awards} awards x {MESSAGES_PER_AWARD} messages)")
+
+
+if __name__ == "__main__":
+    import logging
+
+    logging.disable(logging.CRITICAL)
+    asyncio.run(main())
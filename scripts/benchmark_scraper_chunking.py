@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of the scraper embedding chunker.
+
+Splits a large DOF-style text (300 articles plus a tabular annex without
+sentence punctuation, which forces the word-level fallback) with the current
+incremental ``_split_long_text`` and with the pre-memoization implementation,
+which re-encoded the whole buffer on every append, and reports the time and
+chunk count of each.
+
+Usage:
+    python scripts/benchmark_scraper_chunking.py
+    python scripts/benchmark_scraper_chunking.py --rounds 5
+"""
+import argparse
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src.gui.infrastructure.scraper_document_workflow as workflow
+
+
+def _legacy_count_tokens(text):
+    if not text:
+        return 0
+    encoder = workflow._get_token_encoder()
+    if encoder is not None:
+        return len(encoder.encode(text))
+    return max(1, int(len(text.split()) / 0.75))
+
+
+def legacy_split_long_text(text):
+    """Pre-memoization implementation: re-encodes the whole buffer per append."""
+    max_chars = workflow.CHUNK_MAX_CHARS
+    max_tokens = workflow.CHUNK_MAX_TOKENS
+    text = (text or "").strip()
+    if len(text) <= max_chars and _legacy_count_tokens(text) <= max_tokens:
+        return [text]
+
+    pieces = []
+    current_parts = []
+
+    def _too_big(value):
+        return len(value) > max_chars or _legacy_count_tokens(value) > max_tokens
+
+    for segment in re.split(r"\n{2,}", text):
+        candidate = segment.strip()
+        if not candidate:
+            continue
+        subsegments = [candidate]
+        if _too_big(candidate):
+            subsegments = [
+                s.strip() for s in workflow.SENTENCE_BOUNDARY_RE.split(candidate) if s.strip()
+            ]
+            if len(subsegments) <= 1:
+                subsegments = []
+                current_words = []
+                for word in candidate.split():
+                    if current_words and _too_big(" ".join(current_words + [word])):
+                        subsegments.append(" ".join(current_words))
+                        current_words = [word]
+                    else:
+                        current_words.append(word)
+                if current_words:
+                    subsegments.append(" ".join(current_words))
+        for subsegment in subsegments:
+            if current_parts and _too_big("\n\n".join(current_parts + [subsegment])):
+                pieces.append("\n\n".join(current_parts))
+                current_parts = []
+            current_parts.append(subsegment)
+    if current_parts:
+        pieces.append("\n\n".join(current_parts))
+    return pieces
+
+
+def large_dof_text() -> str:
+    paragraphs = []
+    for number in range(1, 301):
+        paragraphs.append(
+            f"ARTÍCULO {number}.- La Secretaría de Hacienda y Crédito Público publicará "
+            f"en el Diario Oficial de la Federación las reglas de carácter general "
+            f"número {number} aplicables al ejercicio fiscal, conforme a lo dispuesto "
+            "por la Ley Federal de Presupuesto y Responsabilidad Hacendaria. "
+            "Las dependencias y entidades deberán observar dichas disposiciones."
+        )
+    # Tabular annex without sentence punctuation forces the word-level fallback.
+    paragraphs.append(" ".join(f"CLAVE-{index:05d} importe {index * 13}" for index in range(4000)))
+    return "\n\n".join(paragraphs)
+
+
+def run_round(func, text) -> tuple[list[str], float]:
+    """Split ``text`` with a cold token cache; return the pieces and elapsed seconds."""
+    workflow._count_tokens_cached.cache_clear()
+    started = time.perf_counter()
+    pieces = func(text)
+    return pieces, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=3, help="Measured rounds (default: 3)")
+    args = parser.parse_args()
+
+    text = large_dof_text()
+    for name, func in (("legacy", legacy_split_long_text), ("incremental", workflow._split_long_text)):
+        timings = []
+        for _ in range(args.rounds):
+            pieces, elapsed = run_round(func, text)
+            timings.append(elapsed)
+        print(f"{name}: median {statistics.median(timings) * 1000:.1f}ms, "
+              f"{len(pieces)} chunks ({len(text)} chars)")
+
+
+if __name__ == "__main__":
+    import logging
+
+    logging.disable(logging.CRITICAL)
+    main()
@@ -0,0 +1,3 @@
+create index if not exists scraper_documents_content_hash_idx
+    on public.scraper_documents (content_hash)
+    where content_hash is not null and storage_path is not null;
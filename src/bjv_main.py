@@ -260,6 +260,13 @@ class BJVCLIHandler:
     def _create_coordinator(self, **kwargs) -> Any:
         """Create coordinator actor (placeholder for future integration)."""
         from src.infrastructure.actors.bjv_coordinator_actor import BJVCoordinatorActor
+        from src.infrastructure.actors.bjv_rate_limiter import RateLimiterConfig
+        from src.infrastructure.actors.bjv_scraper_actor import BJV_BASE_URL
+
+        kwargs.setdefault("rate_limiter_config", RateLimiterConfig(
+            requests_per_second=getattr(self.args, "rate_limit", 0.5),
+            domain=BJV_BASE_URL,
+        ))
         return BJVCoordinatorActor(**kwargs)
 
     async def run(self) -> int:
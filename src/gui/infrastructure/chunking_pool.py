@@ -0,0 +1,199 @@
+"""
+Process pool for CPU-bound document chunking.
+
+Unstructured/PyMuPDF partitioning of a large BJV book can take minutes. Running
+it inside the async embedding activity freezes the worker event loop, so the
+activity hands each file to a small pool of long-lived worker processes and
+awaits the result. Every job has a wall-clock timeout; a worker that overruns
+it (typically a runaway OCR pass) is killed and replaced on the next job.
+
+Environment Variables:
+    SCRAPER_CHUNKING_PROCESSES: Worker processes (default: 0 = chunk in a thread)
+    SCRAPER_CHUNKING_TIMEOUT_SECONDS: Per-file timeout (default: 1800, 0 = none)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNKING_PROCESSES = 0
+DEFAULT_CHUNKING_TIMEOUT_SECONDS = 1800.0
+
+
+class ChunkingTimeoutError(TimeoutError):
+    """Raised when a chunking job exceeds its per-file timeout."""
+
+
+def _worker_main(conn: Any) -> None:
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if job is None:
+            return
+        func, args, kwargs = job
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as exc:
+            try:
+                conn.send((False, exc))
+            except Exception:
+                conn.send((False, RuntimeError(f"{type(exc).__name__}: {exc}")))
+            continue
+        conn.send((True, result))
+
+
+class _ChunkingWorker:
+    def __init__(self, context: Any):
+        parent_conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except Exception:
+            pass
+        self.process.join(timeout=5)
+        self.kill()
+
+
+class ChunkingProcessPool:
+    """Bounded pool of chunking processes with per-job kill-on-timeout."""
+
+    def __init__(
+        self,
+        max_workers: int,
+        timeout_seconds: float = DEFAULT_CHUNKING_TIMEOUT_SECONDS,
+        start_method: str = "spawn",
+    ):
+        self.max_workers = max(int(max_workers), 1)
+        self.timeout_seconds = timeout_seconds
+        self._context = multiprocessing.get_context(start_method)
+        self._idle: list[_ChunkingWorker] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closed = False
+        self.jobs_completed = 0
+        self.jobs_timed_out = 0
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_workers)
+            self._slots_loop = loop
+        return self._slots
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run ``func(*args, **kwargs)`` in a worker process.
+
+        ``func`` and its arguments must be picklable (module-level callables).
+        Exceptions raised by ``func`` are re-raised here.
+        """
+        if self._closed:
+            raise RuntimeError("Chunking pool is shut down")
+
+        timeout = self.timeout_seconds if timeout is None else timeout
+        poll_timeout = timeout if timeout and timeout > 0 else None
+
+        async with self._get_slots():
+            worker = self._idle.pop() if self._idle else _ChunkingWorker(self._context)
+            reusable = False
+            try:
+                worker.conn.send((func, args, kwargs))
+                ready = await asyncio.to_thread(worker.conn.poll, poll_timeout)
+                if not ready:
+                    self.jobs_timed_out += 1
+                    raise ChunkingTimeoutError(
+                        f"Chunking exceeded {timeout:.0f}s; worker pid {worker.process.pid} killed"
+                    )
+                ok, payload = worker.conn.recv()
+                reusable = True
+            except (EOFError, BrokenPipeError, ConnectionResetError) as exc:
+                raise RuntimeError(
+                    f"Chunking worker pid {worker.process.pid} exited unexpectedly"
+                ) from exc
+            finally:
+                if reusable and not self._closed:
+                    self._idle.append(worker)
+                else:
+                    worker.kill()
+
+        self.jobs_completed += 1
+        if ok:
+            return payload
+        raise payload
+
+    def shutdown(self) -> None:
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+
+
+def _env_number(name: str, default: float) -> float:
+    raw_value = os.environ.get(name, "").strip()
+    if not raw_value:
+        return default
+    try:
+        return float(raw_value)
+    except Exception:
+        logger.warning("Invalid %s=%s", name, raw_value)
+        return default
+
+
+def chunking_process_count() -> int:
+    return max(int(_env_number("SCRAPER_CHUNKING_PROCESSES", DEFAULT_CHUNKING_PROCESSES)), 0)
+
+
+def chunking_timeout_seconds() -> float:
+    return max(
+        _env_number("SCRAPER_CHUNKING_TIMEOUT_SECONDS", DEFAULT_CHUNKING_TIMEOUT_SECONDS),
+        0.0,
+    )
+
+
+_shared_pool: Optional[ChunkingProcessPool] = None
+
+
+def get_chunking_pool() -> Optional[ChunkingProcessPool]:
+    """Return the process-wide chunking pool, or ``None`` when it is disabled."""
+    global _shared_pool
+    processes = chunking_process_count()
+    if processes <= 0:
+        return None
+    if _shared_pool is None or _shared_pool._closed:
+        _shared_pool = ChunkingProcessPool(
+            max_workers=processes,
+            timeout_seconds=chunking_timeout_seconds(),
+        )
+        logger.info("Started chunking process pool with %s workers", processes)
+    return _shared_pool
+
+
+def shutdown_chunking_pool() -> None:
+    global _shared_pool
+    if _shared_pool is not None:
+        _shared_pool.shutdown()
+        _shared_pool = None
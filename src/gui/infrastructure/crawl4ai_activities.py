@@ -16,12 +16,17 @@ PDF/Document Download Support:
 - BJV: url_pdf field from book detail pages
 - CAS: URLLaudo for arbitral award PDFs
 """
+import asyncio
+import hashlib
 import json
 import logging
 import os
 import re
+import time
 import urllib.parse
+import uuid
 import aiohttp
+from contextlib import nullcontext
 from dataclasses import dataclass, asdict, field
 from datetime import date, datetime
 from pathlib import Path
@@ -29,6 +34,17 @@ from typing import Any, List, Optional
 
 from temporalio import activity
 
+from src.gui.infrastructure.http_download_pool import (
+    DownloadLimits,
+    HostThrottle,
+    build_download_connector,
+    stream_response_to_file,
+)
+from src.gui.infrastructure.dof_index_cache import CachedDofDay, DofIndexCache
+from src.gui.infrastructure.storage_dedup import StorageHashIndex
+from src.infrastructure.http_response_cache import utc_now_iso
+from src.infrastructure.resilience.shared_rate_limiter import SharedRateLimiter, get_shared_rate_limiter
+
 logger = logging.getLogger(__name__)
 
 # User agent for HTTP requests
@@ -36,6 +52,17 @@ USER_AGENT = "LegalScraper/1.0 (Educational Research)"
 SOURCE_FILE_PENDING_STATUS = "pending"
 HTML_FALLBACK_SOURCES = {"bjv", "cas"}
 SCRAPER_DOCUMENT_ALIASES_TABLE = "scraper_document_aliases"
+DEFAULT_CAS_QUERY_CONCURRENCY = 4
+DEFAULT_DOF_DAY_CONCURRENCY = 4
+
+
+def _env_positive_int(name: str, default: int) -> int:
+    raw_value = os.environ.get(name, "").strip()
+    try:
+        return max(int(raw_value), 1) if raw_value else default
+    except ValueError:
+        logger.warning("Invalid %s=%s", name, raw_value)
+        return default
 
 
 def _normalize_embedding_status(value: Any) -> str:
@@ -70,6 +97,11 @@ def _build_scraper_document_row(
         "publication_date": pub_date,
         "storage_path": effective_storage_path,
     }
+    if incoming_storage_path and doc.get("content_hash"):
+        # Keeps the content-hash index in storage_dedup current for new uploads.
+        row["content_hash"] = doc["content_hash"]
+        if doc.get("file_size_bytes") is not None:
+            row["file_size_bytes"] = doc["file_size_bytes"]
 
     existing_status = _normalize_embedding_status((existing_row or {}).get("embedding_status"))
     existing_chunk_count = _coerce_chunk_count((existing_row or {}).get("chunk_count"))
@@ -233,6 +265,8 @@ class ExtractionResult:
     errors: List[str]
     output_directory: Optional[str] = None
     pdfs_downloaded: int = 0
+    query_timings: List[dict] = field(default_factory=list)
+    index_cache_stats: dict = field(default_factory=dict)
 
 
 @dataclass
@@ -247,6 +281,10 @@ class DownloadResult:
     errors: List[str] = field(default_factory=list)
     storage_paths: List[str] = field(default_factory=list)
     downloaded_documents: List[dict] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    host_stats: dict = field(default_factory=dict)
+    deduplicated_count: int = 0
+    bytes_saved: int = 0
 
 
 # =============================================================================
@@ -365,16 +403,20 @@ async def _download_html_source_snapshot(
     session: aiohttp.ClientSession,
     source: str,
     source_url: Optional[str],
+    throttle: Optional[HostThrottle] = None,
 ) -> Optional[dict]:
     normalized_url = _normalize_source_url(source, source_url)
     if not normalized_url:
         return None
 
     try:
-        async with session.get(normalized_url, ssl=False, timeout=30) as response:
-            if response.status != 200:
-                return None
-            html = await response.text(encoding="utf-8", errors="replace")
+        async with throttle.request(normalized_url) if throttle is not None else nullcontext() as request:
+            async with session.get(normalized_url, ssl=False, timeout=30) as response:
+                if request is not None:
+                    request.observe(response)
+                if response.status != 200:
+                    return None
+                html = await response.text(encoding="utf-8", errors="replace")
     except Exception:
         return None
 
@@ -391,6 +433,7 @@ async def _download_html_source_snapshot(
 async def _extract_bjv_pdf_url(
     session: aiohttp.ClientSession,
     detail_url: Optional[str],
+    throttle: Optional[HostThrottle] = None,
 ) -> Optional[str]:
     """Resolve the real BJV PDF URL from a book detail page."""
     if not detail_url:
@@ -403,10 +446,13 @@ async def _extract_bjv_pdf_url(
     try:
         from src.infrastructure.adapters.bjv_libro_parser import BJVLibroParser
 
-        async with session.get(normalized_detail_url, ssl=False, timeout=30) as response:
-            if response.status != 200:
-                return None
-            html = await response.text(encoding="utf-8", errors="replace")
+        async with throttle.request(normalized_detail_url) if throttle is not None else nullcontext() as request:
+            async with session.get(normalized_detail_url, ssl=False, timeout=30) as response:
+                if request is not None:
+                    request.observe(response)
+                if response.status != 200:
+                    return None
+                html = await response.text(encoding="utf-8", errors="replace")
 
         parser = BJVLibroParser()
         libro = parser.parse_libro_detalle(html, _extract_bjv_libro_id(normalized_detail_url))
@@ -516,7 +562,10 @@ async def extract_scjn_documents(
             with open(doc_file, 'w', encoding='utf-8') as f:
                 json.dump(doc, f, ensure_ascii=False, indent=2)
 
-        activity.logger.info(f"SCJN extraction complete: {len(all_documents)} documents")
+        activity.logger.info(
+            f"SCJN extraction complete: {len(all_documents)} documents "
+            f"(fetch stats: {parser.fetcher.stats.to_dict()})"
+        )
 
         return asdict(ExtractionResult(
             source="scjn",
@@ -539,12 +588,73 @@ async def extract_scjn_documents(
             output_directory=output_directory,
             pdfs_downloaded=0,
         ))
+    finally:
+        await parser.close()
 
 
 # =============================================================================
 # DOF Extraction Activity
 # =============================================================================
 
+async def _fetch_dof_day_items(
+    session,
+    fetch_date: date,
+    parse_index,
+    cache: Optional[DofIndexCache],
+    day_slots: asyncio.Semaphore,
+    stats: dict,
+    limiter: Optional[SharedRateLimiter] = None,
+) -> tuple[list[dict], Optional[str]]:
+    """
+    Return ``(items, error)`` for one DOF day, reusing or revalidating cached
+    copies. Requests go through ``limiter`` when given (paced only if a
+    SCRAPER_RATE_LIMIT_DOF_GOB_MX budget is set; 429s pause every worker).
+    """
+    cached = await asyncio.to_thread(cache.load, fetch_date) if cache is not None else None
+    if cached is not None and cache.is_settled(cached):
+        stats["reused"] += 1
+        return cached.items, None
+
+    url = f"https://dof.gob.mx/index.php?year={fetch_date.year}&month={fetch_date.month:02d}&day={fetch_date.day:02d}"
+    headers = cached.conditional_headers() if cached is not None else {}
+    async with day_slots:
+        activity.logger.info(f"Fetching DOF for {fetch_date}: {url}")
+        try:
+            if limiter is not None:
+                await limiter.acquire(url)
+            async with session.get(url, ssl=False, timeout=30, headers=headers) as response:
+                if limiter is not None:
+                    await limiter.report(url, response.status, response.headers.get("Retry-After"))
+                if response.status == 304 and cached is not None:
+                    cached.fetched_at = utc_now_iso()
+                    await asyncio.to_thread(cache.store, cached)
+                    stats["revalidated"] += 1
+                    return cached.items, None
+                if response.status != 200:
+                    return [], f"DOF {fetch_date}: HTTP {response.status}"
+                html = await response.text(encoding='utf-8')
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except Exception as e:
+            activity.logger.warning(f"DOF {fetch_date} error: {e}")
+            return [], f"DOF {fetch_date} error: {str(e)}"
+
+    items = await asyncio.to_thread(parse_index, html)
+    stats["fetched"] += 1
+    if cache is not None:
+        await asyncio.to_thread(
+            cache.store,
+            CachedDofDay(
+                day=fetch_date.isoformat(),
+                items=items,
+                etag=etag,
+                last_modified=last_modified,
+                fetched_at=utc_now_iso(),
+            ),
+        )
+    return items, None
+
+
 @activity.defn
 async def extract_dof_documents(
     mode: str = "today",
@@ -556,6 +666,11 @@ async def extract_dof_documents(
     """
     Extract DOF publications using HTML parser.
 
+    Range mode fetches up to SCRAPER_DOF_DAY_CONCURRENCY days at once. With
+    SCRAPER_DOF_INDEX_CACHE_DIR set, parsed days are cached on disk: settled
+    days are reused without a request and recent ones are revalidated with
+    conditional GETs (see dof_index_cache).
+
     Args:
         mode: 'today' or 'range'
         start_date: Start date for range mode (YYYY-MM-DD)
@@ -575,6 +690,7 @@ async def extract_dof_documents(
     all_documents = []
     errors = []
     pdfs_downloaded = 0
+    cache_stats = {"fetched": 0, "revalidated": 0, "reused": 0}
 
     try:
         # For today mode, try sumario.xml first (structured, includes section/agency)
@@ -623,57 +739,69 @@ async def extract_dof_documents(
             from datetime import timedelta
             start = datetime.strptime(start_date, "%Y-%m-%d").date()
             end = datetime.strptime(end_date, "%Y-%m-%d").date()
+            skip_weekends = os.environ.get("SCRAPER_DOF_SKIP_WEEKENDS", "").strip().lower() in {"1", "true", "yes"}
             dates_to_fetch = []
             current = start
             while current <= end:
-                dates_to_fetch.append(current)
+                if not (skip_weekends and current.weekday() >= 5):
+                    dates_to_fetch.append(current)
                 current += timedelta(days=1)
         else:
             dates_to_fetch = [date.today()]
 
+        index_cache = DofIndexCache.from_env()
+        rate_limiter = get_shared_rate_limiter()
+        day_slots = asyncio.Semaphore(
+            _env_positive_int("SCRAPER_DOF_DAY_CONCURRENCY", DEFAULT_DOF_DAY_CONCURRENCY)
+        )
         async with aiohttp.ClientSession(headers={"User-Agent": USER_AGENT}) as session:
-            for fetch_date in dates_to_fetch:
-                url = f"https://dof.gob.mx/index.php?year={fetch_date.year}&month={fetch_date.month:02d}&day={fetch_date.day:02d}"
-                activity.logger.info(f"Fetching DOF for {fetch_date}: {url}")
+            day_results = await asyncio.gather(*(
+                _fetch_dof_day_items(
+                    session, fetch_date, parse_dof_index, index_cache, day_slots, cache_stats,
+                    limiter=rate_limiter,
+                )
+                for fetch_date in dates_to_fetch
+            ))
+
+        # Build documents in date order so fallback ids match a sequential run.
+        for fetch_date, (items, error) in zip(dates_to_fetch, day_results):
+            if error:
+                errors.append(error)
+                continue
+
+            for item in items:
+                # Extract cod_diario from URL if not present
+                detail_url = item.get('url', '')
+                cod_diario = item.get('cod_diario')
+                if not cod_diario and 'codigo=' in detail_url:
+                    match = re.search(r'codigo=(\d+)', detail_url)
+                    if match:
+                        cod_diario = match.group(1)
 
-                try:
-                    async with session.get(url, ssl=False, timeout=30) as response:
-                        if response.status == 200:
-                            html = await response.text(encoding='utf-8')
-                            items = parse_dof_index(html)
-
-                            for item in items:
-                                # Extract cod_diario from URL if not present
-                                detail_url = item.get('url', '')
-                                cod_diario = item.get('cod_diario')
-                                if not cod_diario and 'codigo=' in detail_url:
-                                    match = re.search(r'codigo=(\d+)', detail_url)
-                                    if match:
-                                        cod_diario = match.group(1)
-
-                                extracted = ExtractedDocument(
-                                    source="dof",
-                                    external_id=cod_diario or f"dof-{fetch_date}-{len(all_documents)}",
-                                    title=item.get('title', 'Unknown'),
-                                    content_type="publicacion",
-                                    publication_date=fetch_date.isoformat(),
-                                    url=detail_url,
-                                    metadata={
-                                        "section": item.get('section'),
-                                        "cod_diario": cod_diario,
-                                    },
-                                    # DOF PDFs are available via detail page - URL is the same as detail
-                                    pdf_url=detail_url,  # Detail page contains PDF link
-                                )
-                                all_documents.append(asdict(extracted))
-
-                            activity.logger.info(f"DOF {fetch_date}: Found {len(items)} publications")
-                        else:
-                            errors.append(f"DOF {fetch_date}: HTTP {response.status}")
+                extracted = ExtractedDocument(
+                    source="dof",
+                    external_id=cod_diario or f"dof-{fetch_date}-{len(all_documents)}",
+                    title=item.get('title', 'Unknown'),
+                    content_type="publicacion",
+                    publication_date=fetch_date.isoformat(),
+                    url=detail_url,
+                    metadata={
+                        "section": item.get('section'),
+                        "cod_diario": cod_diario,
+                    },
+                    # DOF PDFs are available via detail page - URL is the same as detail
+                    pdf_url=detail_url,  # Detail page contains PDF link
+                )
+                all_documents.append(asdict(extracted))
 
-                except Exception as e:
-                    errors.append(f"DOF {fetch_date} error: {str(e)}")
-                    activity.logger.warning(f"DOF {fetch_date} error: {e}")
+            activity.logger.info(f"DOF {fetch_date}: Found {len(items)} publications")
+
+        activity.logger.info(
+            "DOF day indexes: %s fetched, %s revalidated (304), %s reused from cache",
+            cache_stats["fetched"],
+            cache_stats["revalidated"],
+            cache_stats["reused"],
+        )
 
         # Save documents
         output_path = Path(output_directory)
@@ -694,6 +822,7 @@ async def extract_dof_documents(
             errors=errors,
             output_directory=output_directory,
             pdfs_downloaded=pdfs_downloaded,
+            index_cache_stats=cache_stats,
         ))
 
     except Exception as e:
@@ -835,9 +964,15 @@ async def extract_cas_documents(
     """
     Extract CAS arbitration awards using Playwright.
 
+    Every (year, sport) query runs as its own search, up to
+    SCRAPER_CAS_QUERY_CONCURRENCY at once. Results are merged in query order,
+    so the output matches a sequential run, and outstanding queries are
+    cancelled once ``max_results`` cases are collected.
+
     Args:
         max_results: Maximum cases to extract
-        sport: Sport filter (Football, Athletics, etc.)
+        sport: Sport filter (Football, Athletics, etc.); comma-separated
+            values are queried separately
         year: Exact year filter
         year_from: Range start year
         year_to: Range end year
@@ -864,6 +999,7 @@ async def extract_cas_documents(
     all_documents = []
     errors = []
     pdfs_downloaded = 0
+    query_timings: List[dict] = []
 
     try:
         if year is not None:
@@ -874,15 +1010,12 @@ async def extract_cas_documents(
             query_years = list(range(min(start_year, end_year), max(start_year, end_year) + 1))
         else:
             query_years = [None]
+        query_sports = [part.strip() for part in (sport or "").split(",") if part.strip()] or [None]
+        queries = [(query_year, query_sport) for query_year in query_years for query_sport in query_sports]
 
         seen_case_numbers = set()
 
-        for query_year in query_years:
-            results, _has_next = await parser.search(
-                sport=sport,
-                year=query_year,
-            )
-
+        def _merge(results) -> None:
             for case in results:
                 case_number = case.numero_caso.valor
                 if case_number in seen_case_numbers:
@@ -918,8 +1051,53 @@ async def extract_cas_documents(
                 )
                 all_documents.append(asdict(extracted))
 
-            if len(all_documents) >= max_results:
-                break
+        query_slots = asyncio.Semaphore(
+            min(_env_positive_int("SCRAPER_CAS_QUERY_CONCURRENCY", DEFAULT_CAS_QUERY_CONCURRENCY), len(queries))
+        )
+
+        async def _run_query(index: int, query_year: Optional[int], query_sport: Optional[str]):
+            async with query_slots:
+                started = time.monotonic()
+                error = None
+                try:
+                    results, _has_next = await parser.search(sport=query_sport, year=query_year)
+                except Exception as exc:
+                    results, error = [], str(exc)
+                return index, results, {
+                    "year": query_year,
+                    "sport": query_sport,
+                    "elapsed_seconds": round(time.monotonic() - started, 3),
+                    "result_count": len(results),
+                    "error": error,
+                }
+
+        tasks = [
+            asyncio.create_task(_run_query(index, query_year, query_sport))
+            for index, (query_year, query_sport) in enumerate(queries)
+        ]
+        finished_results: dict[int, list] = {}
+        timings_by_index: dict[int, dict] = {}
+        next_index = 0
+        try:
+            for finished in asyncio.as_completed(tasks):
+                index, results, timing = await finished
+                timings_by_index[index] = timing
+                if timing["error"]:
+                    errors.append(
+                        f"CAS query year={timing['year']} sport={timing['sport']} failed: {timing['error']}"
+                    )
+                finished_results[index] = results
+                # Merge in query order so dedup and truncation match a sequential run.
+                while next_index in finished_results and len(all_documents) < max_results:
+                    _merge(finished_results.pop(next_index))
+                    next_index += 1
+                if len(all_documents) >= max_results:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        query_timings = [timings_by_index[index] for index in sorted(timings_by_index)]
 
         # Save documents
         output_path = Path(output_directory)
@@ -942,6 +1120,7 @@ async def extract_cas_documents(
             errors=errors,
             output_directory=output_directory,
             pdfs_downloaded=pdfs_downloaded,
+            query_timings=query_timings,
         ))
 
     except Exception as e:
@@ -1030,6 +1209,238 @@ async def extract_documents_crawl4ai(config: dict) -> dict:
 # PDF/Document Download Activity
 # =============================================================================
 
+@dataclass
+class _DocumentDownload:
+    """Outcome of downloading (and optionally uploading) one document."""
+    status: str = "skipped"
+    errors: List[str] = field(default_factory=list)
+    storage_path: Optional[str] = None
+    deduplicated: bool = False
+    downloaded_document: Optional[dict] = None
+
+
+def _sniff_document_type(
+    content: bytes,
+    content_type: str,
+    pdf_url: str,
+    external_id: str,
+) -> tuple[str, str]:
+    if content[:4] == b'%PDF' or "pdf" in content_type.lower():
+        return ".pdf", "application/pdf"
+    if content[:4] == b'PK\x03\x04':  # DOCX/ZIP magic bytes
+        return ".docx", "application/pdf"
+    if content[:8] == b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1':  # DOC magic bytes
+        return ".doc", "application/pdf"
+    if "word" in content_type.lower() or pdf_url.lower().endswith(".docx"):
+        return ".docx", "application/pdf"
+    if pdf_url.lower().endswith(".doc"):
+        return ".doc", "application/pdf"
+    if pdf_url.lower().endswith(".pdf"):
+        return ".pdf", "application/pdf"
+    # Default to PDF for legal document sources
+    activity.logger.warning(f"{external_id}: Unrecognized file type, defaulting to PDF")
+    return ".pdf", "application/pdf"
+
+
+async def _upload_downloaded_file(
+    storage_adapter: Any,
+    hash_index: StorageHashIndex,
+    source: str,
+    safe_id: str,
+    external_id: str,
+    local_path: Path,
+    mime_type: str,
+    extension: str,
+    content_hash: str,
+    file_size_bytes: int,
+    outcome: _DocumentDownload,
+) -> None:
+    async def _upload() -> str:
+        storage_path = await storage_adapter.upload(
+            content=local_path,
+            source_type=source,
+            doc_id=safe_id,
+            content_type=mime_type,
+            file_extension=extension,
+        )
+        activity.logger.info(f"Uploaded to storage: {storage_path}")
+        return storage_path
+
+    try:
+        outcome.storage_path, outcome.deduplicated = await hash_index.upload_or_link(
+            content_hash,
+            file_size_bytes,
+            _upload,
+        )
+        if outcome.deduplicated:
+            activity.logger.info(
+                f"{external_id}: content already stored, linking {outcome.storage_path}"
+            )
+    except Exception as e:
+        error_message = str(e)
+        if any(
+            marker in error_message
+            for marker in ("Duplicate", "already exists", "statusCode': 409")
+        ):
+            outcome.storage_path = storage_adapter.build_path(
+                source_type=source,
+                doc_id=safe_id,
+                content_type=mime_type,
+                file_extension=extension,
+            )
+            hash_index.record(content_hash, outcome.storage_path)
+            activity.logger.info(f"Reusing existing storage object: {outcome.storage_path}")
+        else:
+            outcome.errors.append(f"{external_id} storage upload: {error_message}")
+
+
+async def _download_one_document(
+    doc: dict,
+    *,
+    source: str,
+    session: aiohttp.ClientSession,
+    throttle: HostThrottle,
+    output_path: Path,
+    storage_adapter: Any,
+    hash_index: StorageHashIndex,
+    upload_slots: asyncio.Semaphore,
+) -> _DocumentDownload:
+    outcome = _DocumentDownload()
+    pdf_url = doc.get("pdf_url")
+    source_url = doc.get("url")
+    external_id = doc.get("external_id", "unknown")
+
+    if source == "bjv" and not pdf_url:
+        pdf_url = await _extract_bjv_pdf_url(session, source_url, throttle)
+    elif source == "cas" and not pdf_url:
+        pdf_url = build_cas_pdf_url(source_url)
+
+    html_snapshot = None
+
+    if not pdf_url:
+        html_snapshot = await _download_html_source_snapshot(session, source, source_url, throttle)
+        if html_snapshot is None:
+            return outcome
+
+    partial_path: Optional[Path] = None
+    try:
+        # Download the file
+        activity.logger.info(f"Downloading: {external_id}")
+
+        # Handle DOF special case - use nota_to_doc.php directly
+        if source == "dof":
+            cod = doc.get("external_id") or ""
+            if not cod and "codigo=" in (pdf_url or ""):
+                m = re.search(r'codigo=(\d+)', pdf_url)
+                if m:
+                    cod = m.group(1)
+            if cod:
+                pdf_url = f"https://dof.gob.mx/nota_to_doc.php?codnota={cod}"
+            else:
+                return outcome
+
+        # Sanitize filename
+        safe_id = external_id.replace("/", "_").replace("=", "").replace("+", "-")
+        if len(safe_id) > 100:
+            safe_id = safe_id[:100]
+
+        if html_snapshot is not None:
+            mime_type = html_snapshot["mime_type"]
+            extension = ".html"
+            local_path = output_path / f"{safe_id}{extension}"
+            await asyncio.to_thread(local_path.write_bytes, html_snapshot["content"])
+            content_hash = hashlib.sha256(html_snapshot["content"]).hexdigest()
+            file_size_bytes = len(html_snapshot["content"])
+        else:
+            # Stream the body to a partial file; only the first block is kept
+            # in memory for type sniffing. Truncated ids can collide, so the
+            # name is unique per download.
+            partial_path = output_path / f"{safe_id}.{uuid.uuid4().hex}.part"
+            async with throttle.request(pdf_url) as request:
+                async with session.get(pdf_url, ssl=False) as response:
+                    request.observe(response)
+                    if response.status != 200:
+                        request.failed = True
+                        outcome.errors.append(f"{external_id}: HTTP {response.status}")
+                        outcome.status = "failed"
+                        return outcome
+
+                    content_type = response.headers.get("Content-Type", "")
+                    response_url = str(getattr(response, "url", pdf_url) or pdf_url)
+                    body = await stream_response_to_file(response, partial_path)
+                    request.bytes = body.size
+
+            if _looks_like_html_document(body.head, content_type):
+                raw_html = await asyncio.to_thread(partial_path.read_bytes)
+                partial_path.unlink(missing_ok=True)
+                html_text = raw_html.decode("utf-8", errors="replace")
+                if not _should_store_html_source(source, response_url, html_text):
+                    outcome.errors.append(f"{external_id}: Received HTML instead of document")
+                    outcome.status = "failed"
+                    return outcome
+                content = html_text.encode("utf-8")
+                extension = ".html"
+                mime_type = "text/html"
+                local_path = output_path / f"{safe_id}{extension}"
+                await asyncio.to_thread(local_path.write_bytes, content)
+                content_hash = hashlib.sha256(content).hexdigest()
+                file_size_bytes = len(content)
+            else:
+                extension, mime_type = _sniff_document_type(
+                    body.head,
+                    content_type,
+                    pdf_url,
+                    external_id,
+                )
+                local_path = output_path / f"{safe_id}{extension}"
+                partial_path.replace(local_path)
+                content_hash = body.sha256
+                file_size_bytes = body.size
+
+        activity.logger.info(f"Saved: {local_path}")
+        outcome.status = "downloaded"
+
+        # Upload to Supabase Storage if enabled. The host slot is already
+        # released, so other downloads keep going while this uploads.
+        if storage_adapter is not None:
+            async with upload_slots:
+                await _upload_downloaded_file(
+                    storage_adapter,
+                    hash_index,
+                    source,
+                    safe_id,
+                    external_id,
+                    local_path,
+                    mime_type,
+                    extension,
+                    content_hash,
+                    file_size_bytes,
+                    outcome,
+                )
+
+        outcome.downloaded_document = {
+            "external_id": external_id,
+            "pdf_downloaded": True,
+            "pdf_path": str(local_path),
+            "pdf_storage_path": outcome.storage_path,
+            "content_type": mime_type,
+            "content_hash": content_hash,
+            "file_size_bytes": file_size_bytes,
+        }
+
+    except aiohttp.ClientError as e:
+        outcome.errors.append(f"{external_id}: {str(e)}")
+        outcome.status = "failed"
+    except Exception as e:
+        outcome.errors.append(f"{external_id}: {str(e)}")
+        outcome.status = "failed"
+    finally:
+        if partial_path is not None:
+            partial_path.unlink(missing_ok=True)
+
+    return outcome
+
+
 @activity.defn
 async def download_documents_pdfs(
     documents: List[dict],
@@ -1044,6 +1455,12 @@ async def download_documents_pdfs(
     and falls back to storing canonical HTML detail pages for sources whose
     primary content lives on the page itself.
 
+    Documents are fetched concurrently over one keep-alive connection pool,
+    capped per host with a politeness delay between request starts (see
+    ``http_download_pool``); uploads overlap with the remaining downloads.
+    Files whose SHA-256 is already stored are linked to the existing object
+    instead of being uploaded again (see ``storage_dedup``).
+
     Args:
         documents: List of ExtractedDocument dicts with pdf_url field
         source: Source type (scjn, dof, bjv, cas)
@@ -1054,19 +1471,14 @@ async def download_documents_pdfs(
         DownloadResult as dict
     """
     activity.logger.info(f"Starting PDF download for {len(documents)} {source} documents")
+    started_at = time.monotonic()
 
     output_path = Path(output_directory)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    downloaded = 0
-    failed = 0
-    skipped = 0
-    errors = []
-    storage_paths = []
-    downloaded_documents = []
-
     # Initialize Supabase storage if needed
     storage_adapter = None
+    client = None
     if upload_to_storage:
         try:
             from supabase import create_client
@@ -1080,163 +1492,54 @@ async def download_documents_pdfs(
         except Exception as e:
             activity.logger.warning(f"Could not initialize Supabase storage: {e}")
 
+    hash_index = StorageHashIndex(client if storage_adapter is not None else None, storage_adapter)
+    limits = DownloadLimits.from_env()
+    throttle = HostThrottle(limits, get_shared_rate_limiter())
+    document_slots = asyncio.Semaphore(limits.concurrency)
+    upload_slots = asyncio.Semaphore(limits.uploads)
+
     # Create HTTP session for downloads
     timeout = aiohttp.ClientTimeout(total=60)  # Longer timeout for PDFs
-    async with aiohttp.ClientSession(
-        timeout=timeout,
-        headers={"User-Agent": USER_AGENT}
-    ) as session:
-        for doc in documents:
-            pdf_url = doc.get("pdf_url")
-            source_url = doc.get("url")
-            external_id = doc.get("external_id", "unknown")
-
-            if source == "bjv" and not pdf_url:
-                pdf_url = await _extract_bjv_pdf_url(session, source_url)
-            elif source == "cas" and not pdf_url:
-                pdf_url = build_cas_pdf_url(source_url)
-
-            html_snapshot = None
-
-            if not pdf_url:
-                html_snapshot = await _download_html_source_snapshot(session, source, source_url)
-                if html_snapshot is None:
-                    skipped += 1
-                    continue
-
-            try:
-                # Download the file
-                activity.logger.info(f"Downloading: {external_id}")
-
-                # Handle DOF special case - use nota_to_doc.php directly
-                if source == "dof":
-                    cod = doc.get("external_id") or ""
-                    if not cod and "codigo=" in (pdf_url or ""):
-                        import re as _re
-                        m = _re.search(r'codigo=(\d+)', pdf_url)
-                        if m:
-                            cod = m.group(1)
-                    if cod:
-                        pdf_url = f"https://dof.gob.mx/nota_to_doc.php?codnota={cod}"
-                    else:
-                        skipped += 1
-                        continue
-
-                if html_snapshot is not None:
-                    content = html_snapshot["content"]
-                    mime_type = html_snapshot["mime_type"]
-                    extension = ".html"
-                else:
-                    async with session.get(pdf_url, ssl=False) as response:
-                        if response.status != 200:
-                            errors.append(f"{external_id}: HTTP {response.status}")
-                            failed += 1
-                            continue
-
-                        content = await response.read()
-                        content_type = response.headers.get("Content-Type", "")
-                        response_url = str(getattr(response, "url", pdf_url) or pdf_url)
-
-                        if _looks_like_html_document(content, content_type):
-                            html_text = content.decode("utf-8", errors="replace")
-                            if _should_store_html_source(source, response_url, html_text):
-                                content = html_text.encode("utf-8")
-                                extension = ".html"
-                                mime_type = "text/html"
-                            else:
-                                errors.append(f"{external_id}: Received HTML instead of document")
-                                failed += 1
-                                continue
-                        elif content[:4] == b'%PDF' or "pdf" in content_type.lower():
-                            extension = ".pdf"
-                            mime_type = "application/pdf"
-                        elif content[:4] == b'PK\x03\x04':  # DOCX/ZIP magic bytes
-                            extension = ".docx"
-                            mime_type = "application/pdf"
-                        elif content[:8] == b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1':  # DOC magic bytes
-                            extension = ".doc"
-                            mime_type = "application/pdf"
-                        elif "word" in content_type.lower() or pdf_url.lower().endswith(".docx"):
-                            extension = ".docx"
-                            mime_type = "application/pdf"
-                        elif pdf_url.lower().endswith(".doc"):
-                            extension = ".doc"
-                            mime_type = "application/pdf"
-                        elif pdf_url.lower().endswith(".pdf"):
-                            extension = ".pdf"
-                            mime_type = "application/pdf"
-                        else:
-                            # Default to PDF for legal document sources
-                            extension = ".pdf"
-                            mime_type = "application/pdf"
-                            activity.logger.warning(
-                                f"{external_id}: Unrecognized file type, defaulting to PDF"
-                            )
-
-                # Sanitize filename
-                safe_id = external_id.replace("/", "_").replace("=", "").replace("+", "-")
-                if len(safe_id) > 100:
-                    safe_id = safe_id[:100]
-
-                # Save locally
-                local_path = output_path / f"{safe_id}{extension}"
-                with open(local_path, "wb") as f:
-                    f.write(content)
-
-                activity.logger.info(f"Saved: {local_path}")
-                downloaded += 1
-
-                # Upload to Supabase Storage if enabled
-                storage_path = None
-                if storage_adapter and upload_to_storage:
-                    try:
-                        storage_path = await storage_adapter.upload(
-                            content=content,
-                            source_type=source,
-                            doc_id=safe_id,
-                            content_type=mime_type,
-                            file_extension=extension,
-                        )
-                        storage_paths.append(storage_path)
-                        activity.logger.info(f"Uploaded to storage: {storage_path}")
-                    except Exception as e:
-                        error_message = str(e)
-                        if any(
-                            marker in error_message
-                            for marker in ("Duplicate", "already exists", "statusCode': 409")
-                        ):
-                            storage_path = storage_adapter.build_path(
-                                source_type=source,
-                                doc_id=safe_id,
-                                content_type=mime_type,
-                                file_extension=extension,
-                            )
-                            storage_paths.append(storage_path)
-                            activity.logger.info(
-                                f"Reusing existing storage object: {storage_path}"
-                            )
-                        else:
-                            errors.append(f"{external_id} storage upload: {error_message}")
-
-                downloaded_documents.append(
-                    {
-                        "external_id": external_id,
-                        "pdf_downloaded": True,
-                        "pdf_path": str(local_path),
-                        "pdf_storage_path": storage_path,
-                        "content_type": mime_type,
-                    }
-                )
+    connector = build_download_connector(limits)
+    try:
+        async with aiohttp.ClientSession(
+            timeout=timeout,
+            headers={"User-Agent": USER_AGENT},
+            connector=connector,
+        ) as session:
+
+            async def _bounded(doc: dict) -> _DocumentDownload:
+                async with document_slots:
+                    return await _download_one_document(
+                        doc,
+                        source=source,
+                        session=session,
+                        throttle=throttle,
+                        output_path=output_path,
+                        storage_adapter=storage_adapter,
+                        hash_index=hash_index,
+                        upload_slots=upload_slots,
+                    )
 
-            except aiohttp.ClientError as e:
-                errors.append(f"{external_id}: {str(e)}")
-                failed += 1
-            except Exception as e:
-                errors.append(f"{external_id}: {str(e)}")
-                failed += 1
+            outcomes = await asyncio.gather(*(_bounded(doc) for doc in documents))
+    finally:
+        if not connector.closed:
+            await connector.close()
+
+    downloaded = sum(1 for outcome in outcomes if outcome.status == "downloaded")
+    failed = sum(1 for outcome in outcomes if outcome.status == "failed")
+    skipped = sum(1 for outcome in outcomes if outcome.status == "skipped")
+    errors = [error for outcome in outcomes for error in outcome.errors]
+    storage_paths = [outcome.storage_path for outcome in outcomes if outcome.storage_path]
+    downloaded_documents = [
+        outcome.downloaded_document for outcome in outcomes if outcome.downloaded_document
+    ]
+    elapsed = time.monotonic() - started_at
 
     activity.logger.info(
-        f"Download complete: {downloaded} downloaded, {failed} failed, {skipped} skipped"
+        f"Download complete: {downloaded} downloaded, {failed} failed, {skipped} skipped "
+        f"in {elapsed:.1f}s; {hash_index.deduplicated} uploads deduplicated "
+        f"({hash_index.bytes_saved} bytes saved)"
     )
 
     return asdict(DownloadResult(
@@ -1249,6 +1552,10 @@ async def download_documents_pdfs(
         errors=errors[:20],  # Limit error messages
         storage_paths=storage_paths,
         downloaded_documents=downloaded_documents,
+        elapsed_seconds=round(elapsed, 3),
+        host_stats=throttle.stats_dict(),
+        deduplicated_count=hash_index.deduplicated,
+        bytes_saved=hash_index.bytes_saved,
     ))
 
 
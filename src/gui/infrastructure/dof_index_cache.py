@@ -0,0 +1,101 @@
+"""
+On-disk cache of parsed DOF daily index pages.
+
+Range extractions fetch ``index.php?year=..&month=..&day=..`` once per day; a
+multi-year backfill re-downloaded and re-parsed thousands of pages that had
+not changed since the previous run. Each day's parsed items are now stored
+with the ``ETag``/``Last-Modified`` validators of the response that produced
+them:
+
+- a day whose entry was fetched at least ``settled_after_days`` after it was
+  published is treated as immutable and reused without any request, unless
+  it parsed to no items (a holiday, or a maintenance or error page served
+  with 200), which is always revalidated;
+- any other cached day is revalidated with a conditional GET, and a 304 reuses
+  the stored items;
+- days without an entry are fetched normally.
+
+Entries are stored through the validator-cache helpers in
+``src.infrastructure.http_response_cache``.
+
+Environment Variables:
+    SCRAPER_DOF_INDEX_CACHE_DIR: Directory for cached day indexes (unset = no cache)
+    SCRAPER_DOF_INDEX_SETTLED_DAYS: Age after which a cached day is not
+        revalidated (default: 7)
+"""
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from src.infrastructure.http_response_cache import JsonEntryCache, ValidatedEntry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SETTLED_AFTER_DAYS = 7
+
+
+@dataclass
+class CachedDofDay(ValidatedEntry):
+    """Parsed index items of one DOF day and the validators that produced them."""
+
+    day: str
+    items: list[dict] = field(default_factory=list)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: Optional[str] = None
+
+
+class DofIndexCache(JsonEntryCache):
+    """Per-day JSON files under ``cache_dir``, one directory per year."""
+
+    description = "DOF index cache"
+
+    def __init__(self, cache_dir: Path, settled_after_days: int = DEFAULT_SETTLED_AFTER_DAYS):
+        super().__init__(cache_dir)
+        self.settled_after_days = max(int(settled_after_days), 0)
+
+    @classmethod
+    def from_env(cls) -> Optional["DofIndexCache"]:
+        raw_dir = os.environ.get("SCRAPER_DOF_INDEX_CACHE_DIR", "").strip()
+        if not raw_dir:
+            return None
+        raw_days = os.environ.get("SCRAPER_DOF_INDEX_SETTLED_DAYS", "").strip()
+        try:
+            settled_after_days = int(raw_days) if raw_days else DEFAULT_SETTLED_AFTER_DAYS
+        except ValueError:
+            logger.warning("Invalid SCRAPER_DOF_INDEX_SETTLED_DAYS=%s", raw_days)
+            settled_after_days = DEFAULT_SETTLED_AFTER_DAYS
+        return cls(Path(raw_dir), settled_after_days)
+
+    def _path(self, day: date) -> Path:
+        return self.cache_dir / f"{day.year:04d}" / f"{day.isoformat()}.json"
+
+    def load(self, day: date) -> Optional[CachedDofDay]:
+        payload = self._read(self._path(day))
+        if payload is None or payload.get("day") != day.isoformat():
+            return None
+        return CachedDofDay(
+            day=payload["day"],
+            items=payload.get("items") or [],
+            etag=payload.get("etag"),
+            last_modified=payload.get("last_modified"),
+            fetched_at=payload.get("fetched_at"),
+        )
+
+    def store(self, entry: CachedDofDay) -> None:
+        self._write(self._path(date.fromisoformat(entry.day)), entry)
+
+    def is_settled(self, entry: CachedDofDay) -> bool:
+        """True when the entry has items and was fetched long enough after its day to be final."""
+        if not entry.items or not entry.fetched_at:
+            return False
+        try:
+            fetched_on = datetime.fromisoformat(entry.fetched_at).date()
+        except ValueError:
+            return False
+        return fetched_on >= date.fromisoformat(entry.day) + timedelta(days=self.settled_after_days)
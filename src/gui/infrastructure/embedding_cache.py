@@ -0,0 +1,132 @@
+"""
+Content-addressed embedding cache for the document embedding workflow.
+
+Vectors are keyed by ``(model, vector_size, sha256(normalized chunk text))`` so
+re-running ``ScraperDocumentWorkflow`` on an unchanged document (stale requeue,
+backfill re-pass, title-only update) reuses stored vectors instead of calling
+OpenRouter again. The local store is a small SQLite file on the worker; it is
+safe to share between worker processes on one host (WAL mode).
+
+Environment Variables:
+    SCRAPER_EMBEDDING_CACHE_PATH: SQLite file for the local cache (unset = disabled)
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_chunk_text(text: str) -> str:
+    return _WHITESPACE_RE.sub(" ", text or "").strip()
+
+
+def chunk_text_hash(text: str) -> str:
+    return hashlib.sha256(normalize_chunk_text(text).encode("utf-8")).hexdigest()
+
+
+def _pack_vector(vector: list[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack_vector(blob: bytes) -> list[float]:
+    values = array("f")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+class EmbeddingCache:
+    """SQLite-backed ``text hash -> vector`` store for one worker host."""
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                vector_size INTEGER NOT NULL,
+                text_hash TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                PRIMARY KEY (model, vector_size, text_hash)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get_many(
+        self,
+        model: str,
+        vector_size: int,
+        text_hashes: Iterable[str],
+    ) -> dict[str, list[float]]:
+        unique_hashes = list(dict.fromkeys(text_hashes))
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for start in range(0, len(unique_hashes), 500):
+                batch = unique_hashes[start : start + 500]
+                placeholders = ",".join("?" for _ in batch)
+                rows = self._conn.execute(
+                    "SELECT text_hash, embedding FROM embeddings "
+                    f"WHERE model = ? AND vector_size = ? AND text_hash IN ({placeholders})",
+                    (model, vector_size, *batch),
+                ).fetchall()
+                for text_hash, blob in rows:
+                    found[text_hash] = _unpack_vector(blob)
+        return found
+
+    def put_many(
+        self,
+        model: str,
+        vector_size: int,
+        vectors: dict[str, list[float]],
+    ) -> None:
+        if not vectors:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, vector_size, text_hash, embedding) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (model, vector_size, text_hash, _pack_vector(vector))
+                    for text_hash, vector in vectors.items()
+                ],
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_shared_cache: Optional[EmbeddingCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Return the process-wide local cache, or ``None`` when it is not configured."""
+    global _shared_cache
+    raw_path = os.environ.get("SCRAPER_EMBEDDING_CACHE_PATH", "").strip()
+    if not raw_path:
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None or str(_shared_cache.path) != str(Path(raw_path)):
+            try:
+                _shared_cache = EmbeddingCache(raw_path)
+            except Exception as exc:
+                logger.warning("Embedding cache unavailable at %s: %s", raw_path, exc)
+                return None
+        return _shared_cache
@@ -0,0 +1,236 @@
+"""
+Per-host throttling and stats for the document download activity.
+
+``download_documents_pdfs`` fetches many documents from a handful of hosts
+(dof.gob.mx, biblio.juridicas.unam.mx, ...). Downloads run concurrently, but
+each host gets its own concurrency cap and a minimum delay between request
+starts so a large range run stays polite to the origin. Given a
+``SharedRateLimiter``, the delay becomes that host's default budget in the
+shared limiter, which every worker on the host (or cluster) draws from and
+which pauses the host when it answers 429.
+
+Response bodies are streamed to disk in fixed-size chunks while the SHA-256
+is computed, so worker memory stays bounded by the chunk size rather than the
+size of the largest BJV book.
+
+Environment Variables:
+    SCRAPER_DOWNLOAD_CONCURRENCY: Documents downloaded at once (default: 8)
+    SCRAPER_DOWNLOAD_PER_HOST_CONCURRENCY: Open requests per host (default: 4)
+    SCRAPER_DOWNLOAD_HOST_DELAY_SECONDS: Minimum gap between request starts per host (default: 0.25)
+    SCRAPER_DOWNLOAD_UPLOAD_CONCURRENCY: Concurrent storage uploads (default: 4)
+    SCRAPER_DOWNLOAD_CHUNK_BYTES: Read/write buffer for streamed bodies (default: 262144)
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+import urllib.parse
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional
+
+import aiohttp
+
+from src.infrastructure.resilience.shared_rate_limiter import RateBudget, SharedRateLimiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DOWNLOAD_CONCURRENCY = 8
+DEFAULT_PER_HOST_CONCURRENCY = 4
+DEFAULT_HOST_DELAY_SECONDS = 0.25
+DEFAULT_UPLOAD_CONCURRENCY = 4
+DEFAULT_STREAM_CHUNK_BYTES = 256 * 1024
+SNIFF_BYTES = 512
+DNS_CACHE_TTL_SECONDS = 300
+KEEPALIVE_TIMEOUT_SECONDS = 30
+
+
+def _env_number(name: str, default: float, minimum: float) -> float:
+    raw_value = os.environ.get(name, "").strip()
+    if not raw_value:
+        return default
+    try:
+        return max(float(raw_value), minimum)
+    except Exception:
+        logger.warning("Invalid %s=%s", name, raw_value)
+        return default
+
+
+@dataclass(frozen=True)
+class DownloadLimits:
+    concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY
+    per_host: int = DEFAULT_PER_HOST_CONCURRENCY
+    host_delay_seconds: float = DEFAULT_HOST_DELAY_SECONDS
+    uploads: int = DEFAULT_UPLOAD_CONCURRENCY
+
+    @classmethod
+    def from_env(cls) -> "DownloadLimits":
+        return cls(
+            concurrency=int(_env_number("SCRAPER_DOWNLOAD_CONCURRENCY", DEFAULT_DOWNLOAD_CONCURRENCY, 1)),
+            per_host=int(
+                _env_number("SCRAPER_DOWNLOAD_PER_HOST_CONCURRENCY", DEFAULT_PER_HOST_CONCURRENCY, 1)
+            ),
+            host_delay_seconds=_env_number(
+                "SCRAPER_DOWNLOAD_HOST_DELAY_SECONDS",
+                DEFAULT_HOST_DELAY_SECONDS,
+                0,
+            ),
+            uploads=int(
+                _env_number("SCRAPER_DOWNLOAD_UPLOAD_CONCURRENCY", DEFAULT_UPLOAD_CONCURRENCY, 1)
+            ),
+        )
+
+
+def build_download_connector(limits: DownloadLimits) -> aiohttp.TCPConnector:
+    """Keep-alive connector with a DNS cache, sized to the download limits."""
+    return aiohttp.TCPConnector(
+        limit=max(limits.concurrency, limits.per_host),
+        limit_per_host=limits.per_host,
+        ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+        keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS,
+        enable_cleanup_closed=True,
+    )
+
+
+def url_host(url: str) -> str:
+    return (urllib.parse.urlsplit(url or "").hostname or "").lower()
+
+
+@dataclass
+class HostStats:
+    requests: int = 0
+    failures: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "bytes": self.bytes,
+            "avg_latency_ms": round(self.seconds / self.requests * 1000, 1) if self.requests else 0.0,
+            "bytes_per_second": round(self.bytes / self.seconds, 1) if self.seconds > 0 else 0.0,
+        }
+
+
+class _RequestRecord:
+    def __init__(self) -> None:
+        self.bytes = 0
+        self.failed = False
+        self.status: Optional[int] = None
+        self.retry_after: Optional[str] = None
+
+    def observe(self, response: Any) -> None:
+        """Keep the status and Retry-After for the shared limiter."""
+        self.status = response.status
+        self.retry_after = (getattr(response, "headers", None) or {}).get("Retry-After")
+
+
+class HostThrottle:
+    """Per-host concurrency caps, politeness delays and request stats."""
+
+    def __init__(self, limits: DownloadLimits, limiter: Optional[SharedRateLimiter] = None):
+        self.limits = limits
+        self.limiter = limiter
+        self.stats: dict[str, HostStats] = {}
+        self._slots: dict[str, asyncio.Semaphore] = {}
+        self._start_locks: dict[str, asyncio.Lock] = {}
+        self._last_start: dict[str, float] = {}
+
+    async def _wait_turn(self, host: str) -> None:
+        delay = self.limits.host_delay_seconds
+        if self.limiter is not None:
+            await self.limiter.acquire(host, RateBudget(requests_per_second=1.0 / delay if delay > 0 else 0.0))
+            return
+        if delay <= 0:
+            return
+        lock = self._start_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            wait = self._last_start.get(host, float("-inf")) + delay - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_start[host] = time.monotonic()
+
+    @asynccontextmanager
+    async def request(self, url: str) -> AsyncIterator[_RequestRecord]:
+        """
+        Hold a request slot for ``url``'s host; set ``.bytes``/``.failed`` on
+        the record and ``observe()`` the response.
+        """
+        host = url_host(url)
+        slots = self._slots.setdefault(host, asyncio.Semaphore(self.limits.per_host))
+        async with slots:
+            await self._wait_turn(host)
+            record = _RequestRecord()
+            started = time.monotonic()
+            try:
+                yield record
+            except BaseException:
+                record.failed = True
+                raise
+            finally:
+                stats = self.stats.setdefault(host, HostStats())
+                stats.requests += 1
+                stats.failures += int(record.failed)
+                stats.bytes += record.bytes
+                stats.seconds += time.monotonic() - started
+                if self.limiter is not None and record.status is not None:
+                    await self.limiter.report(host, record.status, record.retry_after)
+
+    def stats_dict(self) -> dict[str, dict]:
+        return {host: stats.to_dict() for host, stats in sorted(self.stats.items())}
+
+
+def stream_chunk_bytes() -> int:
+    return int(_env_number("SCRAPER_DOWNLOAD_CHUNK_BYTES", DEFAULT_STREAM_CHUNK_BYTES, 4096))
+
+
+class DownloadTooLarge(Exception):
+    """Raised when a streamed body exceeds the caller's size cap."""
+
+
+@dataclass(frozen=True)
+class StreamedBody:
+    path: Path
+    size: int
+    sha256: str
+    head: bytes
+
+
+async def stream_response_to_file(
+    response: Any,
+    destination: Path,
+    *,
+    chunk_size: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+) -> StreamedBody:
+    """
+    Write ``response``'s body to ``destination`` chunk by chunk.
+
+    Returns the size, SHA-256 and the first ``SNIFF_BYTES`` bytes for type
+    sniffing. The file is removed if the transfer fails or exceeds ``max_bytes``.
+    """
+    chunk_size = chunk_size or stream_chunk_bytes()
+    digest = hashlib.sha256()
+    head = bytearray()
+    size = 0
+    destination = Path(destination)
+    try:
+        with destination.open("wb") as fh:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise DownloadTooLarge(f"Body exceeds {max_bytes} bytes")
+                if len(head) < SNIFF_BYTES:
+                    head.extend(chunk[: SNIFF_BYTES - len(head)])
+                digest.update(chunk)
+                fh.write(chunk)
+    except BaseException:
+        destination.unlink(missing_ok=True)
+        raise
+    return StreamedBody(path=destination, size=size, sha256=digest.hexdigest(), head=bytes(head))
+
@@ -13,14 +13,31 @@ import logging
 import os
 import re
 import sqlite3
+import threading
 import time
 import unicodedata
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable, Optional
 
-from src.gui.infrastructure.temporal_client import TemporalConfig, TemporalScraperClient
+from src.gui.infrastructure.mounted_file_index import (
+    FilesystemProbe,
+    MountedFileIndex,
+    load_mounted_file_index,
+    mounted_file_index_enabled,
+)
+from src.gui.infrastructure.storage_dedup import StorageHashIndex
+from src.gui.infrastructure.supabase_pagination import (
+    INCOMPLETE_EMBEDDING_FILTER,
+    iter_keyset_rows,
+)
+from src.gui.infrastructure.temporal_client import (
+    TemporalConfig,
+    TemporalScraperClient,
+    get_temporal_client_pool,
+)
 from src.infrastructure.adapters.supabase_storage import SupabaseStorageAdapter
 
 logger = logging.getLogger(__name__)
@@ -31,9 +48,18 @@ BACKFILL_SELECT = (
     "embedding_status, chunk_count, created_at, updated_at"
 )
 BOOTSTRAP_IDENTITY_SELECT = (
-    "id, external_id, title, publication_date, storage_path, embedding_status, chunk_count"
+    "id, external_id, title, publication_date, storage_path, embedding_status, chunk_count, "
+    "created_at"
 )
 FETCH_PAGE_SIZE = 200
+DOF_FUZZY_MATCH_MIN_CHARS = 12
+DEFAULT_BACKFILL_DISK_CONCURRENCY = 4
+DEFAULT_BACKFILL_UPLOAD_CONCURRENCY = 4
+DEFAULT_BACKFILL_DB_CONCURRENCY = 4
+DEFAULT_BACKFILL_STATUS_BATCH_SIZE = 100
+DEFAULT_BOOTSTRAP_UPSERT_BATCH_SIZE = 200
+DEFAULT_BOOTSTRAP_ALIAS_BATCH_SIZE = 500
+BOOTSTRAP_LOOKUP_BATCH_SIZE = 100
 DEFAULT_DATA_ROOT = "/app/mounted_data"
 TERMINAL_EMBEDDING_STATUS = "completed"
 AWAITING_SOURCE_STATUS = "awaiting_source_file"
@@ -43,6 +69,9 @@ SCRAPER_DOCUMENT_ALIASES_TABLE = "scraper_document_aliases"
 SCJN_MOUNTED_FAMILIES = ("tesis", "ejecutorias", "votos", "acuerdos", "otros")
 SCJN_BOOTSTRAP_FAMILY_ORDER = ("ejecutorias", "votos", "acuerdos", "otros", "tesis")
 
+MountedFileLookup = FilesystemProbe | MountedFileIndex
+_FILESYSTEM = FilesystemProbe()
+
 
 @dataclass
 class LocalSourceMatch:
@@ -80,6 +109,8 @@ class MountedBackfillResult:
     registered_rows: int = 0
     existing_registered_rows: int = 0
     alias_rows_upserted: int = 0
+    deduplicated_uploads: int = 0
+    bytes_saved: int = 0
     trigger_job_id: Optional[str] = None
     trigger_run_id: Optional[str] = None
     workflow_result: Optional[dict] = None
@@ -100,6 +131,8 @@ class MountedBackfillResult:
             "registered_rows": self.registered_rows,
             "existing_registered_rows": self.existing_registered_rows,
             "alias_rows_upserted": self.alias_rows_upserted,
+            "deduplicated_uploads": self.deduplicated_uploads,
+            "bytes_saved": self.bytes_saved,
             "trigger_job_id": self.trigger_job_id,
             "trigger_run_id": self.trigger_run_id,
             "workflow_result": self.workflow_result,
@@ -321,10 +354,14 @@ def _extract_cas_case_keys(external_id: str, title: Optional[str] = None) -> lis
     return candidates
 
 
-def _resolve_bjv_file(data_root: Path, external_id: str) -> Optional[LocalSourceMatch]:
+def _resolve_bjv_file(
+    data_root: Path,
+    external_id: str,
+    files: MountedFileLookup = _FILESYSTEM,
+) -> Optional[LocalSourceMatch]:
     book_dir = data_root / "books" / external_id
     whole_book_pdf = book_dir / "book.pdf"
-    if whole_book_pdf.exists():
+    if files.exists(whole_book_pdf):
         return LocalSourceMatch(
             path=whole_book_pdf,
             content_type="application/pdf",
@@ -340,7 +377,7 @@ def _resolve_bjv_file(data_root: Path, external_id: str) -> Optional[LocalSource
             chapters_dir / f"{book_id}_{chapter_id}.pdf",
         )
         for candidate in chapter_candidates:
-            if candidate.exists():
+            if files.exists(candidate):
                 return LocalSourceMatch(
                     path=candidate,
                     content_type="application/pdf",
@@ -353,6 +390,7 @@ def _resolve_cas_file(
     data_root: Path,
     external_id: str,
     title: Optional[str] = None,
+    files: MountedFileLookup = _FILESYSTEM,
 ) -> Optional[LocalSourceMatch]:
     cases_dir = data_root / "cas_pdfs"
     converted_dir = data_root / "cas" / "converted"
@@ -360,7 +398,7 @@ def _resolve_cas_file(
     for case_key in _extract_cas_case_keys(external_id, title):
         for converted_name in ("canonical.json", "output.md", "output.txt"):
             converted_candidate = converted_dir / case_key / converted_name
-            if converted_candidate.exists():
+            if files.exists(converted_candidate):
                 return LocalSourceMatch(
                     path=converted_candidate,
                     content_type=_content_type_for_path(converted_candidate),
@@ -370,11 +408,11 @@ def _resolve_cas_file(
         pdf_candidates: list[Path] = [cases_dir / f"{case_key}.pdf"]
         if case_key.endswith("-O"):
             base_key = case_key[:-2]
-            pdf_candidates.extend(sorted(cases_dir.glob(f"{base_key}-O*.pdf")))
+            pdf_candidates.extend(files.glob(cases_dir, f"{base_key}-O*.pdf"))
             pdf_candidates.append(cases_dir / f"{base_key}.pdf")
         elif case_key.endswith("-IA"):
             base_key = case_key[:-3]
-            pdf_candidates.extend(sorted(cases_dir.glob(f"{base_key}-IA*.pdf")))
+            pdf_candidates.extend(files.glob(cases_dir, f"{base_key}-IA*.pdf"))
             pdf_candidates.append(cases_dir / f"{base_key}.pdf")
 
         seen_candidates: set[Path] = set()
@@ -382,7 +420,7 @@ def _resolve_cas_file(
             if candidate in seen_candidates:
                 continue
             seen_candidates.add(candidate)
-            if candidate.exists():
+            if files.exists(candidate):
                 return LocalSourceMatch(
                     path=candidate,
                     content_type="application/pdf",
@@ -391,10 +429,14 @@ def _resolve_cas_file(
     return None
 
 
-def _resolve_dof_file_by_external_id(data_root: Path, external_id: str) -> Optional[LocalSourceMatch]:
+def _resolve_dof_file_by_external_id(
+    data_root: Path,
+    external_id: str,
+    files: MountedFileLookup = _FILESYSTEM,
+) -> Optional[LocalSourceMatch]:
     dof_root = data_root / "dof"
     converted_txt = dof_root / "converted" / external_id / "output.txt"
-    if converted_txt.exists():
+    if files.exists(converted_txt):
         return LocalSourceMatch(
             path=converted_txt,
             content_type="text/plain",
@@ -403,7 +445,7 @@ def _resolve_dof_file_by_external_id(data_root: Path, external_id: str) -> Optio
 
     for suffix in (".docx", ".doc", ".pdf", ".html", ".txt"):
         candidate = dof_root / f"{external_id}{suffix}"
-        if candidate.exists():
+        if files.exists(candidate):
             return LocalSourceMatch(
                 path=candidate,
                 content_type=_content_type_for_path(candidate),
@@ -413,47 +455,25 @@ def _resolve_dof_file_by_external_id(data_root: Path, external_id: str) -> Optio
     return None
 
 
-def _iter_dof_progress_candidates(
-    data_root: Path,
-    publication_date: Optional[str],
-) -> list[dict[str, str]]:
-    db_path = data_root / "dof_progress.db"
-    if not db_path.exists():
-        return []
-
-    conn = sqlite3.connect(str(db_path), timeout=10)
-    conn.row_factory = sqlite3.Row
-    try:
-        if publication_date:
-            rows = conn.execute(
-                "SELECT external_id, title, publication_date "
-                "FROM documents WHERE publication_date = ?",
-                (publication_date,),
-            ).fetchall()
-            if rows:
-                return [dict(row) for row in rows]
-
-            year = publication_date[:4]
-            if year.isdigit():
-                rows = conn.execute(
-                    "SELECT external_id, title, publication_date "
-                    "FROM documents WHERE substr(publication_date, 1, 4) = ?",
-                    (year,),
-                ).fetchall()
-                if rows:
-                    return [dict(row) for row in rows]
-        return []
-    finally:
-        conn.close()
-
-
 def _score_dof_candidate(
     candidate_title: Optional[str],
     *,
     target_title_norm: str,
     legacy_slug_norm: str,
 ) -> int:
-    candidate_norm = _normalize_match_text(candidate_title)
+    return _score_normalized_dof_candidate(
+        _normalize_match_text(candidate_title),
+        target_title_norm=target_title_norm,
+        legacy_slug_norm=legacy_slug_norm,
+    )
+
+
+def _score_normalized_dof_candidate(
+    candidate_norm: str,
+    *,
+    target_title_norm: str,
+    legacy_slug_norm: str,
+) -> int:
     if not candidate_norm:
         return -1
 
@@ -463,13 +483,13 @@ def _score_dof_candidate(
     if legacy_slug_norm and candidate_norm == legacy_slug_norm:
         scores.append(99)
 
-    if target_title_norm and len(target_title_norm) >= 12:
+    if target_title_norm and len(target_title_norm) >= DOF_FUZZY_MATCH_MIN_CHARS:
         if candidate_norm.startswith(target_title_norm) or target_title_norm.startswith(candidate_norm):
             scores.append(95)
         elif target_title_norm in candidate_norm or candidate_norm in target_title_norm:
             scores.append(90)
 
-    if legacy_slug_norm and len(legacy_slug_norm) >= 12:
+    if legacy_slug_norm and len(legacy_slug_norm) >= DOF_FUZZY_MATCH_MIN_CHARS:
         if candidate_norm.startswith(legacy_slug_norm) or legacy_slug_norm.startswith(candidate_norm):
             scores.append(94)
         elif legacy_slug_norm in candidate_norm or candidate_norm in legacy_slug_norm:
@@ -478,6 +498,212 @@ def _score_dof_candidate(
     return max(scores) if scores else -1
 
 
+def _trigrams(value: str) -> set[str]:
+    return {value[index : index + 3] for index in range(len(value) - 2)}
+
+
+class _DofTitleBucket:
+    """
+    Normalized DOF titles for one publication date or year.
+
+    Only titles that can score are returned as candidates: exact matches, titles
+    containing the query (every query trigram is present) and titles contained
+    in the query (their first trigram is one of the query's).
+    """
+
+    def __init__(self) -> None:
+        self.external_ids: list[str] = []
+        self.titles: list[str] = []
+        self._by_title: dict[str, list[int]] = {}
+        self._by_trigram: dict[str, set[int]] = {}
+        self._by_first_trigram: dict[str, list[int]] = {}
+        self._short: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self.external_ids)
+
+    def add(self, external_id: str, title_norm: str) -> None:
+        position = len(self.external_ids)
+        self.external_ids.append(external_id)
+        self.titles.append(title_norm)
+        self._by_title.setdefault(title_norm, []).append(position)
+        if len(title_norm) < 3:
+            self._short.append(position)
+            return
+        self._by_first_trigram.setdefault(title_norm[:3], []).append(position)
+        for trigram in _trigrams(title_norm):
+            self._by_trigram.setdefault(trigram, set()).add(position)
+
+    def candidates(self, query_norm: str) -> set[int]:
+        found = set(self._by_title.get(query_norm, ()))
+        if len(query_norm) < DOF_FUZZY_MATCH_MIN_CHARS:
+            return found
+        query_trigrams = _trigrams(query_norm)
+        postings = sorted(
+            (self._by_trigram.get(trigram, set()) for trigram in query_trigrams),
+            key=len,
+        )
+        if postings and postings[0]:
+            containing = set(postings[0])
+            for posting in postings[1:]:
+                containing &= posting
+                if not containing:
+                    break
+            found |= containing
+        for trigram in query_trigrams:
+            found.update(self._by_first_trigram.get(trigram, ()))
+        found.update(self._short)
+        return found
+
+
+class DofLegacyTitleMatcher:
+    """
+    Resolve legacy ``dof-<title slug>`` ids against ``dof_progress.db``.
+
+    Keeps one read-only connection and loads the catalog a year at a time into
+    per-date and per-year title indexes, so matching many legacy slugs does not
+    rescan the table for every document.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._conn = sqlite3.connect(
+            f"file:{self.db_path}?mode=ro",
+            uri=True,
+            timeout=10,
+            check_same_thread=False,
+        )
+        self._lock = threading.Lock()
+        self._years: dict[str, _DofTitleBucket] = {}
+        self._dates: dict[str, _DofTitleBucket] = {}
+
+    def _load_year(self, year: str) -> _DofTitleBucket:
+        bucket = self._years.get(year)
+        if bucket is not None:
+            return bucket
+        bucket = _DofTitleBucket()
+        rows = self._conn.execute(
+            "SELECT external_id, title, publication_date "
+            "FROM documents WHERE substr(publication_date, 1, 4) = ?",
+            (year,),
+        )
+        for external_id, title, row_date in rows:
+            # A date with rows (even unusable ones) never falls back to its year.
+            date_bucket = self._dates.setdefault(str(row_date), _DofTitleBucket())
+            external_id = str(external_id or "").strip()
+            title_norm = _normalize_match_text(title)
+            if not external_id or not title_norm:
+                continue
+            bucket.add(external_id, title_norm)
+            date_bucket.add(external_id, title_norm)
+        self._years[year] = bucket
+        return bucket
+
+    def _load_date(self, publication_date: str) -> Optional[_DofTitleBucket]:
+        bucket = self._dates.get(publication_date)
+        if bucket is not None:
+            return bucket
+        rows = self._conn.execute(
+            "SELECT external_id, title FROM documents WHERE publication_date = ?",
+            (publication_date,),
+        ).fetchall()
+        if not rows:
+            return None
+        bucket = _DofTitleBucket()
+        for external_id, title in rows:
+            external_id = str(external_id or "").strip()
+            title_norm = _normalize_match_text(title)
+            if external_id and title_norm:
+                bucket.add(external_id, title_norm)
+        self._dates[publication_date] = bucket
+        return bucket
+
+    def _bucket_for(self, publication_date: str) -> Optional[_DofTitleBucket]:
+        year = publication_date[:4]
+        if not year.isdigit():
+            return self._load_date(publication_date)
+        year_bucket = self._load_year(year)
+        date_bucket = self._dates.get(publication_date)
+        if date_bucket is not None:
+            return date_bucket
+        return year_bucket
+
+    def resolve(
+        self,
+        external_id: str,
+        *,
+        title: Optional[str] = None,
+        publication_date: Optional[str] = None,
+    ) -> Optional[str]:
+        legacy_slug_norm = _normalize_match_text(_extract_dof_legacy_slug(external_id))
+        target_title_norm = _normalize_match_text(title)
+        if not (legacy_slug_norm or target_title_norm) or not publication_date:
+            return None
+
+        with self._lock:
+            bucket = self._bucket_for(publication_date)
+        if bucket is None:
+            return None
+
+        positions: set[int] = set()
+        for query_norm in (target_title_norm, legacy_slug_norm):
+            if query_norm:
+                positions |= bucket.candidates(query_norm)
+
+        best_external_id: Optional[str] = None
+        best_score = -1
+        duplicate_best = False
+        for position in positions:
+            score = _score_normalized_dof_candidate(
+                bucket.titles[position],
+                target_title_norm=target_title_norm,
+                legacy_slug_norm=legacy_slug_norm,
+            )
+            if score < 0:
+                continue
+            if score > best_score:
+                best_score = score
+                best_external_id = bucket.external_ids[position]
+                duplicate_best = False
+            elif score == best_score:
+                duplicate_best = True
+
+        if duplicate_best or best_score < 0:
+            return None
+        return best_external_id
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_dof_matchers: dict[str, tuple[int, DofLegacyTitleMatcher]] = {}
+_dof_matchers_lock = threading.Lock()
+
+
+def get_dof_legacy_matcher(data_root: Path) -> Optional[DofLegacyTitleMatcher]:
+    """Return the shared matcher for ``data_root``, reopened when the catalog changes."""
+    db_path = Path(data_root) / "dof_progress.db"
+    try:
+        mtime_ns = db_path.stat().st_mtime_ns
+    except OSError:
+        return None
+    key = str(db_path)
+    with _dof_matchers_lock:
+        cached = _dof_matchers.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        try:
+            matcher = DofLegacyTitleMatcher(db_path)
+        except sqlite3.Error as exc:
+            logger.warning("Could not open DOF progress catalog %s: %s", db_path, exc)
+            return None
+        if cached is not None:
+            cached[1].close()
+        _dof_matchers[key] = (mtime_ns, matcher)
+        return matcher
+
+
 def _resolve_dof_legacy_external_id(
     data_root: Path,
     external_id: str,
@@ -485,37 +711,14 @@ def _resolve_dof_legacy_external_id(
     title: Optional[str] = None,
     publication_date: Optional[str] = None,
 ) -> Optional[str]:
-    legacy_slug_norm = _normalize_match_text(_extract_dof_legacy_slug(external_id))
-    target_title_norm = _normalize_match_text(title)
-    if not legacy_slug_norm and not target_title_norm:
+    matcher = get_dof_legacy_matcher(data_root)
+    if matcher is None:
         return None
-
-    best_external_id: Optional[str] = None
-    best_score = -1
-    duplicate_best = False
-
-    for row in _iter_dof_progress_candidates(data_root, publication_date):
-        candidate_external_id = str(row.get("external_id") or "").strip()
-        if not candidate_external_id:
-            continue
-
-        score = _score_dof_candidate(
-            row.get("title"),
-            target_title_norm=target_title_norm,
-            legacy_slug_norm=legacy_slug_norm,
-        )
-        if score < 0:
-            continue
-        if score > best_score:
-            best_score = score
-            best_external_id = candidate_external_id
-            duplicate_best = False
-        elif score == best_score:
-            duplicate_best = True
-
-    if duplicate_best or best_score < 0:
+    try:
+        return matcher.resolve(external_id, title=title, publication_date=publication_date)
+    except sqlite3.Error as exc:
+        logger.warning("DOF legacy title lookup failed for %s: %s", external_id, exc)
         return None
-    return best_external_id
 
 
 def _resolve_dof_file(
@@ -524,8 +727,9 @@ def _resolve_dof_file(
     *,
     title: Optional[str] = None,
     publication_date: Optional[str] = None,
+    files: MountedFileLookup = _FILESYSTEM,
 ) -> Optional[LocalSourceMatch]:
-    direct_match = _resolve_dof_file_by_external_id(data_root, external_id)
+    direct_match = _resolve_dof_file_by_external_id(data_root, external_id, files)
     if direct_match is not None:
         return direct_match
 
@@ -536,17 +740,21 @@ def _resolve_dof_file(
         publication_date=publication_date,
     )
     if legacy_external_id:
-        return _resolve_dof_file_by_external_id(data_root, legacy_external_id)
+        return _resolve_dof_file_by_external_id(data_root, legacy_external_id, files)
     return None
 
 
-def _iter_orden_candidates(data_root: Path, external_id: str) -> Iterable[Path]:
+def _iter_orden_candidates(
+    data_root: Path,
+    external_id: str,
+    files: MountedFileLookup = _FILESYSTEM,
+) -> Iterable[Path]:
     converted_candidates = (
         data_root / "federal" / "converted" / external_id / "output.txt",
         data_root / "federal" / "converted" / external_id / "output.md",
     )
     for candidate in converted_candidates:
-        if candidate.exists():
+        if files.exists(candidate):
             yield candidate
 
     glob_patterns = (
@@ -564,11 +772,15 @@ def _iter_orden_candidates(data_root: Path, external_id: str) -> Iterable[Path]:
         ("internacional", "html", ".html"),
     )
     for root_name, subdir_pattern, suffix in glob_patterns:
-        yield from sorted((data_root / root_name).glob(f"{subdir_pattern}/{external_id}{suffix}"))
+        yield from files.glob(data_root / root_name, f"{subdir_pattern}/{external_id}{suffix}")
 
 
-def _resolve_orden_file(data_root: Path, external_id: str) -> Optional[LocalSourceMatch]:
-    for candidate in _iter_orden_candidates(data_root, external_id):
+def _resolve_orden_file(
+    data_root: Path,
+    external_id: str,
+    files: MountedFileLookup = _FILESYSTEM,
+) -> Optional[LocalSourceMatch]:
+    for candidate in _iter_orden_candidates(data_root, external_id, files):
         return LocalSourceMatch(
             path=candidate,
             content_type=_content_type_for_path(candidate),
@@ -577,7 +789,11 @@ def _resolve_orden_file(data_root: Path, external_id: str) -> Optional[LocalSour
     return None
 
 
-def _resolve_scjn_file(data_root: Path, external_id: str) -> Optional[LocalSourceMatch]:
+def _resolve_scjn_file(
+    data_root: Path,
+    external_id: str,
+    files: MountedFileLookup = _FILESYSTEM,
+) -> Optional[LocalSourceMatch]:
     normalized = (external_id or "").strip()
     for family in SCJN_MOUNTED_FAMILIES:
         prefix = f"{family}-"
@@ -586,21 +802,21 @@ def _resolve_scjn_file(data_root: Path, external_id: str) -> Optional[LocalSourc
         doc_id = normalized.split("-", 1)[1]
         for converted_name in ("output.txt", "output.md"):
             converted_candidate = data_root / family / "converted" / doc_id / converted_name
-            if converted_candidate.exists():
+            if files.exists(converted_candidate):
                 return LocalSourceMatch(
                     path=converted_candidate,
                     content_type=_content_type_for_path(converted_candidate),
                     detail=f"{family}/converted/<id>/{converted_name}",
                 )
         api_json_candidate = data_root / family / "api_json" / f"{doc_id}.json"
-        if api_json_candidate.exists():
+        if files.exists(api_json_candidate):
             return LocalSourceMatch(
                 path=api_json_candidate,
                 content_type="application/json",
                 detail=f"{family}/api_json/<id>.json",
             )
         pdf_candidate = data_root / family / "pdf" / f"{doc_id}.pdf"
-        if pdf_candidate.exists():
+        if files.exists(pdf_candidate):
             return LocalSourceMatch(
                 path=pdf_candidate,
                 content_type="application/pdf",
@@ -616,16 +832,25 @@ def resolve_local_source_file(
     title: Optional[str] = None,
     publication_date: Optional[str] = None,
     data_root: Optional[str | Path] = None,
+    file_index: Optional[MountedFileIndex] = None,
 ) -> Optional[LocalSourceMatch]:
+    """
+    Locate the mounted source file for a document.
+
+    Pass ``file_index`` (see ``load_mounted_file_index``) to answer from a
+    prebuilt index instead of probing the mounted volume.
+    """
     root = _mounted_data_root(data_root)
+    files: MountedFileLookup = file_index if file_index is not None else _FILESYSTEM
     if source == "cas":
-        return _resolve_cas_file(root, external_id, title=title)
+        return _resolve_cas_file(root, external_id, title=title, files=files)
     if source == "dof":
         return _resolve_dof_file(
             root,
             external_id,
             title=title,
             publication_date=publication_date,
+            files=files,
         )
 
     resolvers = {
@@ -636,7 +861,7 @@ def resolve_local_source_file(
     resolver = resolvers.get(source)
     if resolver is None:
         raise ValueError(f"Unsupported mounted-disk source: {source}")
-    return resolver(root, external_id)
+    return resolver(root, external_id, files)
 
 
 def _build_mounted_record(
@@ -870,28 +1095,47 @@ def _iter_source_documents(
     *,
     has_storage: Optional[bool] = None,
     select_columns: str = BACKFILL_SELECT,
+    incomplete_only: bool = False,
 ) -> Iterable[dict[str, Any]]:
-    offset = 0
-    while True:
+    def _query() -> Any:
+        query = _build_source_documents_query(
+            client,
+            source,
+            has_storage=has_storage,
+            select_columns=select_columns,
+        )
+        if incomplete_only:
+            query = query.or_(INCOMPLETE_EMBEDDING_FILTER)
+        return query
+
+    yield from iter_keyset_rows(_query, page_size=FETCH_PAGE_SIZE)
+
+
+def _count_completed_documents(
+    client: Any,
+    source: str,
+    *,
+    has_storage: Optional[bool] = None,
+) -> int:
+    try:
         response = (
             _build_source_documents_query(
                 client,
                 source,
                 has_storage=has_storage,
-                select_columns=select_columns,
+                select_columns="id",
+                count="exact",
+                head=True,
             )
-            .order("created_at", desc=True)
-            .range(offset, offset + FETCH_PAGE_SIZE - 1)
+            .eq("embedding_status", TERMINAL_EMBEDDING_STATUS)
+            .gt("chunk_count", 0)
             .execute()
         )
-        rows = getattr(response, "data", None) or []
-        if not rows:
-            break
-        for row in rows:
-            yield row
-        if len(rows) < FETCH_PAGE_SIZE:
-            break
-        offset += FETCH_PAGE_SIZE
+    except Exception as exc:
+        logger.warning("Could not count completed %s documents: %s", source, exc)
+        return 0
+    count = getattr(response, "count", None)
+    return count if isinstance(count, int) else 0
 
 
 def _lookup_document_by_external_id(
@@ -1105,34 +1349,6 @@ def _lookup_document_id(client: Any, source: str, external_id: str) -> Optional[
     return None
 
 
-def _upsert_document_aliases(
-    client: Any,
-    source: str,
-    document_id: str,
-    external_id: str,
-    aliases: Iterable[DocumentAlias],
-) -> int:
-    rows = [
-        {
-            "document_id": document_id,
-            "source_type": source,
-            "alias_type": alias.alias_type,
-            "alias_value": alias.alias_value,
-        }
-        for alias in _iter_unique_aliases(external_id, aliases)
-    ]
-    if not rows:
-        return 0
-    try:
-        client.table(SCRAPER_DOCUMENT_ALIASES_TABLE).upsert(
-            rows,
-            on_conflict="source_type,alias_value",
-        ).execute()
-    except Exception:
-        return 0
-    return len(rows)
-
-
 def _filter_missing_aliases(
     documents_by_external_id: dict[str, dict[str, Any]],
     documents_by_alias: dict[str, dict[str, Any]],
@@ -1184,13 +1400,231 @@ def _build_registration_upsert_row(
     return update_fields
 
 
+def _positive_env_int(name: str, default: int) -> int:
+    raw_value = os.environ.get(name, "").strip()
+    if not raw_value:
+        return default
+    try:
+        return max(int(raw_value), 1)
+    except Exception:
+        logger.warning("Invalid %s=%s", name, raw_value)
+        return default
+
+
+def _lookup_document_ids(
+    client: Any,
+    source: str,
+    external_ids: list[str],
+) -> dict[str, str]:
+    found: dict[str, str] = {}
+    for start in range(0, len(external_ids), BOOTSTRAP_LOOKUP_BATCH_SIZE):
+        batch = external_ids[start : start + BOOTSTRAP_LOOKUP_BATCH_SIZE]
+        try:
+            response = (
+                client.table("scraper_documents")
+                .select("id, external_id")
+                .eq("source_type", source)
+                .in_("external_id", batch)
+                .execute()
+            )
+            for row in getattr(response, "data", None) or []:
+                if row.get("id") and row.get("external_id"):
+                    found[str(row["external_id"])] = row["id"]
+        except Exception:
+            for external_id in batch:
+                document_id = _lookup_document_id(client, source, external_id)
+                if document_id:
+                    found[external_id] = document_id
+    return found
+
+
+@dataclass
+class _PendingRegistration:
+    record: MountedCorpusRecord
+    existing_row: Optional[dict[str, Any]]
+    row: Optional[dict[str, Any]]
+    document_id: Optional[str]
+    error: Optional[str] = None
+
+
+class _RegistrationBatch:
+    """
+    Accumulates bootstrap registrations and flushes them as bulk upserts.
+
+    Rows are grouped by their column set before upserting, because PostgREST
+    bulk upserts null out columns missing from individual payloads. A failing
+    bulk request is retried row by row so one bad record does not sink the page.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        source: str,
+        documents_by_external_id: dict[str, dict[str, Any]],
+        documents_by_alias: dict[str, dict[str, Any]],
+        result: dict[str, Any],
+        *,
+        alias_batch_size: int,
+    ):
+        self.client = client
+        self.source = source
+        self.documents_by_external_id = documents_by_external_id
+        self.documents_by_alias = documents_by_alias
+        self.result = result
+        self.alias_batch_size = alias_batch_size
+        self.pending: list[_PendingRegistration] = []
+        self._pending_keys: set[str] = set()
+        self.pending_new_rows = 0
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def conflicts_with(self, record: MountedCorpusRecord) -> bool:
+        if record.external_id in self._pending_keys:
+            return True
+        return any(
+            alias.alias_value in self._pending_keys
+            for alias in _iter_unique_aliases(record.external_id, record.aliases)
+        )
+
+    def add(self, entry: _PendingRegistration) -> None:
+        self.pending.append(entry)
+        self._pending_keys.add(entry.record.external_id)
+        self._pending_keys.update(
+            alias.alias_value
+            for alias in _iter_unique_aliases(entry.record.external_id, entry.record.aliases)
+        )
+        if entry.existing_row is None:
+            self.pending_new_rows += 1
+
+    def _upsert_documents(self, entries: list[_PendingRegistration]) -> None:
+        groups: dict[tuple[str, ...], list[_PendingRegistration]] = {}
+        for entry in entries:
+            if entry.row is not None:
+                groups.setdefault(tuple(sorted(entry.row)), []).append(entry)
+
+        for group in groups.values():
+            try:
+                response = self.client.table("scraper_documents").upsert(
+                    [entry.row for entry in group],
+                    on_conflict="source_type,external_id",
+                ).execute()
+                returned = {
+                    str(row.get("external_id")): row.get("id")
+                    for row in getattr(response, "data", None) or []
+                    if row.get("id")
+                }
+                for entry in group:
+                    entry.document_id = returned.get(entry.record.external_id) or entry.document_id
+            except Exception:
+                for entry in group:
+                    try:
+                        response = self.client.table("scraper_documents").upsert(
+                            entry.row,
+                            on_conflict="source_type,external_id",
+                        ).execute()
+                        rows = getattr(response, "data", None) or []
+                        if rows and rows[0].get("id"):
+                            entry.document_id = rows[0]["id"]
+                    except Exception as exc:
+                        entry.error = str(exc)
+
+        unresolved = [
+            entry.record.external_id
+            for entry in entries
+            if entry.error is None and entry.row is not None and not entry.document_id
+        ]
+        if unresolved:
+            found = _lookup_document_ids(self.client, self.source, unresolved)
+            for entry in entries:
+                if entry.error is None and not entry.document_id:
+                    entry.document_id = found.get(entry.record.external_id)
+
+    def _upsert_aliases(self, alias_rows: list[dict[str, Any]]) -> None:
+        table = self.client.table
+        for start in range(0, len(alias_rows), self.alias_batch_size):
+            page = alias_rows[start : start + self.alias_batch_size]
+            try:
+                table(SCRAPER_DOCUMENT_ALIASES_TABLE).upsert(
+                    page,
+                    on_conflict="source_type,alias_value",
+                ).execute()
+                self.result["alias_rows_upserted"] += len(page)
+            except Exception:
+                for alias_row in page:
+                    try:
+                        table(SCRAPER_DOCUMENT_ALIASES_TABLE).upsert(
+                            alias_row,
+                            on_conflict="source_type,alias_value",
+                        ).execute()
+                        self.result["alias_rows_upserted"] += 1
+                    except Exception:
+                        continue
+
+    def flush(self) -> None:
+        entries, self.pending = self.pending, []
+        self._pending_keys = set()
+        self.pending_new_rows = 0
+        if not entries:
+            return
+
+        self._upsert_documents(entries)
+
+        alias_rows: list[dict[str, Any]] = []
+        for entry in entries:
+            record = entry.record
+            if entry.error is not None:
+                self.result["errors"].append(f"{record.external_id}: {entry.error}")
+                continue
+            document_id = entry.document_id
+            if document_id:
+                for alias in _filter_missing_aliases(
+                    self.documents_by_external_id,
+                    self.documents_by_alias,
+                    record.external_id,
+                    record.aliases,
+                ):
+                    alias_rows.append(
+                        {
+                            "document_id": document_id,
+                            "source_type": self.source,
+                            "alias_type": alias.alias_type,
+                            "alias_value": alias.alias_value,
+                        }
+                    )
+                refreshed_row = dict(entry.existing_row or {})
+                if entry.row is not None:
+                    refreshed_row.update(entry.row)
+                refreshed_row["id"] = document_id
+                self.documents_by_external_id[record.external_id] = refreshed_row
+                for alias in _iter_unique_aliases(record.external_id, record.aliases):
+                    self.documents_by_alias[alias.alias_value] = refreshed_row
+            if entry.existing_row is None:
+                self.result["registered_rows"] += 1
+            else:
+                self.result["existing_registered_rows"] += 1
+
+        if alias_rows:
+            self._upsert_aliases(alias_rows)
+
+
 def bootstrap_source_documents_from_mounted_disk(
     source: str,
     *,
     data_root: Optional[str | Path] = None,
     supabase_client: Any | None = None,
     limit: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    alias_batch_size: Optional[int] = None,
 ) -> dict[str, Any]:
+    """
+    Register mounted corpus records in ``scraper_documents`` and their aliases.
+
+    Registrations are upserted in pages of ``batch_size`` rows and aliases in
+    pages of ``alias_batch_size`` (``SCRAPER_BOOTSTRAP_UPSERT_BATCH_SIZE`` /
+    ``SCRAPER_BOOTSTRAP_ALIAS_BATCH_SIZE`` when omitted); ``batch_size=1``
+    restores one round trip per record.
+    """
     if source not in SUPPORTED_BACKFILL_SOURCES:
         raise ValueError(f"Unsupported source: {source}")
 
@@ -1198,6 +1632,19 @@ def bootstrap_source_documents_from_mounted_disk(
     if not root.exists():
         raise FileNotFoundError(f"Mounted data root not found: {root}")
 
+    if batch_size is None:
+        batch_size = _positive_env_int(
+            "SCRAPER_BOOTSTRAP_UPSERT_BATCH_SIZE",
+            DEFAULT_BOOTSTRAP_UPSERT_BATCH_SIZE,
+        )
+    if alias_batch_size is None:
+        alias_batch_size = _positive_env_int(
+            "SCRAPER_BOOTSTRAP_ALIAS_BATCH_SIZE",
+            DEFAULT_BOOTSTRAP_ALIAS_BATCH_SIZE,
+        )
+    batch_size = max(int(batch_size), 1)
+
+    started_at = time.monotonic()
     client = supabase_client or _get_supabase_client_from_env()
     documents_by_external_id, documents_by_alias = _load_source_identity_index(client, source)
     result = {
@@ -1208,10 +1655,20 @@ def bootstrap_source_documents_from_mounted_disk(
         "alias_rows_upserted": 0,
         "errors": [],
     }
+    batch = _RegistrationBatch(
+        client,
+        source,
+        documents_by_external_id,
+        documents_by_alias,
+        result,
+        alias_batch_size=max(int(alias_batch_size), 1),
+    )
 
     for record in _iter_mounted_corpus_records(source, root):
-        if limit is not None and result["registered_rows"] >= limit:
+        if limit is not None and result["registered_rows"] + batch.pending_new_rows >= limit:
             break
+        if batch.conflicts_with(record):
+            batch.flush()
         result["scanned_records"] += 1
         try:
             existing_row = _find_document_in_identity_index(
@@ -1222,48 +1679,17 @@ def bootstrap_source_documents_from_mounted_disk(
             )
             row = _build_registration_upsert_row(source, record, existing_row)
             document_id = str((existing_row or {}).get("id") or "").strip() or None
-
-            if row is not None:
-                response = client.table("scraper_documents").upsert(
-                    row,
-                    on_conflict="source_type,external_id",
-                ).execute()
-                rows = getattr(response, "data", None) or []
-                if rows:
-                    document_id = rows[0].get("id")
-                if not document_id:
-                    document_id = _lookup_document_id(client, source, record.external_id)
-
-            alias_rows = _filter_missing_aliases(
-                documents_by_external_id,
-                documents_by_alias,
-                record.external_id,
-                record.aliases,
-            )
-            if document_id and alias_rows:
-                result["alias_rows_upserted"] += _upsert_document_aliases(
-                    client,
-                    source,
-                    document_id,
-                    record.external_id,
-                    alias_rows,
-                )
-
-            if document_id:
-                refreshed_row = dict(existing_row or {})
-                if row is not None:
-                    refreshed_row.update(row)
-                refreshed_row["id"] = document_id
-                documents_by_external_id[record.external_id] = refreshed_row
-                for alias in _iter_unique_aliases(record.external_id, record.aliases):
-                    documents_by_alias[alias.alias_value] = refreshed_row
-            if existing_row is None:
-                result["registered_rows"] += 1
-            else:
-                result["existing_registered_rows"] += 1
         except Exception as exc:
             result["errors"].append(f"{record.external_id}: {exc}")
-
+            continue
+        batch.add(_PendingRegistration(record, existing_row, row, document_id))
+        if len(batch) >= batch_size:
+            batch.flush()
+
+    batch.flush()
+    elapsed = time.monotonic() - started_at
+    result["elapsed_seconds"] = round(elapsed, 3)
+    result["records_per_second"] = round(result["scanned_records"] / elapsed, 1) if elapsed > 0 else 0.0
     return result
 
 
@@ -1364,6 +1790,57 @@ class PersistedMountedFile:
     content_hash: str
 
 
+@dataclass(frozen=True)
+class BackfillConcurrency:
+    """Per-resource limits for one mounted-disk backfill pass."""
+
+    disk_io: int = DEFAULT_BACKFILL_DISK_CONCURRENCY
+    uploads: int = DEFAULT_BACKFILL_UPLOAD_CONCURRENCY
+    db_updates: int = DEFAULT_BACKFILL_DB_CONCURRENCY
+    status_batch_size: int = DEFAULT_BACKFILL_STATUS_BATCH_SIZE
+
+    @classmethod
+    def from_env(cls) -> "BackfillConcurrency":
+        return cls(
+            disk_io=_positive_env_int(
+                "SCRAPER_BACKFILL_DISK_CONCURRENCY",
+                DEFAULT_BACKFILL_DISK_CONCURRENCY,
+            ),
+            uploads=_positive_env_int(
+                "SCRAPER_BACKFILL_UPLOAD_CONCURRENCY",
+                DEFAULT_BACKFILL_UPLOAD_CONCURRENCY,
+            ),
+            db_updates=_positive_env_int(
+                "SCRAPER_BACKFILL_DB_CONCURRENCY",
+                DEFAULT_BACKFILL_DB_CONCURRENCY,
+            ),
+            status_batch_size=_positive_env_int(
+                "SCRAPER_BACKFILL_STATUS_BATCH_SIZE",
+                DEFAULT_BACKFILL_STATUS_BATCH_SIZE,
+            ),
+        )
+
+
+class _BackfillLimits:
+    def __init__(self, concurrency: BackfillConcurrency):
+        self.concurrency = concurrency
+        self.disk_io = asyncio.Semaphore(max(concurrency.disk_io, 1))
+        self.uploads = asyncio.Semaphore(max(concurrency.uploads, 1))
+        self.db_updates = asyncio.Semaphore(max(concurrency.db_updates, 1))
+        # Bound scheduled documents so a 5000-document pass does not hold
+        # thousands of idle tasks.
+        self.in_flight = asyncio.Semaphore(
+            max(concurrency.disk_io, concurrency.uploads, concurrency.db_updates, 1) * 4
+        )
+
+
+async def _hash_local_file(path: Path, limits: Optional[_BackfillLimits]) -> str:
+    if limits is None:
+        return _sha256_for_path(path)
+    async with limits.disk_io:
+        return await asyncio.to_thread(_sha256_for_path, path)
+
+
 async def _persist_local_match(
     storage_adapter: SupabaseStorageAdapter,
     source: str,
@@ -1371,6 +1848,8 @@ async def _persist_local_match(
     local_match: LocalSourceMatch,
     *,
     root: Path,
+    limits: Optional[_BackfillLimits] = None,
+    hash_index: Optional[StorageHashIndex] = None,
 ) -> PersistedMountedFile:
     file_size_bytes = local_match.path.stat().st_size
     if _prefer_direct_mounted_backfill_for_source(source):
@@ -1378,7 +1857,7 @@ async def _persist_local_match(
             storage_path=_build_mounted_storage_path(root, local_match),
             reused_existing=True,
             file_size_bytes=file_size_bytes,
-            content_hash=_sha256_for_path(local_match.path),
+            content_hash=await _hash_local_file(local_match.path, limits),
         )
 
     if local_match.path.suffix.lower() == ".json":
@@ -1386,7 +1865,7 @@ async def _persist_local_match(
             storage_path=_build_mounted_storage_path(root, local_match),
             reused_existing=True,
             file_size_bytes=file_size_bytes,
-            content_hash=_sha256_for_path(local_match.path),
+            content_hash=await _hash_local_file(local_match.path, limits),
         )
 
     if _prefer_mounted_path_for_large_files(file_size_bytes):
@@ -1394,21 +1873,38 @@ async def _persist_local_match(
             storage_path=_build_mounted_storage_path(root, local_match),
             reused_existing=True,
             file_size_bytes=file_size_bytes,
-            content_hash=_sha256_for_path(local_match.path),
+            content_hash=await _hash_local_file(local_match.path, limits),
         )
 
     try:
-        storage_path, reused_existing, content = await _upload_or_reuse_local_file(
-            storage_adapter,
-            source,
-            external_id,
-            local_match,
-        )
+        content_hash = await _hash_local_file(local_match.path, limits)
+        reused_existing = False
+
+        async def _upload() -> str:
+            nonlocal reused_existing
+            storage_path, reused_existing = await _upload_or_reuse_local_file(
+                storage_adapter,
+                source,
+                external_id,
+                local_match,
+                limits=limits,
+            )
+            return storage_path
+
+        if hash_index is None:
+            storage_path = await _upload()
+        else:
+            storage_path, deduplicated = await hash_index.upload_or_link(
+                content_hash,
+                file_size_bytes,
+                _upload,
+            )
+            reused_existing = reused_existing or deduplicated
         return PersistedMountedFile(
             storage_path=storage_path,
             reused_existing=reused_existing,
-            file_size_bytes=len(content),
-            content_hash=hashlib.sha256(content).hexdigest(),
+            file_size_bytes=file_size_bytes,
+            content_hash=content_hash,
         )
     except Exception as exc:
         if not (_storage_payload_too_large_error(exc) or _storage_timeout_error(exc)):
@@ -1417,7 +1913,7 @@ async def _persist_local_match(
             storage_path=_build_mounted_storage_path(root, local_match),
             reused_existing=True,
             file_size_bytes=file_size_bytes,
-            content_hash=_sha256_for_path(local_match.path),
+            content_hash=await _hash_local_file(local_match.path, limits),
         )
 
 
@@ -1426,17 +1922,21 @@ async def _upload_or_reuse_local_file(
     source: str,
     external_id: str,
     local_match: LocalSourceMatch,
-) -> tuple[str, bool, bytes]:
-    content = local_match.path.read_bytes()
+    *,
+    limits: Optional[_BackfillLimits] = None,
+) -> tuple[str, bool]:
+    # Hand the adapter the path so the file is streamed rather than read
+    # into memory.
     try:
-        storage_path = await storage_adapter.upload(
-            content=content,
-            source_type=source,
-            doc_id=external_id,
-            content_type=local_match.content_type,
-            file_extension=local_match.path.suffix.lower(),
-        )
-        return storage_path, False, content
+        async with limits.uploads if limits is not None else nullcontext():
+            storage_path = await storage_adapter.upload(
+                content=local_match.path,
+                source_type=source,
+                doc_id=external_id,
+                content_type=local_match.content_type,
+                file_extension=local_match.path.suffix.lower(),
+            )
+        return storage_path, False
     except Exception as exc:
         if not _duplicate_storage_error(exc):
             raise
@@ -1446,7 +1946,7 @@ async def _upload_or_reuse_local_file(
             content_type=local_match.content_type,
             file_extension=local_match.path.suffix.lower(),
         )
-        return storage_path, True, content
+        return storage_path, True
 
 
 async def _storage_path_exists(storage_adapter: SupabaseStorageAdapter, storage_path: str) -> bool:
@@ -1468,6 +1968,84 @@ def _update_document_row(client: Any, document_id: str, fields: dict[str, Any])
     client.table("scraper_documents").update(payload).eq("id", document_id).execute()
 
 
+def _update_document_rows(client: Any, document_ids: list[str], fields: dict[str, Any]) -> None:
+    if not document_ids or not fields:
+        return
+    payload = {**fields, "updated_at": datetime.now(timezone.utc).isoformat()}
+    status = str(fields.get("embedding_status") or "").strip().lower()
+    if status in {"pending", AWAITING_SOURCE_STATUS}:
+        payload["processing_started_at"] = None
+        payload["processed_at"] = None
+    client.table("scraper_documents").update(payload).in_("id", document_ids).execute()
+
+
+@dataclass
+class _DocumentBackfillOutcome:
+    external_id: str
+    document_id: str
+    missing_local_file: bool = False
+    queued_existing_storage: bool = False
+    uploaded: bool = False
+    reused_storage_object: bool = False
+    updated_row: bool = False
+    queue_for_embedding: bool = False
+    error: Optional[str] = None
+
+    def fail(self, exc: Exception) -> None:
+        logger.warning("Mounted-disk backfill failed for %s: %s", self.external_id, exc)
+        if self.error is None:
+            self.error = f"{self.external_id}: {exc}"
+
+
+class _StatusUpdateBatcher:
+    """Coalesces status-only row updates into ``update ... where id in (...)`` calls."""
+
+    def __init__(self, client: Any, limits: _BackfillLimits):
+        self._client = client
+        self._limits = limits
+        self._pending: dict[str, list[_DocumentBackfillOutcome]] = {}
+
+    async def add(self, outcome: _DocumentBackfillOutcome, status: str) -> None:
+        outcome.updated_row = True
+        batch = self._pending.setdefault(status, [])
+        batch.append(outcome)
+        if len(batch) >= self._limits.concurrency.status_batch_size:
+            await self._flush_status(status)
+
+    async def _flush_status(self, status: str) -> None:
+        outcomes = self._pending.pop(status, [])
+        if not outcomes:
+            return
+        fields = {"embedding_status": status}
+        async with self._limits.db_updates:
+            try:
+                await asyncio.to_thread(
+                    _update_document_rows,
+                    self._client,
+                    [outcome.document_id for outcome in outcomes],
+                    fields,
+                )
+                return
+            except Exception as exc:
+                logger.warning("Batched %s status update failed, retrying per row: %s", status, exc)
+            for outcome in outcomes:
+                try:
+                    await asyncio.to_thread(
+                        _update_document_row,
+                        self._client,
+                        outcome.document_id,
+                        fields,
+                    )
+                except Exception as exc:
+                    outcome.updated_row = False
+                    outcome.queue_for_embedding = False
+                    outcome.fail(exc)
+
+    async def flush(self) -> None:
+        for status in list(self._pending):
+            await self._flush_status(status)
+
+
 def _count_documents_missing_storage(client: Any, source: str) -> int:
     try:
         response = _build_source_documents_query(
@@ -1532,9 +2110,7 @@ async def _wait_for_workflow_result(job_id: str) -> Optional[dict[str, Any]]:
     if not config.enabled or not config.address:
         return None
 
-    from temporalio.client import Client
-
-    client = await Client.connect(config.address, namespace=config.namespace)
+    client = await get_temporal_client_pool().get(config.address, config.namespace)
     workflow_id = f"{TemporalScraperClient.WORKFLOW_ID_PREFIX}{job_id}"
     handle = client.get_workflow_handle(workflow_id)
     return await handle.result()
@@ -1567,7 +2143,17 @@ async def backfill_source_from_mounted_disk(
     supabase_client: Any | None = None,
     storage_adapter: SupabaseStorageAdapter | None = None,
     temporal_client: TemporalScraperClient | Any | None = None,
+    concurrency: BackfillConcurrency | None = None,
 ) -> MountedBackfillResult:
+    """
+    Run one backfill pass: attach mounted files to pending documents and
+    queue them for embedding.
+
+    Documents are classified in scan order (so ``limit`` and the result
+    counters are deterministic), then hashed, uploaded and updated
+    concurrently within the ``concurrency`` limits
+    (``BackfillConcurrency.from_env()`` when omitted).
+    """
     if source not in SUPPORTED_BACKFILL_SOURCES:
         raise ValueError(f"Unsupported source: {source}")
 
@@ -1583,12 +2169,99 @@ async def backfill_source_from_mounted_disk(
     temporal = temporal_client or TemporalScraperClient()
 
     result = MountedBackfillResult(source=source)
-    embedding_document_ids: list[str] = []
+    file_index = (
+        await asyncio.to_thread(load_mounted_file_index, root, source)
+        if mounted_file_index_enabled()
+        else None
+    )
+    limits = _BackfillLimits(concurrency or BackfillConcurrency.from_env())
+    status_updates = _StatusUpdateBatcher(client, limits)
+    hash_index = StorageHashIndex(client, storage)
+    outcomes: list[_DocumentBackfillOutcome] = []
+    tasks: list[asyncio.Task] = []
+
+    async def _persist_and_update(
+        outcome: _DocumentBackfillOutcome,
+        local_match: LocalSourceMatch,
+    ) -> None:
+        persisted = await _persist_local_match(
+            storage,
+            source,
+            outcome.external_id,
+            local_match,
+            root=root,
+            limits=limits,
+            hash_index=hash_index,
+        )
+        update_fields = {
+            "storage_path": persisted.storage_path,
+            "file_size_bytes": persisted.file_size_bytes,
+            "content_hash": persisted.content_hash,
+            "embedding_status": "pending",
+        }
+        async with limits.db_updates:
+            await asyncio.to_thread(_update_document_row, client, outcome.document_id, update_fields)
+        outcome.updated_row = True
+        if persisted.reused_existing:
+            outcome.reused_storage_object = True
+        else:
+            outcome.uploaded = True
+        outcome.queue_for_embedding = True
+
+    async def _mark_missing(outcome: _DocumentBackfillOutcome) -> None:
+        outcome.missing_local_file = True
+        await status_updates.add(outcome, AWAITING_SOURCE_STATUS)
+
+    async def _process_stored_document(
+        outcome: _DocumentBackfillOutcome,
+        storage_path: str,
+        local_match: Optional[LocalSourceMatch],
+    ) -> None:
+        if local_match is not None and _storage_suffix(storage_path) != local_match.path.suffix.lower():
+            await _persist_and_update(outcome, local_match)
+            return
+
+        async with limits.uploads:
+            storage_exists = await _storage_path_exists(storage, storage_path)
+        if storage_exists:
+            outcome.queued_existing_storage = True
+            outcome.queue_for_embedding = True
+            await status_updates.add(outcome, "pending")
+            return
+
+        if local_match is None:
+            await _mark_missing(outcome)
+            return
+
+        await _persist_and_update(outcome, local_match)
+
+    async def _run_document(outcome: _DocumentBackfillOutcome, work: Any) -> None:
+        try:
+            await work
+        except Exception as exc:
+            outcome.fail(exc)
+        finally:
+            limits.in_flight.release()
+
+    async def _schedule(outcome: _DocumentBackfillOutcome, work: Any) -> None:
+        await limits.in_flight.acquire()
+        tasks.append(asyncio.create_task(_run_document(outcome, work)))
+
     stage_filters = [True, False] if include_existing_storage else [False]
     seen_document_ids: set[str] = set()
 
     for require_storage in stage_filters:
-        for doc in _iter_source_documents(client, source, has_storage=require_storage):
+        result.already_completed += _count_completed_documents(
+            client,
+            source,
+            has_storage=require_storage,
+        )
+        for doc in _iter_source_documents(
+            client,
+            source,
+            has_storage=require_storage,
+            incomplete_only=True,
+        ):
             document_id = doc.get("id")
             if not document_id or document_id in seen_document_ids:
                 continue
@@ -1600,7 +2273,11 @@ async def backfill_source_from_mounted_disk(
                 continue
 
             storage_path = str(doc.get("storage_path") or "").strip()
-            current_status = str(doc.get("embedding_status") or "").strip().lower()
+            outcome = _DocumentBackfillOutcome(
+                external_id=str(doc.get("external_id") or ""),
+                document_id=document_id,
+            )
+            outcomes.append(outcome)
 
             try:
                 if storage_path:
@@ -1609,75 +2286,16 @@ async def backfill_source_from_mounted_disk(
                     result.eligible += 1
                     local_match = resolve_local_source_file(
                         source,
-                        str(doc.get("external_id") or ""),
+                        outcome.external_id,
                         title=str(doc.get("title") or ""),
                         publication_date=str(doc.get("publication_date") or ""),
                         data_root=root,
+                        file_index=file_index,
                     )
-                    if local_match is not None and _storage_suffix(storage_path) != local_match.path.suffix.lower():
-                        persisted = await _persist_local_match(
-                            storage,
-                            source,
-                            str(doc.get("external_id") or ""),
-                            local_match,
-                            root=root,
-                        )
-                        update_fields = {
-                            "storage_path": persisted.storage_path,
-                            "file_size_bytes": persisted.file_size_bytes,
-                            "content_hash": persisted.content_hash,
-                            "embedding_status": "pending",
-                        }
-                        _update_document_row(client, document_id, update_fields)
-                        result.updated_rows += 1
-                        if persisted.reused_existing:
-                            result.reused_storage_object += 1
-                        else:
-                            result.uploaded += 1
-                        embedding_document_ids.append(document_id)
-                        continue
-
-                    if await _storage_path_exists(storage, storage_path):
-                        result.queued_existing_storage += 1
-                        _update_document_row(
-                            client,
-                            document_id,
-                            {"embedding_status": "pending"},
-                        )
-                        result.updated_rows += 1
-                        embedding_document_ids.append(document_id)
-                        continue
-
-                    if local_match is None:
-                        result.missing_local_file += 1
-                        _update_document_row(
-                            client,
-                            document_id,
-                            {"embedding_status": AWAITING_SOURCE_STATUS},
-                        )
-                        result.updated_rows += 1
-                        continue
-
-                    persisted = await _persist_local_match(
-                        storage,
-                        source,
-                        str(doc.get("external_id") or ""),
-                        local_match,
-                        root=root,
+                    await _schedule(
+                        outcome,
+                        _process_stored_document(outcome, storage_path, local_match),
                     )
-                    update_fields = {
-                        "storage_path": persisted.storage_path,
-                        "file_size_bytes": persisted.file_size_bytes,
-                        "content_hash": persisted.content_hash,
-                        "embedding_status": "pending",
-                    }
-                    _update_document_row(client, document_id, update_fields)
-                    result.updated_rows += 1
-                    if persisted.reused_existing:
-                        result.reused_storage_object += 1
-                    else:
-                        result.uploaded += 1
-                    embedding_document_ids.append(document_id)
                     continue
 
                 if not _should_retry_awaiting_source(doc):
@@ -1685,54 +2303,46 @@ async def backfill_source_from_mounted_disk(
 
                 local_match = resolve_local_source_file(
                     source,
-                    str(doc.get("external_id") or ""),
+                    outcome.external_id,
                     title=str(doc.get("title") or ""),
                     publication_date=str(doc.get("publication_date") or ""),
                     data_root=root,
+                    file_index=file_index,
                 )
                 if local_match is None:
-                    result.missing_local_file += 1
-                    _update_document_row(
-                        client,
-                        document_id,
-                        {"embedding_status": AWAITING_SOURCE_STATUS},
-                    )
-                    result.updated_rows += 1
+                    await _schedule(outcome, _mark_missing(outcome))
                     continue
 
                 if result.eligible >= limit:
                     break
                 result.eligible += 1
-
-                persisted = await _persist_local_match(
-                    storage,
-                    source,
-                    str(doc.get("external_id") or ""),
-                    local_match,
-                    root=root,
-                )
-                update_fields = {
-                    "storage_path": persisted.storage_path,
-                    "file_size_bytes": persisted.file_size_bytes,
-                    "content_hash": persisted.content_hash,
-                    "embedding_status": "pending",
-                }
-                _update_document_row(client, document_id, update_fields)
-                result.updated_rows += 1
-                if persisted.reused_existing:
-                    result.reused_storage_object += 1
-                else:
-                    result.uploaded += 1
-                embedding_document_ids.append(document_id)
+                await _schedule(outcome, _persist_and_update(outcome, local_match))
 
             except Exception as exc:
-                message = f"{doc.get('external_id', '?')}: {exc}"
-                logger.warning("Mounted-disk backfill failed for %s: %s", doc.get("external_id"), exc)
-                result.errors.append(message)
+                outcome.fail(exc)
 
         if result.eligible >= limit:
             break
 
+    if tasks:
+        await asyncio.gather(*tasks)
+    await status_updates.flush()
+
+    result.deduplicated_uploads = hash_index.deduplicated
+    result.bytes_saved = hash_index.bytes_saved
+
+    embedding_document_ids: list[str] = []
+    for outcome in outcomes:
+        result.missing_local_file += int(outcome.missing_local_file)
+        result.queued_existing_storage += int(outcome.queued_existing_storage)
+        result.uploaded += int(outcome.uploaded)
+        result.reused_storage_object += int(outcome.reused_storage_object)
+        result.updated_rows += int(outcome.updated_row)
+        if outcome.error is not None:
+            result.errors.append(outcome.error)
+        elif outcome.queue_for_embedding:
+            embedding_document_ids.append(outcome.document_id)
+
     embedding_document_ids = list(dict.fromkeys(filter(None, embedding_document_ids)))
     if trigger_embedding and not embedding_document_ids:
         embedding_document_ids = _pending_embedding_document_ids(
@@ -1788,6 +2398,7 @@ async def backfill_source_from_mounted_disk_until_exhausted(
     supabase_client: Any | None = None,
     storage_adapter: SupabaseStorageAdapter | None = None,
     temporal_client: TemporalScraperClient | Any | None = None,
+    concurrency: BackfillConcurrency | None = None,
 ) -> MountedBackfillDrainResult:
     client = supabase_client or _get_supabase_client_from_env()
     storage = storage_adapter or _get_storage_adapter_from_env(client)
@@ -1816,6 +2427,7 @@ async def backfill_source_from_mounted_disk_until_exhausted(
             supabase_client=client,
             storage_adapter=storage,
             temporal_client=temporal,
+            concurrency=concurrency,
         )
         remaining_after = _count_documents_missing_storage(client, source)
         hydrated_this_pass = max(0, remaining_before - remaining_after)
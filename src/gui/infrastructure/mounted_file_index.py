@@ -0,0 +1,289 @@
+"""
+File index for the mounted scraper corpus.
+
+``resolve_local_source_file`` used to probe the mounted volume for every
+document (``exists()`` per candidate, prefix globs for CAS awards, twelve
+recursive globs per ``orden`` id). On the network mount those probes dominate
+backfill time, so a backfill pass scans each source's directories once and the
+resolvers answer ``exists``/``glob`` questions from memory.
+
+Indexes are revalidated against directory mtimes (adding or removing an entry
+bumps its parent's mtime) and can be persisted between runs.
+
+Environment Variables:
+    SCRAPER_MOUNTED_FILE_INDEX: Use the prebuilt index during backfill (default: true)
+    SCRAPER_MOUNTED_INDEX_DIR: Directory for persisted indexes (unset = memory only)
+"""
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+SOURCE_INDEX_ROOTS = {
+    "bjv": ("books",),
+    "cas": ("cas_pdfs", "cas/converted"),
+    "dof": ("dof",),
+    "orden": ("federal", "estatal", "internacional"),
+    "scjn": ("tesis", "ejecutorias", "votos", "acuerdos", "otros"),
+}
+_GLOB_MAGIC_RE = re.compile(r"[*?\[]")
+
+
+class FilesystemProbe:
+    """Direct filesystem lookups; the behaviour used when no index is built."""
+
+    def exists(self, path: Path) -> bool:
+        return path.exists()
+
+    def glob(self, directory: Path, pattern: str) -> list[Path]:
+        return sorted(directory.glob(pattern))
+
+
+class MountedFileIndex:
+    """In-memory set of every file under one source's mounted directories."""
+
+    def __init__(
+        self,
+        root: Path,
+        source: str,
+        files: Iterable[str],
+        directory_mtimes: dict[str, int],
+    ):
+        self.root = Path(root)
+        self.source = source
+        self.directory_mtimes = dict(directory_mtimes)
+        self._files: set[str] = set()
+        self._by_name: dict[str, list[str]] = {}
+        self._children: dict[str, list[str]] = {}
+        for relative in files:
+            self._files.add(relative)
+            parent, _, name = relative.rpartition("/")
+            self._by_name.setdefault(name, []).append(relative)
+            self._children.setdefault(parent, []).append(name)
+        for names in self._children.values():
+            names.sort()
+        self.built_at = time.time()
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def _relative(self, path: Path) -> Optional[str]:
+        try:
+            return Path(path).relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+
+    def exists(self, path: Path) -> bool:
+        relative = self._relative(path)
+        if relative is None:
+            return Path(path).exists()
+        return relative in self._files
+
+    def glob(self, directory: Path, pattern: str) -> list[Path]:
+        base = self._relative(directory)
+        if base is None:
+            return sorted(Path(directory).glob(pattern))
+        base = "" if base == "." else base
+        pattern_parts = pattern.split("/")
+        parent_pattern, name_pattern = pattern_parts[:-1], pattern_parts[-1]
+
+        if not _GLOB_MAGIC_RE.search(name_pattern):
+            candidates = self._by_name.get(name_pattern, ())
+        elif not any(_GLOB_MAGIC_RE.search(part) for part in parent_pattern):
+            parent = "/".join(part for part in (base, *parent_pattern) if part)
+            names = self._children.get(parent, [])
+            literal_prefix = _GLOB_MAGIC_RE.split(name_pattern, 1)[0]
+            start = bisect.bisect_left(names, literal_prefix)
+            candidates = []
+            for name in names[start:]:
+                if not name.startswith(literal_prefix):
+                    break
+                candidates.append(f"{parent}/{name}" if parent else name)
+        else:
+            candidates = self._files
+
+        prefix = f"{base}/" if base else ""
+        matches = []
+        for relative in candidates:
+            if not relative.startswith(prefix):
+                continue
+            parts = relative[len(prefix) :].split("/")
+            if len(parts) == len(pattern_parts) and all(
+                fnmatchcase(part, part_pattern)
+                for part, part_pattern in zip(parts, pattern_parts)
+            ):
+                matches.append(self.root / relative)
+        return sorted(matches)
+
+    def is_current(self) -> bool:
+        """Return ``True`` when no indexed directory was modified since the scan."""
+        for relative, mtime_ns in self.directory_mtimes.items():
+            try:
+                if os.stat(self.root / relative).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def to_dict(self) -> dict:
+        return {
+            "version": INDEX_FORMAT_VERSION,
+            "root": str(self.root),
+            "source": self.source,
+            "directories": self.directory_mtimes,
+            "files": sorted(self._files),
+        }
+
+
+def _scan_tree(root: Path, relative_dirs: Iterable[str]) -> tuple[list[str], dict[str, int]]:
+    files: list[str] = []
+    directory_mtimes: dict[str, int] = {}
+    visited: set[tuple[int, int]] = set()
+    pending = list(relative_dirs)
+    while pending:
+        relative = pending.pop()
+        directory = root / relative
+        try:
+            stat = os.stat(directory)
+        except OSError:
+            # Record the parent so creating the missing directory invalidates us.
+            parent = relative.rpartition("/")[0]
+            try:
+                directory_mtimes[parent or "."] = os.stat(root / parent).st_mtime_ns
+            except OSError:
+                pass
+            continue
+        key = (stat.st_dev, stat.st_ino)
+        if key in visited:
+            continue
+        visited.add(key)
+        directory_mtimes[relative] = stat.st_mtime_ns
+        try:
+            entries = list(os.scandir(directory))
+        except OSError as exc:
+            logger.warning("Could not list mounted directory %s: %s", directory, exc)
+            continue
+        for entry in entries:
+            child = f"{relative}/{entry.name}"
+            try:
+                if entry.is_dir():
+                    pending.append(child)
+                elif entry.is_file():
+                    files.append(child)
+            except OSError:
+                continue
+    return files, directory_mtimes
+
+
+def build_mounted_file_index(root: Path, source: str) -> MountedFileIndex:
+    relative_dirs = SOURCE_INDEX_ROOTS.get(source)
+    if relative_dirs is None:
+        raise ValueError(f"Unsupported mounted-disk source: {source}")
+    started = time.monotonic()
+    files, directory_mtimes = _scan_tree(Path(root), relative_dirs)
+    index = MountedFileIndex(Path(root), source, files, directory_mtimes)
+    logger.info(
+        "Indexed %s mounted files for %s under %s in %.2fs",
+        len(index),
+        source,
+        root,
+        time.monotonic() - started,
+    )
+    return index
+
+
+def mounted_file_index_enabled() -> bool:
+    raw_value = os.environ.get("SCRAPER_MOUNTED_FILE_INDEX", "true").strip().lower()
+    return raw_value not in {"0", "false", "no"}
+
+
+def _persisted_index_path(root: Path, source: str) -> Optional[Path]:
+    raw_dir = os.environ.get("SCRAPER_MOUNTED_INDEX_DIR", "").strip()
+    if not raw_dir:
+        return None
+    digest = hashlib.sha1(str(Path(root).resolve()).encode("utf-8")).hexdigest()[:12]
+    return Path(raw_dir) / f"{source}-{digest}.json"
+
+
+def _load_persisted_index(path: Path, root: Path, source: str) -> Optional[MountedFileIndex]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        logger.warning("Ignoring unreadable mounted file index %s: %s", path, exc)
+        return None
+    if (
+        payload.get("version") != INDEX_FORMAT_VERSION
+        or payload.get("source") != source
+        or payload.get("root") != str(root)
+    ):
+        return None
+    return MountedFileIndex(
+        root,
+        source,
+        payload.get("files") or [],
+        {key: int(value) for key, value in (payload.get("directories") or {}).items()},
+    )
+
+
+def _save_persisted_index(path: Path, index: MountedFileIndex) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Backfill workers may save the same index at once; never share a temp file.
+        tmp_path = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(index.to_dict()), encoding="utf-8")
+        tmp_path.replace(path)
+    except Exception as exc:
+        logger.warning("Could not persist mounted file index %s: %s", path, exc)
+
+
+_index_cache: dict[tuple[str, str], MountedFileIndex] = {}
+_index_cache_lock = threading.Lock()
+
+
+def load_mounted_file_index(root: Path, source: str) -> MountedFileIndex:
+    """
+    Return an up-to-date index for ``source`` under ``root``.
+
+    Reuses the in-memory or persisted index when none of its directories
+    changed since it was built, otherwise rescans.
+    """
+    root = Path(root)
+    cache_key = (str(root), source)
+    with _index_cache_lock:
+        cached = _index_cache.get(cache_key)
+    if cached is not None and cached.is_current():
+        return cached
+
+    persisted_path = _persisted_index_path(root, source)
+    index = None
+    if persisted_path is not None:
+        index = _load_persisted_index(persisted_path, root, source)
+        if index is not None and not index.is_current():
+            index = None
+    if index is None:
+        index = build_mounted_file_index(root, source)
+        if persisted_path is not None:
+            _save_persisted_index(persisted_path, index)
+
+    with _index_cache_lock:
+        _index_cache[cache_key] = index
+    return index
+
+
+def clear_mounted_file_index_cache() -> None:
+    with _index_cache_lock:
+        _index_cache.clear()
@@ -15,11 +15,14 @@ Workflow Input:
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
 import re
 import subprocess
+import time
 from html import unescape
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -32,6 +35,12 @@ from zipfile import ZipFile
 
 from temporalio import activity, workflow
 
+from src.gui.infrastructure.embedding_cache import chunk_text_hash, get_embedding_cache
+from src.gui.infrastructure.supabase_pagination import (
+    INCOMPLETE_EMBEDDING_FILTER,
+    iter_keyset_pages,
+)
+
 logger = logging.getLogger(__name__)
 
 EMBEDDING_MODEL = "qwen/qwen3-embedding-8b"
@@ -39,6 +48,10 @@ EMBEDDING_VECTOR_SIZE = 4000
 EMBEDDING_BATCH_SIZE = 32
 CHUNK_MAX_TOKENS = 900
 CHUNK_MAX_CHARS = 6000
+TOKEN_COUNT_CACHE_SIZE = 16384
+# Only short strings (words, headings, sentence fragments) repeat often enough
+# to be worth caching; whole paragraphs and chunks would just pin memory.
+TOKEN_COUNT_CACHE_MAX_CHARS = 256
 UNSTRUCTURED_SKIP_TYPES = {"Header", "Footer", "PageBreak", "Image"}
 UNSTRUCTURED_HEADING_TYPES = {"Title"}
 SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9ÁÉÍÓÚÑ])")
@@ -62,6 +75,10 @@ SOURCE_FILE_PENDING_STATUS = "pending"
 FETCH_PAGE_SIZE = 200
 DOCUMENT_ID_QUERY_BATCH_SIZE = 100
 DEFAULT_STALE_PROCESSING_HOURS = 24.0
+DEFAULT_EMBEDDING_DOCUMENT_CONCURRENCY = 1
+CHUNK_WRITE_MODE_INCREMENTAL = "incremental"
+CHUNK_WRITE_MODE_REPLACE = "replace"
+DEFAULT_CHUNK_UPSERT_PAGE_BYTES = 4 * 1024 * 1024
 
 
 @dataclass
@@ -98,7 +115,17 @@ def _get_token_encoder():
 def _count_tokens(text: str) -> int:
     if not text:
         return 0
+    if len(text) < TOKEN_COUNT_CACHE_MAX_CHARS:
+        return _count_tokens_cached(text)
+    return _encode_token_count(text)
+
+
+@lru_cache(maxsize=TOKEN_COUNT_CACHE_SIZE)
+def _count_tokens_cached(text: str) -> int:
+    return _encode_token_count(text)
+
 
+def _encode_token_count(text: str) -> int:
     encoder = _get_token_encoder()
     if encoder is not None:
         try:
@@ -109,6 +136,78 @@ def _count_tokens(text: str) -> int:
     return max(1, int(len(text.split()) / 0.75))
 
 
+def _token_units(text: str) -> int:
+    # Additive size measure: encoded tokens, or words when tiktoken is
+    # unavailable (the word-based estimate is only linear before rounding).
+    if _get_token_encoder() is None:
+        return len(text.split())
+    return _count_tokens(text)
+
+
+def _units_to_tokens(units: int) -> int:
+    if _get_token_encoder() is None:
+        return max(1, int(units / 0.75)) if units else 0
+    return units
+
+
+class _JoinedTextBudget:
+    """
+    Running size of ``separator.join(parts)`` for stripped parts.
+
+    Each appended part is costed once as ``separator + part`` (the separator
+    merges into the next token for spaces and stays a single token for blank
+    lines), so deciding whether one more part fits is O(len(part)) instead of
+    re-encoding the whole buffer.
+    """
+
+    def __init__(self, separator: str):
+        self.separator = separator
+        self.parts: list[str] = []
+        self.chars = 0
+        self.units = 0
+
+    def _cost(self, piece: str) -> tuple[int, int]:
+        if not self.parts:
+            return len(piece), _token_units(piece)
+        return len(self.separator) + len(piece), _token_units(self.separator + piece)
+
+    def exceeds_limits(self, piece: str) -> bool:
+        if not self.parts:
+            return False
+        chars, units = self._cost(piece)
+        return (
+            self.chars + chars > CHUNK_MAX_CHARS
+            or _units_to_tokens(self.units + units) > CHUNK_MAX_TOKENS
+        )
+
+    def append(self, piece: str) -> None:
+        chars, units = self._cost(piece)
+        self.parts.append(piece)
+        self.chars += chars
+        self.units += units
+
+    def text(self) -> str:
+        return self.separator.join(self.parts).strip()
+
+    def clear(self) -> None:
+        self.parts = []
+        self.chars = 0
+        self.units = 0
+
+
+def _split_words(text: str) -> list[str]:
+    pieces: list[str] = []
+    current = _JoinedTextBudget(" ")
+    for word in text.split():
+        if current.exceeds_limits(word):
+            pieces.append(current.text())
+            current.clear()
+        current.append(word)
+    if current.parts:
+        pieces.append(current.text())
+    return pieces
+
+
 def _split_long_text(text: str) -> list[str]:
     text = (text or "").strip()
     if not text:
@@ -119,12 +218,13 @@ def _split_long_text(text: str) -> list[str]:
 
     segments = re.split(r"\n{2,}", text)
     pieces: list[str] = []
-    current_parts: list[str] = []
+    current = _JoinedTextBudget("\n\n")
 
-    def _flush_current() -> None:
-        if current_parts:
-            pieces.append("\n\n".join(current_parts).strip())
-            current_parts.clear()
+    def _append(piece: str) -> None:
+        if current.exceeds_limits(piece):
+            pieces.append(current.text())
+            current.clear()
+        current.append(piece)
 
     for segment in segments:
         candidate = segment.strip()
@@ -134,39 +234,15 @@ def _split_long_text(text: str) -> list[str]:
         if len(candidate) > CHUNK_MAX_CHARS or _count_tokens(candidate) > CHUNK_MAX_TOKENS:
             subsegments = [s.strip() for s in SENTENCE_BOUNDARY_RE.split(candidate) if s.strip()]
             if len(subsegments) <= 1:
-                subsegments = []
-                current_words: list[str] = []
-                for word in candidate.split():
-                    tentative = " ".join(current_words + [word]).strip()
-                    if current_words and (
-                        len(tentative) > CHUNK_MAX_CHARS
-                        or _count_tokens(tentative) > CHUNK_MAX_TOKENS
-                    ):
-                        subsegments.append(" ".join(current_words).strip())
-                        current_words = [word]
-                    else:
-                        current_words.append(word)
-                if current_words:
-                    subsegments.append(" ".join(current_words).strip())
-
+                subsegments = _split_words(candidate)
             for subsegment in subsegments:
-                tentative = "\n\n".join(current_parts + [subsegment]).strip()
-                if current_parts and (
-                    len(tentative) > CHUNK_MAX_CHARS
-                    or _count_tokens(tentative) > CHUNK_MAX_TOKENS
-                ):
-                    _flush_current()
-                current_parts.append(subsegment)
+                _append(subsegment)
             continue
 
-        tentative = "\n\n".join(current_parts + [candidate]).strip()
-        if current_parts and (
-            len(tentative) > CHUNK_MAX_CHARS or _count_tokens(tentative) > CHUNK_MAX_TOKENS
-        ):
-            _flush_current()
-        current_parts.append(candidate)
+        _append(candidate)
 
-    _flush_current()
+    if current.parts:
+        pieces.append(current.text())
     return [piece for piece in pieces if piece]
 
 
@@ -217,6 +293,29 @@ def _processing_stale_after() -> timedelta:
     return timedelta(hours=max(hours, 0.0))
 
 
+def _embedding_document_concurrency(source_type: str) -> int:
+    source_key = (source_type or "").strip().upper()
+    env_names = []
+    if source_key:
+        env_names.append(f"SCRAPER_EMBEDDING_DOCUMENT_CONCURRENCY_{source_key}")
+    env_names.append("SCRAPER_EMBEDDING_DOCUMENT_CONCURRENCY")
+    for env_name in env_names:
+        raw_value = os.environ.get(env_name, "").strip()
+        if not raw_value:
+            continue
+        try:
+            return max(int(raw_value), 1)
+        except Exception:
+            logger.warning("Invalid %s=%s", env_name, raw_value)
+    return DEFAULT_EMBEDDING_DOCUMENT_CONCURRENCY
+
+
+def _per_minute(count: int, elapsed_seconds: float) -> float:
+    if elapsed_seconds <= 0:
+        return 0.0
+    return round(count * 60.0 / elapsed_seconds, 2)
+
+
 def _parse_document_timestamp(value: Any) -> datetime | None:
     if not value:
         return None
@@ -371,7 +470,7 @@ def _partition_document_elements(file_path: Path) -> list[Any]:
 
 def _chunk_unstructured_elements(elements: list[Any], fallback_title: str) -> list[dict]:
     chunks: list[dict] = []
-    current_parts: list[str] = []
+    current_parts = _JoinedTextBudget("\n\n")
     current_pages: list[int] = []
     current_types: list[str] = []
     current_heading_path = []
@@ -384,11 +483,11 @@ def _chunk_unstructured_elements(elements: list[Any], fallback_title: str) -> li
     current_chunk_heading_level = current_heading_level
 
     def _flush() -> None:
-        nonlocal current_parts, current_pages, current_types
+        nonlocal current_pages, current_types
         nonlocal current_chunk_heading, current_chunk_heading_path, current_chunk_heading_level
-        text = "\n\n".join(part for part in current_parts if part.strip()).strip()
+        text = current_parts.text()
         if not text:
-            current_parts = []
+            current_parts.clear()
             current_pages = []
             current_types = []
             current_chunk_heading = current_heading
@@ -412,7 +511,7 @@ def _chunk_unstructured_elements(elements: list[Any], fallback_title: str) -> li
                 },
             }
         )
-        current_parts = []
+        current_parts.clear()
         current_pages = []
         current_types = []
         current_chunk_heading = current_heading
@@ -441,7 +540,7 @@ def _chunk_unstructured_elements(elements: list[Any], fallback_title: str) -> li
 
         page_number = getattr(getattr(element, "metadata", None), "page_number", None)
         for piece in _split_long_text(text):
-            if not current_parts:
+            if not current_parts.parts:
                 current_chunk_heading = current_heading
                 current_chunk_heading_path = list(current_heading_path)
                 current_chunk_heading_level = current_heading_level
@@ -451,11 +550,7 @@ def _chunk_unstructured_elements(elements: list[Any], fallback_title: str) -> li
                     if page_number is not None:
                         current_pages.append(page_number)
 
-            tentative_text = "\n\n".join(current_parts + [piece]).strip()
-            if current_parts and (
-                len(tentative_text) > CHUNK_MAX_CHARS
-                or _count_tokens(tentative_text) > CHUNK_MAX_TOKENS
-            ):
+            if current_parts.exceeds_limits(piece):
                 _flush()
                 current_chunk_heading = current_heading
                 current_chunk_heading_path = list(current_heading_path)
@@ -572,6 +667,68 @@ def _extract_scjn_api_json_chunks(file_path: Path, fallback_title: str) -> list[
     return chunks
 
 
+def _chunk_source_file(
+    file_path: Path,
+    source_type: str,
+    fallback_title: str,
+    *,
+    mounted: bool = False,
+) -> list[dict]:
+    suffix = file_path.suffix.lower()
+    if source_type == "cas" and suffix == ".json":
+        from src.gui.infrastructure.cas_chunking import (
+            extract_cas_canonical_chunks,
+            is_cas_canonical_json,
+        )
+
+        if not mounted or is_cas_canonical_json(file_path):
+            try:
+                chunks = extract_cas_canonical_chunks(file_path, fallback_title)
+                if chunks:
+                    return chunks
+            except Exception as exc:
+                logger.warning("CAS canonical chunking failed for %s: %s", file_path, exc)
+    if source_type == "scjn" and suffix == ".json":
+        try:
+            chunks = _extract_scjn_api_json_chunks(file_path, fallback_title)
+            if chunks:
+                return chunks
+        except Exception as exc:
+            logger.warning("SCJN API JSON chunking failed for %s: %s", file_path, exc)
+    if source_type == "bjv" and suffix == ".pdf":
+        from src.gui.infrastructure.biblio_chunking import extract_biblio_chunks
+
+        try:
+            chunks = extract_biblio_chunks(file_path, fallback_title)
+            if chunks:
+                return chunks
+        except Exception as exc:
+            logger.warning("Biblio chunking failed for %s: %s", file_path, exc)
+    return _extract_document_chunks(file_path, fallback_title)
+
+
+async def _run_chunker(
+    file_path: Path,
+    source_type: str,
+    fallback_title: str,
+    *,
+    mounted: bool = False,
+) -> list[dict]:
+    # Chunking is CPU/disk bound; keep it off the event loop so concurrent
+    # documents keep their embedding and Supabase I/O moving. With
+    # SCRAPER_CHUNKING_PROCESSES set it runs in a killable worker process.
+    from src.gui.infrastructure.chunking_pool import get_chunking_pool
+
+    pool = get_chunking_pool()
+    if pool is None:
+        return await asyncio.to_thread(
+            _chunk_source_file, file_path, source_type, fallback_title, mounted=mounted
+        )
+    return await pool.run(
+        _chunk_source_file, file_path, source_type, fallback_title, mounted=mounted
+    )
+
+
 async def _load_document_chunks(doc: dict, storage_adapter: Any, bucket_name: str) -> list[dict]:
     storage_path = doc.get("storage_path")
     if not storage_path:
@@ -586,42 +743,7 @@ async def _load_document_chunks(doc: dict, storage_adapter: Any, bucket_name: st
     if mounted_path is not None:
         if not mounted_path.exists():
             raise FileNotFoundError(f"Mounted storage path not found: {mounted_path}")
-        if doc.get("source_type") == "cas" and mounted_path.suffix.lower() == ".json":
-            from src.gui.infrastructure.cas_chunking import (
-                extract_cas_canonical_chunks,
-                is_cas_canonical_json,
-            )
-
-            if is_cas_canonical_json(mounted_path):
-                try:
-                    chunks = extract_cas_canonical_chunks(
-                        mounted_path,
-                        doc.get("title") or doc.get("external_id") or doc.get("id", ""),
-                    )
-                    if chunks:
-                        return chunks
-                except Exception as exc:
-                    logger.warning("CAS canonical chunking failed for %s: %s", mounted_path, exc)
-        if source_type == "scjn" and mounted_path.suffix.lower() == ".json":
-            try:
-                chunks = _extract_scjn_api_json_chunks(mounted_path, fallback_title)
-                if chunks:
-                    return chunks
-            except Exception as exc:
-                logger.warning("SCJN API JSON chunking failed for %s: %s", mounted_path, exc)
-        if source_type == "bjv" and mounted_path.suffix.lower() == ".pdf":
-            from src.gui.infrastructure.biblio_chunking import extract_biblio_chunks
-
-            try:
-                chunks = extract_biblio_chunks(mounted_path, fallback_title)
-                if chunks:
-                    return chunks
-            except Exception as exc:
-                logger.warning("Biblio chunking failed for %s: %s", mounted_path, exc)
-        return _extract_document_chunks(
-            mounted_path,
-            fallback_title,
-        )
+        return await _run_chunker(mounted_path, source_type, fallback_title, mounted=True)
 
     normalized_path = _normalize_storage_path(storage_path, bucket_name)
     content = await storage_adapter.download(normalized_path)
@@ -633,39 +755,7 @@ async def _load_document_chunks(doc: dict, storage_adapter: Any, bucket_name: st
             temp_file.write(content)
             temp_path = Path(temp_file.name)
 
-        if doc.get("source_type") == "cas" and temp_path.suffix.lower() == ".json":
-            from src.gui.infrastructure.cas_chunking import extract_cas_canonical_chunks
-
-            try:
-                chunks = extract_cas_canonical_chunks(
-                    temp_path,
-                    doc.get("title") or doc.get("external_id") or doc.get("id", ""),
-                )
-                if chunks:
-                    return chunks
-            except Exception as exc:
-                logger.warning("CAS canonical chunking failed for %s: %s", temp_path, exc)
-        if source_type == "scjn" and temp_path.suffix.lower() == ".json":
-            try:
-                chunks = _extract_scjn_api_json_chunks(temp_path, fallback_title)
-                if chunks:
-                    return chunks
-            except Exception as exc:
-                logger.warning("SCJN API JSON chunking failed for %s: %s", temp_path, exc)
-        if source_type == "bjv" and temp_path.suffix.lower() == ".pdf":
-            from src.gui.infrastructure.biblio_chunking import extract_biblio_chunks
-
-            try:
-                chunks = extract_biblio_chunks(temp_path, fallback_title)
-                if chunks:
-                    return chunks
-            except Exception as exc:
-                logger.warning("Biblio chunking failed for %s: %s", temp_path, exc)
-
-        return _extract_document_chunks(
-            temp_path,
-            fallback_title,
-        )
+        return await _run_chunker(temp_path, source_type, fallback_title)
     finally:
         if temp_path is not None:
             temp_path.unlink(missing_ok=True)
@@ -785,25 +875,21 @@ async def fetch_documents_for_embedding(
     else:
         documents = []
         scanned = 0
-        offset = 0
         page_size = min(max(max_documents, 1), FETCH_PAGE_SIZE)
         completed_count = 0
         blocked_count = 0
         active_processing_count = 0
         stale_requeued_count = 0
 
-        while len(documents) < max_documents:
-            result = (
+        def _pending_query():
+            return (
                 client.table("scraper_documents")
                 .select(SCRAPER_DOCUMENT_SELECT)
                 .eq("source_type", source_type)
-                .order("created_at", desc=True)
-                .range(offset, offset + page_size - 1)
-                .execute()
+                .or_(INCOMPLETE_EMBEDDING_FILTER)
             )
-            page = result.data if result.data else []
-            if not page:
-                break
+
+        for page in iter_keyset_pages(_pending_query, page_size=page_size):
             scanned += len(page)
             for doc in page:
                 if _document_index_completed(doc):
@@ -831,9 +917,8 @@ async def fetch_documents_for_embedding(
                         active_processing_count += 1
                         continue
                 documents.append(doc)
-            if len(page) < page_size:
+            if len(documents) >= max_documents:
                 break
-            offset += page_size
 
         documents = documents[:max_documents]
         activity.logger.info(
@@ -847,6 +932,301 @@ async def fetch_documents_for_embedding(
     return documents
 
 
+def _reuse_stored_vectors_enabled() -> bool:
+    raw_value = os.environ.get("SCRAPER_EMBEDDING_REUSE_STORED", "true").strip().lower()
+    return raw_value not in {"0", "false", "no"}
+
+
+def _coerce_vector(value: Any) -> list[float] | None:
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return None
+    if not isinstance(value, list) or len(value) != EMBEDDING_VECTOR_SIZE:
+        return None
+    try:
+        return [float(item) for item in value]
+    except (TypeError, ValueError):
+        return None
+
+
+def _load_stored_chunk_vectors(
+    client: Any,
+    document_id: str,
+    text_hashes: set[str],
+) -> dict[str, list[float]]:
+    """Stored vectors of ``text_hashes`` that match the current model and size."""
+    wanted = sorted(text_hashes)
+    found: dict[str, list[float]] = {}
+    for start in range(0, len(wanted), DOCUMENT_ID_QUERY_BATCH_SIZE):
+        result = (
+            client.table("scraper_chunks")
+            .select("embedding, metadata")
+            .eq("document_id", document_id)
+            .in_("metadata->>text_hash", wanted[start : start + DOCUMENT_ID_QUERY_BATCH_SIZE])
+            .execute()
+        )
+        for row in result.data or []:
+            metadata = row.get("metadata") or {}
+            if metadata.get("embedding_model", EMBEDDING_MODEL) != EMBEDDING_MODEL:
+                continue
+            text_hash = metadata.get("text_hash")
+            if text_hash not in text_hashes or text_hash in found:
+                continue
+            vector = _coerce_vector(row.get("embedding"))
+            if vector is not None:
+                found[text_hash] = vector
+    return found
+
+
+async def _lookup_cached_vectors(
+    client: Any,
+    document_id: str,
+    text_hashes: list[str],
+) -> dict[str, list[float]]:
+    """Resolve vectors for unchanged chunk texts from the local cache, then stored rows."""
+    wanted = set(text_hashes)
+    found: dict[str, list[float]] = {}
+    local_cache = get_embedding_cache()
+    if local_cache is not None:
+        try:
+            found.update(
+                await asyncio.to_thread(
+                    local_cache.get_many, EMBEDDING_MODEL, EMBEDDING_VECTOR_SIZE, wanted
+                )
+            )
+        except Exception as exc:
+            activity.logger.warning(f"Embedding cache lookup failed for {document_id}: {exc}")
+    missing = wanted - found.keys()
+    if missing and document_id and _reuse_stored_vectors_enabled():
+        try:
+            stored = await asyncio.to_thread(
+                _load_stored_chunk_vectors, client, document_id, missing
+            )
+        except Exception as exc:
+            activity.logger.warning(f"Stored vector lookup failed for {document_id}: {exc}")
+            stored = {}
+        found.update(stored)
+        if local_cache is not None and stored:
+            try:
+                await asyncio.to_thread(
+                    local_cache.put_many, EMBEDDING_MODEL, EMBEDDING_VECTOR_SIZE, stored
+                )
+            except Exception as exc:
+                activity.logger.warning(f"Failed to write embedding cache for {document_id}: {exc}")
+    return found
+
+
+def _chunk_write_mode() -> str:
+    mode = os.environ.get("SCRAPER_CHUNK_WRITE_MODE", CHUNK_WRITE_MODE_INCREMENTAL).strip().lower()
+    if mode not in {CHUNK_WRITE_MODE_INCREMENTAL, CHUNK_WRITE_MODE_REPLACE}:
+        logger.warning("Invalid SCRAPER_CHUNK_WRITE_MODE=%s", mode)
+        return CHUNK_WRITE_MODE_INCREMENTAL
+    return mode
+
+
+def _chunk_upsert_page_bytes() -> int:
+    raw_value = os.environ.get("SCRAPER_CHUNK_UPSERT_PAGE_BYTES", "").strip()
+    if raw_value:
+        try:
+            return max(int(raw_value), 1)
+        except Exception:
+            logger.warning("Invalid SCRAPER_CHUNK_UPSERT_PAGE_BYTES=%s", raw_value)
+    return DEFAULT_CHUNK_UPSERT_PAGE_BYTES
+
+
+def _chunk_row_hash(row: dict) -> str:
+    """Fingerprint every stored column except the (text-hash derived) embedding."""
+    fingerprint = {
+        key: value for key, value in row.items() if key not in {"embedding", "metadata"}
+    }
+    fingerprint["metadata"] = {
+        key: value for key, value in (row.get("metadata") or {}).items() if key != "row_hash"
+    }
+    encoded = json.dumps(fingerprint, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _paginate_chunk_rows(rows: list[dict], max_bytes: int) -> list[list[dict]]:
+    pages: list[list[dict]] = []
+    current: list[dict] = []
+    current_bytes = 0
+    for row in rows:
+        row_bytes = len(json.dumps(row, ensure_ascii=False, default=str))
+        if current and current_bytes + row_bytes > max_bytes:
+            pages.append(current)
+            current = []
+            current_bytes = 0
+        current.append(row)
+        current_bytes += row_bytes
+    if current:
+        pages.append(current)
+    return pages
+
+
+def _write_document_chunks(
+    client: Any,
+    document_id: str,
+    chunk_rows: list[dict],
+    refreshed_ids: frozenset[str] = frozenset(),
+) -> dict:
+    """
+    Bring a document's stored chunks in line with ``chunk_rows``.
+
+    Incremental mode upserts only new or changed rows (by ``metadata.row_hash``)
+    in size-capped pages and only then deletes orphaned chunk ids, so the
+    document never has zero searchable chunks. ``row_hash`` leaves out the
+    embedding, so rows in ``refreshed_ids`` (freshly embedded because no valid
+    vector was found for them) are always written; otherwise a stored row with
+    a missing or wrong-size vector would be re-embedded on every run and never
+    repaired. Replace mode keeps the legacy delete-all-then-upsert behaviour.
+    """
+    table = client.table
+    if _chunk_write_mode() == CHUNK_WRITE_MODE_REPLACE:
+        table("scraper_chunks").delete().eq("document_id", document_id).execute()
+        for page in _paginate_chunk_rows(chunk_rows, _chunk_upsert_page_bytes()):
+            table("scraper_chunks").upsert(page, on_conflict="chunk_id").execute()
+        return {"written": len(chunk_rows), "unchanged": 0, "deleted": None}
+
+    result = (
+        table("scraper_chunks")
+        .select("chunk_id, metadata")
+        .eq("document_id", document_id)
+        .execute()
+    )
+    stored_hashes = {
+        row.get("chunk_id"): (row.get("metadata") or {}).get("row_hash")
+        for row in result.data or []
+        if row.get("chunk_id")
+    }
+    changed_rows = [
+        row
+        for row in chunk_rows
+        if row["chunk_id"] in refreshed_ids
+        or not stored_hashes.get(row["chunk_id"])
+        or stored_hashes[row["chunk_id"]] != row["metadata"].get("row_hash")
+    ]
+    for page in _paginate_chunk_rows(changed_rows, _chunk_upsert_page_bytes()):
+        table("scraper_chunks").upsert(page, on_conflict="chunk_id").execute()
+
+    current_ids = {row["chunk_id"] for row in chunk_rows}
+    orphan_ids = [chunk_id for chunk_id in stored_hashes if chunk_id not in current_ids]
+    for start in range(0, len(orphan_ids), DOCUMENT_ID_QUERY_BATCH_SIZE):
+        table("scraper_chunks").delete().in_(
+            "chunk_id", orphan_ids[start : start + DOCUMENT_ID_QUERY_BATCH_SIZE]
+        ).execute()
+
+    return {
+        "written": len(changed_rows),
+        "unchanged": len(chunk_rows) - len(changed_rows),
+        "deleted": len(orphan_ids),
+    }
+
+
+async def _index_document(
+    doc: dict,
+    *,
+    source_type: str,
+    sb_client: Any,
+    storage_adapter: Any,
+    bucket_name: str,
+    session: Any,
+    openrouter_key: str,
+) -> dict[str, int]:
+    """Chunk, embed and store one document; returns chunk and cache-hit counts."""
+    doc_id = doc.get("id")
+    await asyncio.to_thread(
+        _safe_update_document_state, sb_client, doc_id, embedding_status="processing"
+    )
+    doc_chunks = await _load_document_chunks(doc, storage_adapter, bucket_name)
+    if not doc_chunks:
+        raise ValueError(f"No unstructured chunks extracted for document {doc_id}")
+
+    text_hashes = [chunk_text_hash(chunk["text"]) for chunk in doc_chunks]
+    known_vectors = await _lookup_cached_vectors(sb_client, doc_id, text_hashes)
+    cache_hits = sum(1 for text_hash in text_hashes if text_hash in known_vectors)
+
+    pending_texts: dict[str, str] = {}
+    for chunk, text_hash in zip(doc_chunks, text_hashes):
+        if text_hash not in known_vectors:
+            pending_texts.setdefault(text_hash, chunk["text"])
+    pending_items = list(pending_texts.items())
+    new_vectors: dict[str, list[float]] = {}
+    for start in range(0, len(pending_items), EMBEDDING_BATCH_SIZE):
+        batch = pending_items[start : start + EMBEDDING_BATCH_SIZE]
+        batch_vectors = await _embed_text_batch(
+            session,
+            openrouter_key,
+            [text for _, text in batch],
+        )
+        if len(batch_vectors) != len(batch):
+            raise RuntimeError(
+                f"Embedding count mismatch for {doc.get('id')}: "
+                f"{len(batch_vectors)} vectors for {len(batch)} chunks"
+            )
+        new_vectors.update(zip((text_hash for text_hash, _ in batch), batch_vectors))
+
+    local_cache = get_embedding_cache()
+    if local_cache is not None and new_vectors:
+        try:
+            await asyncio.to_thread(
+                local_cache.put_many, EMBEDDING_MODEL, EMBEDDING_VECTOR_SIZE, new_vectors
+            )
+        except Exception as exc:
+            activity.logger.warning(f"Failed to write embedding cache for {doc_id}: {exc}")
+    known_vectors.update(new_vectors)
+    vectors = [known_vectors[text_hash] for text_hash in text_hashes]
+
+    chunk_rows = []
+    for index, (chunk, embedding, text_hash) in enumerate(zip(doc_chunks, vectors, text_hashes)):
+        chunk_metadata = {
+            **chunk["metadata"],
+            "source": "scraper_document_workflow",
+            "storage_path": doc.get("storage_path"),
+            "text_hash": text_hash,
+            "embedding_model": EMBEDDING_MODEL,
+        }
+        token_count = _coerce_chunk_count(
+            chunk_metadata.get("token_count")
+        ) or _count_tokens(chunk["text"])
+        chunk_row = {
+            "chunk_id": f"{source_type}-{doc_id}-{index}",
+            "document_id": doc_id,
+            "source_type": source_type,
+            "chunk_index": index,
+            "text": chunk["text"],
+            "titulo": chunk["title"],
+            "token_count": token_count,
+            "embedding": embedding,
+            "metadata": chunk_metadata,
+        }
+        chunk_metadata["row_hash"] = _chunk_row_hash(chunk_row)
+        chunk_rows.append(chunk_row)
+
+    refreshed_ids = frozenset(
+        row["chunk_id"] for row in chunk_rows if row["metadata"]["text_hash"] in new_vectors
+    )
+    write_stats = await asyncio.to_thread(
+        _write_document_chunks, sb_client, doc_id, chunk_rows, refreshed_ids
+    )
+    await asyncio.to_thread(
+        _safe_update_document_state,
+        sb_client,
+        doc_id,
+        embedding_status="completed",
+        chunk_count=len(chunk_rows),
+    )
+    return {
+        "chunks": len(chunk_rows),
+        "cache_hits": cache_hits,
+        "cache_misses": len(chunk_rows) - cache_hits,
+        "rows_written": write_stats["written"],
+        "rows_unchanged": write_stats["unchanged"],
+        "rows_deleted": write_stats["deleted"] or 0,
+    }
+
+
 @activity.defn
 async def generate_and_store_embeddings(
     documents: List[dict],
@@ -857,6 +1237,8 @@ async def generate_and_store_embeddings(
 
     The workflow now embeds the real downloaded file contents via Unstructured
     instead of emitting a single placeholder chunk from the document title.
+    Up to ``SCRAPER_EMBEDDING_DOCUMENT_CONCURRENCY[_<SOURCE>]`` documents are
+    indexed at once; a failure only marks its own document as failed.
     """
     import os
 
@@ -885,91 +1267,68 @@ async def generate_and_store_embeddings(
 
     sb_client = create_client(sb_url, sb_key)
     storage_adapter = SupabaseStorageAdapter(client=sb_client, bucket_name=bucket_name)
-
-    stored = 0
-    errors = 0
-    stored_documents = 0
-    error_messages: list[str] = []
+    concurrency = min(_embedding_document_concurrency(source_type), len(documents))
+    semaphore = asyncio.Semaphore(concurrency)
+    started = time.perf_counter()
 
     async with aiohttp.ClientSession() as session:
-        for doc in documents:
+
+        async def _run(doc: dict) -> tuple[dict, str | None]:
             doc = {**doc, "source_type": doc.get("source_type") or source_type}
             doc_id = doc.get("id")
-            try:
-                _safe_update_document_state(sb_client, doc_id, embedding_status="processing")
-                doc_chunks = await _load_document_chunks(doc, storage_adapter, bucket_name)
-                if not doc_chunks:
-                    raise ValueError(f"No unstructured chunks extracted for document {doc_id}")
-
-                vectors: list[list[float]] = []
-                for start in range(0, len(doc_chunks), EMBEDDING_BATCH_SIZE):
-                    batch = doc_chunks[start : start + EMBEDDING_BATCH_SIZE]
-                    vectors.extend(
-                        await _embed_text_batch(
-                            session,
-                            openrouter_key,
-                            [chunk["text"] for chunk in batch],
-                        )
+            async with semaphore:
+                try:
+                    doc_stats = await _index_document(
+                        doc,
+                        source_type=source_type,
+                        sb_client=sb_client,
+                        storage_adapter=storage_adapter,
+                        bucket_name=bucket_name,
+                        session=session,
+                        openrouter_key=openrouter_key,
                     )
-
-                if len(vectors) != len(doc_chunks):
-                    raise RuntimeError(
-                        f"Embedding count mismatch for {doc.get('id')}: "
-                        f"{len(vectors)} vectors for {len(doc_chunks)} chunks"
+                    return doc_stats, None
+                except Exception as e:
+                    await asyncio.to_thread(
+                        _safe_update_document_state, sb_client, doc_id, embedding_status="failed"
                     )
-
-                chunk_rows = []
-                for index, (chunk, embedding) in enumerate(zip(doc_chunks, vectors)):
-                    chunk_metadata = {
-                        **chunk["metadata"],
-                        "source": "scraper_document_workflow",
-                        "storage_path": doc.get("storage_path"),
-                    }
-                    token_count = _coerce_chunk_count(
-                        chunk_metadata.get("token_count")
-                    ) or _count_tokens(chunk["text"])
-                    chunk_rows.append(
-                        {
-                            "chunk_id": f"{source_type}-{doc_id}-{index}",
-                            "document_id": doc_id,
-                            "source_type": source_type,
-                            "chunk_index": index,
-                            "text": chunk["text"],
-                            "titulo": chunk["title"],
-                            "token_count": token_count,
-                            "embedding": embedding,
-                            "metadata": chunk_metadata,
-                        }
-                    )
-
-                sb_client.table("scraper_chunks").delete().eq("document_id", doc_id).execute()
-                sb_client.table("scraper_chunks").upsert(
-                    chunk_rows, on_conflict="chunk_id"
-                ).execute()
-                _safe_update_document_state(
-                    sb_client,
-                    doc_id,
-                    embedding_status="completed",
-                    chunk_count=len(chunk_rows),
-                )
-                stored += len(chunk_rows)
-                stored_documents += 1
-
-            except Exception as e:
-                _safe_update_document_state(sb_client, doc_id, embedding_status="failed")
-                message = f"{doc.get('id', '?')}: {e}"
-                activity.logger.warning(f"Error for {doc.get('id','?')}: {e}")
-                errors += 1
-                error_messages.append(message)
+                    activity.logger.warning(f"Error for {doc.get('id','?')}: {e}")
+                    return {}, f"{doc.get('id', '?')}: {e}"
+
+        outcomes = await asyncio.gather(*(_run(doc) for doc in documents))
+
+    elapsed_seconds = time.perf_counter() - started
+    stored = sum(doc_stats.get("chunks", 0) for doc_stats, _ in outcomes)
+    cache_hits = sum(doc_stats.get("cache_hits", 0) for doc_stats, _ in outcomes)
+    cache_lookups = cache_hits + sum(doc_stats.get("cache_misses", 0) for doc_stats, _ in outcomes)
+    write_totals = {
+        key: sum(doc_stats.get(key, 0) for doc_stats, _ in outcomes)
+        for key in ("rows_written", "rows_unchanged", "rows_deleted")
+    }
+    stored_documents = sum(1 for _, message in outcomes if message is None)
+    error_messages = [message for _, message in outcomes if message is not None]
+    errors = len(error_messages)
 
     activity.logger.info(
-        f"Done: {stored} chunks stored across {stored_documents} docs, {errors} errors"
+        f"Done: {stored} chunks stored across {stored_documents} docs, {errors} errors "
+        f"(concurrency={concurrency}, {elapsed_seconds:.1f}s, "
+        f"{cache_hits}/{cache_lookups} embedding cache hits)"
     )
     return {
         "stored_count": stored,
         "stored_documents": stored_documents,
         "error_count": errors,
         "errors": error_messages[:10],
+        "concurrency": concurrency,
+        "elapsed_seconds": round(elapsed_seconds, 3),
+        "documents_per_minute": _per_minute(stored_documents, elapsed_seconds),
+        "chunks_per_minute": _per_minute(stored, elapsed_seconds),
+        "embedding_cache_hits": cache_hits,
+        "embedding_cache_misses": cache_lookups - cache_hits,
+        "embedding_cache_hit_rate": round(cache_hits / cache_lookups, 4) if cache_lookups else 0.0,
+        "chunk_rows_written": write_totals["rows_written"],
+        "chunk_rows_unchanged": write_totals["rows_unchanged"],
+        "chunk_rows_deleted": write_totals["rows_deleted"],
     }
 
 
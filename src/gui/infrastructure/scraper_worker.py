@@ -12,6 +12,9 @@ Environment Variables:
     TEMPORAL_NAMESPACE: Namespace (default: default)
     TEMPORAL_TASK_QUEUE: Task queue name (default: scraper-pipeline)
     LEGAL_SCRAPER_API_URL: API URL for scraper (default: http://api:8000)
+    SCRAPER_CHUNKING_PROCESSES: Chunking worker processes (default: 0 = thread)
+    SCRAPER_BROWSER_POOL_SIZE: Warm Chromium browsers shared by extractions (default: 2)
+    SCRAPER_BROWSER_MAX_PAGES: Pages per browser before it is recycled (default: 100)
 """
 import asyncio
 import logging
@@ -53,6 +56,8 @@ from src.gui.infrastructure.scraper_document_workflow import (
     fetch_documents_for_embedding,
     generate_and_store_embeddings,
 )
+from src.gui.infrastructure.chunking_pool import shutdown_chunking_pool
+from src.infrastructure.adapters.browser_pool import close_browser_pool
 
 logging.basicConfig(
     level=logging.INFO,
@@ -135,9 +140,13 @@ async def run_worker():
         loop.add_signal_handler(sig, lambda s=sig: handle_signal(s))
 
     # Run worker until shutdown
-    async with worker:
-        logger.info("Worker started, waiting for tasks...")
-        await shutdown_event.wait()
+    try:
+        async with worker:
+            logger.info("Worker started, waiting for tasks...")
+            await shutdown_event.wait()
+    finally:
+        shutdown_chunking_pool()
+        await close_browser_pool()
 
     logger.info("Worker shutdown complete")
 
@@ -0,0 +1,110 @@
+"""
+Content-hash deduplication for document storage uploads.
+
+Uploads are keyed by ``doc_id``, so the same DOF/SCJN file reached through
+different external ids used to be uploaded once per id, and an identical
+re-download paid for a full upload before the 409 came back. Callers now hash
+the file first and ask a ``StorageHashIndex`` whether those bytes are already
+stored: first in an in-process map filled during the run, then in
+``scraper_documents.content_hash``. A hit links the document to the existing
+object and the skipped bytes are counted instead of uploaded.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+MOUNTED_STORAGE_PREFIX = "mounted://"
+REMOTE_LOOKUP_LIMIT = 5
+
+
+class StorageHashIndex:
+    """``sha256 -> storage_path`` index shared by the uploads of one run."""
+
+    def __init__(self, client: Optional[Any] = None, storage_adapter: Optional[Any] = None):
+        self._client = client
+        self._storage_adapter = storage_adapter
+        self._known: dict[str, str] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self.deduplicated = 0
+        self.bytes_saved = 0
+
+    def _lock_for(self, content_hash: str) -> asyncio.Lock:
+        lock = self._locks.get(content_hash)
+        if lock is None:
+            lock = self._locks[content_hash] = asyncio.Lock()
+        return lock
+
+    def record(self, content_hash: str, storage_path: str) -> None:
+        if content_hash and storage_path:
+            self._known[content_hash] = storage_path
+
+    async def lookup(self, content_hash: str) -> Optional[str]:
+        """Return a stored object holding these bytes, if one is known."""
+        if not content_hash:
+            return None
+        known = self._known.get(content_hash)
+        if known is not None:
+            return known
+        if self._client is None:
+            return None
+
+        for storage_path in await asyncio.to_thread(self._remote_candidates, content_hash):
+            # Rows can outlive their objects; only link to one that is still there.
+            if self._storage_adapter is not None:
+                try:
+                    if not await self._storage_adapter.exists(storage_path):
+                        continue
+                except Exception as exc:
+                    logger.warning("Failed to check storage path %s: %s", storage_path, exc)
+                    continue
+            self._known[content_hash] = storage_path
+            return storage_path
+        return None
+
+    def _remote_candidates(self, content_hash: str) -> list[str]:
+        try:
+            response = (
+                self._client.table("scraper_documents")
+                .select("storage_path")
+                .eq("content_hash", content_hash)
+                .not_.is_("storage_path", "null")
+                .limit(REMOTE_LOOKUP_LIMIT)
+                .execute()
+            )
+        except Exception as exc:
+            logger.warning("Content hash lookup failed for %s: %s", content_hash, exc)
+            return []
+        candidates = []
+        for row in getattr(response, "data", None) or []:
+            storage_path = str(row.get("storage_path") or "").strip()
+            if storage_path and not storage_path.startswith(MOUNTED_STORAGE_PREFIX):
+                candidates.append(storage_path)
+        return list(dict.fromkeys(candidates))
+
+    async def upload_or_link(
+        self,
+        content_hash: str,
+        size_bytes: int,
+        upload: Callable[[], Awaitable[str]],
+    ) -> tuple[str, bool]:
+        """
+        Return ``(storage_path, deduplicated)`` for a file with this hash.
+
+        Concurrent callers with the same hash are serialized, so only the
+        first one uploads and the rest link to its object.
+        """
+        if not content_hash:
+            return await upload(), False
+        async with self._lock_for(content_hash):
+            existing = await self.lookup(content_hash)
+            if existing is not None:
+                self.deduplicated += 1
+                self.bytes_saved += max(int(size_bytes or 0), 0)
+                return existing, True
+            storage_path = await upload()
+            self.record(content_hash, storage_path)
+            return storage_path, False
@@ -0,0 +1,121 @@
+"""
+Keyset pagination for Supabase/PostgREST table scans.
+
+Offset pagination (``.range(offset, ...)``) gets slower with every page on
+large tables and skips or repeats rows when the scan itself updates rows that
+match its filters (for example the mounted backfill filling ``storage_path``
+while scanning ``storage_path is null``). These helpers page on a stable
+``(order_column, id)`` cursor instead and prefetch the next page in a
+background thread while the caller processes the current one.
+"""
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterator, Optional
+
+DEFAULT_KEYSET_PAGE_SIZE = 200
+# Server-side complement of "embedding_status = completed and chunk_count > 0",
+# so scans for pending work skip already-indexed rows in Postgres.
+INCOMPLETE_EMBEDDING_FILTER = (
+    "embedding_status.is.null,embedding_status.neq.completed,"
+    "chunk_count.is.null,chunk_count.lte.0"
+)
+
+
+def _quote_filter_value(value: Any) -> str:
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+
+def keyset_cursor_filter(
+    last_row: dict[str, Any],
+    *,
+    order_column: str = "created_at",
+    id_column: str = "id",
+    descending: bool = True,
+) -> str:
+    """
+    Build the PostgREST ``or`` expression selecting rows after ``last_row``.
+
+    Follows Postgres' default null placement (NULLS FIRST for DESC, NULLS
+    LAST for ASC) so rows without an ``order_column`` value are still visited.
+    """
+    op = "lt" if descending else "gt"
+    last_id = _quote_filter_value(last_row[id_column])
+    last_value = last_row.get(order_column)
+    if last_value is None:
+        expression = f"and({order_column}.is.null,{id_column}.{op}.{last_id})"
+        if descending:
+            expression += f",{order_column}.not.is.null"
+        return expression
+
+    value = _quote_filter_value(last_value)
+    expression = (
+        f"{order_column}.{op}.{value},"
+        f"and({order_column}.eq.{value},{id_column}.{op}.{last_id})"
+    )
+    if not descending:
+        expression += f",{order_column}.is.null"
+    return expression
+
+
+def iter_keyset_pages(
+    query_factory: Callable[[], Any],
+    *,
+    page_size: int = DEFAULT_KEYSET_PAGE_SIZE,
+    order_column: str = "created_at",
+    id_column: str = "id",
+    descending: bool = True,
+    prefetch: bool = True,
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Yield pages from ``query_factory()`` ordered by ``(order_column, id_column)``.
+
+    ``query_factory`` must return a fresh filtered select (including both
+    cursor columns) on every call; ordering, the cursor and the page limit are
+    applied here.
+    """
+    page_size = max(int(page_size), 1)
+
+    def _fetch(last_row: Optional[dict[str, Any]]) -> list[dict[str, Any]]:
+        query = query_factory()
+        if last_row is not None:
+            query = query.or_(
+                keyset_cursor_filter(
+                    last_row,
+                    order_column=order_column,
+                    id_column=id_column,
+                    descending=descending,
+                )
+            )
+        response = (
+            query.order(order_column, desc=descending)
+            .order(id_column, desc=descending)
+            .limit(page_size)
+            .execute()
+        )
+        return list(getattr(response, "data", None) or [])
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        page = _fetch(None)
+        while page:
+            upcoming: Optional[Future] = None
+            has_more = len(page) >= page_size
+            if has_more and executor is not None:
+                upcoming = executor.submit(_fetch, page[-1])
+            yield page
+            if not has_more:
+                break
+            page = upcoming.result() if upcoming is not None else _fetch(page[-1])
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_keyset_rows(
+    query_factory: Callable[[], Any],
+    **kwargs: Any,
+) -> Iterator[dict[str, Any]]:
+    for page in iter_keyset_pages(query_factory, **kwargs):
+        yield from page
@@ -3,17 +3,178 @@ Temporal Client Adapter for Scraper API.
 
 Triggers ScraperDocumentWorkflow when a scraper job completes,
 enabling durable document embedding processing.
+
+Temporal connections are shared process-wide through ``TemporalClientPool``:
+one lazily created client per (address, namespace), dropped and re-dialed
+when a call fails with a connection error. ``describe()`` results are cached
+for a few seconds so dashboard polling does not hit Temporal on every refresh.
+
+Environment Variables:
+    TEMPORAL_DESCRIBE_CACHE_SECONDS: TTL for cached describe() results (default: 2)
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import time
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import Optional
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+DEFAULT_DESCRIBE_CACHE_SECONDS = 2.0
+_CONNECTION_ERROR_STATUSES = {"UNAVAILABLE"}
+
+
+def _is_connection_error(exc: BaseException) -> bool:
+    if isinstance(exc, (ConnectionError, OSError)):
+        return True
+    status = getattr(exc, "status", None)
+    return getattr(status, "name", None) in _CONNECTION_ERROR_STATUSES
+
+
+def _is_already_started(exc: BaseException) -> bool:
+    return type(exc).__name__ == "WorkflowAlreadyStartedError" or "already started" in str(exc).lower()
+
+
+def _describe_cache_seconds() -> float:
+    raw = os.environ.get("TEMPORAL_DESCRIBE_CACHE_SECONDS", "").strip()
+    if not raw:
+        return DEFAULT_DESCRIBE_CACHE_SECONDS
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return DEFAULT_DESCRIBE_CACHE_SECONDS
+
+
+class TemporalClientPool:
+    """Process-wide Temporal clients keyed by (address, namespace)."""
+
+    def __init__(self, describe_ttl_seconds: Optional[float] = None):
+        self._clients: dict[tuple[str, str], Any] = {}
+        self._locks: dict[tuple[str, str], asyncio.Lock] = {}
+        self._describe_ttl = (
+            _describe_cache_seconds() if describe_ttl_seconds is None else describe_ttl_seconds
+        )
+        self._describe_cache: dict[tuple[str, str, str], tuple[float, Any]] = {}
+
+    async def get(self, address: str, namespace: str = "default") -> Any:
+        """Return the shared client, connecting on first use."""
+        key = (address, namespace)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            client = self._clients.get(key)
+            if client is None:
+                from temporalio.client import Client
+
+                client = await Client.connect(address, namespace=namespace)
+                self._clients[key] = client
+                logger.info(f"Connected to Temporal at {address} ({namespace})")
+        return client
+
+    def invalidate(self, address: str, namespace: str = "default", client: Any = None) -> None:
+        """Drop a cached client so the next ``get`` reconnects."""
+        key = (address, namespace)
+        if client is None or self._clients.get(key) is client:
+            self._clients.pop(key, None)
+
+    async def call(
+        self,
+        address: str,
+        namespace: str,
+        operation: Callable[[Any], Awaitable[T]],
+    ) -> T:
+        """
+        Run ``operation(client)``, reconnecting once on a connection error.
+
+        The operation may run twice, so it must be safe to repeat; start
+        workflows through ``start_workflow``.
+        """
+        client = await self.get(address, namespace)
+        try:
+            return await operation(client)
+        except Exception as exc:
+            if not _is_connection_error(exc):
+                raise
+            logger.warning("Temporal call failed, reconnecting to %s: %s", address, exc)
+            self.invalidate(address, namespace, client)
+            client = await self.get(address, namespace)
+            return await operation(client)
+
+    async def start_workflow(
+        self,
+        address: str,
+        namespace: str,
+        workflow_id: str,
+        start: Callable[[Any], Awaitable[Any]],
+    ) -> Any:
+        """
+        Run ``start(client)`` for ``workflow_id`` through ``call``.
+
+        If the connection drops after the server accepted the first start,
+        the retry fails with "already started". That only means the first
+        attempt landed, so the retry returns the workflow's handle instead of
+        raising.
+        """
+        attempts = 0
+
+        async def _start(client: Any) -> Any:
+            nonlocal attempts
+            attempts += 1
+            try:
+                return await start(client)
+            except Exception as exc:
+                if attempts > 1 and _is_already_started(exc):
+                    logger.info("Workflow %s was started before the connection dropped", workflow_id)
+                    return client.get_workflow_handle(workflow_id)
+                raise
+
+        return await self.call(address, namespace, _start)
+
+    async def describe(self, address: str, namespace: str, workflow_id: str) -> Any:
+        """Return ``describe()`` for a workflow, served from a short-TTL cache."""
+        key = (address, namespace, workflow_id)
+        now = time.monotonic()
+        cached = self._describe_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        async def _describe(client: Any) -> Any:
+            return await client.get_workflow_handle(workflow_id).describe()
+
+        description = await self.call(address, namespace, _describe)
+        if self._describe_ttl > 0:
+            if len(self._describe_cache) > 1024:
+                self._describe_cache = {
+                    k: v for k, v in self._describe_cache.items() if v[0] > now
+                }
+            self._describe_cache[key] = (now + self._describe_ttl, description)
+        return description
+
+    def close(self) -> None:
+        """Forget all clients; called from the web app shutdown."""
+        self._clients.clear()
+        self._describe_cache.clear()
+
+
+_client_pool: Optional[TemporalClientPool] = None
+
+
+def get_temporal_client_pool() -> TemporalClientPool:
+    """Get the process-wide Temporal client pool."""
+    global _client_pool
+    if _client_pool is None:
+        _client_pool = TemporalClientPool()
+    return _client_pool
+
 
 @dataclass
 class TemporalConfig:
@@ -45,32 +206,36 @@ class TemporalScraperClient:
     MOUNTED_BACKFILL_WORKFLOW_ID_PREFIX = "mounted-backfill-drain-"
     WORKFLOW_TASK_TIMEOUT = timedelta(minutes=2)
 
-    def __init__(self, config: Optional[TemporalConfig] = None):
+    def __init__(
+        self,
+        config: Optional[TemporalConfig] = None,
+        pool: Optional[TemporalClientPool] = None,
+    ):
         self._config = config or TemporalConfig.from_env()
-        self._client = None
+        self._pool = pool
 
     @property
     def enabled(self) -> bool:
         return self._config.enabled and bool(self._config.address)
 
+    @property
+    def pool(self) -> TemporalClientPool:
+        return self._pool or get_temporal_client_pool()
+
     async def _get_client(self):
-        """Lazy initialization of Temporal client with connection retry."""
+        """Return the shared Temporal client, or None if unreachable."""
         if not self.enabled:
             return None
 
-        if self._client is None:
-            try:
-                from temporalio.client import Client
+        try:
+            return await self.pool.get(self._config.address, self._config.namespace)
+        except Exception as e:
+            logger.error(f"Failed to connect to Temporal: {e}")
+            return None
 
-                self._client = await Client.connect(
-                    self._config.address,
-                    namespace=self._config.namespace,
-                )
-                logger.info(f"Connected to Temporal at {self._config.address}")
-            except Exception as e:
-                logger.error(f"Failed to connect to Temporal: {e}")
-                return None
-        return self._client
+    def _drop_client_on_connection_error(self, client: Any, exc: BaseException) -> None:
+        if _is_connection_error(exc):
+            self.pool.invalidate(self._config.address, self._config.namespace, client)
 
     async def trigger_embedding_workflow(
         self,
@@ -140,6 +305,7 @@ class TemporalScraperClient:
             if "already started" in str(e).lower():
                 logger.info(f"Workflow {workflow_id} already running")
                 return workflow_id
+            self._drop_client_on_connection_error(client, e)
             logger.error(f"Failed to start workflow: {e}")
             return None
 
@@ -148,15 +314,14 @@ class TemporalScraperClient:
         if not self.enabled:
             return None
 
-        client = await self._get_client()
-        if client is None:
-            return None
-
         workflow_id = f"{self.WORKFLOW_ID_PREFIX}{job_id}"
 
         try:
-            handle = client.get_workflow_handle(workflow_id)
-            desc = await handle.describe()
+            desc = await self.pool.describe(
+                self._config.address,
+                self._config.namespace,
+                workflow_id,
+            )
             return {
                 "workflow_id": workflow_id,
                 "status": desc.status.name,
@@ -213,6 +378,7 @@ class TemporalScraperClient:
             if "already started" in str(e).lower():
                 logger.info("Mounted backfill workflow %s already running", workflow_id)
                 return workflow_id
+            self._drop_client_on_connection_error(client, e)
             logger.error("Failed to start mounted backfill workflow %s: %s", workflow_id, e)
             return None
 
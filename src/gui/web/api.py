@@ -80,7 +80,32 @@ from src.gui.web.auth import (
     decode_access_token,
     verify_password,
 )
-from src.gui.infrastructure.temporal_client import get_temporal_client
+from src.gui.infrastructure.temporal_client import (
+    get_temporal_client,
+    get_temporal_client_pool,
+)
+from src.gui.web.event_hub import SourceEventHub, format_sse
+from src.gui.web.log_store import SourceLogStore
+
+# Sources with a per-source event stream; "jobs" is the generic ScraperService.
+EVENT_SOURCES = ("scjn", "bjv", "cas", "dof")
+SERVICE_EVENT_SOURCE = "jobs"
+TERMINAL_JOB_STATES = {"completed", "failed", "cancelled"}
+WORKFLOW_WATCH_INTERVAL_SECONDS = float(
+    os.environ.get("SCRAPER_EVENTS_WORKFLOW_POLL_SECONDS", "3")
+)
+WORKFLOW_WATCH_MAX_BACKOFF_SECONDS = 60.0
+WORKFLOW_WATCH_MAX_FAILURES = 5
+EVENT_STREAM_KEEPALIVE_SECONDS = 15
+
+
+def _web_temporal_settings() -> tuple[str, str, str]:
+    """Return (address, namespace, task_queue) for web-started workflows."""
+    return (
+        os.environ.get("TEMPORAL_ADDRESS", "temporal-temporal-1:7233"),
+        os.environ.get("TEMPORAL_NAMESPACE", "default"),
+        os.environ.get("TEMPORAL_TASK_QUEUE", "scraper-pipeline"),
+    )
 
 
 @dataclass
@@ -90,6 +115,7 @@ class ScraperArgs:
     checkpoint_dir: str = "checkpoints"
     rate_limit: float = 0.5
     concurrency: int = 3
+    mailbox_size: int = 100
     skip_pdfs: bool = True
     max_results: int = 100
     category: Optional[str] = None
@@ -179,11 +205,14 @@ class LogEntry(BaseModel):
     message: str
     source: str
     timestamp: str
+    seq: Optional[int] = None
 
 
 class LogsResponse(BaseModel):
     """Response model for logs endpoint."""
     logs: List[LogEntry]
+    # Pass back as ``since`` to receive only newer entries
+    next_since: Optional[int] = None
 
 
 class ConfigOption(BaseModel):
@@ -398,19 +427,23 @@ class ScraperAPI:
     """
 
     def __init__(self, service: Optional[ScraperService] = None):
-        self._service = service or ScraperService()
+        self._events = SourceEventHub()
+        self._logs = SourceLogStore(EVENT_SOURCES)
+        self._service_job_id: Optional[str] = None
+        self._service_log_count = 0
+        self._workflow_watcher: Optional[asyncio.Task] = None
+        self._service = service or ScraperService(
+            state_change_callback=self._handle_service_state
+        )
         self._config_service = ConfigurationService()
         self._event_subscribers: List[asyncio.Queue] = []
         self._scjn_bridge: Optional[SCJNGuiBridgeActor] = None
         self._scjn_coordinator = None
-        self._scjn_logs: List[dict] = []
         self._bjv_bridge: Optional[BJVGuiBridgeActor] = None
-        self._bjv_logs: List[dict] = []
         self._cas_bridge: Optional[CASGuiBridgeActor] = None
-        self._cas_logs: List[dict] = []
         self._dof_bridge: Optional[DOFGuiBridgeActor] = None
-        self._dof_logs: List[dict] = []
         self._temporal_client = get_temporal_client()
+        self._temporal_pool = get_temporal_client_pool()
         self._source_workflows: dict[str, str] = {}
         # n8n callback URL storage: workflow_id -> callback_url
         self._n8n_callbacks: dict[str, str] = {}
@@ -419,6 +452,129 @@ class ScraperAPI:
     def service(self) -> ScraperService:
         return self._service
 
+    @property
+    def temporal_pool(self):
+        return self._temporal_pool
+
+    @property
+    def events(self) -> SourceEventHub:
+        return self._events
+
+    @property
+    def logs(self) -> SourceLogStore:
+        return self._logs
+
+    def _append_log(self, source: str, entry: dict) -> None:
+        """Record a log line for a source and publish it to event stream subscribers."""
+        # Log seq ids follow the event stream's, so either can serve as a cursor.
+        entry = self._logs[source].append(entry, seq=self._events.last_seq + 1)
+        self._events.publish_log(source, entry)
+
+    def _handle_service_state(self, state) -> None:
+        """Publish ScraperService job changes (status, progress, new logs) as deltas."""
+        job = getattr(state, "current_job", None)
+        if job is None:
+            return
+        if job.id != self._service_job_id:
+            self._service_job_id = job.id
+            self._service_log_count = 0
+            self._events.reset_state(SERVICE_EVENT_SOURCE)
+
+        self._events.publish_state(
+            SERVICE_EVENT_SOURCE,
+            "status",
+            {"status": getattr(job.status, "value", str(job.status)), "job_id": job.id},
+        )
+        if job.progress:
+            self._events.publish_state(
+                SERVICE_EVENT_SOURCE,
+                "progress",
+                {
+                    "total_items": job.progress.total_items,
+                    "processed_items": job.progress.processed_items,
+                    "successful_items": job.progress.successful_items,
+                    "failed_items": job.progress.failed_items,
+                    "percentage": job.progress.percentage,
+                },
+            )
+        for log in job.logs[self._service_log_count:]:
+            self._events.publish_log(
+                SERVICE_EVENT_SOURCE,
+                {
+                    "level": log.level.value,
+                    "message": log.message,
+                    "source": log.source,
+                    "timestamp": log.timestamp.isoformat(),
+                },
+            )
+        self._service_log_count = len(job.logs)
+
+    def _publish_job_status(self, source: str, **values: Any) -> None:
+        self._events.publish_state(source, "status", values)
+
+    def _publish_job_progress(self, source: str, **values: Any) -> None:
+        self._events.publish_state(source, "progress", values)
+
+    def _publish_workflow_status(self, source: str, workflow_status: dict) -> None:
+        result = workflow_status.get("result") or {}
+        download = result.get("download") or {}
+        self._publish_job_status(
+            source,
+            status=workflow_status["status"],
+            job_id=workflow_status["workflow_id"],
+        )
+        if result:
+            self._publish_job_progress(
+                source,
+                discovered_count=result.get("document_count", 0),
+                downloaded_count=download.get("downloaded_count", 0),
+                error_count=len(result.get("errors", []) or []),
+            )
+
+    def _ensure_workflow_watcher(self) -> None:
+        if self._workflow_watcher is None or self._workflow_watcher.done():
+            self._workflow_watcher = asyncio.create_task(self._watch_source_workflows())
+
+    async def _watch_source_workflows(self) -> None:
+        """
+        Publish status deltas for web-started Temporal workflows.
+
+        One watcher serves every stream subscriber and exits once no tracked
+        workflow is still running, so idle dashboards cost nothing. While
+        every watched workflow fails to answer, polling backs off
+        exponentially; a workflow is dropped after
+        ``WORKFLOW_WATCH_MAX_FAILURES`` consecutive failed queries.
+        """
+        failures: dict[str, int] = {}
+        while True:
+            active = [
+                source
+                for source in list(self._source_workflows)
+                if self._events.snapshot(source)["status"].get("status") not in TERMINAL_JOB_STATES
+                and failures.get(source, 0) < WORKFLOW_WATCH_MAX_FAILURES
+            ]
+            if not active:
+                return
+            for source in active:
+                if await self.get_source_workflow_status(source) is not None:
+                    failures.pop(source, None)
+                    continue
+                failures[source] = failures.get(source, 0) + 1
+                if failures[source] >= WORKFLOW_WATCH_MAX_FAILURES:
+                    logger.warning(
+                        "Stopped watching %s workflow %s after %d failed status queries",
+                        source,
+                        self._source_workflows.get(source),
+                        failures[source],
+                    )
+            streak = min(failures.get(source, 0) for source in active)
+            await asyncio.sleep(
+                min(
+                    WORKFLOW_WATCH_INTERVAL_SECONDS * 2 ** streak,
+                    WORKFLOW_WATCH_MAX_BACKOFF_SECONDS,
+                )
+            )
+
     @property
     def scjn_bridge(self) -> Optional[SCJNGuiBridgeActor]:
         return self._scjn_bridge
@@ -438,14 +594,9 @@ class ScraperAPI:
     async def start_source_workflow(self, source: str, config: dict) -> Optional[str]:
         """Prefer the durable Crawl4AI workflow path for source ingestion."""
         try:
-            from temporalio.client import Client
             from src.gui.infrastructure.crawl4ai_workflow import Crawl4AIExtractionWorkflow
 
-            temporal_address = os.environ.get("TEMPORAL_ADDRESS", "temporal-temporal-1:7233")
-            namespace = os.environ.get("TEMPORAL_NAMESPACE", "default")
-            task_queue = os.environ.get("TEMPORAL_TASK_QUEUE", "scraper-pipeline")
-
-            client = await Client.connect(temporal_address, namespace=namespace)
+            temporal_address, namespace, task_queue = _web_temporal_settings()
             workflow_id = f"{source}-crawl4ai-web-{uuid.uuid4().hex[:10]}"
             workflow_config = {
                 **config,
@@ -455,13 +606,21 @@ class ScraperAPI:
                 "persist_to_db": True,
                 "trigger_embedding": True,
             }
-            await client.start_workflow(
-                Crawl4AIExtractionWorkflow.run,
-                args=[workflow_config],
-                id=workflow_id,
-                task_queue=task_queue,
+            await self._temporal_pool.start_workflow(
+                temporal_address,
+                namespace,
+                workflow_id,
+                lambda client: client.start_workflow(
+                    Crawl4AIExtractionWorkflow.run,
+                    args=[workflow_config],
+                    id=workflow_id,
+                    task_queue=task_queue,
+                ),
             )
             self._source_workflows[source] = workflow_id
+            self._events.reset_state(source)
+            self._publish_job_status(source, status="running", job_id=workflow_id)
+            self._ensure_workflow_watcher()
             return workflow_id
         except Exception as exc:
             logger.warning("Falling back to legacy %s bridge start path: %s", source, exc)
@@ -474,33 +633,34 @@ class ScraperAPI:
             return None
 
         try:
-            from temporalio.client import Client
-
-            temporal_address = os.environ.get("TEMPORAL_ADDRESS", "temporal-temporal-1:7233")
-            namespace = os.environ.get("TEMPORAL_NAMESPACE", "default")
-            client = await Client.connect(temporal_address, namespace=namespace)
-            handle = client.get_workflow_handle(workflow_id)
-            desc = await handle.describe()
+            temporal_address, namespace, _ = _web_temporal_settings()
+            desc = await self._temporal_pool.describe(temporal_address, namespace, workflow_id)
             raw_status = desc.status.name.upper()
             status_map = {
                 "RUNNING": "running",
                 "COMPLETED": "completed",
+                "CONTINUED_AS_NEW": "completed",
                 "FAILED": "failed",
+                "TIMED_OUT": "failed",
                 "CANCELED": "cancelled",
                 "TERMINATED": "cancelled",
             }
-            status = status_map.get(raw_status, raw_status.lower())
+            # Any status other than RUNNING is final; unknown ones count as failed.
+            status = status_map.get(raw_status, "failed")
             result = None
             if status in {"completed", "failed", "cancelled"}:
                 try:
-                    result = await handle.result()
+                    client = await self._temporal_pool.get(temporal_address, namespace)
+                    result = await client.get_workflow_handle(workflow_id).result()
                 except Exception as exc:
                     result = {"errors": [str(exc)]}
-            return {
+            workflow_status = {
                 "workflow_id": workflow_id,
                 "status": status,
                 "result": result,
             }
+            self._publish_workflow_status(source, workflow_status)
+            return workflow_status
         except Exception as exc:
             logger.warning("Could not query %s workflow %s: %s", source, workflow_id, exc)
             return None
@@ -513,14 +673,14 @@ class ScraperAPI:
         args = ScraperArgs()
         try:
             self._scjn_coordinator = await create_pipeline(args)
-            self._scjn_logs.append({
+            self._append_log("scjn", {
                 "level": "info",
                 "message": "SCJN pipeline initialized",
                 "source": "System",
                 "timestamp": __import__('datetime').datetime.now().isoformat()
             })
         except Exception as e:
-            self._scjn_logs.append({
+            self._append_log("scjn", {
                 "level": "error",
                 "message": f"Failed to initialize SCJN pipeline: {e}",
                 "source": "System",
@@ -545,7 +705,7 @@ class ScraperAPI:
             on_event=self._handle_cas_event
         )
         # Note: CAS bridge doesn't require start() as it inherits from CASBaseActor
-        self._cas_logs.append({
+        self._append_log("cas", {
             "level": "info",
             "message": "CAS bridge initialized",
             "source": "System",
@@ -556,7 +716,7 @@ class ScraperAPI:
         self._dof_bridge = DOFGuiBridgeActor(
             on_event=self._handle_dof_event
         )
-        self._dof_logs.append({
+        self._append_log("dof", {
             "level": "info",
             "message": "DOF bridge initialized",
             "source": "System",
@@ -565,6 +725,9 @@ class ScraperAPI:
 
     async def shutdown(self):
         """Stop the scraper service and bridges."""
+        if self._workflow_watcher is not None:
+            self._workflow_watcher.cancel()
+        await self._logs.flush()
         await self._service.stop()
         if self._scjn_bridge:
             await self._scjn_bridge.stop()
@@ -583,17 +746,34 @@ class ScraperAPI:
         from datetime import datetime
 
         if isinstance(event, SCJNJobStarted):
-            self._scjn_logs.append({
+            self._events.reset_state("scjn")
+            self._publish_job_status("scjn", status="running", job_id=str(event.job_id))
+            self._append_log("scjn", {
                 "level": "info",
                 "message": f"SCJN job started: {event.job_id}",
                 "source": "SCJN",
                 "timestamp": event.timestamp.isoformat()
             })
         elif isinstance(event, SCJNJobProgress):
-            # Don't spam logs with progress updates
-            pass
+            # Don't spam logs with progress updates; stream the counters instead
+            self._publish_job_progress(
+                "scjn",
+                discovered_count=event.progress.discovered_count,
+                downloaded_count=event.progress.downloaded_count,
+                pending_count=event.progress.pending_count,
+                active_downloads=event.progress.active_downloads,
+                error_count=event.progress.error_count,
+                state=event.progress.state,
+            )
         elif isinstance(event, SCJNJobCompleted):
-            self._scjn_logs.append({
+            self._publish_job_progress(
+                "scjn",
+                discovered_count=event.total_discovered,
+                downloaded_count=event.total_downloaded,
+                error_count=event.total_errors,
+            )
+            self._publish_job_status("scjn", status="completed", job_id=str(event.job_id))
+            self._append_log("scjn", {
                 "level": "success",
                 "message": f"SCJN job completed: {event.total_downloaded} documents",
                 "source": "SCJN",
@@ -607,7 +787,13 @@ class ScraperAPI:
                     document_count=event.total_downloaded,
                 )
         elif isinstance(event, SCJNJobFailed):
-            self._scjn_logs.append({
+            self._publish_job_status(
+                "scjn",
+                status="failed",
+                job_id=str(event.job_id),
+                error=event.error_message,
+            )
+            self._append_log("scjn", {
                 "level": "error",
                 "message": f"SCJN job failed: {event.error_message}",
                 "source": "SCJN",
@@ -622,17 +808,34 @@ class ScraperAPI:
         from datetime import datetime
 
         if isinstance(event, BJVJobStarted):
-            self._bjv_logs.append({
+            self._events.reset_state("bjv")
+            self._publish_job_status("bjv", status="running", job_id=str(event.job_id))
+            self._append_log("bjv", {
                 "level": "info",
                 "message": f"BJV job started: {event.job_id}",
                 "source": "BJV",
                 "timestamp": event.timestamp.isoformat()
             })
         elif isinstance(event, BJVJobProgress):
-            # Don't spam logs with progress updates
-            pass
+            # Don't spam logs with progress updates; stream the counters instead
+            self._publish_job_progress(
+                "bjv",
+                libros_descubiertos=event.progress.libros_descubiertos,
+                libros_descargados=event.progress.libros_descargados,
+                libros_pendientes=event.progress.libros_pendientes,
+                descargas_activas=event.progress.descargas_activas,
+                errores=event.progress.errores,
+                estado=event.progress.estado,
+            )
         elif isinstance(event, BJVJobCompleted):
-            self._bjv_logs.append({
+            self._publish_job_progress(
+                "bjv",
+                libros_descubiertos=event.total_libros_descubiertos,
+                libros_descargados=event.total_libros_descargados,
+                errores=event.total_errores,
+            )
+            self._publish_job_status("bjv", status="completed", job_id=str(event.job_id))
+            self._append_log("bjv", {
                 "level": "success",
                 "message": f"BJV job completed: {event.total_libros_descargados} libros",
                 "source": "BJV",
@@ -646,7 +849,13 @@ class ScraperAPI:
                     document_count=event.total_libros_descargados,
                 )
         elif isinstance(event, BJVJobFailed):
-            self._bjv_logs.append({
+            self._publish_job_status(
+                "bjv",
+                status="failed",
+                job_id=str(event.job_id),
+                error=event.mensaje_error,
+            )
+            self._append_log("bjv", {
                 "level": "error",
                 "message": f"BJV job failed: {event.mensaje_error}",
                 "source": "BJV",
@@ -661,17 +870,28 @@ class ScraperAPI:
         from datetime import datetime
 
         if isinstance(event, CASJobStarted):
-            self._cas_logs.append({
+            self._events.reset_state("cas")
+            self._publish_job_status("cas", status="running", job_id=str(event.job_id))
+            self._append_log("cas", {
                 "level": "info",
                 "message": f"CAS job started: {event.job_id}",
                 "source": "CAS",
                 "timestamp": event.timestamp
             })
         elif isinstance(event, CASJobProgress):
-            # Don't spam logs with progress updates
-            pass
+            # Don't spam logs with progress updates; stream the counters instead
+            self._publish_job_progress(
+                "cas",
+                estado=event.estado,
+                descubiertos=event.descubiertos,
+                descargados=event.descargados,
+                procesados=event.procesados,
+                errores=event.errores,
+                porcentaje=event.porcentaje,
+            )
         elif isinstance(event, CASJobCompleted):
-            self._cas_logs.append({
+            self._publish_job_status("cas", status="completed", job_id=str(event.job_id))
+            self._append_log("cas", {
                 "level": "success",
                 "message": f"CAS job completed: {event.job_id}",
                 "source": "CAS",
@@ -685,7 +905,11 @@ class ScraperAPI:
                 document_count=50,  # Default estimate for CAS jobs
             )
         elif isinstance(event, CASJobError):
-            self._cas_logs.append({
+            status_values = {"job_id": str(event.job_id), "error": event.mensaje}
+            if not event.recuperable:
+                status_values["status"] = "failed"
+            self._publish_job_status("cas", **status_values)
+            self._append_log("cas", {
                 "level": "error",
                 "message": f"CAS job error: {event.mensaje}",
                 "source": "CAS",
@@ -700,17 +924,27 @@ class ScraperAPI:
         from datetime import datetime
 
         if isinstance(event, DOFJobStarted):
-            self._dof_logs.append({
+            self._events.reset_state("dof")
+            self._publish_job_status("dof", status="running", job_id=str(event.job_id))
+            self._append_log("dof", {
                 "level": "info",
                 "message": f"DOF job started: {event.job_id}",
                 "source": "DOF",
                 "timestamp": event.timestamp
             })
         elif isinstance(event, DOFJobProgress):
-            # Don't spam logs with progress updates
-            pass
+            # Don't spam logs with progress updates; stream the counters instead
+            self._publish_job_progress(
+                "dof",
+                estado=event.estado,
+                total_documents=event.total_documents,
+                processed_documents=event.processed_documents,
+                errores=event.errores,
+                porcentaje=event.porcentaje,
+            )
         elif isinstance(event, DOFJobCompleted):
-            self._dof_logs.append({
+            self._publish_job_status("dof", status="completed", job_id=str(event.job_id))
+            self._append_log("dof", {
                 "level": "success",
                 "message": f"DOF job completed: {event.job_id}",
                 "source": "DOF",
@@ -726,7 +960,11 @@ class ScraperAPI:
                     document_count=doc_count,
                 )
         elif isinstance(event, DOFJobError):
-            self._dof_logs.append({
+            status_values = {"job_id": str(event.job_id), "error": event.mensaje}
+            if not event.recuperable:
+                status_values["status"] = "failed"
+            self._publish_job_status("dof", **status_values)
+            self._append_log("dof", {
                 "level": "error",
                 "message": f"DOF job error: {event.mensaje}",
                 "source": "DOF",
@@ -774,8 +1012,10 @@ class ScraperAPI:
                     "source": source_type.upper(),
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                 }
-                logs = getattr(self, f"_{source_type}_logs", self._dof_logs)
-                logs.append(log_entry)
+                self._append_log(
+                    source_type if source_type in EVENT_SOURCES else "dof",
+                    log_entry,
+                )
         except Exception as e:
             logger.warning(f"Failed to trigger embedding workflow: {e}")
 
@@ -851,6 +1091,7 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
         # Shutdown
         if service is None:
             await api.shutdown()
+        api.temporal_pool.close()
 
     app = FastAPI(
         title="Legal Scraper API",
@@ -861,6 +1102,7 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
 
     # Store API instance in app state
     app.state.api = api
+    app.state.temporal_pool = api.temporal_pool
     app.state.auth_settings = AuthSettings.from_env()
 
     # Setup templates
@@ -880,6 +1122,32 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
     scjn_data_dir.mkdir(parents=True, exist_ok=True)
     app.mount("/downloads/scjn", StaticFiles(directory=str(scjn_data_dir)), name="scjn_downloads")
 
+    async def _logs_response(
+        source: str,
+        limit: int,
+        level: Optional[str],
+        since: Optional[int],
+    ) -> LogsResponse:
+        """Serve one source's log buffer, newest ``limit`` or those after ``since``."""
+        entries = await api.logs[source].read(since=since, limit=max(limit, 0), level=level)
+        if entries:
+            next_since = entries[-1]["seq"]
+        else:
+            next_since = since if since is not None else api.logs[source].last_seq
+        return LogsResponse(
+            logs=[
+                LogEntry(
+                    level=log["level"],
+                    message=log["message"],
+                    source=log["source"],
+                    timestamp=log["timestamp"],
+                    seq=log["seq"],
+                )
+                for log in entries
+            ],
+            next_since=next_since,
+        )
+
     # ============ API Endpoints ============
 
     @app.get("/api/health", response_model=HealthResponse, tags=["Health"])
@@ -923,8 +1191,6 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
         3. Triggers embedding workflow
         4. Optionally notifies n8n via callback_url
         """
-        from temporalio.client import Client
-
         source = request.source.lower()
         if source not in ["scjn", "bjv", "cas", "dof"]:
             return N8nPipelineTriggerResponse(
@@ -969,12 +1235,7 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
                 config["section"] = request.section
 
         try:
-            # Get Temporal client
-            temporal_address = os.environ.get("TEMPORAL_ADDRESS", "temporal-temporal-1:7233")
-            namespace = os.environ.get("TEMPORAL_NAMESPACE", "default")
-            task_queue = os.environ.get("TEMPORAL_TASK_QUEUE", "scraper-pipeline")
-
-            client = await Client.connect(temporal_address, namespace=namespace)
+            temporal_address, namespace, task_queue = _web_temporal_settings()
 
             # Generate workflow ID
             import time
@@ -987,11 +1248,16 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
             if request.callback_url:
                 config["callback_url"] = request.callback_url
 
-            handle = await client.start_workflow(
-                ScraperPipelineWorkflow.run,
-                args=[config],
-                id=workflow_id,
-                task_queue=task_queue,
+            await api.temporal_pool.start_workflow(
+                temporal_address,
+                namespace,
+                workflow_id,
+                lambda client: client.start_workflow(
+                    ScraperPipelineWorkflow.run,
+                    args=[config],
+                    id=workflow_id,
+                    task_queue=task_queue,
+                ),
             )
 
             return N8nPipelineTriggerResponse(
@@ -1021,21 +1287,16 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
 
         Returns workflow status including downloaded/error counts.
         """
-        from temporalio.client import Client
-
         try:
-            temporal_address = os.environ.get("TEMPORAL_ADDRESS", "temporal-temporal-1:7233")
-            namespace = os.environ.get("TEMPORAL_NAMESPACE", "default")
-
-            client = await Client.connect(temporal_address, namespace=namespace)
-            handle = client.get_workflow_handle(workflow_id)
-            desc = await handle.describe()
+            temporal_address, namespace, _ = _web_temporal_settings()
+            desc = await api.temporal_pool.describe(temporal_address, namespace, workflow_id)
 
             # Try to get result if completed
             result = None
             if desc.status.name == "COMPLETED":
                 try:
-                    result = await handle.result()
+                    client = await api.temporal_pool.get(temporal_address, namespace)
+                    result = await client.get_workflow_handle(workflow_id).result()
                 except Exception:
                     pass
 
@@ -1072,13 +1333,9 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
             status: Filter by status (RUNNING, COMPLETED, FAILED)
             limit: Maximum number of results
         """
-        from temporalio.client import Client
-
         try:
-            temporal_address = os.environ.get("TEMPORAL_ADDRESS", "temporal-temporal-1:7233")
-            namespace = os.environ.get("TEMPORAL_NAMESPACE", "default")
-
-            client = await Client.connect(temporal_address, namespace=namespace)
+            temporal_address, namespace, _ = _web_temporal_settings()
+            client = await api.temporal_pool.get(temporal_address, namespace)
 
             # Build query for ScraperPipelineWorkflow
             query = "WorkflowType = 'ScraperPipelineWorkflow'"
@@ -1397,6 +1654,78 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
             }
         )
 
+    @app.get(
+        "/api/events/{source}",
+        tags=["Events"],
+        dependencies=[Depends(require_auth)],
+    )
+    async def source_event_stream(
+        source: str,
+        request: Request,
+        since: Optional[int] = None,
+    ):
+        """
+        Per-source job event stream (status deltas, progress counters, log lines).
+
+        Use ``all`` to follow every source. Each frame carries the event's
+        sequence number as its SSE id; reconnect with ``Last-Event-ID`` (or
+        ``?since=``) to receive only the missed events. Without a cursor the
+        stream opens with a ``snapshot`` event holding the current state. A
+        client that falls too far behind has its stream ended and resumes
+        the same way.
+        """
+        source = source.lower()
+        valid_sources = (*EVENT_SOURCES, SERVICE_EVENT_SOURCE)
+        if source != "all" and source not in valid_sources:
+            raise HTTPException(status_code=404, detail=f"Unknown event source: {source}")
+        sources = valid_sources if source == "all" else (source,)
+
+        last_event_id = request.headers.get("last-event-id")
+        if last_event_id and last_event_id.isdigit():
+            since = int(last_event_id)
+
+        hub = api.events
+        opening = []
+        if since is None:
+            opening = [
+                {
+                    "seq": hub.last_seq,
+                    "source": name,
+                    "kind": "snapshot",
+                    "data": hub.snapshot(name),
+                }
+                for name in sources
+            ]
+        subscription = hub.subscribe(sources, since=since)
+
+        async def generate() -> AsyncGenerator[str, None]:
+            try:
+                for event in [*opening, *subscription.backlog]:
+                    yield format_sse(event)
+                while not subscription.finished:
+                    try:
+                        event = await asyncio.wait_for(
+                            subscription.queue.get(),
+                            timeout=EVENT_STREAM_KEEPALIVE_SECONDS,
+                        )
+                        yield format_sse(event)
+                    except asyncio.TimeoutError:
+                        if await request.is_disconnected():
+                            break
+                        yield ": keepalive\n\n"
+            finally:
+                hub.unsubscribe(subscription)
+
+        return StreamingResponse(
+            generate(),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "X-Accel-Buffering": "no",
+            },
+        )
+
     # ============ SCJN API Endpoints ============
 
     @app.get(
@@ -1473,7 +1802,7 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
             },
         )
         if workflow_id:
-            api._scjn_logs.append({
+            api._append_log("scjn", {
                 "level": "info",
                 "message": f"Starting SCJN Crawl4AI workflow (category={request.category}, scope={request.scope})",
                 "source": "SCJN",
@@ -1496,7 +1825,7 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
             result = await api.scjn_bridge.ask(("START_SEARCH", config))
 
             if result.get("success"):
-                api._scjn_logs.append({
+                api._append_log("scjn", {
                     "level": "info",
                     "message": f"Starting SCJN search (category={request.category}, scope={request.scope})",
                     "source": "SCJN",
@@ -1559,18 +1888,13 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
         tags=["SCJN"],
         dependencies=[Depends(require_auth)],
     )
-    async def get_scjn_logs():
-        """Get SCJN job logs."""
-        logs = [
-            LogEntry(
-                level=log["level"],
-                message=log["message"],
-                source=log["source"],
-                timestamp=log["timestamp"]
-            )
-            for log in api._scjn_logs[-100:]  # Last 100 logs
-        ]
-        return LogsResponse(logs=logs)
+    async def get_scjn_logs(
+        limit: int = 100,
+        level: Optional[str] = None,
+        since: Optional[int] = None,
+    ):
+        """Get SCJN job logs, only those after ``since`` when given."""
+        return await _logs_response("scjn", limit, level, since)
 
     @app.get(
         "/api/scjn/categories",
@@ -1672,7 +1996,7 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
             },
         )
         if workflow_id:
-            api._bjv_logs.append({
+            api._append_log("bjv", {
                 "level": "info",
                 "message": f"Starting BJV Crawl4AI workflow (term={request.termino_busqueda}, area={request.area_derecho})",
                 "source": "BJV",
@@ -1705,7 +2029,7 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
             result = await api.bjv_bridge.ask(("START_SEARCH", config))
 
             if result.get("success"):
-                api._bjv_logs.append({
+                api._append_log("bjv", {
                     "level": "info",
                     "message": f"Starting BJV search (term={request.termino_busqueda}, area={request.area_derecho})",
                     "source": "BJV",
@@ -1768,18 +2092,13 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
         tags=["BJV"],
         dependencies=[Depends(require_auth)],
     )
-    async def get_bjv_logs():
-        """Get BJV job logs."""
-        logs = [
-            LogEntry(
-                level=log["level"],
-                message=log["message"],
-                source=log["source"],
-                timestamp=log["timestamp"]
-            )
-            for log in api._bjv_logs[-100:]  # Last 100 logs
-        ]
-        return LogsResponse(logs=logs)
+    async def get_bjv_logs(
+        limit: int = 100,
+        level: Optional[str] = None,
+        since: Optional[int] = None,
+    ):
+        """Get BJV job logs, only those after ``since`` when given."""
+        return await _logs_response("bjv", limit, level, since)
 
     @app.get(
         "/api/bjv/areas",
@@ -1905,7 +2224,7 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
             },
         )
         if workflow_id:
-            api._cas_logs.append({
+            api._append_log("cas", {
                 "level": "info",
                 "message": f"Starting CAS Crawl4AI workflow (sport={request.sport}, matter={request.matter})",
                 "source": "CAS",
@@ -1929,7 +2248,7 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
             # Start job via bridge
             job_id = await api.cas_bridge.start_job(config)
 
-            api._cas_logs.append({
+            api._append_log("cas", {
                 "level": "info",
                 "message": f"Starting CAS search (sport={request.sport}, matter={request.matter})",
                 "source": "CAS",
@@ -2000,24 +2319,10 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
     async def get_cas_logs(
         limit: int = 100,
         level: Optional[str] = None,
+        since: Optional[int] = None,
     ):
-        """Get CAS job logs."""
-        logs = api._cas_logs[-limit:]  # Last N logs
-
-        # Filter by level if specified
-        if level:
-            logs = [log for log in logs if log.get("level") == level]
-
-        log_entries = [
-            LogEntry(
-                level=log["level"],
-                message=log["message"],
-                source=log["source"],
-                timestamp=log["timestamp"]
-            )
-            for log in logs
-        ]
-        return LogsResponse(logs=log_entries)
+        """Get CAS job logs, only those after ``since`` when given."""
+        return await _logs_response("cas", limit, level, since)
 
     # ============ DOF API Endpoints ============
 
@@ -2116,7 +2421,7 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
             },
         )
         if workflow_id:
-            api._dof_logs.append({
+            api._append_log("dof", {
                 "level": "info",
                 "message": f"Starting DOF Crawl4AI workflow (mode={request.mode}, section={request.section})",
                 "source": "DOF",
@@ -2141,7 +2446,7 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
             # Start job via bridge
             job_id = await api.dof_bridge.start_job(config)
 
-            api._dof_logs.append({
+            api._append_log("dof", {
                 "level": "info",
                 "message": f"Starting DOF scrape (mode={request.mode}, section={request.section})",
                 "source": "DOF",
@@ -2212,24 +2517,10 @@ def create_app(service: Optional[ScraperService] = None) -> FastAPI:
     async def get_dof_logs(
         limit: int = 100,
         level: Optional[str] = None,
+        since: Optional[int] = None,
     ):
-        """Get DOF job logs."""
-        logs = api._dof_logs[-limit:]  # Last N logs
-
-        # Filter by level if specified
-        if level:
-            logs = [log for log in logs if log.get("level") == level]
-
-        log_entries = [
-            LogEntry(
-                level=log["level"],
-                message=log["message"],
-                source=log["source"],
-                timestamp=log["timestamp"]
-            )
-            for log in logs
-        ]
-        return LogsResponse(logs=log_entries)
+        """Get DOF job logs, only those after ``since`` when given."""
+        return await _logs_response("dof", limit, level, since)
 
     # ============ Web UI Routes ============
 
@@ -0,0 +1,182 @@
+"""
+Per-source job event hub for the web API.
+
+Bridges, the generic ScraperService and the Temporal workflow watcher publish
+status deltas, progress counters and log lines here. Every event gets a
+process-wide sequence number, so an SSE client can reconnect with
+``Last-Event-ID`` and receive only what it missed. Status and progress are
+published as deltas: an update that changes nothing produces no event, so the
+cost of following a job is proportional to how often it changes rather than
+to how often someone looks at it.
+
+Event shape::
+
+    {"seq": 42, "source": "scjn", "kind": "progress",
+     "data": {"downloaded_count": 17}, "timestamp": "..."}
+
+Kinds:
+    status    Changed fields of the job status (status, job_id, ...)
+    progress  Changed progress counters
+    log       One new log line (the ``data`` is the log entry)
+    resync    Sent instead of a replay when the requested cursor fell out of
+              the replay buffer or is ahead of this process (an API restart);
+              ``data`` holds the current snapshot
+
+A subscriber that falls ``subscriber_queue_size`` events behind is cut off
+rather than skipped ahead: it receives everything queued up to that point,
+then its stream ends, and the client's reconnect with ``Last-Event-ID`` gets
+the rest from the replay buffer (or a ``resync``). Per-source streams have
+seq gaps by design, so clients could not detect a dropped event themselves.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPLAY_SIZE = 1000
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 256
+STATE_KINDS = ("status", "progress")
+
+
+@dataclass
+class EventSubscription:
+    """One live consumer of the hub."""
+
+    sources: Optional[frozenset[str]]
+    queue: asyncio.Queue
+    backlog: list[dict] = field(default_factory=list)
+    dropped: int = 0
+    overflowed: bool = False
+
+    def wants(self, source: str) -> bool:
+        return self.sources is None or source in self.sources
+
+    @property
+    def finished(self) -> bool:
+        """Cut off for falling behind and every queued event delivered."""
+        return self.overflowed and self.queue.empty()
+
+
+class SourceEventHub:
+    """Sequenced fan-out of per-source job events with a bounded replay buffer."""
+
+    def __init__(
+        self,
+        replay_size: int = DEFAULT_REPLAY_SIZE,
+        subscriber_queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+    ):
+        self._seq = 0
+        self._replay: deque[dict] = deque(maxlen=replay_size)
+        self._state: dict[str, dict[str, dict[str, Any]]] = {}
+        self._subscribers: list[EventSubscription] = []
+        self._subscriber_queue_size = subscriber_queue_size
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    def publish(self, source: str, kind: str, data: dict[str, Any]) -> dict:
+        """Append one event and fan it out to matching subscribers."""
+        self._seq += 1
+        event = {
+            "seq": self._seq,
+            "source": source,
+            "kind": kind,
+            "data": data,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        self._replay.append(event)
+        for subscription in list(self._subscribers):
+            if not subscription.wants(source):
+                continue
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Slow consumer: stop feeding it so its stream ends after the
+                # queued events and the client resumes from its last seq.
+                subscription.dropped += 1
+                subscription.overflowed = True
+                self._subscribers.remove(subscription)
+                logger.info("Event subscriber fell behind at seq %s; closing its stream", self._seq)
+        return event
+
+    def publish_state(self, source: str, kind: str, values: dict[str, Any]) -> Optional[dict]:
+        """Publish only the fields of ``values`` that changed since the last update."""
+        current = self._state.setdefault(source, {}).setdefault(kind, {})
+        delta = {key: value for key, value in values.items() if current.get(key) != value}
+        if not delta:
+            return None
+        current.update(delta)
+        return self.publish(source, kind, delta)
+
+    def publish_log(self, source: str, entry: dict[str, Any]) -> dict:
+        return self.publish(source, "log", entry)
+
+    def reset_state(self, source: str) -> None:
+        """Forget the stored snapshot so the next update is published in full."""
+        self._state.pop(source, None)
+
+    def snapshot(self, source: str) -> dict[str, dict[str, Any]]:
+        state = self._state.get(source, {})
+        return {kind: dict(state.get(kind, {})) for kind in STATE_KINDS}
+
+    def subscribe(
+        self,
+        sources: Optional[Iterable[str]] = None,
+        since: Optional[int] = None,
+    ) -> EventSubscription:
+        """
+        Register a consumer.
+
+        With ``since`` the subscription's backlog holds every buffered event
+        after that sequence number, or a single ``resync`` event per source
+        when the buffer no longer reaches back that far or ``since`` is
+        ahead of this hub (the cursor came from before a restart).
+        """
+        wanted = frozenset(sources) if sources is not None else None
+        subscription = EventSubscription(
+            sources=wanted,
+            queue=asyncio.Queue(maxsize=self._subscriber_queue_size),
+        )
+        if since is not None and since != self._seq:
+            oldest = self._replay[0]["seq"] if self._replay else self._seq + 1
+            if oldest <= since + 1 <= self._seq:
+                subscription.backlog = [
+                    event
+                    for event in self._replay
+                    if event["seq"] > since and subscription.wants(event["source"])
+                ]
+            else:
+                known_sources = wanted if wanted is not None else frozenset(self._state)
+                subscription.backlog = [
+                    {
+                        "seq": self._seq,
+                        "source": source,
+                        "kind": "resync",
+                        "data": self.snapshot(source),
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                    }
+                    for source in sorted(known_sources)
+                ]
+        self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        if subscription in self._subscribers:
+            self._subscribers.remove(subscription)
+
+
+def format_sse(event: dict) -> str:
+    """Render one hub event as a Server-Sent Events frame."""
+    return (
+        f"id: {event['seq']}\n"
+        f"event: {event['kind']}\n"
+        f"data: {json.dumps(event, default=str)}\n\n"
+    )
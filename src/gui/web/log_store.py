@@ -0,0 +1,258 @@
+"""
+Bounded per-source log store for the web API.
+
+Each scraper source keeps its most recent log lines in a fixed-capacity ring
+buffer instead of an ever-growing list, so a week-long backfill no longer
+grows the API process or turns every ``/logs`` poll into a multi-MB response.
+Entries carry monotonically increasing ``seq`` ids; clients pass the last one
+they saw as ``since`` and receive only newer lines.
+
+When ``SCRAPER_LOG_SPILL_DIR`` is set, lines evicted from the buffer are
+appended in batches to a gzip-compressed JSON-lines file per source and
+process, and ``since`` cursors older than the buffer are served from it.
+Spill writes run in a worker thread, like spill reads, so a full batch never
+blocks the event loop that called ``append``.
+
+Environment variables:
+    SCRAPER_LOG_BUFFER_SIZE: Lines kept in memory per source (default: 1000)
+    SCRAPER_LOG_SPILL_DIR: Directory for compressed log history (unset = off)
+"""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import zlib
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOG_BUFFER_SIZE = 1000
+SPILL_BATCH_SIZE = 200
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _spill_dir_from_env() -> Optional[Path]:
+    value = os.environ.get("SCRAPER_LOG_SPILL_DIR", "").strip()
+    return Path(value) if value else None
+
+
+class LogRingBuffer:
+    """Fixed-capacity, sequence-numbered log buffer for one source."""
+
+    def __init__(
+        self,
+        source: str,
+        capacity: Optional[int] = None,
+        spill_dir: Optional[Path] = None,
+        spill_batch_size: int = SPILL_BATCH_SIZE,
+    ):
+        self.source = source
+        self._entries: deque[dict] = deque(
+            maxlen=capacity or _env_int("SCRAPER_LOG_BUFFER_SIZE", DEFAULT_LOG_BUFFER_SIZE)
+        )
+        self._last_seq = 0
+        self._spill_batch_size = max(1, spill_batch_size)
+        self._pending_spill: list[dict] = []
+        self._writing_spill: list[dict] = []
+        self._spill_task: Optional[asyncio.Task] = None
+        self._spill_path: Optional[Path] = None
+        if spill_dir is not None:
+            started = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+            self._spill_path = Path(spill_dir) / f"{source}-{started}-{os.getpid()}.jsonl.gz"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def last_seq(self) -> int:
+        return self._last_seq
+
+    @property
+    def oldest_seq(self) -> Optional[int]:
+        return self._entries[0]["seq"] if self._entries else None
+
+    @property
+    def spill_path(self) -> Optional[Path]:
+        return self._spill_path
+
+    def append(self, entry: dict[str, Any], seq: Optional[int] = None) -> dict:
+        """Store one entry and return it with its ``seq`` assigned."""
+        if seq is None or seq <= self._last_seq:
+            seq = self._last_seq + 1
+        self._last_seq = seq
+        entry = {**entry, "seq": seq}
+        if self._spill_path is not None and len(self._entries) == self._entries.maxlen:
+            self._pending_spill.append(self._entries[0])
+            if len(self._pending_spill) >= self._spill_batch_size:
+                self._schedule_spill()
+        self._entries.append(entry)
+        return entry
+
+    def _schedule_spill(self) -> None:
+        if self._spill_task is not None and not self._spill_task.done():
+            return  # The running writer drains the new batch too
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_spill(self._drain_pending())
+            return
+        self._spill_task = loop.create_task(self._spill_pending())
+
+    def _drain_pending(self) -> list[dict]:
+        pending, self._pending_spill = self._pending_spill, []
+        return pending
+
+    async def _spill_pending(self) -> None:
+        # One writer at a time keeps gzip members in seq order.
+        while self._pending_spill:
+            self._writing_spill = self._drain_pending()
+            try:
+                await asyncio.to_thread(self._write_spill, self._writing_spill)
+            finally:
+                self._writing_spill = []
+
+    async def flush(self) -> None:
+        """Write evicted entries that are still pending to the spill file."""
+        if self._spill_path is None:
+            return
+        if self._spill_task is not None:
+            await self._spill_task
+        await self._spill_pending()
+
+    def _write_spill(self, pending: list[dict]) -> None:
+        if self._spill_path is None or not pending:
+            return
+        try:
+            self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+            # Each flush appends one gzip member; readers see them as one stream.
+            with gzip.open(self._spill_path, "at", encoding="utf-8") as handle:
+                for entry in pending:
+                    handle.write(json.dumps(entry, default=str) + "\n")
+        except OSError as exc:
+            logger.warning("Failed to spill %s logs to %s: %s", self.source, self._spill_path, exc)
+
+    def recent(
+        self,
+        since: Optional[int] = None,
+        limit: int = 100,
+        level: Optional[str] = None,
+    ) -> list[dict]:
+        """
+        Return buffered entries.
+
+        Without ``since`` the newest ``limit`` entries are returned; with it,
+        the oldest ``limit`` entries after that cursor, so a client can page
+        forward without gaps.
+        """
+        entries = [
+            entry
+            for entry in self._entries
+            if (since is None or entry["seq"] > since)
+            and (level is None or entry.get("level") == level)
+        ]
+        if since is None:
+            return entries[-limit:] if limit > 0 else []
+        return entries[:limit]
+
+    def needs_history(self, since: Optional[int]) -> bool:
+        """True when ``since`` points before the buffer and a spill file exists."""
+        oldest = self.oldest_seq
+        return (
+            since is not None
+            and self._spill_path is not None
+            and oldest is not None
+            and since + 1 < oldest
+            and (
+                self._spill_path.exists()
+                or bool(self._pending_spill)
+                or bool(self._writing_spill)
+            )
+        )
+
+    def _read_spilled(
+        self,
+        since: int,
+        limit: int,
+        level: Optional[str],
+        pending: list[dict],
+    ) -> list[dict]:
+        entries = [
+            entry
+            for entry in pending
+            if entry["seq"] > since and (level is None or entry.get("level") == level)
+        ]
+        if self._spill_path is None or not self._spill_path.exists():
+            return entries[:limit]
+        spilled: list[dict] = []
+        try:
+            with gzip.open(self._spill_path, "rt", encoding="utf-8") as handle:
+                for line in handle:
+                    entry = json.loads(line)
+                    if entry["seq"] <= since or (level is not None and entry.get("level") != level):
+                        continue
+                    spilled.append(entry)
+                    if len(spilled) >= limit:
+                        break
+        except (EOFError, OSError, ValueError, zlib.error) as exc:
+            # A flush may be appending the last member while we read.
+            logger.debug("Stopped reading %s at a partial member: %s", self._spill_path, exc)
+        pending_seqs = {entry["seq"] for entry in entries}
+        merged = [entry for entry in spilled if entry["seq"] not in pending_seqs] + entries
+        merged.sort(key=lambda entry: entry["seq"])
+        return merged[:limit]
+
+    async def read(
+        self,
+        since: Optional[int] = None,
+        limit: int = 100,
+        level: Optional[str] = None,
+    ) -> list[dict]:
+        """``recent`` that falls back to the spill file for old cursors."""
+        if not self.needs_history(since):
+            return self.recent(since=since, limit=limit, level=level)
+        history = await asyncio.to_thread(
+            self._read_spilled,
+            since,
+            limit,
+            level,
+            self._writing_spill + self._pending_spill,
+        )
+        if len(history) >= limit:
+            return history
+        after = history[-1]["seq"] if history else since
+        return history + self.recent(since=after, limit=limit - len(history), level=level)
+
+
+class SourceLogStore:
+    """The ring buffers of every source served by the web API."""
+
+    def __init__(
+        self,
+        sources,
+        capacity: Optional[int] = None,
+        spill_dir: Optional[Path] = None,
+    ):
+        spill_dir = spill_dir if spill_dir is not None else _spill_dir_from_env()
+        self._buffers = {
+            source: LogRingBuffer(source, capacity=capacity, spill_dir=spill_dir)
+            for source in sources
+        }
+
+    def __getitem__(self, source: str) -> LogRingBuffer:
+        return self._buffers[source]
+
+    async def flush(self) -> None:
+        for buffer in self._buffers.values():
+            await buffer.flush()
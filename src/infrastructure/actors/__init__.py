@@ -3,7 +3,8 @@ SCJN Scraping Actor System
 
 Actor-based architecture for document scraping pipeline.
 """
-from .base import BaseActor
+from .base import BaseActor, DeferredReply
+from .mailbox import Mailbox, MailboxStats, OverflowPolicy
 from .messages import (
     # Commands
     DescubrirDocumentos,
@@ -69,6 +70,10 @@ from .cas_coordinator_actor import CASCoordinatorActor
 __all__ = [
     # Base
     "BaseActor",
+    "DeferredReply",
+    "Mailbox",
+    "MailboxStats",
+    "OverflowPolicy",
     # Commands
     "DescubrirDocumentos",
     "DescubrirPagina",
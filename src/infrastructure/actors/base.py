@@ -1,62 +1,170 @@
 import asyncio
 from abc import ABC, abstractmethod
+from functools import partial
+
+from .mailbox import Mailbox, OverflowPolicy
+
+
+class DeferredReply:
+    """
+    Handler result that answers an ask once ``awaitable`` completes.
+
+    The actor moves on to its next message meanwhile, so a handler that waits
+    on another actor (which may be sending to this one) does not stall the
+    mailbox.
+    """
+    def __init__(self, awaitable):
+        self.awaitable = awaitable
+
 
 class BaseActor(ABC):
     """
     Abstract Base Actor.
     Runs an internal infinite loop to process messages from a Queue.
+
+    With ``concurrency`` > 1 the actor becomes a worker pool: that many
+    consumer loops share the mailbox, so up to ``concurrency`` handlers run at
+    once. Consumers pull the next message as soon as they are free, which
+    routes every message to the least-busy worker without a dispatcher.
+    ``mailbox_size`` bounds the mailbox (0 = unbounded); once it is full,
+    ``tell`` waits for room (or drops the message under
+    ``OverflowPolicy.DROP``) and ``ask`` waits, pushing backpressure onto the
+    sender. Handlers of a pooled actor must be safe to interleave.
+
+    Message types listed in ``CONTROL_MESSAGES`` skip the bound and are
+    handled ahead of queued work: completions and lifecycle commands must
+    reach an actor whose own sends are waiting on a full mailbox.
     """
-    def __init__(self):
-        self._queue = asyncio.Queue()
+    CONTROL_MESSAGES: tuple = ()
+
+    def __init__(
+        self,
+        concurrency: int = 1,
+        mailbox_size: int = 0,
+        mailbox_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ):
+        self._queue = Mailbox(mailbox_size, mailbox_policy)
+        self._concurrency = max(1, concurrency)
         self._running = False
         self._task = None
+        self._tasks = []
+        self._in_flight = 0
+        self._deferred = set()
+
+    @property
+    def concurrency(self) -> int:
+        """Number of mailbox consumers."""
+        return self._concurrency
+
+    @property
+    def load(self) -> int:
+        """Messages queued or being handled."""
+        return self._queue.qsize() + self._in_flight
+
+    def mailbox_stats(self) -> dict:
+        """Mailbox depth, drops and enqueue-wait totals."""
+        stats = self._queue.stats().to_dict()
+        stats["in_flight"] = self._in_flight
+        return stats
 
     async def start(self):
-        """Starts the actor's processing loop in the background."""
+        """Starts the actor's processing loop(s) in the background."""
         self._running = True
-        self._task = asyncio.create_task(self._process_mailbox())
+        self._tasks = [
+            asyncio.create_task(self._process_mailbox())
+            for _ in range(self._concurrency)
+        ]
+        self._task = self._tasks[0]
 
     async def stop(self):
         """Stops the actor cleanly."""
         self._running = False
-        await self._queue.put(None)  # Poison pill to break the loop
-        if self._task:
-            await self._task
+        # Wakes a consumer idling on an empty mailbox; each consumer passes it
+        # on when it exits, busy ones see _running after their message.
+        self._queue.put_control(None)
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+        # The last consumer out leaves the pill behind; a restarted actor
+        # would otherwise stop on it at once.
+        self._queue.discard_control(None)
+        for task in list(self._deferred):
+            task.cancel()
 
     async def tell(self, message):
         """Fire and forget: Send a message without waiting."""
-        await self._queue.put(message)
+        if isinstance(message, self.CONTROL_MESSAGES):
+            self._queue.put_control(message)
+        else:
+            await self._queue.put(message)
 
     async def ask(self, message):
         """Request-Response: Send a message and wait for a reply."""
         future = asyncio.get_running_loop().create_future()
         # Wrap the message so we know to send the result back to this future
-        await self._queue.put((message, future))
+        if isinstance(message, self.CONTROL_MESSAGES):
+            self._queue.put_control((message, future))
+        else:
+            await self._queue.put((message, future), droppable=False)
         return await future
 
+    def _accepting_work(self) -> bool:
+        """Whether to take queued work; control messages are always taken."""
+        return True
+
     async def _process_mailbox(self):
         """Internal loop that pulls messages off the queue."""
         while self._running:
-            item = await self._queue.get()
-            
+            item = await self._queue.get(self._accepting_work)
+
             if item is None:  # Poison pill check
+                self._queue.put_control(None)
                 break
 
-            # Check if it's an "Ask" (Tuple) or a "Tell" (Raw Message)
-            if isinstance(item, tuple) and len(item) == 2 and isinstance(item[1], asyncio.Future):
-                msg, future = item
-                try:
-                    result = await self.handle_message(msg)
-                    if not future.done():
-                        future.set_result(result)
-                except Exception as e:
-                    if not future.done():
-                        future.set_exception(e)
-            else:
-                # It's a standard Tell message
-                await self.handle_message(item)
+            self._in_flight += 1
+            try:
+                await self._dispatch(item)
+            finally:
+                self._in_flight -= 1
+
+    async def _dispatch(self, item):
+        """Run one mailbox item, resolving the future of an ask."""
+        # Check if it's an "Ask" (Tuple) or a "Tell" (Raw Message)
+        if isinstance(item, tuple) and len(item) == 2 and isinstance(item[1], asyncio.Future):
+            msg, future = item
+            try:
+                result = await self.handle_message(msg)
+                if isinstance(result, DeferredReply):
+                    self._defer(result, future)
+                elif not future.done():
+                    future.set_result(result)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            # It's a standard Tell message
+            result = await self.handle_message(item)
+            if isinstance(result, DeferredReply):
+                self._defer(result, None)
+
+    def _defer(self, reply: DeferredReply, future):
+        task = asyncio.ensure_future(reply.awaitable)
+        self._deferred.add(task)
+        task.add_done_callback(partial(self._settle_deferred, future))
+
+    def _settle_deferred(self, future, task):
+        self._deferred.discard(task)
+        if future is None or future.done():
+            if not task.cancelled():
+                task.exception()  # Mark retrieved; tells have nobody to report to
+            return
+        if task.cancelled():
+            future.cancel()
+        elif task.exception() is not None:
+            future.set_exception(task.exception())
+        else:
+            future.set_result(task.result())
 
     @abstractmethod
     async def handle_message(self, message):
         """Subclasses must implement this to define behavior."""
-        pass
\ No newline at end of file
+        pass
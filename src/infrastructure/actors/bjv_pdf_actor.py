@@ -142,6 +142,7 @@ class BJVPDFActor(BJVBaseActor):
         await self._rate_limiter.acquire()
 
         async with self._session.get(url) as response:
+            await self._rate_limiter.report(response.status, response.headers.get("Retry-After"))
             response.raise_for_status()
             return await response.read()
 
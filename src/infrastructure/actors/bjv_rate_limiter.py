@@ -3,11 +3,20 @@ Rate limiter for BJV scraping.
 
 Academic resource - be respectful with 0.5 req/sec default.
 Uses token bucket algorithm for smooth rate limiting.
+
+With ``RateLimiterConfig.domain`` set, requests draw from the shared
+per-domain budget instead, so every worker hitting BJV is paced together.
 """
 import asyncio
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
+
+from src.infrastructure.resilience.shared_rate_limiter import (
+    RateBudget,
+    SharedRateLimiter,
+    get_shared_rate_limiter,
+)
 
 
 @dataclass(frozen=True)
@@ -15,6 +24,7 @@ class RateLimiterConfig:
     """Rate limiter configuration."""
     requests_per_second: float = 0.5  # 1 request per 2 seconds (respectful)
     burst_size: int = 1
+    domain: Optional[str] = None  # Share this domain's budget across workers
 
 
 class BJVRateLimiter:
@@ -24,20 +34,33 @@ class BJVRateLimiter:
     Default: 0.5 requests/second (respectful of academic resource)
     """
 
-    def __init__(self, config: Optional[RateLimiterConfig] = None):
+    def __init__(
+        self,
+        config: Optional[RateLimiterConfig] = None,
+        shared: Optional[SharedRateLimiter] = None,
+    ):
         """
         Initialize the rate limiter.
 
         Args:
             config: Rate limiter configuration
+            shared: Shared limiter for ``config.domain`` (default: process-wide one)
         """
         self._config = config or RateLimiterConfig()
+        self._shared = shared
         self._tokens = float(self._config.burst_size)
         self._last_update = datetime.utcnow()
         self._lock = asyncio.Lock()
 
     async def acquire(self) -> None:
         """Wait until a request token is available."""
+        if self._config.domain:
+            await self._shared_limiter().acquire(
+                self._config.domain,
+                RateBudget(self._config.requests_per_second, self._config.burst_size),
+            )
+            return
+
         async with self._lock:
             now = datetime.utcnow()
             elapsed = (now - self._last_update).total_seconds()
@@ -56,3 +79,11 @@ class BJVRateLimiter:
                 self._tokens = 0
             else:
                 self._tokens -= 1
+
+    async def report(self, status: Any, retry_after: Any = None) -> None:
+        """Feed a response status (and Retry-After) back to the shared budget."""
+        if self._config.domain:
+            await self._shared_limiter().report(self._config.domain, status, retry_after)
+
+    def _shared_limiter(self) -> SharedRateLimiter:
+        return self._shared or get_shared_rate_limiter()
@@ -6,8 +6,9 @@ Implements the Actor Model pattern with message passing.
 """
 import asyncio
 import logging
+import re
 import uuid
-from typing import Optional, Any
+from typing import Callable, Optional, Any
 from abc import ABC
 
 from src.infrastructure.actors.cas_messages import (
@@ -15,10 +16,18 @@ from src.infrastructure.actors.cas_messages import (
     ObtenerEstadoCAS,
     ErrorCASPipeline,
 )
+from src.infrastructure.actors.mailbox import Mailbox, OverflowPolicy
 
 
 logger = logging.getLogger(__name__)
 
+# Insert underscore between lower->upper or between caps and cap+lower
+# This handles: IniciarDescubrimientoCAS -> iniciar_descubrimiento_cas
+_HANDLER_NAME_RE = re.compile(r'(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])')
+
+# Mailbox sentinel that ends the processing loop
+_STOP = object()
+
 
 class CASBaseActor(ABC):
     """
@@ -30,18 +39,35 @@ class CASBaseActor(ABC):
     - ask() for request-response patterns
     - Supervisor escalation for errors
     - Lifecycle hooks (on_start, on_stop)
+    - Bounded mailbox (``mailbox_size``, 0 = unbounded) that blocks or
+      drops tells once full; ``CONTROL_MESSAGES`` bypass the bound
+
+    Messages are routed to ``handle_<snake_case_type>`` methods. Each class
+    resolves a message type to its handler once and keeps it in a dispatch
+    table, so steady-state dispatch is a dict lookup.
     """
 
+    CONTROL_MESSAGES: tuple = ()
+    # Seconds stop() lets the current handler finish before cancelling it
+    STOP_GRACE_SECONDS: float = 5.0
+    _dispatch_table: dict = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch_table = {}
+
     def __init__(
         self,
         actor_id: Optional[str] = None,
         supervisor: Optional["CASBaseActor"] = None,
+        mailbox_size: int = 0,
+        mailbox_policy: OverflowPolicy = OverflowPolicy.BLOCK,
     ):
         self._actor_id = actor_id or f"cas-actor-{uuid.uuid4().hex[:8]}"
         self._supervisor = supervisor
         self._estado = EstadoPipelineCAS.INICIANDO
         self._running = False
-        self._mailbox: asyncio.Queue = asyncio.Queue()
+        self._mailbox = Mailbox(mailbox_size, mailbox_policy)
         self._task: Optional[asyncio.Task] = None
         self._pending_asks: dict = {}
 
@@ -69,6 +95,10 @@ class CASBaseActor(ABC):
         """Set actor state."""
         self._estado = estado
 
+    def mailbox_stats(self) -> dict:
+        """Get mailbox depth, drops and enqueue-wait totals."""
+        return self._mailbox.stats().to_dict()
+
     async def start(self) -> None:
         """Start the actor."""
         if self._running:
@@ -87,13 +117,19 @@ class CASBaseActor(ABC):
         self._running = False
         await self.on_stop()
 
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-            self._task = None
+        task, self._task = self._task, None
+        if task:
+            self._mailbox.put_control(_STOP)
+            # Stopped from one of its own handlers: the loop ends on the
+            # sentinel once that handler returns.
+            if task is not asyncio.current_task():
+                try:
+                    await asyncio.wait_for(task, self.STOP_GRACE_SECONDS)
+                except asyncio.TimeoutError:
+                    logger.warning(f"Actor {self._actor_id} handler cancelled on stop")
+                # A cancelled loop never read the sentinel; drop it so a
+                # restarted actor does not stop on it.
+                self._mailbox.discard_control(_STOP)
 
         logger.debug(f"Actor {self._actor_id} stopped")
 
@@ -109,10 +145,25 @@ class CASBaseActor(ABC):
         """
         Send message without waiting for response (fire-and-forget).
 
+        Waits while the mailbox is full, or drops the message under
+        ``OverflowPolicy.DROP``.
+
         Args:
             message: The message to send
         """
-        await self._mailbox.put((message, None))
+        if isinstance(message, self.CONTROL_MESSAGES):
+            self._mailbox.put_control((message, None))
+        elif not await self._mailbox.put((message, None)):
+            logger.warning(f"Mailbox full, dropped {type(message).__name__} for {self._actor_id}")
+
+    def _requeue(self, message: Any) -> None:
+        """
+        Re-send a message to this actor from one of its own handlers.
+
+        Skips the bound: a handler waiting for room in its own mailbox
+        would never finish.
+        """
+        self._mailbox.put_control((message, None))
 
     async def ask(self, message: Any, timeout: float = 30.0) -> Any:
         """
@@ -132,7 +183,10 @@ class CASBaseActor(ABC):
         request_id = uuid.uuid4().hex
         self._pending_asks[request_id] = response_future
 
-        await self._mailbox.put((message, request_id))
+        if isinstance(message, self.CONTROL_MESSAGES):
+            self._mailbox.put_control((message, request_id))
+        else:
+            await self._mailbox.put((message, request_id), droppable=False)
 
         try:
             return await asyncio.wait_for(response_future, timeout)
@@ -150,12 +204,11 @@ class CASBaseActor(ABC):
         Returns:
             Optional response
         """
-        handler_name = self._get_handler_name(message)
-        handler = getattr(self, handler_name, None)
+        handler = self._resolve_handler(type(message))
 
         if handler:
             try:
-                return await handler(message)
+                return await handler(self, message)
             except Exception as e:
                 logger.error(f"Error handling {type(message).__name__}: {e}")
                 error_msg = self._handle_error(e)
@@ -171,18 +224,24 @@ class CASBaseActor(ABC):
 
     def _get_handler_name(self, message: Any) -> str:
         """Get handler method name for message type."""
-        # Convert CamelCase to snake_case, handling acronyms like CAS
-        import re
-        class_name = type(message).__name__
-        # Insert underscore between lower->upper or between caps and cap+lower
-        # This handles: IniciarDescubrimientoCAS -> iniciar_descubrimiento_cas
-        snake_case = re.sub(
-            r'(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])',
-            '_',
-            class_name
-        ).lower()
+        return self._handler_name_for(type(message))
+
+    @staticmethod
+    def _handler_name_for(message_type: type) -> str:
+        """Convert CamelCase to snake_case, handling acronyms like CAS."""
+        snake_case = _HANDLER_NAME_RE.sub('_', message_type.__name__).lower()
         return f"handle_{snake_case}"
 
+    @classmethod
+    def _resolve_handler(cls, message_type: type) -> Optional[Callable]:
+        """Get the handler function for a message type from the class table."""
+        try:
+            return cls._dispatch_table[message_type]
+        except KeyError:
+            handler = getattr(cls, cls._handler_name_for(message_type), None)
+            cls._dispatch_table[message_type] = handler
+            return handler
+
     async def escalate(self, error: ErrorCASPipeline) -> None:
         """
         Escalate error to supervisor.
@@ -217,29 +276,29 @@ class CASBaseActor(ABC):
             recuperable=recuperable,
         )
 
+    def _accepting_work(self) -> bool:
+        """Whether to take queued work; control messages are always taken."""
+        return True
+
     async def _process_mailbox(self) -> None:
-        """Process messages from mailbox."""
-        while self._running:
-            try:
-                message, request_id = await asyncio.wait_for(
-                    self._mailbox.get(),
-                    timeout=1.0
-                )
+        """Process messages from mailbox until the stop sentinel arrives."""
+        while True:
+            item = await self._mailbox.get(self._accepting_work)
+            if item is _STOP:
+                break
 
+            message, request_id = item
+            future = self._pending_asks.pop(request_id, None) if request_id else None
+            try:
                 result = await self.receive(message)
-
-                if request_id and request_id in self._pending_asks:
-                    future = self._pending_asks.pop(request_id)
-                    if not future.done():
-                        future.set_result(result)
-
-            except asyncio.TimeoutError:
-                # No message, continue loop
-                continue
-            except asyncio.CancelledError:
-                break
             except Exception as e:
                 logger.error(f"Error in mailbox processing: {e}")
+                if future and not future.done():
+                    future.set_exception(e)
+                continue
+
+            if future and not future.done():
+                future.set_result(result)
 
     # Default handlers that can be overridden
 
@@ -40,8 +40,23 @@ class CASCoordinatorActor(CASBaseActor):
     - Statistics tracking
     - Pause/Resume support
     - Error handling and retry coordination
+
+    Discovered awards wait in the coordinator's bounded mailbox, which it
+    stops reading while paused, so discovery blocks instead of flooding the
+    scraper. Results, errors and control commands use the control lane and
+    are handled even while queued work waits.
     """
 
+    CONTROL_MESSAGES = (
+        LaudoScrapeadoCAS,
+        FragmentosListosCAS,
+        ErrorCASPipeline,
+        PausarPipelineCAS,
+        ReanudarPipelineCAS,
+        DetenerPipelineCAS,
+        ObtenerEstadoCAS,
+    )
+
     def __init__(
         self,
         discovery_actor: Optional[CASBaseActor] = None,
@@ -49,8 +64,13 @@ class CASCoordinatorActor(CASBaseActor):
         fragmentador_actor: Optional[CASBaseActor] = None,
         actor_id: Optional[str] = None,
         supervisor: Optional[CASBaseActor] = None,
+        mailbox_size: int = 100,
     ):
-        super().__init__(actor_id=actor_id or "cas-coordinator", supervisor=supervisor)
+        super().__init__(
+            actor_id=actor_id or "cas-coordinator",
+            supervisor=supervisor,
+            mailbox_size=mailbox_size,
+        )
         self._discovery_actor = discovery_actor
         self._scraper_actor = scraper_actor
         self._fragmentador_actor = fragmentador_actor
@@ -77,6 +97,10 @@ class CASCoordinatorActor(CASBaseActor):
         """Get pipeline statistics."""
         return self._estadisticas
 
+    def _accepting_work(self) -> bool:
+        """Leave discovered awards queued while paused."""
+        return self._estado != EstadoPipelineCAS.PAUSADO
+
     # Pipeline control handlers
 
     async def handle_iniciar_descubrimiento_cas(
@@ -234,6 +258,16 @@ class CASCoordinatorActor(CASBaseActor):
                 "errores": self._estadisticas.errores,
                 "tasa_exito": self._estadisticas.tasa_exito,
             }
+            result["buzones"] = {
+                actor.actor_id: actor.mailbox_stats()
+                for actor in [
+                    self,
+                    self._discovery_actor,
+                    self._scraper_actor,
+                    self._fragmentador_actor,
+                ]
+                if isinstance(actor, CASBaseActor)
+            }
 
         return result
 
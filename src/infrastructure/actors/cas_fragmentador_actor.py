@@ -33,8 +33,9 @@ class CASFragmentadorActor(CASBaseActor):
         text_chunker: Optional[CASTextChunker] = None,
         actor_id: Optional[str] = None,
         supervisor: Optional[CASBaseActor] = None,
+        mailbox_size: int = 20,
     ):
-        super().__init__(actor_id=actor_id, supervisor=supervisor)
+        super().__init__(actor_id=actor_id, supervisor=supervisor, mailbox_size=mailbox_size)
         self._text_chunker = text_chunker or CASTextChunker()
         self._fragmented_count = 0
         self._total_fragments = 0
@@ -39,8 +39,9 @@ class CASScraperActor(CASBaseActor):
         max_reintentos: int = 3,
         actor_id: Optional[str] = None,
         supervisor: Optional[CASBaseActor] = None,
+        mailbox_size: int = 100,
     ):
-        super().__init__(actor_id=actor_id, supervisor=supervisor)
+        super().__init__(actor_id=actor_id, supervisor=supervisor, mailbox_size=mailbox_size)
         self._browser_adapter = browser_adapter
         self._max_reintentos = max_reintentos
         self._scraped_count = 0
@@ -169,4 +170,4 @@ class CASScraperActor(CASBaseActor):
             url=msg.url,
             reintentos=msg.reintentos + 1,
         )
-        await self.tell(retry_msg)
+        self._requeue(retry_msg)
@@ -0,0 +1,135 @@
+"""
+Bounded actor mailboxes.
+
+Actors used to queue into unbounded ``asyncio.Queue``s, so a fast producer
+(discovery emitting ``DocumentoDescubierto``, a scraper emitting
+``ProcesarPDF`` with the full PDF bytes) could grow a slow consumer's backlog
+without limit. A :class:`Mailbox` has two lanes:
+
+- the work lane holds ordinary messages up to ``capacity``. When it is full a
+  sender either waits for room (``OverflowPolicy.BLOCK``) or the message is
+  counted and discarded (``OverflowPolicy.DROP``);
+- the control lane holds completion events, lifecycle commands and the stop
+  sentinel. It ignores the capacity and is always read first, so an actor
+  waiting on a downstream mailbox still receives the completions that free it.
+
+A consumer can also hold the work lane closed (``get(accept_work=...)``) while
+it has no capacity of its own, which leaves upstream senders waiting on the
+bound instead of buffering in the consumer.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import asdict, dataclass
+from enum import Enum
+from typing import Any, Callable, Optional
+
+
+class OverflowPolicy(str, Enum):
+    """What ``put`` does when the work lane is full."""
+    BLOCK = "block"
+    DROP = "drop"
+
+
+@dataclass
+class MailboxStats:
+    """Depth and enqueue-wait counters of one mailbox."""
+    capacity: int
+    policy: str
+    depth: int = 0
+    control_depth: int = 0
+    high_water: int = 0
+    enqueued: int = 0
+    dropped: int = 0
+    blocked_puts: int = 0
+    enqueue_wait_seconds: float = 0.0
+    max_enqueue_wait_seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class Mailbox:
+    """Two-lane actor mailbox with a bounded work lane."""
+
+    def __init__(self, capacity: int = 0, policy: OverflowPolicy | str = OverflowPolicy.BLOCK):
+        self.capacity = max(0, int(capacity or 0))
+        self.policy = OverflowPolicy(policy)
+        self._work: deque = deque()
+        self._control: deque = deque()
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._stats = MailboxStats(capacity=self.capacity, policy=self.policy.value)
+
+    def qsize(self) -> int:
+        """Messages waiting in the work lane."""
+        return len(self._work)
+
+    def full(self) -> bool:
+        return bool(self.capacity) and len(self._work) >= self.capacity
+
+    def empty(self) -> bool:
+        return not self._work and not self._control
+
+    async def put(self, item: Any, *, droppable: bool = True) -> bool:
+        """
+        Enqueue ``item`` on the work lane.
+
+        Returns False when the mailbox dropped it. Items that are not
+        ``droppable`` (asks, whose caller waits on a reply) always wait.
+        """
+        if self.full():
+            if droppable and self.policy is OverflowPolicy.DROP:
+                self._stats.dropped += 1
+                return False
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            self._stats.blocked_puts += 1
+            while self.full():
+                self._writable.clear()
+                await self._writable.wait()
+            waited = loop.time() - started
+            self._stats.enqueue_wait_seconds += waited
+            self._stats.max_enqueue_wait_seconds = max(self._stats.max_enqueue_wait_seconds, waited)
+        self._work.append(item)
+        self._stats.enqueued += 1
+        self._stats.high_water = max(self._stats.high_water, len(self._work))
+        self._readable.set()
+        return True
+
+    def put_control(self, item: Any) -> None:
+        """Enqueue ``item`` on the control lane; never waits and never drops."""
+        self._control.append(item)
+        self._readable.set()
+
+    def discard_control(self, item: Any) -> int:
+        """Remove every ``item`` (a stop sentinel) from the control lane."""
+        kept = deque(queued for queued in self._control if queued is not item)
+        removed = len(self._control) - len(kept)
+        self._control = kept
+        return removed
+
+    async def get(self, accept_work: Optional[Callable[[], bool]] = None) -> Any:
+        """
+        Return the next control item, or the next work item when
+        ``accept_work`` (re-checked on every wake-up) allows it.
+        """
+        while True:
+            if self._control:
+                return self._control.popleft()
+            if self._work and (accept_work is None or accept_work()):
+                item = self._work.popleft()
+                self._writable.set()
+                return item
+            self._readable.clear()
+            await self._readable.wait()
+
+    def notify(self) -> None:
+        """Wake consumers so they re-check a changed ``accept_work``."""
+        self._readable.set()
+
+    def stats(self) -> MailboxStats:
+        self._stats.depth = len(self._work)
+        self._stats.control_depth = len(self._control)
+        return MailboxStats(**asdict(self._stats))
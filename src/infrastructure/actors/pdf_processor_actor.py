@@ -43,6 +43,8 @@ class PDFProcessorActor(BaseActor):
         max_tokens: int = 512,
         overlap_tokens: int = 50,
         ocr_enabled: bool = False,
+        concurrency: int = 1,
+        mailbox_size: int = 8,
     ):
         """
         Initialize the PDF processor actor.
@@ -51,8 +53,11 @@ class PDFProcessorActor(BaseActor):
             max_tokens: Maximum tokens per chunk
             overlap_tokens: Token overlap between chunks
             ocr_enabled: Whether to enable OCR for scanned PDFs
+            concurrency: PDFs processed at once
+            mailbox_size: Mailbox bound, 0 for unbounded; each queued
+                ProcesarPDF holds a whole PDF in memory
         """
-        super().__init__()
+        super().__init__(concurrency=concurrency, mailbox_size=mailbox_size)
         self._max_tokens = max_tokens
         self._overlap_tokens = overlap_tokens
         self._ocr_enabled = ocr_enabled
@@ -64,7 +69,7 @@ class PDFProcessorActor(BaseActor):
     async def start(self):
         """Start the actor and initialize adapters."""
         await super().start()
-        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._executor = ThreadPoolExecutor(max_workers=max(2, self.concurrency))
         self._initialize_adapters()
 
     async def stop(self):
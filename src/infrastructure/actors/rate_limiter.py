@@ -3,10 +3,22 @@ Token bucket rate limiter for respectful SCJN scraping.
 
 Implements async rate limiting to avoid overwhelming the SCJN server.
 Default rate is 0.5 requests per second (1 request every 2 seconds).
+
+A limiter given a ``domain`` draws from the shared per-domain budget
+(``src.infrastructure.resilience.shared_rate_limiter``) instead of its own
+bucket, so every actor, activity and worker hitting that domain is paced
+together.
 """
 import asyncio
 import time
 from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from src.infrastructure.resilience.shared_rate_limiter import (
+    RateBudget,
+    SharedRateLimiter,
+    get_shared_rate_limiter,
+)
 
 
 @dataclass
@@ -20,8 +32,14 @@ class RateLimiter:
     - acquire() waits until a token is available
 
     Default: 0.5 requests/second (1 request per 2 seconds)
+
+    With ``domain`` set, acquire() and report() go through the shared limiter
+    (``shared``, or the process-wide one) with this rate as the domain's
+    default budget.
     """
     requests_per_second: float = 0.5
+    domain: Optional[str] = None
+    shared: Optional[SharedRateLimiter] = field(default=None, repr=False)
     _tokens: float = field(default=1.0, init=False, repr=False)
     _last_update: float = field(default_factory=time.time, init=False, repr=False)
     _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
@@ -33,6 +51,11 @@ class RateLimiter:
         This method will block (async sleep) if no tokens are available,
         waiting for the token to replenish based on the configured rate.
         """
+        if self.domain:
+            limiter = self.shared or get_shared_rate_limiter()
+            await limiter.acquire(self.domain, RateBudget(self.requests_per_second))
+            return
+
         async with self._lock:
             now = time.time()
             elapsed = now - self._last_update
@@ -51,11 +74,23 @@ class RateLimiter:
 
             self._last_update = time.time()
 
+    async def report(self, status: Any, retry_after: Any = None) -> None:
+        """
+        Feed a response status back to the shared budget.
+
+        A 429 pauses the domain for ``retry_after`` and slows it down for
+        every limiter sharing it. No-op without ``domain``.
+        """
+        if self.domain:
+            limiter = self.shared or get_shared_rate_limiter()
+            await limiter.report(self.domain, status, retry_after)
+
     def reset(self) -> None:
         """
         Reset to full token.
 
         Useful for testing or when starting a new batch of requests.
+        Does not touch a shared domain budget.
         """
         self._tokens = 1.0
         self._last_update = time.time()
@@ -74,6 +109,10 @@ class NoOpRateLimiter:
         """Acquire without waiting."""
         pass
 
+    async def report(self, status: Any, retry_after: Any = None) -> None:
+        """Report does nothing."""
+        pass
+
     def reset(self) -> None:
         """Reset does nothing."""
         pass
@@ -4,12 +4,11 @@ SCJN Coordinator Actor
 Orchestrates the SCJN scraping pipeline.
 Coordinates discovery, download, persistence, and checkpoint actors.
 """
-import asyncio
 from enum import Enum
 from typing import Optional, Dict, Set, Any
 from collections import deque
 
-from .base import BaseActor
+from .base import BaseActor, DeferredReply
 from .messages import (
     DescubrirDocumentos,
     DescargarDocumento,
@@ -17,7 +16,9 @@ from .messages import (
     DocumentoDescargado,
     PaginaDescubierta,
     PDFProcesado,
+    ProcesarPDF,
     EmbeddingsGenerados,
+    GuardarDocumento,
     DocumentoGuardado,
     GuardarCheckpoint,
     CheckpointGuardado,
@@ -57,8 +58,29 @@ class SCJNCoordinatorActor(BaseActor):
     - PausarPipeline → pauses and saves checkpoint
     - ReanudarPipeline → resumes from checkpoint
     - ObtenerEstado → returns current state (ask pattern)
+
+    Backpressure: discovered documents wait in the coordinator's bounded
+    mailbox, which it stops reading while ``max_concurrent_downloads`` are in
+    flight or the pipeline is paused. Discovery therefore blocks on the bound
+    instead of the coordinator buffering every discovered document. Events
+    from child actors and control commands travel on the control lane, so
+    they are never blocked by queued work.
+
+    GuardarDocumento and ProcesarPDF carry payloads (ProcesarPDF the whole
+    PDF), so they stay on the bounded work lane. A scraper wired with its
+    own persistence and PDF processor actors sends them there directly;
+    otherwise the coordinator forwards them, waiting on the target's mailbox.
     """
 
+    CONTROL_MESSAGES = (
+        DocumentoDescargado,
+        PaginaDescubierta,
+        ErrorDeActor,
+        PausarPipeline,
+        ReanudarPipeline,
+        ObtenerEstado,
+    )
+
     def __init__(
         self,
         discovery_actor: 'BaseActor',
@@ -68,12 +90,15 @@ class SCJNCoordinatorActor(BaseActor):
         rate_limiter: RateLimiter,
         max_concurrent_downloads: int = 3,
         checkpoint_interval: int = 10,
+        mailbox_size: int = 100,
+        pdf_processor_actor: Optional['BaseActor'] = None,
     ):
-        super().__init__()
+        super().__init__(mailbox_size=mailbox_size)
         self._discovery_actor = discovery_actor
         self._scraper_actor = scraper_actor
         self._persistence_actor = persistence_actor
         self._checkpoint_actor = checkpoint_actor
+        self._pdf_processor_actor = pdf_processor_actor
         self._rate_limiter = rate_limiter
         self._max_concurrent_downloads = max_concurrent_downloads
         self._checkpoint_interval = checkpoint_interval
@@ -82,9 +107,9 @@ class SCJNCoordinatorActor(BaseActor):
         self._state = PipelineState.IDLE
         self._discovered_q_params: Set[str] = set()
         self._downloaded_q_params: Set[str] = set()
-        self._pending_queue: deque = deque()
         self._active_downloads: int = 0
         self._error_count: int = 0
+        self._skipped_pdfs: int = 0
         self._current_correlation_id: Optional[str] = None
 
         # Retry tracking
@@ -137,6 +162,14 @@ class SCJNCoordinatorActor(BaseActor):
         elif isinstance(message, ErrorDeActor):
             return await self._handle_error(message)
 
+        # Payloads from scrapers wired without their own targets
+        elif isinstance(message, GuardarDocumento):
+            await self._persistence_actor.tell(message)
+            return None
+
+        elif isinstance(message, ProcesarPDF):
+            return await self._forward_pdf(message)
+
         return None
 
     async def _handle_discover(self, cmd: DescubrirDocumentos):
@@ -144,12 +177,17 @@ class SCJNCoordinatorActor(BaseActor):
         self._state = PipelineState.DISCOVERING
         self._current_correlation_id = cmd.correlation_id
 
-        # Forward to discovery actor
+        # Discovery sends DocumentoDescubierto back to this mailbox while it
+        # runs, so wait for its reply outside the message loop.
+        return DeferredReply(self._run_discovery(cmd))
+
+    async def _run_discovery(self, cmd: DescubrirDocumentos):
+        """Forward discovery and settle the state once it replies."""
         result = await self._discovery_actor.ask(cmd)
 
         if isinstance(result, PaginaDescubierta):
             if not result.has_more_pages:
-                self._state = PipelineState.DOWNLOADING if self._pending_queue else PipelineState.IDLE
+                self._state = PipelineState.DOWNLOADING if self._has_pending_work() else PipelineState.IDLE
 
         return result
 
@@ -172,12 +210,7 @@ class SCJNCoordinatorActor(BaseActor):
         if exists:
             return None
 
-        # Queue for download
-        self._pending_queue.append(event)
-
-        # Trigger download if capacity available
-        await self._process_download_queue()
-
+        await self._start_download(event)
         return None
 
     async def _handle_documento_descargado(self, event: DocumentoDescargado):
@@ -189,11 +222,8 @@ class SCJNCoordinatorActor(BaseActor):
         if len(self._downloaded_q_params) % self._checkpoint_interval == 0:
             await self._save_checkpoint()
 
-        # Process more downloads
-        await self._process_download_queue()
-
         # Update state
-        if not self._pending_queue and self._active_downloads == 0:
+        if not self._has_pending_work() and self._active_downloads == 0:
             if self._state == PipelineState.DOWNLOADING:
                 self._state = PipelineState.IDLE
 
@@ -202,13 +232,21 @@ class SCJNCoordinatorActor(BaseActor):
     async def _handle_pagina_descubierta(self, event: PaginaDescubierta):
         """Handle page discovered event."""
         if not event.has_more_pages:
-            if self._pending_queue:
+            if self._has_pending_work():
                 self._state = PipelineState.DOWNLOADING
             elif self._state == PipelineState.DISCOVERING:
                 self._state = PipelineState.IDLE
 
         return None
 
+    async def _forward_pdf(self, cmd: ProcesarPDF):
+        """Hand a PDF to the processor; waits while its mailbox is full."""
+        if self._pdf_processor_actor is None:
+            self._skipped_pdfs += 1
+            return None
+        await self._pdf_processor_actor.tell(cmd)
+        return None
+
     async def _handle_pause(self, cmd: PausarPipeline):
         """Handle pause command."""
         self._state = PipelineState.PAUSED
@@ -218,9 +256,8 @@ class SCJNCoordinatorActor(BaseActor):
     async def _handle_resume(self, cmd: ReanudarPipeline):
         """Handle resume command."""
         if self._state == PipelineState.PAUSED:
-            if self._pending_queue:
+            if self._has_pending_work():
                 self._state = PipelineState.DOWNLOADING
-                await self._process_download_queue()
             else:
                 self._state = PipelineState.IDLE
 
@@ -230,6 +267,10 @@ class SCJNCoordinatorActor(BaseActor):
         """Handle error from child actor."""
         self._error_count += 1
 
+        if isinstance(error.original_command, DescargarDocumento):
+            # A failed download frees its slot like a finished one
+            self._active_downloads = max(0, self._active_downloads - 1)
+
         if error.recoverable and error.original_command:
             # Check retry count
             cmd = error.original_command
@@ -242,26 +283,27 @@ class SCJNCoordinatorActor(BaseActor):
 
         return None
 
-    async def _process_download_queue(self):
-        """Process pending downloads up to concurrency limit."""
-        if self._state == PipelineState.PAUSED:
-            return
+    def _accepting_work(self) -> bool:
+        """Read queued discoveries only while a download slot is free."""
+        return (
+            self._state != PipelineState.PAUSED
+            and self._active_downloads < self._max_concurrent_downloads
+        )
 
-        while self._pending_queue and self._active_downloads < self._max_concurrent_downloads:
-            event = self._pending_queue.popleft()
-            self._active_downloads += 1
+    def _has_pending_work(self) -> bool:
+        return self._queue.qsize() > 0
 
-            # Create download command
-            cmd = DescargarDocumento(
-                q_param=event.q_param,
-                correlation_id=event.correlation_id,
-            )
+    async def _start_download(self, event: DocumentoDescubierto):
+        """Hand a discovered document to the scraper."""
+        self._active_downloads += 1
 
-            # Fire and forget - response comes back as event
-            asyncio.create_task(self._execute_download(cmd))
+        cmd = DescargarDocumento(
+            q_param=event.q_param,
+            correlation_id=event.correlation_id,
+        )
 
-    async def _execute_download(self, cmd: DescargarDocumento):
-        """Execute a single download."""
+        # Response comes back as an event; waits only while the
+        # scraper's own mailbox is full.
         try:
             await self._scraper_actor.tell(cmd)
         except Exception:
@@ -291,7 +333,25 @@ class SCJNCoordinatorActor(BaseActor):
             "state": self._state,
             "discovered_count": len(self._discovered_q_params),
             "downloaded_count": len(self._downloaded_q_params),
-            "pending_count": len(self._pending_queue),
+            "pending_count": self._queue.qsize(),
             "active_downloads": self._active_downloads,
             "error_count": self._error_count,
+            "skipped_pdfs": self._skipped_pdfs,
+            "mailboxes": self._mailbox_stats(),
+        }
+
+    def _mailbox_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Mailbox metrics of the coordinator and its child actors."""
+        actors = {
+            "coordinator": self,
+            "discovery": self._discovery_actor,
+            "scraper": self._scraper_actor,
+            "persistence": self._persistence_actor,
+            "checkpoint": self._checkpoint_actor,
+            "pdf_processor": self._pdf_processor_actor,
+        }
+        return {
+            name: actor.mailbox_stats()
+            for name, actor in actors.items()
+            if isinstance(actor, BaseActor)
         }
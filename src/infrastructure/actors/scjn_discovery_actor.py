@@ -117,10 +117,13 @@ class SCJNDiscoveryActor(BaseActor):
                 self._use_browser = False
 
     async def stop(self):
-        """Stop the actor and close browser."""
+        """Stop the actor and close browser and LLM parser."""
         if self._browser_adapter:
             await self._browser_adapter.stop()
             self._browser_adapter = None
+        if self._llm_parser is not None:
+            await self._llm_parser.close()
+            self._llm_parser = None
         await super().stop()
 
     async def handle_message(self, message):
@@ -461,6 +464,7 @@ class SCJNDiscoveryActor(BaseActor):
             headers={"User-Agent": USER_AGENT},
         ) as session:
             async with session.get(url) as response:
+                await self._rate_limiter.report(response.status, response.headers.get("Retry-After"))
                 if response.status != 200:
                     raise DiscoveryError(f"Search failed: {response.status}")
                 return await response.text()
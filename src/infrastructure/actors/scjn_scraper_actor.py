@@ -57,11 +57,19 @@ class SCJNScraperActor(BaseActor):
 
     Message Protocol:
     - DescargarDocumento → fetches detail page, optionally PDF
-    - Emits: DocumentoDescargado, ProcesarPDF (to coordinator)
+    - Emits: DocumentoDescargado (to coordinator), GuardarDocumento (to
+      persistence) and ProcesarPDF (to the PDF processor); without those
+      actors wired, both go to the coordinator
+
+    Runs ``concurrency`` downloads at once over one shared HTTP session;
+    the shared rate limiter still paces the requests. ProcesarPDF goes
+    straight into the PDF processor's bounded mailbox, so a slow processor
+    makes downloads wait instead of PDFs piling up in memory.
     """
 
     SCJN_BASE_URL = "https://legislacion.scjn.gob.mx/Buscador/Paginas"
     USER_AGENT = "LegalScraper/1.0 (Educational Research)"
+    PDF_READ_CHUNK_BYTES = 256 * 1024
 
     def __init__(
         self,
@@ -70,9 +78,15 @@ class SCJNScraperActor(BaseActor):
         download_pdfs: bool = True,
         max_pdf_size_mb: float = 50.0,
         timeout_seconds: float = 30.0,
+        concurrency: int = 1,
+        mailbox_size: int = 0,
+        persistence_actor: Optional['BaseActor'] = None,
+        pdf_processor: Optional['BaseActor'] = None,
     ):
-        super().__init__()
+        super().__init__(concurrency=concurrency, mailbox_size=mailbox_size)
         self._coordinator = coordinator
+        self._persistence_actor = persistence_actor or coordinator
+        self._pdf_processor = pdf_processor or coordinator
         self._rate_limiter = rate_limiter
         self._download_pdfs = download_pdfs
         self._max_pdf_size = int(max_pdf_size_mb * 1024 * 1024)
@@ -130,7 +144,7 @@ class SCJNScraperActor(BaseActor):
             ))
 
             # Send document for persistence
-            await self._coordinator.tell(GuardarDocumento(
+            await self._persistence_actor.tell(GuardarDocumento(
                 correlation_id=cmd.correlation_id,
                 document=document,
             ))
@@ -170,6 +184,7 @@ class SCJNScraperActor(BaseActor):
         """Fetch HTML content from URL."""
         try:
             async with self._session.get(url) as response:
+                await self._rate_limiter.report(response.status, response.headers.get("Retry-After"))
                 if response.status == 429:
                     raise RateLimitError(f"Rate limited: {url}")
                 if response.status == 404:
@@ -186,6 +201,7 @@ class SCJNScraperActor(BaseActor):
     async def _fetch_pdf(self, url: str) -> bytes:
         """Fetch PDF bytes from URL."""
         async with self._session.get(url) as response:
+            await self._rate_limiter.report(response.status, response.headers.get("Retry-After"))
             if response.status != 200:
                 raise PermanentScraperError(f"PDF not available: {response.status}")
 
@@ -194,12 +210,15 @@ class SCJNScraperActor(BaseActor):
             if content_length > self._max_pdf_size:
                 raise PermanentScraperError(f"PDF too large: {content_length} bytes")
 
-            pdf_bytes = await response.read()
+            # Read in chunks so an oversized body without Content-Length is
+            # abandoned at the cap instead of buffered whole.
+            pdf_bytes = bytearray()
+            async for chunk in response.content.iter_chunked(self.PDF_READ_CHUNK_BYTES):
+                pdf_bytes.extend(chunk)
+                if len(pdf_bytes) > self._max_pdf_size:
+                    raise PermanentScraperError(f"PDF too large: >{self._max_pdf_size} bytes")
 
-            if len(pdf_bytes) > self._max_pdf_size:
-                raise PermanentScraperError(f"PDF too large: {len(pdf_bytes)} bytes")
-
-            return pdf_bytes
+            return bytes(pdf_bytes)
 
     async def _download_pdf(
         self,
@@ -215,8 +234,8 @@ class SCJNScraperActor(BaseActor):
         try:
             pdf_bytes = await self._fetch_pdf(pdf_url)
 
-            # Send to PDF processor via coordinator
-            await self._coordinator.tell(ProcesarPDF(
+            # Waits while the processor's mailbox is full
+            await self._pdf_processor.tell(ProcesarPDF(
                 correlation_id=correlation_id,
                 document_id=document_id,
                 pdf_bytes=pdf_bytes,
@@ -11,6 +11,7 @@ from typing import List, Optional
 from pydantic import BaseModel, Field
 
 from src.domain.bjv_value_objects import IdentificadorLibro, TipoContenido
+from src.infrastructure.adapters.browser_pool import get_browser_pool
 from src.infrastructure.adapters.crawl4ai_adapter import Crawl4AIAdapter
 
 logger = logging.getLogger(__name__)
@@ -253,13 +254,12 @@ Extract every unique book you can find on the page.
         More reliable for the BJV catalog page which has consistent HTML structure.
         """
         import re
-        from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
+        from crawl4ai import CrawlerRunConfig
 
-        browser_config = BrowserConfig(headless=True, browser_type="chromium")
         run_config = CrawlerRunConfig(delay_before_return_html=2.0)
 
         try:
-            async with AsyncWebCrawler(config=browser_config) as crawler:
+            async with get_browser_pool().crawler(headless=True) as crawler:
                 result = await crawler.arun(url=url, config=run_config)
 
                 if not result.success or not result.html:
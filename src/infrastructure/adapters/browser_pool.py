@@ -0,0 +1,372 @@
+"""
+Worker-level pool of warm headless browsers shared by the scraper adapters.
+
+Every CAS search, SCJN session and Crawl4AI extraction used to launch its own
+Chromium, paying a multi-second cold start and hundreds of MB per call. The
+pool keeps a few browsers running per process and leases out:
+
+- Playwright contexts and pages, one shared context per source and set of
+  context options, so cookies and cache survive between calls of a source
+  without leaking into another source;
+- started Crawl4AI crawlers, for the LLM extraction adapters.
+
+Images, fonts and media are aborted at the network layer (Playwright) or
+disabled by launch flags (Crawl4AI); none of the scrapers read them. After a
+browser has served ``max_pages_per_browser`` pages it is retired: new leases
+go to a fresh browser and the old one closes once its last lease ends, which
+bounds Chromium's memory growth on long backfills.
+
+Each event loop gets its own pool, closed by ``close_browser_pool`` or, for
+scripts that call ``asyncio.run`` repeatedly, when its loop shuts down.
+
+Environment variables:
+    SCRAPER_BROWSER_POOL_SIZE: Browsers kept per launch profile (default: 2)
+    SCRAPER_BROWSER_MAX_PAGES: Pages a browser serves before recycling (default: 100)
+    SCRAPER_BROWSER_BLOCK_RESOURCES: Comma-separated resource types to abort
+        (default: image,font,media; empty = block nothing)
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_PAGES_PER_BROWSER = 100
+DEFAULT_BLOCKED_RESOURCE_TYPES = ("image", "font", "media")
+CHROMIUM_ARGS = (
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_resource_types() -> frozenset[str]:
+    value = os.environ.get("SCRAPER_BROWSER_BLOCK_RESOURCES")
+    if value is None:
+        return frozenset(DEFAULT_BLOCKED_RESOURCE_TYPES)
+    return frozenset(part.strip().lower() for part in value.split(",") if part.strip())
+
+
+class _PooledBrowser:
+    """One launched browser and the per-source contexts opened on it."""
+
+    def __init__(self, browser: Any, profile: tuple):
+        self.browser = browser
+        self.profile = profile
+        self.contexts: dict[tuple[str, str], Any] = {}
+        self.leases = 0
+        self.pages_served = 0
+        self.retiring = False
+
+    @property
+    def usable(self) -> bool:
+        is_connected = getattr(self.browser, "is_connected", None)
+        return not self.retiring and (is_connected is None or is_connected())
+
+
+class _PooledCrawler:
+    """One started Crawl4AI crawler."""
+
+    def __init__(self, crawler: Any):
+        self.crawler = crawler
+        self.leases = 0
+        self.pages_served = 0
+        self.retiring = False
+
+
+class BrowserPool:
+    """Warm Playwright browsers and Crawl4AI crawlers leased per page or session."""
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        max_pages_per_browser: Optional[int] = None,
+        blocked_resource_types: Optional[frozenset[str]] = None,
+    ):
+        self._size = size or _env_int("SCRAPER_BROWSER_POOL_SIZE", DEFAULT_POOL_SIZE)
+        self._max_pages = max_pages_per_browser or _env_int(
+            "SCRAPER_BROWSER_MAX_PAGES", DEFAULT_MAX_PAGES_PER_BROWSER
+        )
+        self._blocked = (
+            frozenset(blocked_resource_types)
+            if blocked_resource_types is not None
+            else _env_resource_types()
+        )
+        self._playwright = None
+        self._browsers: list[_PooledBrowser] = []
+        self._crawlers: dict[bool, _PooledCrawler] = {}
+        self._retired_crawlers: list[_PooledCrawler] = []
+        self._lock = asyncio.Lock()
+        self.browsers_launched = 0
+        self.crawlers_started = 0
+
+    # ------------------------------------------------------------------
+    # Playwright
+    # ------------------------------------------------------------------
+
+    async def _launch(self, profile: tuple) -> _PooledBrowser:
+        if self._playwright is None:
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+        headless, slow_mo = profile
+        browser = await self._playwright.chromium.launch(
+            headless=headless,
+            slow_mo=slow_mo,
+            args=list(CHROMIUM_ARGS),
+        )
+        self.browsers_launched += 1
+        logger.info("Browser pool launched chromium #%d", self.browsers_launched)
+        return _PooledBrowser(browser, profile)
+
+    async def _acquire(self, profile: tuple, source: str, options: dict) -> tuple[_PooledBrowser, Any]:
+        async with self._lock:
+            for stale in [item for item in self._browsers if not item.usable and item.leases <= 0]:
+                self._browsers.remove(stale)
+                await self._close_browser(stale)
+            candidates = [
+                pooled
+                for pooled in self._browsers
+                if pooled.profile == profile and pooled.usable
+            ]
+            idle = [pooled for pooled in candidates if pooled.leases == 0]
+            if idle:
+                pooled = idle[0]
+            elif len(candidates) < self._size:
+                pooled = await self._launch(profile)
+                self._browsers.append(pooled)
+            else:
+                pooled = min(candidates, key=lambda item: item.leases)
+            pooled.leases += 1
+            try:
+                context = await self._context_for(pooled, source, options)
+            except BaseException:
+                pooled.leases -= 1
+                raise
+            return pooled, context
+
+    async def _context_for(self, pooled: _PooledBrowser, source: str, options: dict) -> Any:
+        key = (source, json.dumps(options, sort_keys=True, default=str))
+        context = pooled.contexts.get(key)
+        if context is None:
+            context = await pooled.browser.new_context(**options)
+            if self._blocked:
+                await context.route("**/*", self._route)
+            context.on("page", lambda _page, pooled=pooled: self._count_page(pooled))
+            pooled.contexts[key] = context
+        return context
+
+    async def _route(self, route: Any) -> None:
+        if route.request.resource_type in self._blocked:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _count_page(self, pooled: _PooledBrowser) -> None:
+        pooled.pages_served += 1
+        if pooled.pages_served >= self._max_pages:
+            pooled.retiring = True
+
+    async def _release(self, pooled: _PooledBrowser) -> None:
+        async with self._lock:
+            pooled.leases -= 1
+            if (pooled.retiring or not pooled.usable) and pooled.leases <= 0:
+                if pooled in self._browsers:
+                    self._browsers.remove(pooled)
+                await self._close_browser(pooled)
+
+    async def _close_browser(self, pooled: _PooledBrowser) -> None:
+        try:
+            # Closing the browser closes its contexts and pages.
+            await pooled.browser.close()
+        except Exception as exc:
+            logger.debug("Ignoring error while closing pooled browser: %s", exc)
+
+    @asynccontextmanager
+    async def context(
+        self,
+        source: str,
+        *,
+        headless: bool = True,
+        slow_mo: int = 0,
+        **context_options: Any,
+    ) -> AsyncIterator[Any]:
+        """
+        Lease the shared browser context of ``source``.
+
+        The context belongs to the pool: callers open and close their own
+        pages on it but must not close the context itself.
+        """
+        pooled, context = await self._acquire((headless, slow_mo), source, context_options)
+        try:
+            yield context
+        finally:
+            await self._release(pooled)
+
+    @asynccontextmanager
+    async def page(self, source: str, **options: Any) -> AsyncIterator[Any]:
+        """Lease a fresh page in the shared context of ``source``."""
+        async with self.context(source, **options) as context:
+            page = await context.new_page()
+            try:
+                yield page
+            finally:
+                try:
+                    await page.close()
+                except Exception as exc:
+                    logger.debug("Ignoring error while closing pooled page: %s", exc)
+
+    # ------------------------------------------------------------------
+    # Crawl4AI
+    # ------------------------------------------------------------------
+
+    def _crawler_extra_args(self) -> list[str]:
+        args = list(CHROMIUM_ARGS)
+        if "image" in self._blocked:
+            args.append("--blink-settings=imagesEnabled=false")
+        if "font" in self._blocked:
+            args.append("--disable-remote-fonts")
+        return args
+
+    async def _start_crawler(self, headless: bool) -> _PooledCrawler:
+        from crawl4ai import AsyncWebCrawler, BrowserConfig
+
+        crawler = AsyncWebCrawler(
+            config=BrowserConfig(
+                headless=headless,
+                browser_type="chromium",
+                extra_args=self._crawler_extra_args(),
+            )
+        )
+        await crawler.start()
+        self.crawlers_started += 1
+        logger.info("Browser pool started crawler #%d", self.crawlers_started)
+        return _PooledCrawler(crawler)
+
+    @asynccontextmanager
+    async def crawler(self, headless: bool = True) -> AsyncIterator[Any]:
+        """Lease a started ``AsyncWebCrawler``; it may serve other leases concurrently."""
+        async with self._lock:
+            pooled = self._crawlers.get(headless)
+            if pooled is None or pooled.retiring:
+                pooled = await self._start_crawler(headless)
+                self._crawlers[headless] = pooled
+            pooled.leases += 1
+            pooled.pages_served += 1
+            if pooled.pages_served >= self._max_pages:
+                pooled.retiring = True
+                self._crawlers.pop(headless, None)
+                self._retired_crawlers.append(pooled)
+        try:
+            yield pooled.crawler
+        finally:
+            async with self._lock:
+                pooled.leases -= 1
+                if pooled.retiring and pooled.leases <= 0 and pooled in self._retired_crawlers:
+                    self._retired_crawlers.remove(pooled)
+                    await self._close_crawler(pooled)
+
+    async def _close_crawler(self, pooled: _PooledCrawler) -> None:
+        try:
+            await pooled.crawler.close()
+        except Exception as exc:
+            logger.debug("Ignoring error while closing pooled crawler: %s", exc)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def close(self) -> None:
+        """Close every browser and crawler and stop Playwright."""
+        async with self._lock:
+            browsers, self._browsers = self._browsers, []
+            crawlers = list(self._crawlers.values()) + self._retired_crawlers
+            self._crawlers = {}
+            self._retired_crawlers = []
+            for pooled in browsers:
+                await self._close_browser(pooled)
+            for pooled in crawlers:
+                await self._close_crawler(pooled)
+            if self._playwright is not None:
+                try:
+                    await self._playwright.stop()
+                finally:
+                    self._playwright = None
+
+
+_browser_pools: dict[Optional[asyncio.AbstractEventLoop], BrowserPool] = {}
+_pool_reapers: dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+
+
+def _forget_pools_of_closed_loops() -> None:
+    for loop in [loop for loop in _browser_pools if loop is not None and loop.is_closed()]:
+        pool = _browser_pools.pop(loop)
+        _pool_reapers.pop(loop, None)
+        if pool.browsers_launched or pool.crawlers_started:
+            logger.warning(
+                "Browser pool of a closed event loop was never closed; "
+                "%d browser(s) and %d crawler(s) it started may still be running",
+                pool.browsers_launched,
+                pool.crawlers_started,
+            )
+
+
+async def _close_on_loop_shutdown(loop: asyncio.AbstractEventLoop, pool: BrowserPool) -> None:
+    """Wait until cancelled, then close ``pool`` if it is still registered."""
+    try:
+        await loop.create_future()
+    except asyncio.CancelledError:
+        # asyncio.run cancels leftover tasks before closing the loop, so the
+        # pool's browsers close on the loop that owns them.
+        if _browser_pools.get(loop) is pool:
+            del _browser_pools[loop]
+            _pool_reapers.pop(loop, None)
+            await pool.close()
+        raise
+
+
+def get_browser_pool() -> BrowserPool:
+    """
+    Return the running event loop's pool, creating it on first use.
+
+    Browser handles are bound to the loop that created them, so each loop
+    (for example each ``asyncio.run`` of a script) gets its own pool. A pool
+    is closed by ``close_browser_pool`` or, failing that, while its loop
+    shuts down.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    _forget_pools_of_closed_loops()
+    pool = _browser_pools.get(loop)
+    if pool is None:
+        pool = _browser_pools[loop] = BrowserPool()
+        if loop is not None:
+            _pool_reapers[loop] = loop.create_task(_close_on_loop_shutdown(loop, pool))
+    return pool
+
+
+async def close_browser_pool() -> None:
+    """Close the running loop's pool (and one created outside a loop), if any."""
+    loop = asyncio.get_running_loop()
+    reaper = _pool_reapers.pop(loop, None)
+    if reaper is not None:
+        reaper.cancel()
+    for key in (loop, None):
+        pool = _browser_pools.pop(key, None)
+        if pool is not None:
+            await pool.close()
@@ -6,10 +6,12 @@ the JavaScript-heavy CAS jurisprudence database.
 """
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 import asyncio
 import time
 
+from src.infrastructure.adapters.browser_pool import BrowserPool, get_browser_pool
+
 
 @dataclass(frozen=True)
 class BrowserConfig:
@@ -37,17 +39,21 @@ class CASBrowserAdapter:
     Playwright-based browser adapter for CAS SPA.
 
     Handles:
-    - Browser lifecycle management
+    - Leasing a warm browser context from the worker's BrowserPool
     - JavaScript rendering
     - Dynamic content waiting
     - Screenshot capture for debugging
     - Rate limiting compliance
     """
 
-    def __init__(self, config: Optional[BrowserConfig] = None):
+    def __init__(
+        self,
+        config: Optional[BrowserConfig] = None,
+        pool: Optional[BrowserPool] = None,
+    ):
         self._config = config or BrowserConfig()
-        self._playwright = None
-        self._browser = None
+        self._pool = pool
+        self._lease: Optional[AsyncExitStack] = None
         self._context = None
         self._started = False
 
@@ -56,42 +62,37 @@ class CASBrowserAdapter:
         return self._started
 
     async def start(self) -> None:
-        """Initialize Playwright and launch browser."""
-        # Import here to handle missing playwright gracefully
+        """Lease the CAS browser context from the pool."""
+        pool = self._pool or get_browser_pool()
+        lease = AsyncExitStack()
         try:
-            from playwright.async_api import async_playwright
+            self._context = await lease.enter_async_context(
+                pool.context(
+                    "cas",
+                    headless=self._config.headless,
+                    slow_mo=self._config.slow_mo,
+                    viewport={
+                        "width": self._config.viewport_width,
+                        "height": self._config.viewport_height,
+                    },
+                    user_agent=self._config.user_agent,
+                )
+            )
         except ImportError:
             from src.infrastructure.adapters.cas_errors import BrowserNotAvailableError
             raise BrowserNotAvailableError(
                 "Playwright not installed. Run: pip install playwright && playwright install chromium"
             )
-
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(
-            headless=self._config.headless,
-            slow_mo=self._config.slow_mo,
-        )
-        self._context = await self._browser.new_context(
-            viewport={
-                "width": self._config.viewport_width,
-                "height": self._config.viewport_height,
-            },
-            user_agent=self._config.user_agent,
-        )
+        self._lease = lease
         self._started = True
 
     async def stop(self) -> None:
-        """Close browser and cleanup resources."""
-        if self._context:
-            await self._context.close()
-            self._context = None
-        if self._browser:
-            await self._browser.close()
-            self._browser = None
-        if self._playwright:
-            await self._playwright.stop()
-            self._playwright = None
+        """Return the browser context to the pool."""
+        lease, self._lease = self._lease, None
+        self._context = None
         self._started = False
+        if lease is not None:
+            await lease.aclose()
 
     async def render_page(
         self,
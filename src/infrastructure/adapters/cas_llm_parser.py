@@ -7,6 +7,7 @@ jurisprudence database using LLM-powered semantic extraction.
 import logging
 import re
 import urllib.parse
+from contextlib import AsyncExitStack
 from datetime import date
 from typing import List, Optional
 
@@ -19,6 +20,7 @@ from src.domain.cas_value_objects import (
     TipoProcedimiento,
     CategoriaDeporte,
 )
+from src.infrastructure.adapters.browser_pool import get_browser_pool
 from src.infrastructure.adapters.crawl4ai_adapter import Crawl4AIAdapter
 
 logger = logging.getLogger(__name__)
@@ -244,27 +246,21 @@ If a field is not visible or cannot be determined, use null.
 
         Navigates to AllItems.aspx and extracts case links from the
         SharePoint document library view (no dropdown interaction needed).
+        The page is leased from the worker's warm browser pool, so the
+        per-year searches of one extraction share a single Chromium.
         """
-        try:
-            from playwright.async_api import async_playwright
-        except ImportError:
-            logger.warning("Playwright not available for CAS search")
-            return [], False
-
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                    "--disable-dev-shm-usage",
-                ]
-            )
-            context = await browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            )
-            page = await context.new_page()
+        async with AsyncExitStack() as lease:
+            try:
+                page = await lease.enter_async_context(
+                    get_browser_pool().page(
+                        "cas",
+                        viewport={"width": 1920, "height": 1080},
+                        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                    )
+                )
+            except ImportError:
+                logger.warning("Playwright not available for CAS search")
+                return [], False
 
             try:
                 await page.goto(self.SEARCH_URL, timeout=60000)
@@ -407,10 +403,8 @@ If a field is not visible or cannot be determined, use null.
 
                 # If no row/link results, try LLM extraction on rendered HTML
                 if not search_results:
-                    html = await page.content()
                     logger.info("No table cases found, falling back to LLM extraction on rendered HTML")
-                    await context.close()
-                    await browser.close()
+                    await lease.aclose()
                     return await self._search_basic()
 
                 return search_results, len(search_results) >= 20
@@ -419,10 +413,6 @@ If a field is not visible or cannot be determined, use null.
                 logger.error(f"CAS Playwright error: {e}")
                 return [], False
 
-            finally:
-                await context.close()
-                await browser.close()
-
     def _parse_sport(self, sport: str) -> Optional[CategoriaDeporte]:
         """Parse sport string to enum."""
         sport_map = {
@@ -10,13 +10,13 @@ from typing import Type, TypeVar, Optional
 from pydantic import BaseModel
 
 from crawl4ai import (
-    AsyncWebCrawler,
-    BrowserConfig,
     CrawlerRunConfig,
     LLMConfig,
 )
 from crawl4ai.extraction_strategy import LLMExtractionStrategy
 
+from src.infrastructure.adapters.browser_pool import BrowserPool, get_browser_pool
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound=BaseModel)
@@ -29,6 +29,7 @@ class Crawl4AIAdapter:
     Features:
     - Provider-agnostic LLM support via LiteLLM
     - Optional JavaScript rendering via Playwright
+    - Warm crawlers leased from the worker's BrowserPool
     - Pydantic schema-based structured extraction
 
     Usage:
@@ -49,6 +50,7 @@ class Crawl4AIAdapter:
         api_token: Optional[str] = None,
         headless: bool = True,
         timeout_ms: int = 60000,
+        pool: Optional[BrowserPool] = None,
     ):
         """
         Initialize the Crawl4AI adapter.
@@ -58,11 +60,13 @@ class Crawl4AIAdapter:
             api_token: API token for the LLM provider (defaults to OPENROUTER_API_KEY env var)
             headless: Whether to run browser in headless mode
             timeout_ms: Page load timeout in milliseconds
+            pool: Browser pool to lease crawlers from (defaults to the process pool)
         """
         self.provider = provider or self.DEFAULT_PROVIDER
         self.api_token = api_token or os.getenv("OPENROUTER_API_KEY")
         self.headless = headless
         self.timeout_ms = timeout_ms
+        self._pool = pool
 
         if not self.api_token:
             raise ValueError(
@@ -75,11 +79,10 @@ class Crawl4AIAdapter:
             api_token=self.api_token,
         )
 
-        # Browser configuration for JavaScript rendering
-        self.browser_config = BrowserConfig(
-            headless=self.headless,
-            browser_type="chromium",
-        )
+    def _crawler(self, wait_for_js: bool):
+        """Lease a warm crawler; only JS rendering honours ``headless``."""
+        pool = self._pool or get_browser_pool()
+        return pool.crawler(headless=self.headless if wait_for_js else True)
 
     async def extract_structured(
         self,
@@ -120,14 +123,8 @@ class Crawl4AIAdapter:
                 delay_before_return_html=delay_seconds if delay_seconds > 0 else None,
             )
 
-            # Use browser for JS-heavy sites, otherwise direct HTTP
-            if wait_for_js:
-                async with AsyncWebCrawler(config=self.browser_config) as crawler:
-                    result = await crawler.arun(url=url, config=run_config)
-            else:
-                # For non-JS sites, still use crawler but with default config
-                async with AsyncWebCrawler() as crawler:
-                    result = await crawler.arun(url=url, config=run_config)
+            async with self._crawler(wait_for_js) as crawler:
+                result = await crawler.arun(url=url, config=run_config)
 
             if not result.success:
                 logger.error(f"Crawl failed for {url}: {result.error_message}")
@@ -176,12 +173,8 @@ class Crawl4AIAdapter:
                 css_selector=css_selector,
             )
 
-            if wait_for_js:
-                async with AsyncWebCrawler(config=self.browser_config) as crawler:
-                    result = await crawler.arun(url=url, config=run_config)
-            else:
-                async with AsyncWebCrawler() as crawler:
-                    result = await crawler.arun(url=url, config=run_config)
+            async with self._crawler(wait_for_js) as crawler:
+                result = await crawler.arun(url=url, config=run_config)
 
             if result.success and result.markdown:
                 return result.markdown
@@ -211,12 +204,8 @@ class Crawl4AIAdapter:
         try:
             run_config = CrawlerRunConfig()
 
-            if wait_for_js:
-                async with AsyncWebCrawler(config=self.browser_config) as crawler:
-                    result = await crawler.arun(url=url, config=run_config)
-            else:
-                async with AsyncWebCrawler() as crawler:
-                    result = await crawler.arun(url=url, config=run_config)
+            async with self._crawler(wait_for_js) as crawler:
+                result = await crawler.arun(url=url, config=run_config)
 
             if result.success and result.html:
                 return result.html
@@ -6,11 +6,13 @@ the JavaScript-heavy SCJN legislacion search interface.
 """
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 import asyncio
 import time
 import logging
 
+from src.infrastructure.adapters.browser_pool import BrowserPool, get_browser_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,7 +43,7 @@ class SCJNBrowserAdapter:
     Playwright-based browser adapter for SCJN search.
 
     Handles:
-    - Browser lifecycle management
+    - Leasing a warm browser context from the worker's BrowserPool
     - Form interaction for search filters
     - Waiting for JavaScript to render results
     - Pagination handling
@@ -82,10 +84,14 @@ class SCJNBrowserAdapter:
         "CDMX": "CDMX",
     }
 
-    def __init__(self, config: Optional[SCJNBrowserConfig] = None):
+    def __init__(
+        self,
+        config: Optional[SCJNBrowserConfig] = None,
+        pool: Optional[BrowserPool] = None,
+    ):
         self._config = config or SCJNBrowserConfig()
-        self._playwright = None
-        self._browser = None
+        self._pool = pool
+        self._lease: Optional[AsyncExitStack] = None
         self._context = None
         self._started = False
 
@@ -94,41 +100,37 @@ class SCJNBrowserAdapter:
         return self._started
 
     async def start(self) -> None:
-        """Initialize Playwright and launch browser."""
+        """Lease the SCJN browser context from the pool."""
+        pool = self._pool or get_browser_pool()
+        lease = AsyncExitStack()
         try:
-            from playwright.async_api import async_playwright
+            self._context = await lease.enter_async_context(
+                pool.context(
+                    "scjn",
+                    headless=self._config.headless,
+                    slow_mo=self._config.slow_mo,
+                    viewport={
+                        "width": self._config.viewport_width,
+                        "height": self._config.viewport_height,
+                    },
+                    user_agent=self._config.user_agent,
+                )
+            )
         except ImportError:
             raise RuntimeError(
                 "Playwright not installed. Run: pip install playwright && playwright install chromium"
             )
-
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(
-            headless=self._config.headless,
-            slow_mo=self._config.slow_mo,
-        )
-        self._context = await self._browser.new_context(
-            viewport={
-                "width": self._config.viewport_width,
-                "height": self._config.viewport_height,
-            },
-            user_agent=self._config.user_agent,
-        )
+        self._lease = lease
         self._started = True
         logger.info("SCJN browser adapter started")
 
     async def stop(self) -> None:
-        """Close browser and cleanup resources."""
-        if self._context:
-            await self._context.close()
-            self._context = None
-        if self._browser:
-            await self._browser.close()
-            self._browser = None
-        if self._playwright:
-            await self._playwright.stop()
-            self._playwright = None
+        """Return the browser context to the pool."""
+        lease, self._lease = self._lease, None
+        self._context = None
         self._started = False
+        if lease is not None:
+            await lease.aclose()
         logger.info("SCJN browser adapter stopped")
 
     async def search(
@@ -165,6 +165,10 @@ Look for patterns in the HTML like tables, divs with document listings, links wi
         self.fetcher = AsyncFetcher(rate_limit_delay=rate_limit_delay)
         self.model = model
 
+    async def close(self) -> None:
+        """Close the fetcher's pooled HTTP client."""
+        await self.fetcher.aclose()
+
     async def parse_search_page(
         self,
         page: int = 1,
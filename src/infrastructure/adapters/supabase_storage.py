@@ -8,7 +8,15 @@ Features:
 - Organized storage paths: {tenant}/{source_type}/{hash_prefix}/{doc_id}.pdf
 - Hash-based path prefixes for even file distribution
 - Signed URLs for secure temporary access
-- Deduplication via existence checks
+- Deduplication via HEAD-based existence checks
+- Blocking storage3 calls run in worker threads behind a concurrency cap,
+  so transfers never stall the event loop
+- Resumable (TUS) uploads in fixed-size parts for large local files
+
+Environment Variables:
+    SUPABASE_STORAGE_CONCURRENCY: Storage calls in flight at once (default: 8)
+    SUPABASE_STORAGE_RESUMABLE_THRESHOLD_BYTES: Local files at or above this
+        size use the resumable upload endpoint (default: 33554432)
 
 Usage:
     from supabase import create_client
@@ -23,8 +31,36 @@ Usage:
 """
 from __future__ import annotations
 
+import asyncio
+import base64
 import hashlib
-from typing import Any, Optional
+import logging
+import os
+from pathlib import Path
+from typing import Any, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORAGE_CONCURRENCY = 8
+DEFAULT_RESUMABLE_THRESHOLD_BYTES = 32 * 1024 * 1024
+# Supabase's TUS endpoint only accepts 6 MiB parts (except the last one).
+RESUMABLE_CHUNK_BYTES = 6 * 1024 * 1024
+RESUMABLE_MAX_RETRIES = 3
+RESUMABLE_TIMEOUT_SECONDS = 120.0
+
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return max(minimum, int(raw))
+    except ValueError:
+        return default
+
+
+class ResumableUploadError(Exception):
+    """Raised when a resumable upload is rejected by the storage API."""
 
 
 class SupabaseStorageAdapter:
@@ -44,6 +80,8 @@ class SupabaseStorageAdapter:
         self,
         client: Any,
         bucket_name: str = DEFAULT_BUCKET,
+        max_concurrency: Optional[int] = None,
+        resumable_threshold_bytes: Optional[int] = None,
     ) -> None:
         """
         Initialize the storage adapter.
@@ -51,9 +89,28 @@ class SupabaseStorageAdapter:
         Args:
             client: Supabase client from create_client()
             bucket_name: Name of the storage bucket to use
+            max_concurrency: Storage calls allowed in flight at once
+            resumable_threshold_bytes: Minimum local file size that is sent
+                through the resumable upload endpoint
         """
         self._client = client
         self._bucket_name = bucket_name
+        self._max_concurrency = max_concurrency or _env_int(
+            "SUPABASE_STORAGE_CONCURRENCY", DEFAULT_STORAGE_CONCURRENCY, 1
+        )
+        self._resumable_threshold_bytes = resumable_threshold_bytes or _env_int(
+            "SUPABASE_STORAGE_RESUMABLE_THRESHOLD_BYTES",
+            DEFAULT_RESUMABLE_THRESHOLD_BYTES,
+            RESUMABLE_CHUNK_BYTES,
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def _run(self, func: Any, *args: Any) -> Any:
+        """Run a blocking storage3 call in a worker thread under the concurrency cap."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        async with self._semaphore:
+            return await asyncio.to_thread(func, *args)
 
     def _get_bucket(self):
         """Get the storage bucket object."""
@@ -108,7 +165,7 @@ class SupabaseStorageAdapter:
 
     async def upload(
         self,
-        content: bytes,
+        content: Union[bytes, Path],
         source_type: str,
         doc_id: str,
         content_type: str = "application/pdf",
@@ -119,7 +176,8 @@ class SupabaseStorageAdapter:
         Upload a file to Supabase Storage.
 
         Args:
-            content: File content as bytes
+            content: File content as bytes, or a local file path to stream
+                from disk without loading it into memory
             source_type: Document source (scjn, bjv, cas, dof)
             doc_id: Document identifier
             content_type: MIME type (default: application/pdf)
@@ -137,15 +195,115 @@ class SupabaseStorageAdapter:
             tenant_id=tenant_id,
         )
 
-        bucket = self._get_bucket()
-        bucket.upload(
-            path,
-            content,
-            {"content-type": content_type},
-        )
+        if isinstance(content, Path):
+            if self._resumable_endpoint() is not None:
+                file_size = content.stat().st_size
+                if file_size >= self._resumable_threshold_bytes:
+                    await self._upload_resumable(path, content, file_size, content_type)
+                    return path
+            await self._run(self._upload_file_sync, path, content, content_type)
+        else:
+            bucket = self._get_bucket()
+            await self._run(bucket.upload, path, content, {"content-type": content_type})
 
         return path
 
+    def _upload_file_sync(self, path: str, local_path: Path, content_type: str) -> None:
+        with local_path.open("rb") as fh:
+            self._get_bucket().upload(path, fh, {"content-type": content_type})
+
+    def _resumable_endpoint(self) -> Optional[tuple[str, str]]:
+        """Return (endpoint, service key) when the client exposes its credentials."""
+        url = getattr(self._client, "supabase_url", None)
+        key = getattr(self._client, "supabase_key", None)
+        if not isinstance(url, str) or not isinstance(key, str) or not url or not key:
+            return None
+        return f"{url.rstrip('/')}/storage/v1/upload/resumable", key
+
+    async def _upload_resumable(
+        self,
+        path: str,
+        local_path: Path,
+        file_size: int,
+        content_type: str,
+    ) -> None:
+        """
+        Upload a local file through Supabase's TUS endpoint in 6 MiB parts.
+
+        Only one part is held in memory at a time. A failed PATCH re-reads the
+        server offset with HEAD and resumes from there, up to
+        RESUMABLE_MAX_RETRIES times per part.
+        """
+        import httpx
+
+        endpoint, key = self._resumable_endpoint()
+        headers = {
+            "authorization": f"Bearer {key}",
+            "apikey": key,
+            "tus-resumable": "1.0.0",
+        }
+        metadata = {
+            "bucketName": self._bucket_name,
+            "objectName": path,
+            "contentType": content_type,
+            "cacheControl": "3600",
+        }
+        encoded_metadata = ",".join(
+            f"{name} {base64.b64encode(value.encode()).decode()}"
+            for name, value in metadata.items()
+        )
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        async with self._semaphore, httpx.AsyncClient(timeout=RESUMABLE_TIMEOUT_SECONDS) as http:
+            created = await http.post(
+                endpoint,
+                headers={
+                    **headers,
+                    "upload-length": str(file_size),
+                    "upload-metadata": encoded_metadata,
+                    "x-upsert": "false",
+                },
+            )
+            if created.status_code not in (200, 201):
+                raise ResumableUploadError(
+                    f"Resumable upload for {path} failed: {created.status_code} {created.text}"
+                )
+            upload_url = str(httpx.URL(endpoint).join(created.headers["location"]))
+
+            offset = 0
+            retries = 0
+            with local_path.open("rb") as fh:
+                while offset < file_size:
+                    await asyncio.to_thread(fh.seek, offset)
+                    part = await asyncio.to_thread(fh.read, RESUMABLE_CHUNK_BYTES)
+                    try:
+                        response = await http.patch(
+                            upload_url,
+                            content=part,
+                            headers={
+                                **headers,
+                                "upload-offset": str(offset),
+                                "content-type": "application/offset+octet-stream",
+                            },
+                        )
+                        if response.status_code != 204:
+                            raise ResumableUploadError(
+                                f"Resumable upload for {path} failed at offset {offset}: "
+                                f"{response.status_code} {response.text}"
+                            )
+                        offset = int(response.headers.get("upload-offset", offset + len(part)))
+                        retries = 0
+                    except (httpx.TransportError, ResumableUploadError) as exc:
+                        retries += 1
+                        if retries > RESUMABLE_MAX_RETRIES:
+                            raise
+                        logger.warning("Resuming upload of %s after error: %s", path, exc)
+                        status = await http.head(upload_url, headers=headers)
+                        if status.status_code != 200:
+                            raise
+                        offset = int(status.headers.get("upload-offset", offset))
+
     def build_path(
         self,
         source_type: str,
@@ -184,7 +342,7 @@ class SupabaseStorageAdapter:
             File content as bytes
         """
         bucket = self._get_bucket()
-        return bucket.download(path)
+        return await self._run(bucket.download, path)
 
     async def get_signed_url(
         self,
@@ -202,20 +360,29 @@ class SupabaseStorageAdapter:
             HTTPS signed URL with authentication token
         """
         bucket = self._get_bucket()
-        result = bucket.create_signed_url(path, expires_in)
+        result = await self._run(bucket.create_signed_url, path, expires_in)
         return result.get("signedURL", result.get("signedUrl", ""))
 
     async def exists(self, path: str) -> bool:
         """
         Check if a file exists in storage.
 
+        Uses the bucket's HEAD-based ``exists`` call; storage3 releases that
+        predate it fall back to listing the hash-prefix directory.
+
         Args:
             path: Storage path to check
 
         Returns:
             True if file exists, False otherwise
         """
+        return await self._run(self._exists_sync, path)
+
+    def _exists_sync(self, path: str) -> bool:
         bucket = self._get_bucket()
+        head = getattr(bucket, "exists", None)
+        if head is not None:
+            return bool(head(path))
 
         # Extract directory and filename from path
         parts = path.rsplit("/", 1)
@@ -225,8 +392,7 @@ class SupabaseStorageAdapter:
             directory = ""
             filename = parts[0]
 
-        # List files in directory and check for match
-        files = bucket.list(directory)
+        files = bucket.list(directory, {"search": filename})
         return any(f.get("name") == filename for f in files)
 
     async def delete(self, path: str) -> None:
@@ -237,4 +403,4 @@ class SupabaseStorageAdapter:
             path: Storage path of the file to delete
         """
         bucket = self._get_bucket()
-        bucket.remove([path])
+        await self._run(bucket.remove, [path])
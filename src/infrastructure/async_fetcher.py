@@ -1,13 +1,79 @@
 """
 Async HTML fetcher with rate limiting and retry logic.
+
+Requests are paced by the shared per-domain limiter
+(``src.infrastructure.resilience.shared_rate_limiter``), so fetchers in
+different parsers, activities and workers draw from one budget per site and
+back off together when it answers 429.
+
+One pooled ``httpx.AsyncClient`` is kept per fetcher (and event loop), so
+TLS sessions and keep-alive connections are reused across pages; HTTP/2 is
+negotiated when the ``h2`` package is installed. Each domain gets its own
+cap on open requests. With a response cache configured
+(``http_response_cache``), pages are revalidated with conditional GETs and
+a 304 is served from disk.
+
+Environment Variables:
+    SCRAPER_FETCH_MAX_CONNECTIONS: Pooled connections per fetcher (default: 20)
+    SCRAPER_FETCH_PER_DOMAIN_CONNECTIONS: Open requests per domain (default: 4)
+    SCRAPER_FETCH_HTTP2: Use HTTP/2 when h2 is installed (default: true)
+    SCRAPER_FETCH_CACHE_DIR: See ``http_response_cache`` (unset = no cache)
 """
 import asyncio
+import os
 import httpx
-from typing import Optional
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import AsyncIterator, Optional
 import logging
 
+from src.infrastructure.http_response_cache import CachedResponse, ResponseCache, utc_now_iso
+from src.infrastructure.resilience.shared_rate_limiter import (
+    RateBudget,
+    SharedRateLimiter,
+    domain_key,
+    get_shared_rate_limiter,
+)
+
+try:
+    import h2  # noqa: F401  (enables http2=True in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_PER_DOMAIN_CONNECTIONS = 4
+KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+
+def _env_int(name: str, default: int) -> int:
+    raw_value = os.environ.get(name, "").strip()
+    if not raw_value:
+        return default
+    try:
+        return max(int(raw_value), 1)
+    except ValueError:
+        logger.warning("Invalid %s=%s", name, raw_value)
+        return default
+
+
+@dataclass
+class FetchStats:
+    """Request and response-cache counters of one fetcher."""
+    requests: int = 0
+    cache_hits: int = 0  # 304s answered from the response cache
+    cache_misses: int = 0  # full responses while the cache was enabled
+    cache_stores: int = 0
+
+    def to_dict(self) -> dict:
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            **asdict(self),
+            "cache_hit_ratio": round(self.cache_hits / lookups, 3) if lookups else 0.0,
+        }
+
 
 class AsyncFetcher:
     """Async HTTP client for fetching web pages with rate limiting."""
@@ -26,20 +92,133 @@ class AsyncFetcher:
         self,
         rate_limit_delay: float = 2.0,
         timeout: float = 30.0,
-        max_retries: int = 3
+        max_retries: int = 3,
+        rate_limiter: Optional[SharedRateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        max_connections: Optional[int] = None,
+        max_connections_per_domain: Optional[int] = None,
+        http2: Optional[bool] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
         """
         Initialize the fetcher.
 
         Args:
-            rate_limit_delay: Minimum seconds between requests
+            rate_limit_delay: Minimum seconds between requests to a domain
+                (its default budget; SCRAPER_RATE_LIMIT_<DOMAIN> overrides)
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
+            rate_limiter: Shared limiter (default: process-wide one)
+            cache: Response cache (default: SCRAPER_FETCH_CACHE_DIR, if set)
+            max_connections: Pooled connections (default: SCRAPER_FETCH_MAX_CONNECTIONS)
+            max_connections_per_domain: Open requests per domain
+                (default: SCRAPER_FETCH_PER_DOMAIN_CONNECTIONS)
+            http2: Negotiate HTTP/2 (default: SCRAPER_FETCH_HTTP2, when h2 is installed)
+            transport: httpx transport override (tests, proxies)
         """
         self.rate_limit_delay = rate_limit_delay
         self.timeout = timeout
         self.max_retries = max_retries
-        self._last_request_time = 0.0
+        self._rate_limiter = rate_limiter or get_shared_rate_limiter()
+        self.cache = cache if cache is not None else ResponseCache.from_env()
+        self.max_connections = max_connections or _env_int(
+            "SCRAPER_FETCH_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS
+        )
+        self.max_connections_per_domain = max_connections_per_domain or _env_int(
+            "SCRAPER_FETCH_PER_DOMAIN_CONNECTIONS", DEFAULT_PER_DOMAIN_CONNECTIONS
+        )
+        if http2 is None:
+            http2 = os.environ.get("SCRAPER_FETCH_HTTP2", "true").strip().lower() not in {"0", "false", "no"}
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.stats = FetchStats()
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._domain_slots: dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> "AsyncFetcher":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Pooled client of the running loop, created on first use."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            # A client (and its connections) cannot move between loops; one
+            # left on a finished loop is dropped with it.
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers=self.DEFAULT_HEADERS,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+                ),
+                transport=self._transport,
+            )
+            self._client_loop = loop
+            self._domain_slots = {}
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    @asynccontextmanager
+    async def _domain_slot(self, url: str) -> AsyncIterator[None]:
+        domain = domain_key(url)
+        slots = self._domain_slots.setdefault(domain, asyncio.Semaphore(self.max_connections_per_domain))
+        async with slots:
+            yield
+
+    async def _wait_turn(self, url: str) -> None:
+        """Wait for the URL's domain budget."""
+        rate = 1.0 / self.rate_limit_delay if self.rate_limit_delay > 0 else 0.0
+        await self._rate_limiter.acquire(url, RateBudget(requests_per_second=rate))
+
+    async def _load_cached(self, url: str) -> Optional[CachedResponse]:
+        if self.cache is None:
+            return None
+        return await asyncio.to_thread(self.cache.load, url)
+
+    async def _get(self, url: str, cached: Optional[CachedResponse]) -> httpx.Response:
+        """One paced, conditional GET over the pooled client."""
+        await self._wait_turn(url)
+        client = self._get_client()
+        headers = cached.conditional_headers() if cached is not None else {}
+        async with self._domain_slot(url):
+            response = await client.get(url, headers=headers)
+        self.stats.requests += 1
+        await self._rate_limiter.report(
+            url, response.status_code, response.headers.get("Retry-After")
+        )
+        return response
+
+    async def _remember(self, url: str, response: httpx.Response) -> None:
+        """Count a full response and store it when it carries validators."""
+        if self.cache is None:
+            return
+        self.stats.cache_misses += 1
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified):
+            return
+        await asyncio.to_thread(
+            self.cache.store,
+            CachedResponse(
+                url=url,
+                text=response.text,
+                etag=etag,
+                last_modified=last_modified,
+                fetched_at=utc_now_iso(),
+            ),
+        )
+        self.stats.cache_stores += 1
 
     async def fetch(self, url: str) -> Optional[str]:
         """
@@ -51,42 +230,39 @@ class AsyncFetcher:
         Returns:
             HTML content as string, or None on failure
         """
-        # Rate limiting
-        now = asyncio.get_event_loop().time()
-        elapsed = now - self._last_request_time
-        if elapsed < self.rate_limit_delay:
-            wait_time = self.rate_limit_delay - elapsed
-            logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
-            await asyncio.sleep(wait_time)
+        cached = await self._load_cached(url)
 
         for attempt in range(self.max_retries):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(url, headers=self.DEFAULT_HEADERS)
-                    self._last_request_time = asyncio.get_event_loop().time()
-
-                    if response.status_code == 200:
-                        logger.info(f"Fetched {url} ({len(response.text)} chars)")
-                        return response.text
-
-                    elif response.status_code == 429:
-                        # Rate limited by server - wait longer
-                        wait_time = (attempt + 1) * 10
-                        logger.warning(f"Rate limited (429), waiting {wait_time}s")
-                        await asyncio.sleep(wait_time)
-
-                    elif response.status_code >= 500:
-                        # Server error - retry with backoff
-                        wait_time = 2 ** attempt
-                        logger.warning(
-                            f"Server error {response.status_code}, "
-                            f"retry in {wait_time}s"
-                        )
-                        await asyncio.sleep(wait_time)
-
-                    else:
-                        logger.warning(f"HTTP {response.status_code} for {url}")
-                        return None
+                response = await self._get(url, cached)
+
+                if response.status_code == 304 and cached is not None:
+                    self.stats.cache_hits += 1
+                    logger.info(f"Not modified {url} ({len(cached.text)} chars from cache)")
+                    return cached.text
+
+                elif response.status_code == 200:
+                    logger.info(f"Fetched {url} ({len(response.text)} chars)")
+                    await self._remember(url, response)
+                    return response.text
+
+                elif response.status_code == 429:
+                    # Rate limited by server - the shared limiter now holds
+                    # the domain until Retry-After for every fetcher
+                    logger.warning(f"Rate limited (429) fetching {url}")
+
+                elif response.status_code >= 500:
+                    # Server error - retry with backoff
+                    wait_time = 2 ** attempt
+                    logger.warning(
+                        f"Server error {response.status_code}, "
+                        f"retry in {wait_time}s"
+                    )
+                    await asyncio.sleep(wait_time)
+
+                else:
+                    logger.warning(f"HTTP {response.status_code} for {url}")
+                    return None
 
             except httpx.TimeoutException:
                 logger.warning(f"Timeout fetching {url} (attempt {attempt + 1})")
@@ -103,19 +279,21 @@ class AsyncFetcher:
         """
         Fetch URL and return both content and status code.
 
+        A 304 for a cached page is returned as the cached body with status
+        200, since that body is still the current content.
+
         Returns:
             Tuple of (content, status_code)
         """
-        now = asyncio.get_event_loop().time()
-        elapsed = now - self._last_request_time
-        if elapsed < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - elapsed)
-
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=self.DEFAULT_HEADERS)
-                self._last_request_time = asyncio.get_event_loop().time()
-                return response.text, response.status_code
+            cached = await self._load_cached(url)
+            response = await self._get(url, cached)
+            if response.status_code == 304 and cached is not None:
+                self.stats.cache_hits += 1
+                return cached.text, 200
+            if response.status_code == 200:
+                await self._remember(url, response)
+            return response.text, response.status_code
         except Exception as e:
             logger.error(f"Fetch error: {e}")
             return None, 0
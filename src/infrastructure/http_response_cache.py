@@ -0,0 +1,124 @@
+"""
+On-disk caches of fetched pages keyed by their HTTP validators.
+
+LLM parsers fetch the same catalog and search pages on every run. Each 200
+response that carries an ``ETag`` or ``Last-Modified`` header is stored with
+those validators; the next fetch of the URL sends a conditional GET and a
+304 is answered from the stored body instead of transferring the page again.
+
+The building blocks are shared with other validator caches (the DOF daily
+index cache): :class:`ValidatedEntry` gives an entry dataclass its
+conditional headers and versioned ``to_dict``, and :class:`JsonEntryCache`
+reads and atomically replaces one JSON file per entry, with a per-process,
+per-thread temp name so several workers can share one directory.
+
+Environment Variables:
+    SCRAPER_FETCH_CACHE_DIR: Directory for cached responses (unset = no cache)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+
+class ValidatedEntry:
+    """Mixin for cache entry dataclasses with ``etag``/``last_modified`` fields."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+    def to_dict(self) -> dict:
+        return {"version": CACHE_FORMAT_VERSION, **asdict(self)}
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class JsonEntryCache:
+    """One JSON file per entry under ``cache_dir``, replaced atomically."""
+
+    description = "response cache"
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+
+    def _read(self, path: Path) -> Optional[dict]:
+        """Payload at ``path`` in the current format, or None."""
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning("Ignoring unreadable %s %s: %s", self.description, path, exc)
+            return None
+        if not isinstance(payload, dict) or payload.get("version") != CACHE_FORMAT_VERSION:
+            return None
+        return payload
+
+    def _write(self, path: Path, entry: ValidatedEntry) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(entry.to_dict(), ensure_ascii=False), encoding="utf-8")
+            tmp_path.replace(path)
+        except Exception as exc:
+            logger.warning("Could not persist %s %s: %s", self.description, path, exc)
+
+
+@dataclass
+class CachedResponse(ValidatedEntry):
+    """Body of one URL and the validators of the response that produced it."""
+
+    url: str
+    text: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: Optional[str] = None
+
+
+class ResponseCache(JsonEntryCache):
+    """Per-URL JSON files under ``cache_dir``, fanned out by hash prefix."""
+
+    @classmethod
+    def from_env(cls) -> Optional["ResponseCache"]:
+        raw_dir = os.environ.get("SCRAPER_FETCH_CACHE_DIR", "").strip()
+        return cls(Path(raw_dir)) if raw_dir else None
+
+    def _path(self, url: str) -> Path:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.json"
+
+    def load(self, url: str) -> Optional[CachedResponse]:
+        payload = self._read(self._path(url))
+        if payload is None or payload.get("url") != url:
+            return None
+        return CachedResponse(
+            url=payload["url"],
+            text=payload.get("text") or "",
+            etag=payload.get("etag"),
+            last_modified=payload.get("last_modified"),
+            fetched_at=payload.get("fetched_at"),
+        )
+
+    def store(self, entry: CachedResponse) -> None:
+        self._write(self._path(entry.url), entry)
+
+
+def utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
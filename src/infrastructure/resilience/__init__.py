@@ -4,11 +4,20 @@ Resilience patterns for production hardening.
 Provides:
 - Circuit breaker
 - Retry policies
+- Shared per-domain rate limits
 - Timeouts
 - Fallbacks
 """
 from .circuit_breaker import CircuitBreaker, CircuitState, CircuitOpenError
 from .retry_policy import RetryPolicy, ExponentialBackoff, RetryExhaustedError
+from .shared_rate_limiter import (
+    MemoryBackend,
+    RateBudget,
+    RedisBackend,
+    SharedRateLimiter,
+    SQLiteBackend,
+    get_shared_rate_limiter,
+)
 
 __all__ = [
     "CircuitBreaker",
@@ -17,4 +26,10 @@ __all__ = [
     "RetryPolicy",
     "ExponentialBackoff",
     "RetryExhaustedError",
+    "MemoryBackend",
+    "RateBudget",
+    "RedisBackend",
+    "SharedRateLimiter",
+    "SQLiteBackend",
+    "get_shared_rate_limiter",
 ]
@@ -0,0 +1,484 @@
+"""
+Per-domain request budgets shared across actors, processes and hosts.
+
+Each scraper used to pace itself with its own in-process bucket
+(``RateLimiter``, ``BJVRateLimiter``, ``AsyncFetcher``'s delay), so several
+Temporal activities or workers hitting the same site sent N times the
+configured rate. :class:`SharedRateLimiter` keeps one budget per domain in a
+backend that every limiter consults:
+
+- ``memory``: process-local; every limiter in the process shares it;
+- ``sqlite``: a small SQLite file; processes on one host that point at the
+  same file share budgets;
+- ``redis``: any Redis-compatible server (needs the ``redis`` package);
+  workers on every host share budgets.
+
+Budgets use GCRA, the token bucket kept as one "theoretical arrival time" per
+domain, so a reservation is a single atomic read-modify-write: ``burst``
+requests go out at once, then one every ``1 / requests_per_second`` seconds.
+Callers sleep for the returned delay outside any lock or transaction.
+
+``report()`` feeds responses back: a 429 (or a 503 carrying ``Retry-After``)
+blocks the domain until ``Retry-After`` (or ``penalty_seconds``) and doubles
+its slowdown factor up to ``max_slowdown``; later successes shrink it back
+toward 1.
+
+Environment Variables:
+    SCRAPER_RATE_LIMIT_BACKEND: memory, sqlite or redis (default: memory)
+    SCRAPER_RATE_LIMIT_PATH: SQLite file for the sqlite backend (default: <tmpdir>/scraper_rate_limits.sqlite3)
+    SCRAPER_RATE_LIMIT_REDIS_URL: Server for the redis backend (default: redis://localhost:6379/0)
+    SCRAPER_RATE_LIMIT_<DOMAIN>: "rate[:burst]" override for one domain, dots and dashes as
+        underscores, e.g. SCRAPER_RATE_LIMIT_DOF_GOB_MX=1:3
+    SCRAPER_RATE_LIMIT_MAX_SLOWDOWN: Cap for the adaptive slowdown factor (default: 8)
+    SCRAPER_RATE_LIMIT_PENALTY_SECONDS: Block after a 429 without Retry-After (default: 30)
+"""
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import logging
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Protocol, Tuple
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:
+    redis_asyncio = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SLOWDOWN = 8.0
+DEFAULT_PENALTY_SECONDS = 30.0
+SLOWDOWN_RECOVERY = 0.8
+_ENV_PREFIX = "SCRAPER_RATE_LIMIT_"
+_RESERVED_ENV_SUFFIXES = frozenset({"BACKEND", "PATH", "REDIS_URL", "MAX_SLOWDOWN", "PENALTY_SECONDS"})
+_BUDGET_KEY_RE = re.compile(r"[^A-Z0-9]+")
+
+
+@dataclass(frozen=True)
+class RateBudget:
+    """Sustained rate and burst allowance for one domain."""
+    requests_per_second: float = 0.5
+    burst: int = 1
+
+    @property
+    def interval(self) -> float:
+        return 1.0 / self.requests_per_second if self.requests_per_second > 0 else 0.0
+
+    @classmethod
+    def parse(cls, value: str) -> "RateBudget":
+        """Parse ``"rate"`` or ``"rate:burst"``."""
+        rate, _, burst = value.strip().partition(":")
+        return cls(requests_per_second=float(rate), burst=max(1, int(burst or 1)))
+
+
+@dataclass
+class DomainState:
+    """Stored budget state of one domain."""
+    tat: float = 0.0  # theoretical arrival time of the next request
+    blocked_until: float = 0.0
+    slowdown: float = 1.0
+
+
+def gcra_reserve(
+    state: DomainState,
+    now: float,
+    interval: float,
+    burst: int,
+) -> Tuple[DomainState, float]:
+    """Reserve one request; return the new state and the seconds to wait."""
+    effective = interval * state.slowdown
+    start = max(now, state.blocked_until)
+    tat = max(state.tat, start) + effective
+    allowed_at = max(start, tat - max(1, burst) * effective)
+    return DomainState(tat, state.blocked_until, state.slowdown), max(0.0, allowed_at - now)
+
+
+def gcra_penalize(state: DomainState, until: float, max_slowdown: float) -> DomainState:
+    return DomainState(
+        tat=state.tat,
+        blocked_until=max(state.blocked_until, until),
+        slowdown=min(max_slowdown, state.slowdown * 2),
+    )
+
+
+def gcra_relax(state: DomainState) -> DomainState:
+    return DomainState(state.tat, state.blocked_until, max(1.0, state.slowdown * SLOWDOWN_RECOVERY))
+
+
+class RateLimitBackend(Protocol):
+    """Atomic per-domain state store."""
+
+    async def reserve(self, key: str, now: float, interval: float, burst: int) -> Tuple[float, float]:
+        """Reserve a request; return ``(wait_seconds, slowdown)``."""
+        ...
+
+    async def penalize(self, key: str, until: float, max_slowdown: float) -> None:
+        ...
+
+    async def relax(self, key: str) -> None:
+        ...
+
+    async def reset(self, key: str) -> None:
+        ...
+
+
+class MemoryBackend:
+    """Budgets shared by every limiter in this process."""
+
+    def __init__(self) -> None:
+        self._states: dict[str, DomainState] = {}
+
+    async def reserve(self, key: str, now: float, interval: float, burst: int) -> Tuple[float, float]:
+        state, wait = gcra_reserve(self._states.get(key, DomainState()), now, interval, burst)
+        self._states[key] = state
+        return wait, state.slowdown
+
+    async def penalize(self, key: str, until: float, max_slowdown: float) -> None:
+        self._states[key] = gcra_penalize(self._states.get(key, DomainState()), until, max_slowdown)
+
+    async def relax(self, key: str) -> None:
+        if key in self._states:
+            self._states[key] = gcra_relax(self._states[key])
+
+    async def reset(self, key: str) -> None:
+        self._states.pop(key, None)
+
+
+class SQLiteBackend:
+    """
+    Budgets in a SQLite file shared by processes on one host.
+
+    Each update runs in a ``BEGIN IMMEDIATE`` transaction, which takes the
+    file's write lock, so concurrent reservations from different processes
+    are serialized. Statements run in a thread to keep the event loop free
+    while another process holds the lock.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                domain TEXT PRIMARY KEY,
+                tat REAL NOT NULL,
+                blocked_until REAL NOT NULL,
+                slowdown REAL NOT NULL
+            )
+            """
+        )
+
+    def _update(self, key: str, change) -> DomainState:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT tat, blocked_until, slowdown FROM rate_limits WHERE domain = ?",
+                    (key,),
+                ).fetchone()
+                state = change(DomainState(*row) if row else DomainState())
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO rate_limits (domain, tat, blocked_until, slowdown) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, state.tat, state.blocked_until, state.slowdown),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return state
+
+    async def reserve(self, key: str, now: float, interval: float, burst: int) -> Tuple[float, float]:
+        result: list[float] = []
+
+        def change(state: DomainState) -> DomainState:
+            new_state, wait = gcra_reserve(state, now, interval, burst)
+            result.append(wait)
+            return new_state
+
+        state = await asyncio.to_thread(self._update, key, change)
+        return result[0], state.slowdown
+
+    async def penalize(self, key: str, until: float, max_slowdown: float) -> None:
+        await asyncio.to_thread(self._update, key, lambda state: gcra_penalize(state, until, max_slowdown))
+
+    async def relax(self, key: str) -> None:
+        await asyncio.to_thread(self._update, key, gcra_relax)
+
+    async def reset(self, key: str) -> None:
+        def delete() -> None:
+            with self._lock:
+                self._conn.execute("DELETE FROM rate_limits WHERE domain = ?", (key,))
+
+        await asyncio.to_thread(delete)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# KEYS[1] = domain hash; ARGV = now, interval, burst. Mirrors gcra_reserve.
+_REDIS_RESERVE = """
+local state = redis.call('HMGET', KEYS[1], 'tat', 'blocked_until', 'slowdown')
+local now = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local burst = math.max(1, tonumber(ARGV[3]))
+local tat = tonumber(state[1]) or 0
+local blocked_until = tonumber(state[2]) or 0
+local slowdown = tonumber(state[3]) or 1
+local effective = interval * slowdown
+local start = math.max(now, blocked_until)
+tat = math.max(tat, start) + effective
+local allowed_at = math.max(start, tat - burst * effective)
+redis.call('HSET', KEYS[1], 'tat', tostring(tat), 'blocked_until', tostring(blocked_until),
+           'slowdown', tostring(slowdown))
+redis.call('EXPIRE', KEYS[1], math.ceil(math.max(tat, blocked_until) - now) + 3600)
+return {tostring(math.max(0, allowed_at - now)), tostring(slowdown)}
+"""
+
+# KEYS[1] = domain hash; ARGV = now, until, max_slowdown.
+_REDIS_PENALIZE = """
+local state = redis.call('HMGET', KEYS[1], 'blocked_until', 'slowdown')
+local blocked_until = math.max(tonumber(state[1]) or 0, tonumber(ARGV[2]))
+local slowdown = math.min(tonumber(ARGV[3]), (tonumber(state[2]) or 1) * 2)
+redis.call('HSET', KEYS[1], 'blocked_until', tostring(blocked_until), 'slowdown', tostring(slowdown))
+redis.call('EXPIRE', KEYS[1], math.ceil(blocked_until - tonumber(ARGV[1])) + 3600)
+return 1
+"""
+
+# KEYS[1] = domain hash; ARGV = recovery factor.
+_REDIS_RELAX = """
+local slowdown = tonumber(redis.call('HGET', KEYS[1], 'slowdown'))
+if slowdown and slowdown > 1 then
+  redis.call('HSET', KEYS[1], 'slowdown', tostring(math.max(1, slowdown * tonumber(ARGV[1]))))
+end
+return 1
+"""
+
+
+class RedisBackend:
+    """Budgets in a Redis-compatible server shared by every worker host."""
+
+    KEY_PREFIX = "scraper:rate_limit:"
+
+    def __init__(self, url: str = "redis://localhost:6379/0", client: Any = None):
+        if client is None:
+            if redis_asyncio is None:
+                raise RuntimeError("redis package not installed; pip install redis")
+            client = redis_asyncio.from_url(url)
+        self.url = url
+        self._client = client
+        self._reserve = client.register_script(_REDIS_RESERVE)
+        self._penalize = client.register_script(_REDIS_PENALIZE)
+        self._relax = client.register_script(_REDIS_RELAX)
+
+    async def reserve(self, key: str, now: float, interval: float, burst: int) -> Tuple[float, float]:
+        wait, slowdown = await self._reserve(keys=[self.KEY_PREFIX + key], args=[now, interval, burst])
+        return float(wait), float(slowdown)
+
+    async def penalize(self, key: str, until: float, max_slowdown: float) -> None:
+        await self._penalize(keys=[self.KEY_PREFIX + key], args=[time.time(), until, max_slowdown])
+
+    async def relax(self, key: str) -> None:
+        await self._relax(keys=[self.KEY_PREFIX + key], args=[SLOWDOWN_RECOVERY])
+
+    async def reset(self, key: str) -> None:
+        await self._client.delete(self.KEY_PREFIX + key)
+
+
+def domain_key(url_or_host: str) -> str:
+    """Lower-cased host of a URL (or bare host) without a leading ``www.``."""
+    value = (url_or_host or "").strip()
+    host = urllib.parse.urlsplit(value).hostname if "://" in value else value.split("/")[0]
+    host = (host or "").lower().rstrip(".")
+    return host[4:] if host.startswith("www.") else host
+
+
+def budget_key(domain: str) -> str:
+    """Environment-style key of a domain: ``dof.gob.mx`` -> ``DOF_GOB_MX``."""
+    return _BUDGET_KEY_RE.sub("_", domain.upper()).strip("_")
+
+
+def parse_retry_after(value: Any, now: Optional[float] = None) -> Optional[float]:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return max(0.0, float(value))
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - (time.time() if now is None else now))
+
+
+@dataclass
+class DomainStats:
+    acquired: int = 0
+    waited_seconds: float = 0.0
+    throttled: int = 0
+    slowdown: float = 1.0
+
+    def to_dict(self) -> dict:
+        return {
+            "acquired": self.acquired,
+            "waited_seconds": round(self.waited_seconds, 3),
+            "throttled": self.throttled,
+            "slowdown": round(self.slowdown, 3),
+        }
+
+
+@dataclass
+class SharedRateLimiter:
+    """
+    Domain-keyed rate limiter over a pluggable backend.
+
+    Callers pass the budget they were configured with; an entry in
+    ``budgets`` (keyed by domain or :func:`budget_key`, as loaded from
+    ``SCRAPER_RATE_LIMIT_<DOMAIN>``) takes precedence so one setting governs
+    every scraper that hits the domain.
+    """
+    backend: RateLimitBackend = field(default_factory=MemoryBackend)
+    budgets: dict[str, RateBudget] = field(default_factory=dict)
+    max_slowdown: float = DEFAULT_MAX_SLOWDOWN
+    penalty_seconds: float = DEFAULT_PENALTY_SECONDS
+    stats: dict[str, DomainStats] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.budgets = {budget_key(domain): budget for domain, budget in self.budgets.items()}
+
+    def budget_for(self, domain: str, default: Optional[RateBudget] = None) -> RateBudget:
+        return self.budgets.get(budget_key(domain)) or default or RateBudget()
+
+    async def acquire(self, url_or_domain: str, default: Optional[RateBudget] = None) -> float:
+        """
+        Wait for the domain's next request slot; return the seconds waited.
+
+        A budget with no rate (``requests_per_second <= 0``) does not pace
+        requests but still waits out a pause set by :meth:`report`.
+        """
+        domain = domain_key(url_or_domain)
+        budget = self.budget_for(domain, default)
+        wait, slowdown = await self.backend.reserve(domain, time.time(), budget.interval, budget.burst)
+        stats = self.stats.setdefault(domain, DomainStats())
+        stats.acquired += 1
+        stats.waited_seconds += wait
+        stats.slowdown = slowdown
+        if wait > 0:
+            logger.debug("Rate limiting %s: waiting %.2fs", domain, wait)
+            await asyncio.sleep(wait)
+        return wait
+
+    async def report(self, url_or_domain: str, status: Any, retry_after: Any = None) -> None:
+        """
+        Record a response status; 429s (and 503s carrying ``Retry-After``)
+        pause and slow the domain down, successes let it recover.
+        """
+        domain = domain_key(url_or_domain)
+        stats = self.stats.setdefault(domain, DomainStats())
+        delay = parse_retry_after(retry_after)
+        if status == 429 or (status == 503 and delay is not None):
+            delay = self.penalty_seconds if delay is None else delay
+            stats.throttled += 1
+            logger.warning("%s answered %s; pausing the domain for %.1fs", domain, status, delay)
+            await self.backend.penalize(domain, time.time() + delay, self.max_slowdown)
+        elif isinstance(status, int) and 200 <= status < 400 and stats.slowdown > 1.0:
+            await self.backend.relax(domain)
+
+    async def reset(self, url_or_domain: str) -> None:
+        domain = domain_key(url_or_domain)
+        self.stats.pop(domain, None)
+        await self.backend.reset(domain)
+
+    def stats_dict(self) -> dict[str, dict]:
+        return {domain: stats.to_dict() for domain, stats in sorted(self.stats.items())}
+
+
+def _env_float(name: str, default: float, minimum: float) -> float:
+    raw_value = os.environ.get(name, "").strip()
+    if not raw_value:
+        return default
+    try:
+        return max(float(raw_value), minimum)
+    except ValueError:
+        logger.warning("Invalid %s=%s", name, raw_value)
+        return default
+
+
+def budgets_from_env() -> dict[str, RateBudget]:
+    """Per-domain overrides from ``SCRAPER_RATE_LIMIT_<DOMAIN>=rate[:burst]``."""
+    budgets: dict[str, RateBudget] = {}
+    for name, value in os.environ.items():
+        suffix = name[len(_ENV_PREFIX):] if name.startswith(_ENV_PREFIX) else ""
+        if not suffix or suffix in _RESERVED_ENV_SUFFIXES or not value.strip():
+            continue
+        try:
+            budgets[suffix] = RateBudget.parse(value)
+        except ValueError:
+            logger.warning("Invalid %s=%s", name, value)
+    return budgets
+
+
+def _backend_from_env() -> RateLimitBackend:
+    kind = os.environ.get("SCRAPER_RATE_LIMIT_BACKEND", "").strip().lower() or "memory"
+    if kind == "sqlite":
+        path = os.environ.get("SCRAPER_RATE_LIMIT_PATH", "").strip() or str(
+            Path(tempfile.gettempdir()) / "scraper_rate_limits.sqlite3"
+        )
+        return SQLiteBackend(path)
+    if kind == "redis":
+        return RedisBackend(
+            os.environ.get("SCRAPER_RATE_LIMIT_REDIS_URL", "").strip() or "redis://localhost:6379/0"
+        )
+    if kind != "memory":
+        logger.warning("Unknown SCRAPER_RATE_LIMIT_BACKEND=%s; using memory", kind)
+    return MemoryBackend()
+
+
+_shared_limiter: Optional[SharedRateLimiter] = None
+_shared_limiter_lock = threading.Lock()
+
+
+def get_shared_rate_limiter() -> SharedRateLimiter:
+    """
+    Return the process-wide limiter configured from the environment.
+
+    Falls back to the memory backend when the configured one cannot be
+    opened, so a missing Redis or unwritable path never stops a scrape.
+    """
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            try:
+                backend = _backend_from_env()
+            except Exception as exc:
+                logger.warning("Shared rate limit backend unavailable (%s); using memory", exc)
+                backend = MemoryBackend()
+            _shared_limiter = SharedRateLimiter(
+                backend=backend,
+                budgets=budgets_from_env(),
+                max_slowdown=_env_float("SCRAPER_RATE_LIMIT_MAX_SLOWDOWN", DEFAULT_MAX_SLOWDOWN, 1.0),
+                penalty_seconds=_env_float("SCRAPER_RATE_LIMIT_PENALTY_SECONDS", DEFAULT_PENALTY_SECONDS, 0.0),
+            )
+        return _shared_limiter
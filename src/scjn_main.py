@@ -45,6 +45,7 @@ async def create_pipeline(args) -> SCJNCoordinatorActor:
     # Create rate limiter
     rate_limiter = RateLimiter(
         requests_per_second=args.rate_limit,
+        domain=SCJNScraperActor.SCJN_BASE_URL,
     )
 
     # Create child actors
@@ -59,6 +60,7 @@ async def create_pipeline(args) -> SCJNCoordinatorActor:
         checkpoint_actor=checkpoint,
         rate_limiter=rate_limiter,
         max_concurrent_downloads=args.concurrency,
+        mailbox_size=args.mailbox_size,
     )
 
     # Wire discovery and scraper actors
@@ -70,6 +72,9 @@ async def create_pipeline(args) -> SCJNCoordinatorActor:
         coordinator=coordinator,
         rate_limiter=rate_limiter,
         download_pdfs=not args.skip_pdfs if hasattr(args, 'skip_pdfs') else True,
+        concurrency=args.concurrency,
+        mailbox_size=args.concurrency * 2,
+        persistence_actor=persistence,
     )
 
     coordinator._discovery_actor = discovery
@@ -234,6 +239,7 @@ async def run_llm_discovery(args):
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    parser = None
     try:
         # Create LLM parser
         parser = SCJNLLMParser(
@@ -284,11 +290,17 @@ async def run_llm_discovery(args):
         print()
         print("[SUMMARY] LLM Discovery Complete")
         print(f"[SUMMARY] Total documents: {len(documents)}")
+        fetch_stats = parser.fetcher.stats
+        print(f"[SUMMARY] Page requests: {fetch_stats.requests} "
+              f"(cache hits: {fetch_stats.cache_hits}, misses: {fetch_stats.cache_misses})")
 
     except Exception as e:
         print(f"[ERROR] {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        if parser is not None:
+            await parser.close()
 
 
 async def show_status(args):
@@ -390,6 +402,10 @@ Examples:
         '--concurrency', type=int, default=3,
         help='Max concurrent downloads (default: 3)',
     )
+    discover_parser.add_argument(
+        '--mailbox-size', type=int, default=100,
+        help='Discovered documents queued ahead of downloads (default: 100)',
+    )
     discover_parser.add_argument(
         '--rate-limit', type=float, default=0.5,
         help='Requests per second (default: 0.5)',
@@ -39,4 +39,64 @@ async def test_actor_ask_pattern():
     response = await actor.ask("ping")
     
     assert response == "pong"
-    await actor.stop()
\ No newline at end of file
+    await actor.stop()
+
+class SlowActor(BaseActor):
+    def __init__(self, delay, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+        self.peak = 0
+        self._active = 0
+
+    async def handle_message(self, message):
+        self._active += 1
+        self.peak = max(self.peak, self._active)
+        await asyncio.sleep(self.delay)
+        self._active -= 1
+        return message
+
+@pytest.mark.asyncio
+async def test_pooled_actor_runs_handlers_concurrently():
+    """N consumers finish N slow messages in about one handler's time."""
+    actor = SlowActor(0.2, concurrency=5)
+    await actor.start()
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = await asyncio.gather(*(actor.ask(i) for i in range(5)))
+    elapsed = loop.time() - started
+
+    assert results == [0, 1, 2, 3, 4]
+    assert actor.peak == 5
+    assert elapsed < 0.5
+    await actor.stop()
+    assert all(task.done() for task in actor._tasks)
+
+@pytest.mark.asyncio
+async def test_bounded_mailbox_applies_backpressure():
+    """tell waits for room once the mailbox is full."""
+    actor = SlowActor(0.1, concurrency=1, mailbox_size=1)
+    await actor.start()
+
+    await actor.tell("a")
+    await asyncio.sleep(0)  # first message is taken by the consumer
+    await actor.tell("b")
+    blocked = asyncio.create_task(actor.tell("c"))
+    await asyncio.sleep(0.02)
+
+    assert not blocked.done()
+    assert actor.load == 2
+    await asyncio.wait_for(blocked, timeout=1)
+    await actor.stop()
+
+@pytest.mark.asyncio
+async def test_pooled_actor_restarts_after_stop():
+    """stop() leaves no poison pill behind for the next start()."""
+    actor = SlowActor(0, concurrency=2)
+    await actor.start()
+    await actor.stop()
+    await actor.start()
+
+    assert await asyncio.wait_for(actor.ask(2), timeout=1) == 2
+    assert not any(task.done() for task in actor._tasks)
+    await actor.stop()
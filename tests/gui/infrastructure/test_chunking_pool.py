@@ -0,0 +1,91 @@
+import asyncio
+import time
+
+import pytest
+
+from src.gui.infrastructure import chunking_pool
+from src.gui.infrastructure.chunking_pool import ChunkingProcessPool, ChunkingTimeoutError
+
+
+@pytest.fixture
+def pool():
+    pool = ChunkingProcessPool(max_workers=2, timeout_seconds=30)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_chunking_pool_runs_jobs_in_worker_processes(pool):
+    results = await asyncio.gather(
+        pool.run(sorted, [3, 1, 2]),
+        pool.run(sorted, "cba"),
+        pool.run(sorted, [2, 1], reverse=True),
+    )
+
+    assert results == [[1, 2, 3], ["a", "b", "c"], [2, 1]]
+    assert pool.jobs_completed == 3
+    assert len(pool._idle) <= pool.max_workers
+
+
+@pytest.mark.asyncio
+async def test_chunking_pool_reraises_job_errors_and_keeps_worker(pool):
+    with pytest.raises(ValueError):
+        await pool.run(int, "not-a-number")
+
+    assert len(pool._idle) == 1
+    assert await pool.run(int, "7") == 7
+
+
+@pytest.mark.asyncio
+async def test_chunking_pool_kills_worker_on_timeout(pool):
+    started = time.perf_counter()
+    with pytest.raises(ChunkingTimeoutError):
+        await pool.run(time.sleep, 30, timeout=0.5)
+
+    assert time.perf_counter() - started < 10
+    assert pool.jobs_timed_out == 1
+    assert pool._idle == []
+    assert await pool.run(sorted, [2, 1]) == [1, 2]
+
+
+def test_get_chunking_pool_is_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("SCRAPER_CHUNKING_PROCESSES", raising=False)
+
+    assert chunking_pool.get_chunking_pool() is None
+
+
+def test_get_chunking_pool_reuses_configured_pool(monkeypatch):
+    monkeypatch.setenv("SCRAPER_CHUNKING_PROCESSES", "3")
+    monkeypatch.setenv("SCRAPER_CHUNKING_TIMEOUT_SECONDS", "45")
+    try:
+        first = chunking_pool.get_chunking_pool()
+        second = chunking_pool.get_chunking_pool()
+
+        assert first is second
+        assert first.max_workers == 3
+        assert first.timeout_seconds == 45
+    finally:
+        chunking_pool.shutdown_chunking_pool()
+
+
+@pytest.mark.asyncio
+async def test_run_chunker_uses_configured_process_pool(monkeypatch, tmp_path):
+    from src.gui.infrastructure import scraper_document_workflow
+
+    json_path = tmp_path / "33873.json"
+    json_path.write_text(
+        '{"rubro":"<p>Ejecutoria de prueba</p>","texto":"<p>Texto principal</p>"}',
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("SCRAPER_CHUNKING_PROCESSES", "1")
+    try:
+        chunks = await scraper_document_workflow._run_chunker(
+            json_path, "scjn", "Ejecutoria 33873", mounted=True
+        )
+        pool = chunking_pool.get_chunking_pool()
+
+        assert pool.jobs_completed == 1
+        assert chunks[0]["metadata"]["chunking_method"] == "scjn_api_json_v1"
+        assert "Texto principal" in "\n".join(chunk["text"] for chunk in chunks)
+    finally:
+        chunking_pool.shutdown_chunking_pool()
@@ -0,0 +1,66 @@
+from datetime import date
+
+from src.gui.infrastructure.dof_index_cache import CachedDofDay, DofIndexCache
+
+
+def test_store_and_load_round_trip(tmp_path):
+    cache = DofIndexCache(tmp_path)
+    entry = CachedDofDay(
+        day="2024-03-01",
+        items=[{"title": "Decreto", "url": "https://dof.gob.mx/nota_detalle.php?codigo=1"}],
+        etag='"abc"',
+        last_modified="Fri, 01 Mar 2024 10:00:00 GMT",
+        fetched_at="2024-03-20T00:00:00+00:00",
+    )
+
+    cache.store(entry)
+    loaded = cache.load(date(2024, 3, 1))
+
+    assert loaded == entry
+    assert (tmp_path / "2024" / "2024-03-01.json").exists()
+
+
+def test_load_missing_or_corrupt_day_returns_none(tmp_path):
+    cache = DofIndexCache(tmp_path)
+    (tmp_path / "2024").mkdir()
+    (tmp_path / "2024" / "2024-03-02.json").write_text("{not json", encoding="utf-8")
+
+    assert cache.load(date(2024, 3, 1)) is None
+    assert cache.load(date(2024, 3, 2)) is None
+
+
+def test_is_settled_after_configured_days(tmp_path):
+    cache = DofIndexCache(tmp_path, settled_after_days=7)
+    items = [{"title": "Decreto"}]
+
+    assert cache.is_settled(CachedDofDay(day="2024-03-01", items=items, fetched_at="2024-03-08T00:00:00+00:00"))
+    assert not cache.is_settled(CachedDofDay(day="2024-03-01", items=items, fetched_at="2024-03-05T00:00:00+00:00"))
+    assert not cache.is_settled(CachedDofDay(day="2024-03-01", items=items))
+
+
+def test_day_without_items_is_never_settled(tmp_path):
+    cache = DofIndexCache(tmp_path, settled_after_days=7)
+
+    assert not cache.is_settled(CachedDofDay(day="2024-03-01", fetched_at="2024-06-01T00:00:00+00:00"))
+
+
+def test_conditional_headers_use_stored_validators():
+    entry = CachedDofDay(day="2024-03-01", etag='"abc"', last_modified="Fri, 01 Mar 2024 10:00:00 GMT")
+
+    assert entry.conditional_headers() == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Fri, 01 Mar 2024 10:00:00 GMT",
+    }
+    assert CachedDofDay(day="2024-03-01").conditional_headers() == {}
+
+
+def test_from_env_requires_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.delenv("SCRAPER_DOF_INDEX_CACHE_DIR", raising=False)
+    assert DofIndexCache.from_env() is None
+
+    monkeypatch.setenv("SCRAPER_DOF_INDEX_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("SCRAPER_DOF_INDEX_SETTLED_DAYS", "3")
+    cache = DofIndexCache.from_env()
+
+    assert cache.cache_dir == tmp_path
+    assert cache.settled_after_days == 3
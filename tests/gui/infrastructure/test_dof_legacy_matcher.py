@@ -0,0 +1,132 @@
+import random
+import sqlite3
+
+import pytest
+
+import src.gui.infrastructure.mounted_disk_backfill as mounted_disk_backfill
+from src.gui.infrastructure.mounted_disk_backfill import (
+    DofLegacyTitleMatcher,
+    _normalize_match_text,
+    _resolve_dof_legacy_external_id,
+    _score_dof_candidate,
+)
+
+WORDS = (
+    "acuerdo decreto tasas interes interbancarias equilibrio secretaria hacienda "
+    "credito publico reglas operacion programa aviso convocatoria norma oficial"
+).split()
+
+
+def _write_catalog(db_path, rows):
+    conn = sqlite3.connect(str(db_path))
+    conn.execute(
+        "CREATE TABLE documents ("
+        "id TEXT PRIMARY KEY, external_id TEXT UNIQUE NOT NULL, title TEXT, publication_date TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO documents (id, external_id, title, publication_date) VALUES (?, ?, ?, ?)",
+        [(f"row-{index}", *row) for index, row in enumerate(rows)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def _brute_force(rows, external_id, title, publication_date):
+    """The pre-index resolver: score every row for the date, else the year."""
+    candidates = [row for row in rows if row[2] == publication_date]
+    if not candidates:
+        candidates = [row for row in rows if row[2][:4] == publication_date[:4]]
+    slug = _normalize_match_text(external_id[4:] if external_id.startswith("dof-") else "")
+    target = _normalize_match_text(title)
+    best, best_score, duplicate = None, -1, False
+    for candidate_id, candidate_title, _ in candidates:
+        score = _score_dof_candidate(candidate_title, target_title_norm=target, legacy_slug_norm=slug)
+        if score < 0:
+            continue
+        if score > best_score:
+            best, best_score, duplicate = candidate_id, score, False
+        elif score == best_score:
+            duplicate = True
+    return None if duplicate or best_score < 0 else best
+
+
+@pytest.fixture(autouse=True)
+def _fresh_matchers():
+    mounted_disk_backfill._dof_matchers.clear()
+    yield
+    for _mtime, matcher in mounted_disk_backfill._dof_matchers.values():
+        matcher.close()
+    mounted_disk_backfill._dof_matchers.clear()
+
+
+def test_matcher_agrees_with_full_scan_scoring(tmp_path):
+    rng = random.Random(7)
+    rows = []
+    for index in range(400):
+        title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 7)))
+        rows.append((str(5700000 + index), title.title() + ".", f"2021-0{rng.randint(1, 3)}-0{rng.randint(1, 4)}"))
+    _write_catalog(tmp_path / "dof_progress.db", rows)
+    matcher = DofLegacyTitleMatcher(tmp_path / "dof_progress.db")
+
+    for _ in range(300):
+        _, title, publication_date = rng.choice(rows)
+        words = title.rstrip(".").split()
+        query_title = " ".join(words[: rng.randint(1, len(words))])
+        if rng.random() < 0.2:
+            publication_date = "2021-05-01"
+        external_id = "dof-" + query_title.replace(" ", "_")
+        query_kwargs = {"title": query_title if rng.random() < 0.7 else None, "publication_date": publication_date}
+
+        assert matcher.resolve(external_id, **query_kwargs) == _brute_force(
+            rows, external_id, query_kwargs["title"], publication_date
+        )
+    matcher.close()
+
+
+def test_resolver_reuses_one_connection_across_documents(tmp_path, monkeypatch):
+    rows = [
+        ("5784621", "Tasas de interes interbancarias de equilibrio.", "2021-03-03"),
+        ("5784622", "Aviso de convocatoria para el programa federal.", "2021-03-03"),
+        ("5784623", "Decreto por el que se reforma la norma oficial.", "2021-04-10"),
+    ]
+    _write_catalog(tmp_path / "dof_progress.db", rows)
+    connects = []
+    original_connect = sqlite3.connect
+    monkeypatch.setattr(
+        mounted_disk_backfill.sqlite3,
+        "connect",
+        lambda *args, **kwargs: connects.append(args) or original_connect(*args, **kwargs),
+    )
+
+    resolved = [
+        _resolve_dof_legacy_external_id(
+            tmp_path,
+            "dof-" + title.replace(" ", "_"),
+            title=title,
+            publication_date=publication_date,
+        )
+        for _, title, publication_date in rows
+    ]
+
+    assert resolved == ["5784621", "5784622", "5784623"]
+    assert len(connects) == 1
+
+
+def test_resolver_falls_back_to_year_and_rejects_ties(tmp_path):
+    rows = [
+        ("1", "Reglas de operacion del programa de apoyo.", "2020-06-01"),
+        ("2", "Reglas de operacion del programa de apoyo.", "2020-07-01"),
+        ("3", "Acuerdo por el que se da a conocer el formato.", "2020-08-01"),
+    ]
+    _write_catalog(tmp_path / "dof_progress.db", rows)
+
+    assert _resolve_dof_legacy_external_id(
+        tmp_path,
+        "dof-Acuerdo_por_el_que_se_da_a_conocer",
+        publication_date="2020-01-15",
+    ) == "3"
+    assert _resolve_dof_legacy_external_id(
+        tmp_path,
+        "dof-Reglas_de_operacion_del_programa_de_apoyo.",
+        publication_date="2020-01-15",
+    ) is None
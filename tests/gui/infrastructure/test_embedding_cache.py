@@ -0,0 +1,41 @@
+from src.gui.infrastructure import embedding_cache
+from src.gui.infrastructure.embedding_cache import (
+    EmbeddingCache,
+    chunk_text_hash,
+    normalize_chunk_text,
+)
+
+
+def test_chunk_text_hash_ignores_whitespace_differences():
+    assert normalize_chunk_text("  Artículo 1.\n\n  Texto\tfinal ") == "Artículo 1. Texto final"
+    assert chunk_text_hash("Artículo 1.\nTexto") == chunk_text_hash("Artículo 1.  Texto ")
+    assert chunk_text_hash("Artículo 1.") != chunk_text_hash("Artículo 2.")
+
+
+def test_embedding_cache_round_trips_vectors_per_model_and_size(tmp_path):
+    cache = EmbeddingCache(tmp_path / "cache" / "embeddings.sqlite")
+    cache.put_many("model-a", 3, {"h1": [0.5, 0.25, -1.0], "h2": [1.0, 2.0, 3.0]})
+
+    assert cache.get_many("model-a", 3, ["h1", "h2", "h3"]) == {
+        "h1": [0.5, 0.25, -1.0],
+        "h2": [1.0, 2.0, 3.0],
+    }
+    assert cache.get_many("model-b", 3, ["h1"]) == {}
+    assert cache.get_many("model-a", 4, ["h1"]) == {}
+    cache.close()
+
+    reopened = EmbeddingCache(tmp_path / "cache" / "embeddings.sqlite")
+    assert reopened.get_many("model-a", 3, ["h2"]) == {"h2": [1.0, 2.0, 3.0]}
+    reopened.close()
+
+
+def test_get_embedding_cache_requires_configured_path(monkeypatch, tmp_path):
+    monkeypatch.setattr(embedding_cache, "_shared_cache", None)
+    monkeypatch.delenv("SCRAPER_EMBEDDING_CACHE_PATH", raising=False)
+    assert embedding_cache.get_embedding_cache() is None
+
+    monkeypatch.setenv("SCRAPER_EMBEDDING_CACHE_PATH", str(tmp_path / "embeddings.sqlite"))
+    cache = embedding_cache.get_embedding_cache()
+    assert cache is not None
+    assert embedding_cache.get_embedding_cache() is cache
+    cache.close()
@@ -0,0 +1,203 @@
+import asyncio
+import hashlib
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.gui.infrastructure import crawl4ai_activities
+from src.gui.infrastructure.http_download_pool import (
+    SNIFF_BYTES,
+    DownloadLimits,
+    DownloadTooLarge,
+    HostThrottle,
+    stream_response_to_file,
+)
+from src.infrastructure.resilience.shared_rate_limiter import SharedRateLimiter
+
+
+class _SlowResponse:
+    def __init__(self, session, url):
+        self._session = session
+        self.url = url
+        self.status = 200
+        self.headers = {"Content-Type": "application/pdf"}
+
+    async def __aenter__(self):
+        host = self.url.split("/")[2]
+        self._session.open[host] = self._session.open.get(host, 0) + 1
+        self._session.peak[host] = max(self._session.peak.get(host, 0), self._session.open[host])
+        await asyncio.sleep(0.02)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._session.open[self.url.split("/")[2]] -= 1
+        return None
+
+    @property
+    def content(self):
+        return _ChunkedBody([b"%PDF-1.7 ", self.url.encode("utf-8")])
+
+
+class _ChunkedBody:
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def iter_chunked(self, size):
+        for chunk in self._chunks:
+            for start in range(0, len(chunk), size):
+                yield chunk[start : start + size]
+
+
+class _SlowSession:
+    def __init__(self):
+        self.open = {}
+        self.peak = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+    def get(self, url, **kwargs):
+        return _SlowResponse(self, url)
+
+
+def test_download_limits_read_env_and_ignore_invalid_values(monkeypatch):
+    monkeypatch.setenv("SCRAPER_DOWNLOAD_CONCURRENCY", "16")
+    monkeypatch.setenv("SCRAPER_DOWNLOAD_PER_HOST_CONCURRENCY", "0")
+    monkeypatch.setenv("SCRAPER_DOWNLOAD_HOST_DELAY_SECONDS", "soon")
+
+    limits = DownloadLimits.from_env()
+
+    assert limits.concurrency == 16
+    assert limits.per_host == 1
+    assert limits.host_delay_seconds == 0.25
+
+
+@pytest.mark.asyncio
+async def test_host_throttle_spaces_request_starts_and_records_stats():
+    throttle = HostThrottle(DownloadLimits(per_host=4, host_delay_seconds=0.05))
+    starts = []
+
+    async def _fetch(url, size):
+        async with throttle.request(url) as record:
+            starts.append(time.monotonic())
+            record.bytes = size
+
+    await asyncio.gather(*(_fetch("https://dof.gob.mx/a", 10) for _ in range(3)))
+
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    assert all(gap >= 0.045 for gap in gaps)
+    stats = throttle.stats_dict()
+    assert stats["dof.gob.mx"]["requests"] == 3
+    assert stats["dof.gob.mx"]["bytes"] == 30
+    assert stats["dof.gob.mx"]["failures"] == 0
+
+
+@pytest.mark.asyncio
+async def test_host_throttle_reports_429_to_shared_limiter():
+    limiter = SharedRateLimiter()
+    throttle = HostThrottle(DownloadLimits(per_host=2, host_delay_seconds=0), limiter)
+    response = SimpleNamespace(status=429, headers={"Retry-After": "0.2"})
+
+    async with throttle.request("https://dof.gob.mx/a") as record:
+        record.observe(response)
+    started = time.monotonic()
+    async with throttle.request("https://dof.gob.mx/b"):
+        pass
+
+    assert time.monotonic() - started >= 0.15
+    assert limiter.stats_dict()["dof.gob.mx"]["throttled"] == 1
+    assert limiter.stats_dict()["dof.gob.mx"]["acquired"] == 2
+
+
+@pytest.mark.asyncio
+async def test_download_documents_pdfs_caps_requests_per_host(monkeypatch, tmp_path):
+    monkeypatch.setenv("SCRAPER_DOWNLOAD_CONCURRENCY", "8")
+    monkeypatch.setenv("SCRAPER_DOWNLOAD_PER_HOST_CONCURRENCY", "2")
+    monkeypatch.setenv("SCRAPER_DOWNLOAD_HOST_DELAY_SECONDS", "0")
+    session = _SlowSession()
+    monkeypatch.setattr(crawl4ai_activities.aiohttp, "ClientSession", lambda *args, **kwargs: session)
+    documents = [
+        {"external_id": f"doc-{index}", "pdf_url": f"https://{host}/files/{index}.pdf"}
+        for index, host in enumerate(["a.example.org", "b.example.org"] * 4)
+    ]
+
+    result = await crawl4ai_activities.download_documents_pdfs(
+        documents=documents,
+        source="scjn",
+        output_directory=str(tmp_path / "downloads"),
+    )
+
+    assert result["downloaded_count"] == 8
+    assert [doc["external_id"] for doc in result["downloaded_documents"]] == [
+        doc["external_id"] for doc in documents
+    ]
+    assert session.peak == {"a.example.org": 2, "b.example.org": 2}
+    assert result["host_stats"]["a.example.org"]["requests"] == 4
+    assert result["host_stats"]["b.example.org"]["bytes"] > 0
+
+
+@pytest.mark.asyncio
+async def test_stream_response_to_file_hashes_incrementally(tmp_path):
+    body = b"%PDF-1.7\n" + bytes(range(256)) * 40
+    response = SimpleNamespace(content=_ChunkedBody([body]))
+
+    streamed = await stream_response_to_file(response, tmp_path / "doc.part", chunk_size=4096)
+
+    assert streamed.size == len(body)
+    assert streamed.sha256 == hashlib.sha256(body).hexdigest()
+    assert streamed.head == body[:SNIFF_BYTES]
+    assert (tmp_path / "doc.part").read_bytes() == body
+
+
+@pytest.mark.asyncio
+async def test_stream_response_to_file_removes_partial_file_over_cap(tmp_path):
+    response = SimpleNamespace(content=_ChunkedBody([b"x" * 10_000]))
+
+    with pytest.raises(DownloadTooLarge):
+        await stream_response_to_file(response, tmp_path / "doc.part", chunk_size=4096, max_bytes=5000)
+
+    assert not (tmp_path / "doc.part").exists()
+
+
+@pytest.mark.asyncio
+async def test_download_documents_pdfs_reports_streamed_hash(monkeypatch, tmp_path):
+    session = _SlowSession()
+    monkeypatch.setattr(crawl4ai_activities.aiohttp, "ClientSession", lambda *args, **kwargs: session)
+    url = "https://a.example.org/files/1.pdf"
+
+    result = await crawl4ai_activities.download_documents_pdfs(
+        documents=[{"external_id": "doc-1", "pdf_url": url}],
+        source="scjn",
+        output_directory=str(tmp_path / "downloads"),
+    )
+
+    downloaded = result["downloaded_documents"][0]
+    expected = b"%PDF-1.7 " + url.encode("utf-8")
+    assert downloaded["content_hash"] == hashlib.sha256(expected).hexdigest()
+    assert downloaded["file_size_bytes"] == len(expected)
+    assert downloaded["pdf_path"].endswith("doc-1.pdf")
+    assert sorted(path.name for path in (tmp_path / "downloads").iterdir()) == ["doc-1.pdf"]
+
+
+@pytest.mark.asyncio
+async def test_download_documents_pdfs_removes_partial_file_on_failure(monkeypatch, tmp_path):
+    session = _SlowSession()
+    monkeypatch.setattr(crawl4ai_activities.aiohttp, "ClientSession", lambda *args, **kwargs: session)
+
+    def _reject(*args, **kwargs):
+        raise ValueError("unsupported document type")
+
+    monkeypatch.setattr(crawl4ai_activities, "_sniff_document_type", _reject)
+
+    result = await crawl4ai_activities.download_documents_pdfs(
+        documents=[{"external_id": "doc-1", "pdf_url": "https://a.example.org/files/1.pdf"}],
+        source="scjn",
+        output_directory=str(tmp_path / "downloads"),
+    )
+
+    assert result["downloaded_count"] == 0
+    assert list((tmp_path / "downloads").iterdir()) == []
@@ -1,9 +1,11 @@
+import asyncio
 import sqlite3
 from datetime import datetime, timezone
 from types import SimpleNamespace
 
 import pytest
 import src.gui.infrastructure.mounted_disk_backfill as mounted_disk_backfill
+from tests.utils.postgrest_filters import matches_or_filter, sort_rows
 
 from src.gui.infrastructure.mounted_disk_backfill import (
     _count_documents_missing_storage,
@@ -22,6 +24,10 @@ class _DocsQuery:
         self._filters = {}
         self._is_filters = {}
         self._not_is_filters = {}
+        self._or_filters = []
+        self._in_filters = {}
+        self._gt_filters = {}
+        self._orders = []
         self._range = None
         self._update_values = None
         self._upsert_values = None
@@ -53,7 +59,20 @@ class _DocsQuery:
             self._is_filters[key] = value
         return self
 
-    def order(self, *_args, **_kwargs):
+    def in_(self, key, values):
+        self._in_filters[key] = list(values)
+        return self
+
+    def gt(self, key, value):
+        self._gt_filters[key] = value
+        return self
+
+    def or_(self, expression):
+        self._or_filters.append(expression)
+        return self
+
+    def order(self, column, desc=False):
+        self._orders.append((column, desc))
         return self
 
     def range(self, start, end):
@@ -78,6 +97,8 @@ class _DocsQuery:
         data = self._client.rows_by_table[self._table_name]
         if self._upsert_values is not None:
             payloads = self._upsert_values if isinstance(self._upsert_values, list) else [self._upsert_values]
+            if any(payload.get("external_id") in self._client.failing_external_ids for payload in payloads):
+                raise RuntimeError("invalid input syntax")
             results = []
             for payload in payloads:
                 payload = dict(payload)
@@ -111,6 +132,12 @@ class _DocsQuery:
         for key, value in self._not_is_filters.items():
             if value == "null":
                 data = [row for row in data if row.get(key) is not None]
+        for key, values in self._in_filters.items():
+            data = [row for row in data if row.get(key) in values]
+        for key, value in self._gt_filters.items():
+            data = [row for row in data if row.get(key) is not None and row.get(key) > value]
+        for expression in self._or_filters:
+            data = [row for row in data if matches_or_filter(row, expression)]
 
         if self._update_values is not None:
             for row in data:
@@ -121,6 +148,7 @@ class _DocsQuery:
         if self._head:
             return SimpleNamespace(data=[], count=count)
 
+        data = sort_rows(data, self._orders)
         if self._limit is not None:
             data = data[: self._limit]
         if self._range is not None:
@@ -136,6 +164,7 @@ class _FakeSupabaseClient:
             "scraper_document_aliases": alias_rows if alias_rows is not None else [],
         }
         self.queries = []
+        self.failing_external_ids = set()
 
     def table(self, name):
         assert name in self.rows_by_table
@@ -444,6 +473,60 @@ def test_bootstrap_limit_counts_new_registrations_not_existing_rows(tmp_path):
     assert len(upsert_queries) == 1
 
 
+def _write_tesis_outputs(tmp_path, thesis_ids):
+    for thesis_id in thesis_ids:
+        (tmp_path / "tesis" / "converted" / thesis_id).mkdir(parents=True, exist_ok=True)
+        (tmp_path / "tesis" / "converted" / thesis_id / "output.txt").write_text(
+            f"tesis {thesis_id}",
+            encoding="utf-8",
+        )
+
+
+def test_bootstrap_batches_registration_upserts(tmp_path):
+    thesis_ids = [str(2031990 + index) for index in range(5)]
+    _write_tesis_outputs(tmp_path, thesis_ids)
+    docs = []
+    supabase_client = _FakeSupabaseClient(docs, alias_rows=[])
+
+    result = bootstrap_source_documents_from_mounted_disk(
+        "scjn",
+        data_root=tmp_path,
+        supabase_client=supabase_client,
+        batch_size=2,
+    )
+
+    upsert_batches = [
+        query._upsert_values
+        for query in supabase_client.queries
+        if query._table_name == "scraper_documents" and query._upsert_values is not None
+    ]
+
+    assert result["registered_rows"] == 5
+    assert result["errors"] == []
+    assert [len(batch) for batch in upsert_batches] == [2, 2, 1]
+    assert {row["external_id"] for row in docs} == {f"tesis-{thesis_id}" for thesis_id in thesis_ids}
+    assert result["records_per_second"] > 0
+
+
+def test_bootstrap_batch_falls_back_to_single_rows_for_failures(tmp_path):
+    _write_tesis_outputs(tmp_path, ("2031990", "2031991", "2031992"))
+    docs = []
+    supabase_client = _FakeSupabaseClient(docs, alias_rows=[])
+    supabase_client.failing_external_ids.add("tesis-2031991")
+
+    result = bootstrap_source_documents_from_mounted_disk(
+        "scjn",
+        data_root=tmp_path,
+        supabase_client=supabase_client,
+        batch_size=10,
+    )
+
+    assert result["registered_rows"] == 2
+    assert {row["external_id"] for row in docs} == {"tesis-2031990", "tesis-2031992"}
+    assert len(result["errors"]) == 1
+    assert result["errors"][0].startswith("tesis-2031991:")
+
+
 def test_bootstrap_source_documents_registers_scjn_api_json_records(tmp_path):
     (tmp_path / "ejecutorias" / "api_json").mkdir(parents=True)
     (tmp_path / "ejecutorias" / "api_json" / "33873.json").write_text(
@@ -1177,6 +1260,7 @@ async def test_backfill_until_exhausted_continues_when_registration_progresses(m
         supabase_client,
         storage_adapter,
         temporal_client,
+        concurrency=None,
     ):
         bootstrap_flags.append(bootstrap_missing_documents)
         if len(bootstrap_flags) == 1:
@@ -1364,3 +1448,124 @@ async def test_backfill_source_uses_direct_mounted_path_for_cas_canonical_json(t
     assert result.reused_storage_object == 1
     assert storage_adapter.upload_calls == []
     assert docs[0]["storage_path"] == "mounted://cas/converted/A2-99/canonical.json"
+
+
+class _SlowStorageAdapter(_FakeStorageAdapter):
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+
+    async def upload(self, content, source_type, doc_id, **kwargs):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            return await super().upload(content, source_type, doc_id, **kwargs)
+        finally:
+            self.active -= 1
+
+
+def _pending_dof_docs(count):
+    return [
+        {
+            "id": f"doc-{index}",
+            "external_id": f"57000{index:02d}",
+            "title": f"DOF {index}",
+            "source_type": "dof",
+            "storage_path": None,
+            "embedding_status": "pending",
+            "chunk_count": 0,
+            "created_at": f"2026-04-{index + 1:02d}T00:00:00+00:00",
+        }
+        for index in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_backfill_uploads_concurrently_within_limit_with_deterministic_results(tmp_path):
+    docs = _pending_dof_docs(8)
+    (tmp_path / "dof").mkdir()
+    for doc in docs:
+        (tmp_path / "dof" / f"{doc['external_id']}.pdf").write_bytes(f"%PDF {doc['id']}".encode())
+    storage_adapter = _SlowStorageAdapter(delay=0.05)
+    storage_adapter.raise_on_doc_ids["5700003"] = RuntimeError("boom")
+    temporal_client = _FakeTemporalClient()
+
+    started = asyncio.get_running_loop().time()
+    result = await backfill_source_from_mounted_disk(
+        "dof",
+        limit=20,
+        data_root=tmp_path,
+        supabase_client=_FakeSupabaseClient(docs),
+        storage_adapter=storage_adapter,
+        temporal_client=temporal_client,
+        bootstrap_missing_documents=False,
+        concurrency=mounted_disk_backfill.BackfillConcurrency(disk_io=2, uploads=3, db_updates=2),
+    )
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert storage_adapter.max_active == 3
+    assert elapsed < 8 * 0.05
+    assert result.eligible == 8
+    assert result.uploaded == 7
+    assert result.updated_rows == 7
+    assert result.errors == ["5700003: boom"]
+    assert temporal_client.calls[0]["document_ids"] == [
+        f"doc-{index}" for index in (7, 6, 5, 4, 2, 1, 0)
+    ]
+    assert all(doc["storage_path"] for doc in docs if doc["id"] != "doc-3")
+
+
+@pytest.mark.asyncio
+async def test_backfill_coalesces_status_only_updates(tmp_path):
+    docs = _pending_dof_docs(5)
+    (tmp_path / "dof").mkdir()
+    supabase_client = _FakeSupabaseClient(docs)
+
+    result = await backfill_source_from_mounted_disk(
+        "dof",
+        limit=20,
+        data_root=tmp_path,
+        supabase_client=supabase_client,
+        storage_adapter=_FakeStorageAdapter(),
+        temporal_client=_FakeTemporalClient(),
+        bootstrap_missing_documents=False,
+        trigger_embedding=False,
+        concurrency=mounted_disk_backfill.BackfillConcurrency(status_batch_size=3),
+    )
+
+    update_queries = [query for query in supabase_client.queries if query._update_values is not None]
+
+    assert result.missing_local_file == 5
+    assert result.updated_rows == 5
+    assert [len(query._in_filters["id"]) for query in update_queries] == [3, 2]
+    assert {doc["embedding_status"] for doc in docs} == {"awaiting_source_file"}
+
+
+@pytest.mark.asyncio
+async def test_backfill_links_identical_files_to_one_storage_object(tmp_path):
+    docs = _pending_dof_docs(3)
+    (tmp_path / "dof").mkdir()
+    for doc in docs:
+        (tmp_path / "dof" / f"{doc['external_id']}.pdf").write_bytes(b"%PDF same bytes")
+    storage_adapter = _FakeStorageAdapter()
+
+    result = await backfill_source_from_mounted_disk(
+        "dof",
+        limit=10,
+        data_root=tmp_path,
+        supabase_client=_FakeSupabaseClient(docs),
+        storage_adapter=storage_adapter,
+        temporal_client=_FakeTemporalClient(),
+        bootstrap_missing_documents=False,
+    )
+
+    assert len(storage_adapter.upload_calls) == 1
+    assert result.uploaded == 1
+    assert result.reused_storage_object == 2
+    assert result.deduplicated_uploads == 2
+    assert result.bytes_saved == 2 * len(b"%PDF same bytes")
+    assert len({doc["storage_path"] for doc in docs}) == 1
+    assert len({doc["content_hash"] for doc in docs}) == 1
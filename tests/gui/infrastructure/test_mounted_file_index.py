@@ -0,0 +1,173 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.gui.infrastructure import mounted_file_index
+from src.gui.infrastructure.mounted_disk_backfill import resolve_local_source_file
+from src.gui.infrastructure.mounted_file_index import (
+    build_mounted_file_index,
+    clear_mounted_file_index_cache,
+    load_mounted_file_index,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_index_cache():
+    clear_mounted_file_index_cache()
+    yield
+    clear_mounted_file_index_cache()
+
+
+def _touch(path: Path, content: bytes = b"x") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+
+
+def _build_corpus(root: Path) -> None:
+    _touch(root / "books" / "7897" / "chapters" / "6_7897.pdf")
+    _touch(root / "books" / "7867" / "book.pdf")
+    _touch(root / "cas_pdfs" / "378-O.pdf")
+    _touch(root / "cas_pdfs" / "512-O2.pdf")
+    _touch(root / "cas_pdfs" / "378.pdf")
+    _touch(root / "cas" / "converted" / "A2-99" / "canonical.json", b"{}")
+    _touch(root / "dof" / "converted" / "5784621" / "output.txt")
+    _touch(root / "dof" / "5784622.docx")
+    _touch(root / "federal" / "converted" / "wo45" / "output.txt")
+    _touch(root / "estatal" / "17" / "doc" / "comp_63976.doc")
+    _touch(root / "internacional" / "pdf" / "tratado_9.pdf")
+    _touch(root / "tesis" / "converted" / "288180" / "output.txt")
+    _touch(root / "votos" / "pdf" / "300161.pdf")
+
+
+LOOKUPS = [
+    ("bjv", "book-7897-ch6", None),
+    ("bjv", "7867", None),
+    ("bjv", "7999", None),
+    ("cas", "c1", "CAS 1998/O/378 Celtic Football Club v. UEFA"),
+    ("cas", "c2", "CAS 2003/O/512 Example v. FIFA"),
+    ("cas", "c3", "CAS A2/99 AOC v. E. et al."),
+    ("cas", "c4", "CAS 2010/A/777 Missing v. Nobody"),
+    ("dof", "5784621", None),
+    ("dof", "5784622", None),
+    ("orden", "wo45", None),
+    ("orden", "comp_63976", None),
+    ("orden", "tratado_9", None),
+    ("orden", "missing", None),
+    ("scjn", "tesis-288180", None),
+    ("scjn", "votos-300161", None),
+    ("scjn", "votos-1", None),
+]
+
+
+@pytest.mark.parametrize("source, external_id, title", LOOKUPS)
+def test_indexed_resolution_matches_filesystem_probe(tmp_path, source, external_id, title):
+    _build_corpus(tmp_path)
+    index = build_mounted_file_index(tmp_path, source)
+
+    probed = resolve_local_source_file(source, external_id, title=title, data_root=tmp_path)
+    indexed = resolve_local_source_file(
+        source,
+        external_id,
+        title=title,
+        data_root=tmp_path,
+        file_index=index,
+    )
+
+    assert (indexed.path if indexed else None) == (probed.path if probed else None)
+
+
+def test_indexed_resolution_does_not_touch_the_filesystem(tmp_path, monkeypatch):
+    _build_corpus(tmp_path)
+    index = build_mounted_file_index(tmp_path, "orden")
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("filesystem probed")
+
+    monkeypatch.setattr(Path, "exists", _fail)
+    monkeypatch.setattr(Path, "glob", _fail)
+
+    match = resolve_local_source_file("orden", "comp_63976", data_root=tmp_path, file_index=index)
+
+    assert match is not None and match.path.name == "comp_63976.doc"
+
+
+def test_index_glob_matches_pathlib_glob(tmp_path):
+    _build_corpus(tmp_path)
+    _touch(tmp_path / "cas_pdfs" / "378-IA.pdf")
+    index = build_mounted_file_index(tmp_path, "cas")
+
+    for pattern in ("378-O*.pdf", "512-O*.pdf", "378*.pdf", "*.pdf", "9-O*.pdf"):
+        expected = sorted((tmp_path / "cas_pdfs").glob(pattern))
+        assert index.glob(tmp_path / "cas_pdfs", pattern) == expected
+
+
+def test_load_index_reuses_until_a_directory_changes(tmp_path):
+    _build_corpus(tmp_path)
+
+    first = load_mounted_file_index(tmp_path, "scjn")
+    second = load_mounted_file_index(tmp_path, "scjn")
+    _touch(tmp_path / "votos" / "pdf" / "300162.pdf")
+    third = load_mounted_file_index(tmp_path, "scjn")
+
+    assert second is first
+    assert third is not first
+    assert third.exists(tmp_path / "votos" / "pdf" / "300162.pdf")
+
+
+def test_persisted_index_survives_process_cache_and_invalidates_on_change(tmp_path, monkeypatch):
+    corpus = tmp_path / "corpus"
+    _build_corpus(corpus)
+    monkeypatch.setenv("SCRAPER_MOUNTED_INDEX_DIR", str(tmp_path / "indexes"))
+
+    load_mounted_file_index(corpus, "dof")
+    clear_mounted_file_index_cache()
+    scans = []
+    original_build = mounted_file_index.build_mounted_file_index
+    monkeypatch.setattr(
+        mounted_file_index,
+        "build_mounted_file_index",
+        lambda root, source: scans.append(source) or original_build(root, source),
+    )
+
+    reloaded = load_mounted_file_index(corpus, "dof")
+    assert scans == []
+    assert reloaded.exists(corpus / "dof" / "5784622.docx")
+
+    clear_mounted_file_index_cache()
+    _touch(corpus / "dof" / "converted" / "5784623" / "output.txt")
+    refreshed = load_mounted_file_index(corpus, "dof")
+
+    assert scans == ["dof"]
+    assert refreshed.exists(corpus / "dof" / "converted" / "5784623" / "output.txt")
+
+
+def test_concurrent_saves_use_separate_temp_files(tmp_path, monkeypatch):
+    corpus = tmp_path / "corpus"
+    _build_corpus(corpus)
+    index = build_mounted_file_index(corpus, "dof")
+    target = tmp_path / "indexes" / "dof.json"
+    replaced = []
+    both_writing = threading.Barrier(2, timeout=5)
+    original_replace = Path.replace
+
+    def _replace(self, dest):
+        # Hold both savers between write and replace, where a shared name tears.
+        replaced.append(self.name)
+        both_writing.wait()
+        return original_replace(self, dest)
+
+    monkeypatch.setattr(Path, "replace", _replace)
+
+    workers = [
+        threading.Thread(target=mounted_file_index._save_persisted_index, args=(target, index))
+        for _ in range(2)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert len(set(replaced)) == 2
+    assert list(target.parent.glob("*.tmp")) == []
+    assert mounted_file_index._load_persisted_index(target, corpus, "dof") is not None
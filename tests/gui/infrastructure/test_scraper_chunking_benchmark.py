@@ -0,0 +1,52 @@
+"""Output checks for the scraper embedding chunker on a large DOF-style text.
+
+Timings are compared by ``scripts/benchmark_scraper_chunking.py``.
+"""
+from types import SimpleNamespace
+
+import src.gui.infrastructure.scraper_document_workflow as workflow
+from scripts.benchmark_scraper_chunking import large_dof_text, legacy_split_long_text
+
+
+def test_split_long_text_matches_legacy_and_respects_limits():
+    text = large_dof_text()
+
+    legacy_pieces = legacy_split_long_text(text)
+    workflow._count_tokens_cached.cache_clear()
+    pieces = workflow._split_long_text(text)
+
+    assert abs(len(pieces) - len(legacy_pieces)) <= max(2, len(legacy_pieces) // 10)
+    assert " ".join(" ".join(pieces).split()) == " ".join(text.split())
+    for piece in pieces:
+        assert len(piece) <= workflow.CHUNK_MAX_CHARS
+        assert workflow._count_tokens(piece) <= workflow.CHUNK_MAX_TOKENS + 5
+
+
+def test_chunk_unstructured_elements_handles_large_document():
+    NarrativeText = type("NarrativeText", (), {"__str__": lambda self: self.text})
+    elements = []
+    for paragraph in large_dof_text().split("\n\n"):
+        element = NarrativeText()
+        element.text = paragraph
+        element.metadata = SimpleNamespace(page_number=1)
+        elements.append(element)
+
+    workflow._count_tokens_cached.cache_clear()
+    chunks = workflow._chunk_unstructured_elements(elements, "Decreto")
+
+    assert chunks
+    heading_context = len("Decreto\n\n")
+    for chunk in chunks:
+        assert len(chunk["text"]) <= workflow.CHUNK_MAX_CHARS + heading_context
+
+
+def test_only_short_texts_are_kept_in_the_token_count_cache():
+    workflow._count_tokens_cached.cache_clear()
+    paragraph = large_dof_text().split("\n\n")[0]
+    assert len(paragraph) >= workflow.TOKEN_COUNT_CACHE_MAX_CHARS
+
+    workflow._count_tokens(paragraph)
+    workflow._count_tokens(" importe")
+
+    assert workflow._count_tokens_cached.cache_info().currsize == 1
+    assert workflow._count_tokens(paragraph) == workflow._encode_token_count(paragraph)
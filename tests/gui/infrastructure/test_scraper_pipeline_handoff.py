@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import nullcontext
 from datetime import date
 import sys
@@ -6,6 +7,8 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from tests.utils.postgrest_filters import matches_or_filter, sort_rows
+
 if "temporalio" not in sys.modules:
     def _identity_decorator(obj=None, *args, **kwargs):
         if obj is not None:
@@ -52,6 +55,7 @@ import src.gui.infrastructure.scraper_document_workflow as scraper_document_work
 import src.gui.infrastructure.crawl4ai_activities as crawl4ai_activities
 from src.gui.infrastructure.crawl4ai_workflow import _resolve_embedding_document_ids
 from src.gui.infrastructure.crawl4ai_activities import persist_documents_to_supabase
+from src.gui.infrastructure.embedding_cache import chunk_text_hash
 from src.gui.infrastructure.scraper_document_workflow import (
     fetch_documents_for_embedding,
     generate_and_store_embeddings,
@@ -131,6 +135,8 @@ class _DocsQuery:
         self._limit = None
         self._range = None
         self._eq_filters = {}
+        self._or_filters = []
+        self._orders = []
         self._update_data = None
 
     def select(self, _columns):
@@ -147,7 +153,12 @@ class _DocsQuery:
         self._eq_filters[key] = value
         return self
 
-    def order(self, *_args, **_kwargs):
+    def or_(self, expression):
+        self._or_filters.append(expression)
+        return self
+
+    def order(self, column, desc=False):
+        self._orders.append((column, desc))
         return self
 
     def range(self, start, end):
@@ -168,10 +179,13 @@ class _DocsQuery:
             data = [doc for doc in data if doc["id"] in self._ids]
         for key, value in self._eq_filters.items():
             data = [doc for doc in data if doc.get(key) == value]
+        for expression in self._or_filters:
+            data = [doc for doc in data if matches_or_filter(doc, expression)]
         if self._update_data is not None:
             for doc in data:
                 doc.update(self._update_data)
             return SimpleNamespace(data=data)
+        data = sort_rows(data, self._orders)
         if self._range is not None:
             start, end = self._range
             data = data[start : end + 1]
@@ -191,7 +205,8 @@ class _ChunksTable:
         return self
 
     def in_(self, key, values):
-        assert key == "document_id"
+        assert key in {"document_id", "chunk_id", "metadata->>text_hash"}
+        self._in_key = key
         self._ids = list(values)
         return self
 
@@ -205,17 +220,26 @@ class _ChunksTable:
 
     def upsert(self, rows, on_conflict=None):
         self._rows = rows
+        self._on_conflict = on_conflict
         return self
 
     def execute(self):
         if hasattr(self, "_rows"):
             rows = self._rows if isinstance(self._rows, list) else [self._rows]
+            self._client.upsert_batches.append(list(rows))
+            if self._on_conflict:
+                incoming = {row.get(self._on_conflict) for row in rows}
+                self._client.chunk_rows = [
+                    row
+                    for row in self._client.chunk_rows
+                    if row.get(self._on_conflict) not in incoming
+                ]
             self._client.chunk_rows.extend(rows)
             return SimpleNamespace(data=self._rows)
 
         data = list(self._client.chunk_rows)
         if self._ids:
-            data = [row for row in data if row.get("document_id") in self._ids]
+            data = [row for row in data if _chunk_field(row, self._in_key) in self._ids]
         for key, value in self._eq_filters.items():
             data = [row for row in data if row.get(key) == value]
 
@@ -226,10 +250,17 @@ class _ChunksTable:
         return SimpleNamespace(data=data)
 
 
+def _chunk_field(row, key):
+    if key.startswith("metadata->>"):
+        return (row.get("metadata") or {}).get(key.removeprefix("metadata->>"))
+    return row.get(key)
+
+
 class _FetchClient:
     def __init__(self, docs, existing_ids):
         self._docs = docs
         self.requested_id_batches = []
+        self.upsert_batches = []
         self.chunk_rows = [
             {
                 "chunk_id": f"existing-{doc_id}",
@@ -534,6 +565,7 @@ async def test_fetch_documents_for_embedding_requeues_stale_processing_docs(monk
             "id": "doc-1",
             "title": "Stale",
             "external_id": "ext-1",
+            "created_at": "2026-04-12T03:00:00+00:00",
             "source_type": "dof",
             "storage_path": "legal-scraper-pdfs/dof/aa/ext-1.pdf",
             "embedding_status": "processing",
@@ -544,6 +576,7 @@ async def test_fetch_documents_for_embedding_requeues_stale_processing_docs(monk
             "id": "doc-2",
             "title": "Fresh",
             "external_id": "ext-2",
+            "created_at": "2026-04-12T02:00:00+00:00",
             "source_type": "dof",
             "storage_path": "legal-scraper-pdfs/dof/bb/ext-2.pdf",
             "embedding_status": "processing",
@@ -554,6 +587,7 @@ async def test_fetch_documents_for_embedding_requeues_stale_processing_docs(monk
             "id": "doc-3",
             "title": "Pending",
             "external_id": "ext-3",
+            "created_at": "2026-04-12T01:00:00+00:00",
             "source_type": "dof",
             "storage_path": "legal-scraper-pdfs/dof/cc/ext-3.pdf",
             "embedding_status": "pending",
@@ -1197,6 +1231,345 @@ async def test_generate_and_store_embeddings_uses_bjv_chunker(monkeypatch, tmp_p
     download_mock.assert_not_awaited()
 
 
+class _SlowEmbeddingSession(_FakeClientSession):
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def post(self, url, headers=None, json=None):
+        response = super().post(url, headers=headers, json=json)
+        session = self
+
+        class _SlowResponse:
+            status = 200
+
+            async def __aenter__(self_inner):
+                session.in_flight += 1
+                session.max_in_flight = max(session.max_in_flight, session.in_flight)
+                await asyncio.sleep(0.05)
+                return self_inner
+
+            async def __aexit__(self_inner, exc_type, exc, tb):
+                session.in_flight -= 1
+                return None
+
+            async def json(self_inner):
+                return await response.json()
+
+        return _SlowResponse()
+
+
+@pytest.mark.asyncio
+async def test_generate_and_store_embeddings_overlaps_documents_and_isolates_failures(monkeypatch):
+    docs = [
+        {
+            "id": f"doc-{index}",
+            "title": f"Doc {index}",
+            "external_id": f"ext-{index}",
+            "source_type": "dof",
+            "storage_path": f"legal-scraper-pdfs/dof/aa/ext-{index}.pdf",
+            "embedding_status": "pending",
+            "chunk_count": 0,
+        }
+        for index in range(1, 4)
+    ]
+    fake_client = _FetchClient(docs=docs, existing_ids=None)
+    session = _SlowEmbeddingSession()
+    monkeypatch.setenv("SUPABASE_URL", "http://example.test")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "secret")
+    monkeypatch.setenv("OPENROUTER_API_KEY", "router-secret")
+    monkeypatch.setenv("SCRAPER_EMBEDDING_DOCUMENT_CONCURRENCY", "1")
+    monkeypatch.setenv("SCRAPER_EMBEDDING_DOCUMENT_CONCURRENCY_DOF", "3")
+    monkeypatch.setitem(
+        sys.modules,
+        "supabase",
+        SimpleNamespace(create_client=lambda url, key: fake_client),
+    )
+    monkeypatch.setitem(
+        sys.modules,
+        "src.infrastructure.adapters.supabase_storage",
+        SimpleNamespace(
+            SupabaseStorageAdapter=lambda client, bucket_name: SimpleNamespace(
+                download=AsyncMock(return_value=b"%PDF-1.4 fake")
+            )
+        ),
+    )
+    monkeypatch.setitem(sys.modules, "aiohttp", SimpleNamespace(ClientSession=lambda: session))
+
+    def _fake_chunks(file_path, fallback_title):
+        if fallback_title == "Doc 2":
+            raise RuntimeError("partition failed")
+        return [{"text": f"{fallback_title} body", "title": fallback_title, "metadata": {}}]
+
+    monkeypatch.setattr(scraper_document_workflow, "_extract_document_chunks", _fake_chunks)
+
+    result = await generate_and_store_embeddings(
+        [{key: doc[key] for key in ("id", "title", "external_id", "storage_path")} for doc in docs],
+        "dof",
+    )
+
+    assert result["concurrency"] == 3
+    assert session.max_in_flight > 1
+    assert result["stored_documents"] == 2
+    assert result["stored_count"] == 2
+    assert result["error_count"] == 1
+    assert result["errors"] == ["doc-2: partition failed"]
+    assert result["documents_per_minute"] > 0
+    assert result["chunks_per_minute"] > 0
+    assert [doc["embedding_status"] for doc in fake_client._docs] == [
+        "completed",
+        "failed",
+        "completed",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_generate_and_store_embeddings_reuses_vectors_for_unchanged_chunks(
+    monkeypatch, tmp_path
+):
+    fake_client = _FetchClient(
+        docs=[
+            {
+                "id": "doc-1",
+                "title": "Doc One",
+                "external_id": "ext-1",
+                "source_type": "dof",
+                "storage_path": "legal-scraper-pdfs/dof/aa/ext-1.pdf",
+                "embedding_status": "pending",
+                "chunk_count": 1,
+            }
+        ],
+        existing_ids=None,
+    )
+    stored_vector = [7.0] * scraper_document_workflow.EMBEDDING_VECTOR_SIZE
+    fake_client.chunk_rows.extend(
+        [
+            {
+                "chunk_id": "dof-doc-1-0",
+                "document_id": "doc-1",
+                "source_type": "dof",
+                "chunk_index": 0,
+                "text": "Unchanged   chunk text",
+                "embedding": str(stored_vector),
+                "metadata": {"text_hash": chunk_text_hash("Unchanged chunk text")},
+            },
+            {
+                # Wrong dimension: must be re-embedded, not reused or cached.
+                "chunk_id": "dof-doc-1-1",
+                "document_id": "doc-1",
+                "source_type": "dof",
+                "chunk_index": 1,
+                "text": "New chunk text",
+                "embedding": "[7.0,7.0,7.0,7.0]",
+                "metadata": {"text_hash": chunk_text_hash("New chunk text")},
+            },
+        ]
+    )
+    session = _FakeClientSession()
+    monkeypatch.setenv("SUPABASE_URL", "http://example.test")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "secret")
+    monkeypatch.setenv("OPENROUTER_API_KEY", "router-secret")
+    monkeypatch.setenv("SCRAPER_EMBEDDING_CACHE_PATH", str(tmp_path / "embeddings.sqlite"))
+    monkeypatch.setitem(
+        sys.modules,
+        "supabase",
+        SimpleNamespace(create_client=lambda url, key: fake_client),
+    )
+    monkeypatch.setitem(
+        sys.modules,
+        "src.infrastructure.adapters.supabase_storage",
+        SimpleNamespace(
+            SupabaseStorageAdapter=lambda client, bucket_name: SimpleNamespace(
+                download=AsyncMock(return_value=b"%PDF-1.4 fake")
+            )
+        ),
+    )
+    monkeypatch.setitem(sys.modules, "aiohttp", SimpleNamespace(ClientSession=lambda: session))
+    monkeypatch.setattr(
+        scraper_document_workflow,
+        "_extract_document_chunks",
+        lambda file_path, fallback_title: [
+            {"text": "Unchanged chunk text", "title": "I", "metadata": {}},
+            {"text": "New chunk text", "title": "II", "metadata": {}},
+        ],
+    )
+    docs = [
+        {
+            "id": "doc-1",
+            "title": "Doc One",
+            "external_id": "ext-1",
+            "storage_path": "legal-scraper-pdfs/dof/aa/ext-1.pdf",
+        }
+    ]
+
+    first = await generate_and_store_embeddings(docs, "dof")
+
+    assert [payload["input"] for payload in session.payloads] == [["New chunk text"]]
+    assert first["embedding_cache_hits"] == 1
+    assert first["embedding_cache_misses"] == 1
+    assert first["embedding_cache_hit_rate"] == 0.5
+    rows = {row["chunk_id"]: row for row in fake_client.chunk_rows}
+    assert rows["dof-doc-1-0"]["embedding"] == stored_vector
+    assert rows["dof-doc-1-1"]["embedding"] == [1.0, 0.0, 0.0, 0.0]
+    assert rows["dof-doc-1-1"]["metadata"]["text_hash"]
+
+    # A second pass with stored-row reuse disabled is served from the local cache.
+    monkeypatch.setenv("SCRAPER_EMBEDDING_REUSE_STORED", "false")
+    fake_client.chunk_rows.clear()
+    second = await generate_and_store_embeddings(docs, "dof")
+
+    assert len(session.payloads) == 1
+    assert second["embedding_cache_hits"] == 2
+    assert second["embedding_cache_misses"] == 0
+    assert second["embedding_cache_hit_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_generate_and_store_embeddings_writes_only_changed_chunk_rows(monkeypatch, tmp_path):
+    fake_client = _FetchClient(
+        docs=[
+            {
+                "id": "doc-1",
+                "title": "Doc One",
+                "external_id": "ext-1",
+                "source_type": "dof",
+                "storage_path": "legal-scraper-pdfs/dof/aa/ext-1.pdf",
+                "embedding_status": "pending",
+                "chunk_count": 0,
+            }
+        ],
+        existing_ids=None,
+    )
+    monkeypatch.setenv("SUPABASE_URL", "http://example.test")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "secret")
+    monkeypatch.setenv("OPENROUTER_API_KEY", "router-secret")
+    monkeypatch.setenv("SCRAPER_EMBEDDING_CACHE_PATH", str(tmp_path / "embeddings.sqlite"))
+    monkeypatch.setenv("SCRAPER_CHUNK_UPSERT_PAGE_BYTES", "1")
+    monkeypatch.setitem(
+        sys.modules,
+        "supabase",
+        SimpleNamespace(create_client=lambda url, key: fake_client),
+    )
+    monkeypatch.setitem(
+        sys.modules,
+        "src.infrastructure.adapters.supabase_storage",
+        SimpleNamespace(
+            SupabaseStorageAdapter=lambda client, bucket_name: SimpleNamespace(
+                download=AsyncMock(return_value=b"%PDF-1.4 fake")
+            )
+        ),
+    )
+    monkeypatch.setitem(
+        sys.modules,
+        "aiohttp",
+        SimpleNamespace(ClientSession=lambda: _FakeClientSession()),
+    )
+    chunk_texts = ["First chunk", "Second chunk", "Third chunk"]
+    monkeypatch.setattr(
+        scraper_document_workflow,
+        "_extract_document_chunks",
+        lambda file_path, fallback_title: [
+            {"text": text, "title": "Section", "metadata": {}} for text in chunk_texts
+        ],
+    )
+    docs = [
+        {
+            "id": "doc-1",
+            "title": "Doc One",
+            "external_id": "ext-1",
+            "storage_path": "legal-scraper-pdfs/dof/aa/ext-1.pdf",
+        }
+    ]
+
+    first = await generate_and_store_embeddings(docs, "dof")
+
+    assert first["chunk_rows_written"] == 3
+    assert len(fake_client.upsert_batches) == 3
+
+    fake_client.upsert_batches.clear()
+    chunk_texts[:] = ["First chunk", "Second chunk, amended"]
+    second = await generate_and_store_embeddings(docs, "dof")
+
+    assert second["chunk_rows_written"] == 1
+    assert second["chunk_rows_unchanged"] == 1
+    assert second["chunk_rows_deleted"] == 1
+    assert [row["chunk_id"] for batch in fake_client.upsert_batches for row in batch] == [
+        "dof-doc-1-1"
+    ]
+    assert sorted(row["chunk_id"] for row in fake_client.chunk_rows) == [
+        "dof-doc-1-0",
+        "dof-doc-1-1",
+    ]
+    assert fake_client._docs[0]["chunk_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_generate_and_store_embeddings_repairs_rows_with_invalid_vectors(monkeypatch):
+    fake_client = _FetchClient(
+        docs=[
+            {
+                "id": "doc-1",
+                "title": "Doc One",
+                "external_id": "ext-1",
+                "source_type": "dof",
+                "storage_path": "legal-scraper-pdfs/dof/aa/ext-1.pdf",
+                "embedding_status": "pending",
+                "chunk_count": 0,
+            }
+        ],
+        existing_ids=None,
+    )
+    monkeypatch.setenv("SUPABASE_URL", "http://example.test")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "secret")
+    monkeypatch.setenv("OPENROUTER_API_KEY", "router-secret")
+    monkeypatch.setitem(
+        sys.modules,
+        "supabase",
+        SimpleNamespace(create_client=lambda url, key: fake_client),
+    )
+    monkeypatch.setitem(
+        sys.modules,
+        "src.infrastructure.adapters.supabase_storage",
+        SimpleNamespace(
+            SupabaseStorageAdapter=lambda client, bucket_name: SimpleNamespace(
+                download=AsyncMock(return_value=b"%PDF-1.4 fake")
+            )
+        ),
+    )
+    session = _FakeClientSession()
+    monkeypatch.setitem(sys.modules, "aiohttp", SimpleNamespace(ClientSession=lambda: session))
+    monkeypatch.setattr(
+        scraper_document_workflow,
+        "_extract_document_chunks",
+        lambda file_path, fallback_title: [
+            {"text": "First chunk", "title": "Section", "metadata": {}},
+            {"text": "Second chunk", "title": "Section", "metadata": {}},
+        ],
+    )
+    docs = [
+        {
+            "id": "doc-1",
+            "title": "Doc One",
+            "external_id": "ext-1",
+            "storage_path": "legal-scraper-pdfs/dof/aa/ext-1.pdf",
+        }
+    ]
+    await generate_and_store_embeddings(docs, "dof")
+
+    # Same text and metadata, so the row hash still matches; only the vector is bad.
+    rows = {row["chunk_id"]: row for row in fake_client.chunk_rows}
+    rows["dof-doc-1-0"]["embedding"] = None
+    fake_client.upsert_batches.clear()
+    second = await generate_and_store_embeddings(docs, "dof")
+
+    written = {row["chunk_id"] for batch in fake_client.upsert_batches for row in batch}
+    assert "dof-doc-1-0" in written
+    assert second["chunk_rows_written"] == len(written)
+    rows = {row["chunk_id"]: row for row in fake_client.chunk_rows}
+    assert rows["dof-doc-1-0"]["embedding"] is not None
+
+
 class _FakeHttpResponse:
     def __init__(self, body=b"", status=200, text=""):
         self._body = body
@@ -1484,3 +1857,232 @@ async def test_extract_cas_documents_uses_year_range_and_download_urls(monkeypat
     ]
     assert result["documents"][0]["pdf_url"].endswith("CAS-2023-A-1234.pdf")
     assert calls == [(None, 2023), (None, 2024)]
+
+
+def _fake_cas_case(year, suffix="1234"):
+    return SimpleNamespace(
+        numero_caso=SimpleNamespace(valor=f"CAS {year}/A/{suffix}"),
+        titulo=f"Case {year}",
+        fecha=SimpleNamespace(valor=date(year, 1, 1)),
+        categoria_deporte=SimpleNamespace(value="football"),
+        tipo_procedimiento=SimpleNamespace(value="appeal"),
+        partes="Club A v. Club B",
+        resumen="Doping dispute",
+        url=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_extract_cas_documents_fans_out_years_and_merges_in_order(monkeypatch, tmp_path):
+    in_flight = 0
+    peak = 0
+
+    class _FakeCASParser:
+        async def search(self, sport=None, year=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Earlier years finish last; the merge must still follow year order.
+            await asyncio.sleep(0.01 * (2026 - year))
+            in_flight -= 1
+            return [_fake_cas_case(year), _fake_cas_case(2020, "dup")], False
+
+    monkeypatch.setenv("SCRAPER_CAS_QUERY_CONCURRENCY", "3")
+    monkeypatch.setitem(
+        sys.modules,
+        "src.infrastructure.adapters.cas_llm_parser",
+        SimpleNamespace(CASLLMParser=lambda: _FakeCASParser()),
+    )
+
+    result = await crawl4ai_activities.extract_cas_documents(
+        max_results=10,
+        year_from=2021,
+        year_to=2025,
+        output_directory=str(tmp_path / "cas_data"),
+    )
+
+    assert result["success"] is True
+    assert peak == 3
+    assert [doc["external_id"] for doc in result["documents"]] == [
+        "CAS 2021/A/1234",
+        "CAS 2020/A/dup",
+        "CAS 2022/A/1234",
+        "CAS 2023/A/1234",
+        "CAS 2024/A/1234",
+        "CAS 2025/A/1234",
+    ]
+    assert [timing["year"] for timing in result["query_timings"]] == [2021, 2022, 2023, 2024, 2025]
+    assert all(timing["elapsed_seconds"] >= 0 for timing in result["query_timings"])
+
+
+@pytest.mark.asyncio
+async def test_extract_cas_documents_stops_fan_out_at_max_results(monkeypatch, tmp_path):
+    calls = []
+
+    class _FakeCASParser:
+        async def search(self, sport=None, year=None):
+            calls.append((sport, year))
+            await asyncio.sleep(0)
+            return [_fake_cas_case(year)], False
+
+    monkeypatch.setenv("SCRAPER_CAS_QUERY_CONCURRENCY", "2")
+    monkeypatch.setitem(
+        sys.modules,
+        "src.infrastructure.adapters.cas_llm_parser",
+        SimpleNamespace(CASLLMParser=lambda: _FakeCASParser()),
+    )
+
+    result = await crawl4ai_activities.extract_cas_documents(
+        max_results=2,
+        sport="Football, Athletics",
+        year_from=2000,
+        year_to=2010,
+        output_directory=str(tmp_path / "cas_data"),
+    )
+
+    assert result["document_count"] == 2
+    assert calls[:2] == [("Football", 2000), ("Athletics", 2000)]
+    assert len(calls) < 22
+
+
+class _FakeDofResponse:
+    def __init__(self, status, html="", headers=None):
+        self.status = status
+        self._html = html
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def text(self, encoding=None):
+        return self._html
+
+
+class _FakeDofSession:
+    def __init__(self, responder):
+        self._responder = responder
+        self.requests = []
+        self.in_flight = 0
+        self.peak = 0
+
+    def get(self, url, ssl=None, timeout=None, headers=None):
+        self.requests.append((url, dict(headers or {})))
+        session = self
+
+        class _Pending:
+            async def __aenter__(self_inner):
+                session.in_flight += 1
+                session.peak = max(session.peak, session.in_flight)
+                await asyncio.sleep(0.01)
+                session.in_flight -= 1
+                return session._responder(url, headers or {})
+
+            async def __aexit__(self_inner, *exc_info):
+                return False
+
+        return _Pending()
+
+
+def _dof_stats():
+    return {"fetched": 0, "revalidated": 0, "reused": 0}
+
+
+@pytest.mark.asyncio
+async def test_fetch_dof_day_revalidates_cached_day_with_etag(tmp_path):
+    from src.gui.infrastructure.dof_index_cache import DofIndexCache
+
+    cache = DofIndexCache(tmp_path, settled_after_days=100000)
+    parsed = []
+
+    def _parse(html):
+        parsed.append(html)
+        return [{"title": "Decreto", "url": "https://dof.gob.mx/nota_detalle.php?codigo=77"}]
+
+    def _responder(url, headers):
+        if headers.get("If-None-Match") == '"v1"':
+            return _FakeDofResponse(304)
+        return _FakeDofResponse(200, "<html></html>", {"ETag": '"v1"'})
+
+    session = _FakeDofSession(_responder)
+    stats = _dof_stats()
+    slots = asyncio.Semaphore(2)
+
+    first, first_error = await crawl4ai_activities._fetch_dof_day_items(
+        session, date(2024, 3, 1), _parse, cache, slots, stats
+    )
+    second, second_error = await crawl4ai_activities._fetch_dof_day_items(
+        session, date(2024, 3, 1), _parse, cache, slots, stats
+    )
+
+    assert first_error is None and second_error is None
+    assert first == second
+    assert len(parsed) == 1
+    assert session.requests[1][1] == {"If-None-Match": '"v1"'}
+    assert stats == {"fetched": 1, "revalidated": 1, "reused": 0}
+
+
+@pytest.mark.asyncio
+async def test_fetch_dof_day_reuses_settled_day_without_request(tmp_path):
+    from src.gui.infrastructure.dof_index_cache import CachedDofDay, DofIndexCache
+
+    cache = DofIndexCache(tmp_path, settled_after_days=7)
+    cache.store(CachedDofDay(
+        day="2020-01-02",
+        items=[{"title": "Acuerdo", "url": "https://dof.gob.mx/nota_detalle.php?codigo=5"}],
+        fetched_at="2020-02-01T00:00:00+00:00",
+    ))
+    session = _FakeDofSession(lambda url, headers: _FakeDofResponse(500))
+    stats = _dof_stats()
+
+    items, error = await crawl4ai_activities._fetch_dof_day_items(
+        session, date(2020, 1, 2), lambda html: [], cache, asyncio.Semaphore(1), stats
+    )
+
+    assert error is None
+    assert items[0]["title"] == "Acuerdo"
+    assert session.requests == []
+    assert stats["reused"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_dof_day_refetches_old_day_that_parsed_empty(tmp_path):
+    from src.gui.infrastructure.dof_index_cache import CachedDofDay, DofIndexCache
+
+    cache = DofIndexCache(tmp_path, settled_after_days=7)
+    cache.store(CachedDofDay(day="2020-01-02", items=[], fetched_at="2020-02-01T00:00:00+00:00"))
+    session = _FakeDofSession(lambda url, headers: _FakeDofResponse(200, "<html></html>"))
+    stats = _dof_stats()
+
+    items, error = await crawl4ai_activities._fetch_dof_day_items(
+        session, date(2020, 1, 2), lambda html: [{"title": "Acuerdo"}], cache, asyncio.Semaphore(1), stats
+    )
+
+    assert error is None
+    assert items == [{"title": "Acuerdo"}]
+    assert len(session.requests) == 1
+    assert stats["fetched"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_dof_days_are_bounded_and_report_http_errors():
+    def _responder(url, headers):
+        if "day=03" in url:
+            return _FakeDofResponse(503)
+        return _FakeDofResponse(200, "<html></html>")
+
+    session = _FakeDofSession(_responder)
+    stats = _dof_stats()
+    slots = asyncio.Semaphore(2)
+    days = [date(2024, 3, day) for day in range(1, 7)]
+
+    results = await asyncio.gather(*(
+        crawl4ai_activities._fetch_dof_day_items(session, day, lambda html: [], None, slots, stats)
+        for day in days
+    ))
+
+    assert session.peak == 2
+    assert [error for _items, error in results if error] == ["DOF 2024-03-03: HTTP 503"]
+    assert stats["fetched"] == 5
@@ -0,0 +1,114 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.gui.infrastructure.storage_dedup import StorageHashIndex
+
+
+class _HashQuery:
+    def __init__(self, rows):
+        self._rows = rows
+        self._filters = {}
+        self._limit = None
+
+    def select(self, _columns):
+        return self
+
+    def eq(self, key, value):
+        self._filters[key] = value
+        return self
+
+    @property
+    def not_(self):
+        return self
+
+    def is_(self, key, value):
+        self._filters.setdefault("_not_null", []).append(key)
+        return self
+
+    def limit(self, value):
+        self._limit = value
+        return self
+
+    def execute(self):
+        data = [
+            row
+            for row in self._rows
+            if all(row.get(key) == value for key, value in self._filters.items() if key != "_not_null")
+            and all(row.get(key) is not None for key in self._filters.get("_not_null", []))
+        ]
+        return SimpleNamespace(data=data[: self._limit])
+
+
+class _HashClient:
+    def __init__(self, rows):
+        self.rows = rows
+        self.lookups = 0
+
+    def table(self, name):
+        assert name == "scraper_documents"
+        self.lookups += 1
+        return _HashQuery(self.rows)
+
+
+class _ExistsAdapter:
+    def __init__(self, existing):
+        self.existing = set(existing)
+
+    async def exists(self, path):
+        return path in self.existing
+
+
+@pytest.mark.asyncio
+async def test_concurrent_uploads_of_same_content_upload_once():
+    index = StorageHashIndex()
+    uploads = []
+
+    async def _upload(path):
+        uploads.append(path)
+        await asyncio.sleep(0.01)
+        return path
+
+    results = await asyncio.gather(
+        index.upload_or_link("abc", 100, lambda: _upload("dof/aa/1.pdf")),
+        index.upload_or_link("abc", 100, lambda: _upload("dof/bb/2.pdf")),
+        index.upload_or_link("def", 50, lambda: _upload("dof/cc/3.pdf")),
+    )
+
+    assert uploads == ["dof/aa/1.pdf", "dof/cc/3.pdf"]
+    assert results == [("dof/aa/1.pdf", False), ("dof/aa/1.pdf", True), ("dof/cc/3.pdf", False)]
+    assert index.deduplicated == 1
+    assert index.bytes_saved == 100
+
+
+@pytest.mark.asyncio
+async def test_remote_hit_links_to_existing_object():
+    client = _HashClient(
+        [
+            {"content_hash": "abc", "storage_path": "mounted://dof/1.doc"},
+            {"content_hash": "abc", "storage_path": "dof/gone/1.pdf"},
+            {"content_hash": "abc", "storage_path": "dof/aa/1.pdf"},
+        ]
+    )
+    index = StorageHashIndex(client, _ExistsAdapter({"dof/aa/1.pdf"}))
+
+    async def _upload():
+        raise AssertionError("should not upload")
+
+    assert await index.upload_or_link("abc", 2048, _upload) == ("dof/aa/1.pdf", True)
+    assert await index.lookup("abc") == "dof/aa/1.pdf"
+    assert client.lookups == 1
+    assert index.bytes_saved == 2048
+
+
+@pytest.mark.asyncio
+async def test_remote_miss_uploads_and_records():
+    index = StorageHashIndex(_HashClient([]), _ExistsAdapter(set()))
+
+    async def _upload():
+        return "scjn/ab/doc.pdf"
+
+    assert await index.upload_or_link("abc", 10, _upload) == ("scjn/ab/doc.pdf", False)
+    assert await index.lookup("abc") == "scjn/ab/doc.pdf"
+    assert index.deduplicated == 0
@@ -0,0 +1,151 @@
+import threading
+from types import SimpleNamespace
+
+from src.gui.infrastructure.supabase_pagination import (
+    INCOMPLETE_EMBEDDING_FILTER,
+    iter_keyset_pages,
+    iter_keyset_rows,
+    keyset_cursor_filter,
+)
+from tests.utils.postgrest_filters import matches_or_filter, sort_rows
+
+
+class _Query:
+    def __init__(self, table):
+        self._table = table
+        self._eq = {}
+        self._is_null = []
+        self._or = []
+        self._orders = []
+        self._limit = None
+
+    def eq(self, key, value):
+        self._eq[key] = value
+        return self
+
+    def is_(self, key, value):
+        assert value == "null"
+        self._is_null.append(key)
+        return self
+
+    def or_(self, expression):
+        self._or.append(expression)
+        return self
+
+    def order(self, column, desc=False):
+        self._orders.append((column, desc))
+        return self
+
+    def limit(self, value):
+        self._limit = value
+        return self
+
+    def execute(self):
+        with self._table.lock:
+            rows = [dict(row) for row in self._table.rows]
+            self._table.executed += 1
+        rows = [row for row in rows if all(row.get(k) == v for k, v in self._eq.items())]
+        rows = [row for row in rows if all(row.get(k) is None for k in self._is_null)]
+        for expression in self._or:
+            rows = [row for row in rows if matches_or_filter(row, expression)]
+        rows = sort_rows(rows, self._orders)
+        return SimpleNamespace(data=rows[: self._limit])
+
+
+class _Table:
+    def __init__(self, rows):
+        self.rows = rows
+        self.lock = threading.Lock()
+        self.executed = 0
+
+    def query(self):
+        return _Query(self)
+
+
+def _rows(count):
+    return [
+        {
+            "id": f"doc-{index:03d}",
+            # Pairs share a timestamp so the id tiebreaker is exercised.
+            "created_at": f"2026-04-{1 + index // 2:02d}T00:00:00+00:00",
+            "storage_path": None,
+        }
+        for index in range(count)
+    ]
+
+
+def test_keyset_scan_visits_every_row_once_while_rows_leave_the_filter():
+    table = _Table(_rows(25))
+
+    seen = []
+    for row in iter_keyset_rows(
+        lambda: table.query().is_("storage_path", "null"),
+        page_size=4,
+    ):
+        seen.append(row["id"])
+        with table.lock:
+            for stored in table.rows:
+                if stored["id"] == row["id"]:
+                    stored["storage_path"] = f"bucket/{row['id']}.pdf"
+
+    assert sorted(seen) == sorted(row["id"] for row in _rows(25))
+    assert len(seen) == len(set(seen))
+    assert seen[0] == "doc-024"
+
+
+def test_keyset_scan_includes_rows_without_order_value():
+    rows = _rows(5)
+    rows[1]["created_at"] = None
+    rows[3]["created_at"] = None
+    table = _Table(rows)
+
+    seen = [row["id"] for row in iter_keyset_rows(table.query, page_size=2)]
+
+    assert seen[:2] == ["doc-003", "doc-001"]
+    assert sorted(seen) == sorted(row["id"] for row in rows)
+
+
+def test_keyset_scan_prefetches_next_page_while_caller_processes():
+    table = _Table(_rows(9))
+    pages = iter_keyset_pages(table.query, page_size=3)
+
+    first = next(pages)
+    for _ in range(200):
+        if table.executed >= 2:
+            break
+        threading.Event().wait(0.01)
+
+    assert len(first) == 3
+    assert table.executed == 2
+    assert [len(page) for page in pages] == [3, 3]
+    # The last full page triggers one empty lookahead query.
+    assert table.executed == 4
+
+
+def test_keyset_cursor_filter_quotes_values_and_handles_ascending_nulls():
+    expression = keyset_cursor_filter(
+        {"id": "doc-1", "created_at": "2026-04-01T00:00:00+00:00"},
+        descending=False,
+    )
+
+    assert expression == (
+        'created_at.gt."2026-04-01T00:00:00+00:00",'
+        'and(created_at.eq."2026-04-01T00:00:00+00:00",id.gt."doc-1"),'
+        "created_at.is.null"
+    )
+
+
+def test_incomplete_embedding_filter_matches_documents_needing_indexing():
+    docs = [
+        {"embedding_status": "completed", "chunk_count": 4},
+        {"embedding_status": "completed", "chunk_count": 0},
+        {"embedding_status": "pending", "chunk_count": 4},
+        {"embedding_status": None, "chunk_count": None},
+    ]
+
+    assert [matches_or_filter(doc, INCOMPLETE_EMBEDDING_FILTER) for doc in docs] == [
+        False,
+        True,
+        True,
+        True,
+    ]
@@ -0,0 +1,125 @@
+import asyncio
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from src.gui.infrastructure.temporal_client import TemporalClientPool
+
+
+class _Unavailable(Exception):
+    status = SimpleNamespace(name="UNAVAILABLE")
+
+
+class _FakeHandle:
+    def __init__(self, client, workflow_id):
+        self._client = client
+        self._workflow_id = workflow_id
+
+    async def describe(self):
+        self._client.describe_calls += 1
+        return SimpleNamespace(workflow_id=self._workflow_id, status=SimpleNamespace(name="RUNNING"))
+
+
+class _FakeClient:
+    def __init__(self):
+        self.describe_calls = 0
+
+    def get_workflow_handle(self, workflow_id):
+        return _FakeHandle(self, workflow_id)
+
+
+@pytest.fixture
+def connects(monkeypatch):
+    calls = []
+
+    async def _connect(address, namespace="default"):
+        calls.append((address, namespace))
+        await asyncio.sleep(0)
+        return _FakeClient()
+
+    monkeypatch.setitem(
+        sys.modules,
+        "temporalio.client",
+        SimpleNamespace(Client=SimpleNamespace(connect=_connect)),
+    )
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_pool_connects_once_per_address(connects):
+    pool = TemporalClientPool()
+
+    clients = await asyncio.gather(*(pool.get("temporal:7233", "default") for _ in range(5)))
+
+    assert connects == [("temporal:7233", "default")]
+    assert all(client is clients[0] for client in clients)
+
+
+@pytest.mark.asyncio
+async def test_pool_reconnects_after_connection_error(connects):
+    pool = TemporalClientPool()
+    seen = []
+
+    async def _operation(client):
+        seen.append(client)
+        if len(seen) == 1:
+            raise _Unavailable("connection refused")
+        return "started"
+
+    assert await pool.call("temporal:7233", "default", _operation) == "started"
+    assert len(connects) == 2
+    assert seen[0] is not seen[1]
+
+
+@pytest.mark.asyncio
+async def test_pool_does_not_retry_other_errors(connects):
+    pool = TemporalClientPool()
+
+    async def _operation(client):
+        raise ValueError("workflow already started")
+
+    with pytest.raises(ValueError):
+        await pool.call("temporal:7233", "default", _operation)
+    assert len(connects) == 1
+
+
+@pytest.mark.asyncio
+async def test_start_retry_that_finds_workflow_started_succeeds(connects):
+    pool = TemporalClientPool()
+    attempts = []
+
+    async def _start(client):
+        attempts.append(client)
+        if len(attempts) == 1:
+            raise _Unavailable("reply lost after the server accepted the start")
+        raise RuntimeError("Workflow execution already started")
+
+    handle = await pool.start_workflow("temporal:7233", "default", "wf-1", _start)
+
+    assert len(attempts) == 2
+    assert handle._workflow_id == "wf-1"
+
+
+@pytest.mark.asyncio
+async def test_start_already_started_on_first_attempt_still_raises(connects):
+    pool = TemporalClientPool()
+
+    async def _start(client):
+        raise RuntimeError("Workflow execution already started")
+
+    with pytest.raises(RuntimeError):
+        await pool.start_workflow("temporal:7233", "default", "wf-1", _start)
+
+
+@pytest.mark.asyncio
+async def test_describe_is_cached_within_ttl(connects):
+    pool = TemporalClientPool(describe_ttl_seconds=60)
+
+    first = await pool.describe("temporal:7233", "default", "wf-1")
+    second = await pool.describe("temporal:7233", "default", "wf-1")
+    await pool.describe("temporal:7233", "default", "wf-2")
+
+    client = await pool.get("temporal:7233", "default")
+    assert first is second
+    assert client.describe_calls == 2
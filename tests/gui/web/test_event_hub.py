@@ -0,0 +1,128 @@
+"""
+Tests for the per-source job event hub behind /api/events.
+"""
+import json
+
+import pytest
+
+from src.gui.web.event_hub import SourceEventHub, format_sse
+
+
+class TestPublishState:
+    def test_only_changed_fields_are_published(self):
+        hub = SourceEventHub()
+
+        first = hub.publish_state("scjn", "progress", {"downloaded_count": 1, "pending_count": 9})
+        second = hub.publish_state("scjn", "progress", {"downloaded_count": 2, "pending_count": 9})
+
+        assert first["data"] == {"downloaded_count": 1, "pending_count": 9}
+        assert second["data"] == {"downloaded_count": 2}
+
+    def test_unchanged_update_publishes_nothing(self):
+        hub = SourceEventHub()
+        hub.publish_state("bjv", "status", {"status": "running"})
+
+        assert hub.publish_state("bjv", "status", {"status": "running"}) is None
+        assert hub.last_seq == 1
+
+    def test_reset_state_republishes_in_full(self):
+        hub = SourceEventHub()
+        hub.publish_state("dof", "status", {"status": "running", "job_id": "a"})
+        hub.reset_state("dof")
+
+        event = hub.publish_state("dof", "status", {"status": "running", "job_id": "a"})
+
+        assert event["data"] == {"status": "running", "job_id": "a"}
+
+    def test_snapshot_merges_deltas(self):
+        hub = SourceEventHub()
+        hub.publish_state("scjn", "status", {"status": "running", "job_id": "j1"})
+        hub.publish_state("scjn", "status", {"status": "completed"})
+
+        assert hub.snapshot("scjn") == {
+            "status": {"status": "completed", "job_id": "j1"},
+            "progress": {},
+        }
+
+
+class TestSubscribe:
+    @pytest.mark.asyncio
+    async def test_live_events_are_filtered_by_source(self):
+        hub = SourceEventHub()
+        subscription = hub.subscribe(["scjn"])
+
+        hub.publish_log("bjv", {"message": "other"})
+        hub.publish_log("scjn", {"message": "mine"})
+
+        event = subscription.queue.get_nowait()
+        assert event["source"] == "scjn"
+        assert subscription.queue.empty()
+
+    def test_replays_events_after_cursor(self):
+        hub = SourceEventHub()
+        for index in range(5):
+            hub.publish_log("scjn", {"message": str(index)})
+
+        subscription = hub.subscribe(["scjn"], since=3)
+
+        assert [event["seq"] for event in subscription.backlog] == [4, 5]
+
+    def test_cursor_older_than_buffer_gets_resync(self):
+        hub = SourceEventHub(replay_size=2)
+        hub.publish_state("scjn", "status", {"status": "running"})
+        for index in range(4):
+            hub.publish_log("scjn", {"message": str(index)})
+
+        subscription = hub.subscribe(["scjn"], since=1)
+
+        assert len(subscription.backlog) == 1
+        resync = subscription.backlog[0]
+        assert resync["kind"] == "resync"
+        assert resync["data"]["status"] == {"status": "running"}
+
+    def test_cursor_ahead_of_hub_gets_resync(self):
+        hub = SourceEventHub()
+        hub.publish_state("scjn", "status", {"status": "idle"})
+
+        subscription = hub.subscribe(["scjn"], since=500)
+
+        assert [event["kind"] for event in subscription.backlog] == ["resync"]
+        assert subscription.backlog[0]["data"]["status"] == {"status": "idle"}
+
+    def test_full_queue_ends_stream_after_queued_events(self):
+        hub = SourceEventHub(subscriber_queue_size=2)
+        subscription = hub.subscribe()
+
+        for index in range(4):
+            hub.publish_log("scjn", {"message": str(index)})
+
+        assert subscription.overflowed
+        assert subscription.dropped == 1
+        assert not subscription.finished
+        assert [subscription.queue.get_nowait()["seq"] for _ in range(2)] == [1, 2]
+        assert subscription.finished
+
+        resumed = hub.subscribe(since=2)
+        assert [event["seq"] for event in resumed.backlog] == [3, 4]
+
+    def test_unsubscribe_stops_delivery(self):
+        hub = SourceEventHub()
+        subscription = hub.subscribe()
+        hub.unsubscribe(subscription)
+
+        hub.publish_log("scjn", {"message": "late"})
+
+        assert subscription.queue.empty()
+
+
+def test_format_sse_frame():
+    hub = SourceEventHub()
+    event = hub.publish_log("scjn", {"message": "hola"})
+
+    frame = format_sse(event)
+
+    lines = frame.split("\n")
+    assert lines[0] == "id: 1"
+    assert lines[1] == "event: log"
+    assert json.loads(lines[2][len("data: "):])["data"] == {"message": "hola"}
+    assert frame.endswith("\n\n")
@@ -0,0 +1,112 @@
+"""
+Tests for the per-source event stream and incremental log endpoints.
+"""
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.gui.web.api import create_app
+
+
+def _log(message: str) -> dict:
+    return {
+        "level": "info",
+        "message": message,
+        "source": "DOF",
+        "timestamp": "2026-01-01T00:00:00",
+    }
+
+
+def _events(response) -> list[dict]:
+    return [
+        json.loads(line[len("data:"):])
+        for line in response.text.splitlines()
+        if line.startswith("data:")
+    ]
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setenv("SCRAPER_AUTH_DISABLED", "true")
+    app = create_app(service=AsyncMock(is_running=True, state_actor=AsyncMock()))
+    hub = app.state.api.events
+    subscribe = hub.subscribe
+
+    def _finite_subscribe(*args, **kwargs):
+        # End each stream after its opening frames so responses complete.
+        subscription = subscribe(*args, **kwargs)
+        subscription.overflowed = True
+        return subscription
+
+    monkeypatch.setattr(hub, "subscribe", _finite_subscribe)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return TestClient(app)
+
+
+def test_stream_opens_with_snapshot(app, client):
+    app.state.api._publish_job_status("dof", status="running", job_id="job-1")
+
+    response = client.get("/api/events/dof")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response)
+    assert [event["kind"] for event in events] == ["snapshot"]
+    assert events[0]["data"]["status"] == {"status": "running", "job_id": "job-1"}
+
+
+def test_last_event_id_resumes_after_cursor(app, client):
+    api = app.state.api
+    first = api.events.publish_state("dof", "status", {"status": "running"})
+    api.events.publish_state("scjn", "status", {"status": "running"})
+    api._append_log("dof", _log("page 1"))
+    api.events.publish_state("dof", "progress", {"downloaded_count": 3})
+
+    response = client.get("/api/events/dof", headers={"Last-Event-ID": str(first["seq"])})
+
+    events = _events(response)
+    assert [event["kind"] for event in events] == ["log", "progress"]
+    assert all(event["source"] == "dof" and event["seq"] > first["seq"] for event in events)
+    assert f"id: {events[-1]['seq']}" in response.text
+
+
+def test_unknown_source_is_404(client):
+    response = client.get("/api/events/nope")
+
+    assert response.status_code == 404
+
+
+def test_log_seq_follows_event_seq(app):
+    api = app.state.api
+    api.events.publish_state("scjn", "status", {"status": "running"})
+
+    api._append_log("dof", _log("first"))
+    api.events.publish_state("scjn", "progress", {"downloaded_count": 1})
+    api._append_log("dof", _log("second"))
+
+    stored = api.logs["dof"].recent()
+    assert [entry["seq"] for entry in stored] == [2, 4]
+    assert stored[-1]["seq"] == api.events.last_seq
+
+
+def test_logs_since_returns_only_newer_lines_and_next_since(app, client):
+    api = app.state.api
+    for index in range(3):
+        api._append_log("dof", _log(f"line {index}"))
+    first_seq = api.logs["dof"].recent()[0]["seq"]
+
+    page = client.get("/api/dof/logs", params={"since": first_seq}).json()
+
+    assert [entry["message"] for entry in page["logs"]] == ["line 1", "line 2"]
+    assert page["next_since"] == api.logs["dof"].last_seq
+
+    empty = client.get("/api/dof/logs", params={"since": page["next_since"]}).json()
+
+    assert empty["logs"] == []
+    assert empty["next_since"] == page["next_since"]
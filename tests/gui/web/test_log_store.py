@@ -0,0 +1,121 @@
+"""
+Tests for the bounded per-source log store behind /api/<source>/logs.
+"""
+import gzip
+import json
+import os
+import threading
+
+import pytest
+
+from src.gui.web.log_store import LogRingBuffer, SourceLogStore
+
+
+def _entry(index: int, level: str = "info") -> dict:
+    return {
+        "level": level,
+        "message": f"line {index}",
+        "source": "SCJN",
+        "timestamp": "2026-01-01T00:00:00",
+    }
+
+
+class TestLogRingBuffer:
+    def test_capacity_bounds_memory(self):
+        buffer = LogRingBuffer("scjn", capacity=3)
+        for index in range(10):
+            buffer.append(_entry(index))
+
+        assert len(buffer) == 3
+        assert [entry["seq"] for entry in buffer.recent()] == [8, 9, 10]
+
+    def test_seq_is_monotonic_with_external_ids(self):
+        buffer = LogRingBuffer("scjn", capacity=10)
+
+        first = buffer.append(_entry(0), seq=5)
+        second = buffer.append(_entry(1), seq=3)
+        third = buffer.append(_entry(2), seq=9)
+
+        assert [first["seq"], second["seq"], third["seq"]] == [5, 6, 9]
+
+    def test_since_returns_only_newer_entries_oldest_first(self):
+        buffer = LogRingBuffer("scjn", capacity=10)
+        for index in range(6):
+            buffer.append(_entry(index))
+
+        assert [entry["seq"] for entry in buffer.recent(since=2, limit=2)] == [3, 4]
+        assert buffer.recent(since=6) == []
+
+    def test_level_filter_applies_before_limit(self):
+        buffer = LogRingBuffer("scjn", capacity=10)
+        buffer.append(_entry(0, "error"))
+        for index in range(1, 5):
+            buffer.append(_entry(index))
+
+        assert [entry["seq"] for entry in buffer.recent(limit=2, level="error")] == [1]
+
+    @pytest.mark.asyncio
+    async def test_evicted_entries_are_served_from_spill(self, tmp_path):
+        buffer = LogRingBuffer("scjn", capacity=3, spill_dir=tmp_path, spill_batch_size=2)
+        for index in range(8):
+            buffer.append(_entry(index))
+        await buffer.flush()
+
+        with gzip.open(buffer.spill_path, "rt", encoding="utf-8") as handle:
+            spilled = [json.loads(line)["seq"] for line in handle]
+        assert spilled == [1, 2, 3, 4, 5]
+
+        entries = await buffer.read(since=0, limit=100)
+
+        assert [entry["seq"] for entry in entries] == list(range(1, 9))
+
+    def test_spill_file_name_includes_pid(self, tmp_path):
+        buffer = LogRingBuffer("scjn", capacity=1, spill_dir=tmp_path)
+
+        assert buffer.spill_path.name.endswith(f"-{os.getpid()}.jsonl.gz")
+
+    @pytest.mark.asyncio
+    async def test_spill_runs_off_the_event_loop(self, tmp_path, monkeypatch):
+        buffer = LogRingBuffer("scjn", capacity=2, spill_dir=tmp_path, spill_batch_size=2)
+        loop_thread = threading.get_ident()
+        writer_threads = []
+        write_spill = buffer._write_spill
+
+        def _recording_write(pending):
+            writer_threads.append(threading.get_ident())
+            write_spill(pending)
+
+        monkeypatch.setattr(buffer, "_write_spill", _recording_write)
+        for index in range(6):
+            buffer.append(_entry(index))
+
+        # Evicted lines are readable while their write is still in flight.
+        entries = await buffer.read(since=0, limit=100)
+        await buffer.flush()
+
+        assert [entry["seq"] for entry in entries] == list(range(1, 7))
+        assert writer_threads and loop_thread not in writer_threads
+        with gzip.open(buffer.spill_path, "rt", encoding="utf-8") as handle:
+            assert [json.loads(line)["seq"] for line in handle] == [1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_read_without_spill_starts_at_buffer(self):
+        buffer = LogRingBuffer("scjn", capacity=2)
+        for index in range(5):
+            buffer.append(_entry(index))
+
+        entries = await buffer.read(since=0)
+
+        assert [entry["seq"] for entry in entries] == [4, 5]
+
+
+@pytest.mark.asyncio
+async def test_store_flushes_every_source(tmp_path):
+    store = SourceLogStore(("scjn", "bjv"), capacity=1, spill_dir=tmp_path)
+    store["scjn"].append(_entry(0))
+    store["scjn"].append(_entry(1))
+
+    await store.flush()
+
+    assert store["scjn"].spill_path.exists()
+    assert not store["bjv"].spill_path.exists()
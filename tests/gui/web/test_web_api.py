@@ -3,13 +3,23 @@ RED Phase Tests: Web API Endpoints
 
 Tests for the FastAPI web server that provides REST API for the GUI.
 """
+import asyncio
+from types import SimpleNamespace
+
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from httpx import ASGITransport, AsyncClient
 
-from src.gui.web.api import create_app, ScraperAPI
+from src.gui.web.api import (
+    TERMINAL_JOB_STATES,
+    WORKFLOW_WATCH_MAX_FAILURES,
+    ScraperAPI,
+    ScraperArgs,
+    create_app,
+)
+from src.scjn_main import create_pipeline, stop_pipeline
 from src.gui.domain.entities import (
     ScraperJob,
     JobStatus,
@@ -308,3 +318,79 @@ class TestScraperAPIClass:
 
         await api.shutdown()
         assert api.service.is_running is False
+
+    @pytest.mark.asyncio
+    async def test_default_args_build_the_scjn_pipeline(self, tmp_path):
+        """create_pipeline should accept the ScraperArgs the API starts it with."""
+        args = ScraperArgs(
+            output_dir=str(tmp_path / "data"),
+            checkpoint_dir=str(tmp_path / "checkpoints"),
+        )
+
+        coordinator = await create_pipeline(args)
+        try:
+            assert coordinator._scraper_actor is not None
+            assert coordinator.mailbox_stats()["capacity"] == args.mailbox_size
+        finally:
+            await stop_pipeline(coordinator)
+
+
+class _FakeTemporalPool:
+    """Temporal pool stub answering ``describe`` with scripted statuses."""
+
+    def __init__(self, statuses):
+        self._statuses = list(statuses)
+        self.describe_calls = 0
+
+    async def describe(self, address, namespace, workflow_id):
+        self.describe_calls += 1
+        status = self._statuses[min(self.describe_calls, len(self._statuses)) - 1]
+        if isinstance(status, Exception):
+            raise status
+        return SimpleNamespace(status=SimpleNamespace(name=status))
+
+    async def get(self, address, namespace):
+        handle = MagicMock(result=AsyncMock(return_value={"document_count": 2}))
+        return MagicMock(get_workflow_handle=MagicMock(return_value=handle))
+
+
+class TestSourceWorkflowWatcher:
+    """The watcher that streams web-started workflow status."""
+
+    pytestmark = pytest.mark.asyncio
+
+    @pytest.fixture(autouse=True)
+    def fast_polling(self, monkeypatch):
+        monkeypatch.setattr("src.gui.web.api.WORKFLOW_WATCH_INTERVAL_SECONDS", 0.001)
+        monkeypatch.setattr("src.gui.web.api.WORKFLOW_WATCH_MAX_BACKOFF_SECONDS", 0.01)
+
+    def _api(self, pool):
+        api = ScraperAPI(service=StubService())
+        api._temporal_pool = pool
+        api._source_workflows["dof"] = "dof-crawl4ai-web-1"
+        return api
+
+    @pytest.mark.parametrize("raw_status", ["TIMED_OUT", "CONTINUED_AS_NEW", "PAUSED"])
+    async def test_every_non_running_status_ends_the_watch(self, raw_status):
+        pool = _FakeTemporalPool(["RUNNING", raw_status])
+        api = self._api(pool)
+
+        await asyncio.wait_for(api._watch_source_workflows(), timeout=2)
+
+        assert pool.describe_calls == 2
+        assert api.events.snapshot("dof")["status"]["status"] in TERMINAL_JOB_STATES
+
+    async def test_timed_out_workflow_is_reported_as_failed(self):
+        api = self._api(_FakeTemporalPool(["TIMED_OUT"]))
+
+        status = await api.get_source_workflow_status("dof")
+
+        assert status["status"] == "failed"
+
+    async def test_watch_gives_up_after_repeated_query_failures(self):
+        pool = _FakeTemporalPool([ConnectionError("temporal unavailable")])
+        api = self._api(pool)
+
+        await asyncio.wait_for(api._watch_source_workflows(), timeout=2)
+
+        assert pool.describe_calls == WORKFLOW_WATCH_MAX_FAILURES
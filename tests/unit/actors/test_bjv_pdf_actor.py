@@ -155,6 +155,7 @@ class TestBJVPDFActorDownload:
         mock_coordinator.tell = AsyncMock()
         mock_rate_limiter = Mock()
         mock_rate_limiter.acquire = AsyncMock()
+        mock_rate_limiter.report = AsyncMock()
 
         with tempfile.TemporaryDirectory() as tmpdir:
             actor = BJVPDFActor(
@@ -201,6 +202,7 @@ class TestBJVPDFActorDownload:
         mock_coordinator.tell = AsyncMock()
         mock_rate_limiter = Mock()
         mock_rate_limiter.acquire = AsyncMock()
+        mock_rate_limiter.report = AsyncMock()
 
         actor = BJVPDFActor(
             coordinator=mock_coordinator,
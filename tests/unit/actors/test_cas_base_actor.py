@@ -238,6 +238,104 @@ class TestCASBaseActorMessageHandling:
         await actor.receive(UnknownMessage())
         await actor.stop()
 
+    @pytest.mark.asyncio
+    async def test_handler_resolved_once_per_message_type(self):
+        """Handler lookup is cached in the class dispatch table."""
+        from src.infrastructure.actors.cas_base_actor import CASBaseActor
+        from src.infrastructure.actors.cas_messages import ObtenerEstadoCAS
+
+        class TestActor(CASBaseActor):
+            async def handle_obtener_estado_cas(self, msg):
+                return "ok"
+
+        actor = TestActor()
+        with patch.object(TestActor, "_handler_name_for", wraps=TestActor._handler_name_for) as names:
+            assert await actor.receive(ObtenerEstadoCAS()) == "ok"
+            assert await TestActor().receive(ObtenerEstadoCAS()) == "ok"
+
+        assert names.call_count == 1
+        assert ObtenerEstadoCAS in TestActor._dispatch_table
+        assert TestActor._dispatch_table is not CASBaseActor._dispatch_table
+
+    def test_handler_name_handles_acronyms(self):
+        """Message class names map to snake_case handler names."""
+        from src.infrastructure.actors.cas_base_actor import CASBaseActor
+        from src.infrastructure.actors.cas_messages import IniciarDescubrimientoCAS
+
+        assert CASBaseActor()._get_handler_name(IniciarDescubrimientoCAS()) == (
+            "handle_iniciar_descubrimiento_cas"
+        )
+
+
+class TestCASBaseActorMailboxLoop:
+    """Tests for the event-driven mailbox loop."""
+
+    @pytest.mark.asyncio
+    async def test_idle_actor_stops_on_sentinel(self):
+        """An idle actor stops without waiting for a polling timeout."""
+        import asyncio
+        from src.infrastructure.actors.cas_base_actor import CASBaseActor
+
+        actor = CASBaseActor()
+        await actor.start()
+        task = actor._task
+
+        await asyncio.wait_for(actor.stop(), timeout=0.5)
+
+        assert task.done() and not task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_handler_after_grace(self):
+        """A handler still running after the grace period is cancelled."""
+        import asyncio
+        from src.infrastructure.actors.cas_base_actor import CASBaseActor
+        from src.infrastructure.actors.cas_messages import ObtenerEstadoCAS
+
+        class SlowActor(CASBaseActor):
+            STOP_GRACE_SECONDS = 0.05
+
+            async def handle_obtener_estado_cas(self, msg):
+                await asyncio.sleep(10)
+
+        actor = SlowActor()
+        await actor.start()
+        task = actor._task
+        await actor.tell(ObtenerEstadoCAS())
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(actor.stop(), timeout=1)
+
+        assert task.cancelled()
+        assert actor.mailbox_stats()["control_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_actor_restarts_after_cancelled_stop(self):
+        """A sentinel left by a cancelled loop does not stop the next one."""
+        import asyncio
+        from src.infrastructure.actors.cas_base_actor import CASBaseActor
+        from src.infrastructure.actors.cas_messages import EstadoPipelineCAS, ObtenerEstadoCAS
+
+        class SlowActor(CASBaseActor):
+            STOP_GRACE_SECONDS = 0.05
+            slow = True
+
+            async def handle_obtener_estado_cas(self, msg):
+                if self.slow:
+                    await asyncio.sleep(10)
+                return self._estado
+
+        actor = SlowActor()
+        await actor.start()
+        await actor.tell(ObtenerEstadoCAS())
+        await asyncio.sleep(0)
+        await actor.stop()
+
+        actor.slow = False
+        await actor.start()
+
+        assert await actor.ask(ObtenerEstadoCAS(), timeout=1) == EstadoPipelineCAS.INICIANDO
+        await actor.stop()
+
 
 class TestCASBaseActorState:
     """Tests for CASBaseActor state management."""
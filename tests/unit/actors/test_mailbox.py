@@ -0,0 +1,72 @@
+"""
+Tests for the bounded two-lane actor mailbox.
+"""
+import asyncio
+
+import pytest
+
+from src.infrastructure.actors.mailbox import Mailbox, OverflowPolicy
+
+
+class TestMailbox:
+    @pytest.mark.asyncio
+    async def test_block_policy_waits_for_room_and_records_wait(self):
+        mailbox = Mailbox(capacity=1)
+        await mailbox.put("a")
+        blocked = asyncio.create_task(mailbox.put("b"))
+        await asyncio.sleep(0.02)
+
+        assert not blocked.done()
+        assert await mailbox.get() == "a"
+        assert await asyncio.wait_for(blocked, timeout=1) is True
+
+        stats = mailbox.stats()
+        assert stats.blocked_puts == 1
+        assert stats.enqueue_wait_seconds > 0
+        assert stats.depth == 1
+        assert stats.high_water == 1
+
+    @pytest.mark.asyncio
+    async def test_drop_policy_discards_tells_but_not_asks(self):
+        mailbox = Mailbox(capacity=1, policy=OverflowPolicy.DROP)
+        await mailbox.put("a")
+
+        assert await mailbox.put("b") is False
+        blocked = asyncio.create_task(mailbox.put("ask", droppable=False))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+        await mailbox.get()
+        await asyncio.wait_for(blocked, timeout=1)
+
+        assert mailbox.stats().dropped == 1
+        assert await mailbox.get() == "ask"
+
+    @pytest.mark.asyncio
+    async def test_control_lane_bypasses_capacity_and_is_read_first(self):
+        mailbox = Mailbox(capacity=1)
+        await mailbox.put("work")
+        mailbox.put_control("stop")
+
+        assert mailbox.stats().control_depth == 1
+        assert await mailbox.get() == "stop"
+        assert await mailbox.get() == "work"
+
+    @pytest.mark.asyncio
+    async def test_closed_work_lane_waits_until_notified(self):
+        mailbox = Mailbox()
+        accepting = False
+        await mailbox.put("work")
+        getter = asyncio.create_task(mailbox.get(lambda: accepting))
+        await asyncio.sleep(0.01)
+        assert not getter.done()
+
+        accepting = True
+        mailbox.notify()
+
+        assert await asyncio.wait_for(getter, timeout=1) == "work"
+
+    def test_unbounded_mailbox_is_never_full(self):
+        mailbox = Mailbox()
+        assert mailbox.capacity == 0
+        assert not mailbox.full()
+        assert mailbox.stats().to_dict()["policy"] == "block"
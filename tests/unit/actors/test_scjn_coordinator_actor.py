@@ -22,7 +22,9 @@ from src.infrastructure.actors.messages import (
     DocumentoDescargado,
     PaginaDescubierta,
     PDFProcesado,
+    ProcesarPDF,
     EmbeddingsGenerados,
+    GuardarDocumento,
     DocumentoGuardado,
     GuardarCheckpoint,
     CheckpointGuardado,
@@ -493,3 +495,138 @@ class TestSCJNCoordinatorActorConcurrency:
         assert coordinator._max_concurrent_downloads == 2
 
         await coordinator.stop()
+
+
+class TestSCJNCoordinatorActorBackpressure:
+    """Tests for mailbox-driven backpressure."""
+
+    @staticmethod
+    def _discovered(i):
+        return DocumentoDescubierto(q_param=f"q{i}", title=f"Doc {i}", category="LEY")
+
+    @staticmethod
+    def _downloaded(i):
+        return DocumentoDescargado(document_id=f"doc-{i}", q_param=f"q{i}")
+
+    @pytest.mark.asyncio
+    async def test_discovery_waits_on_full_mailbox(self, rate_limiter):
+        """Discoveries beyond the free slots wait in the bounded mailbox."""
+        scraper = MockScraperActor()
+        coordinator = SCJNCoordinatorActor(
+            discovery_actor=MockDiscoveryActor(),
+            scraper_actor=scraper,
+            persistence_actor=MockPersistenceActor(),
+            checkpoint_actor=MockCheckpointActor(),
+            rate_limiter=rate_limiter,
+            max_concurrent_downloads=1,
+            mailbox_size=2,
+        )
+        await coordinator.start()
+
+        for i in range(3):
+            await coordinator.tell(self._discovered(i))
+            await asyncio.sleep(0.01)
+        blocked = asyncio.create_task(coordinator.tell(self._discovered(3)))
+        await asyncio.sleep(0.01)
+
+        assert len(scraper.received) == 1
+        assert not blocked.done()
+        state = await coordinator.ask(ObtenerEstado())
+        assert state["pending_count"] == 2
+        assert state["mailboxes"]["coordinator"]["blocked_puts"] == 1
+
+        await coordinator.tell(self._downloaded(0))
+        await asyncio.wait_for(blocked, timeout=1)
+        await asyncio.sleep(0.01)
+
+        assert [cmd.q_param for cmd in scraper.received] == ["q0", "q1"]
+        state = await coordinator.ask(ObtenerEstado())
+        assert state["mailboxes"]["coordinator"]["enqueue_wait_seconds"] > 0
+
+        await coordinator.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_download_frees_slot(self, rate_limiter):
+        """An ErrorDeActor for a download lets the next one start."""
+        scraper = MockScraperActor()
+        coordinator = SCJNCoordinatorActor(
+            discovery_actor=MockDiscoveryActor(),
+            scraper_actor=scraper,
+            persistence_actor=MockPersistenceActor(),
+            checkpoint_actor=MockCheckpointActor(),
+            rate_limiter=rate_limiter,
+            max_concurrent_downloads=1,
+        )
+        await coordinator.start()
+
+        await coordinator.tell(self._discovered(0))
+        await coordinator.tell(self._discovered(1))
+        await asyncio.sleep(0.01)
+        await coordinator.tell(ErrorDeActor(
+            actor_name="SCJNScraperActor",
+            error_type="PermanentScraperError",
+            error_message="Not found",
+            recoverable=False,
+            original_command=scraper.received[0],
+        ))
+        await asyncio.sleep(0.01)
+
+        assert [cmd.q_param for cmd in scraper.received] == ["q0", "q1"]
+
+        await coordinator.stop()
+
+    @pytest.mark.asyncio
+    async def test_pause_holds_discoveries_in_mailbox(self, rate_limiter):
+        """Paused pipelines leave discoveries queued until resumed."""
+        scraper = MockScraperActor()
+        coordinator = SCJNCoordinatorActor(
+            discovery_actor=MockDiscoveryActor(),
+            scraper_actor=scraper,
+            persistence_actor=MockPersistenceActor(),
+            checkpoint_actor=MockCheckpointActor(),
+            rate_limiter=rate_limiter,
+        )
+        await coordinator.start()
+
+        await coordinator.ask(PausarPipeline())
+        await coordinator.tell(self._discovered(0))
+        await asyncio.sleep(0.01)
+        assert scraper.received == []
+
+        result = await coordinator.ask(ReanudarPipeline())
+        await asyncio.sleep(0.01)
+
+        assert result["state"] == PipelineState.DOWNLOADING
+        assert [cmd.q_param for cmd in scraper.received] == ["q0"]
+
+        await coordinator.stop()
+
+    @pytest.mark.asyncio
+    async def test_payloads_are_forwarded_from_the_bounded_lane(self, rate_limiter):
+        """PDFs and documents are work, forwarded to their actors."""
+        persistence = MockPersistenceActor()
+        processor = MockScraperActor()
+        coordinator = SCJNCoordinatorActor(
+            discovery_actor=MockDiscoveryActor(),
+            scraper_actor=MockScraperActor(),
+            persistence_actor=persistence,
+            checkpoint_actor=MockCheckpointActor(),
+            rate_limiter=rate_limiter,
+            pdf_processor_actor=processor,
+        )
+        await coordinator.start()
+        pdf = ProcesarPDF(document_id="doc-1", pdf_bytes=b"%PDF-1.4")
+        save = GuardarDocumento(document=None)
+
+        assert not isinstance(pdf, coordinator.CONTROL_MESSAGES)
+        assert not isinstance(save, coordinator.CONTROL_MESSAGES)
+        await coordinator.tell(pdf)
+        await coordinator.tell(save)
+        await asyncio.sleep(0.01)
+
+        assert processor.received == [pdf]
+        assert persistence.received == [save]
+        state = await coordinator.ask(ObtenerEstado())
+        assert state["mailboxes"]["coordinator"]["enqueued"] == 2
+
+        await coordinator.stop()
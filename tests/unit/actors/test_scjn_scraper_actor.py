@@ -22,6 +22,7 @@ from src.infrastructure.actors.messages import (
     GuardarDocumento,
     ErrorDeActor,
 )
+from src.infrastructure.actors.base import BaseActor
 from src.infrastructure.actors.rate_limiter import NoOpRateLimiter
 from tests.utils.actor_test_helpers import MockCoordinator
 
@@ -230,6 +231,49 @@ class TestSCJNScraperActorDownload:
         await mock_coordinator.stop()
 
 
+class TestSCJNScraperActorConcurrency:
+    """Worker-pool download tests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_downloads_overlap(
+        self, mock_coordinator, instant_rate_limiter, sample_document_html
+    ):
+        """N slow downloads with N workers take about one download's time."""
+        actor = SCJNScraperActor(
+            coordinator=mock_coordinator,
+            rate_limiter=instant_rate_limiter,
+            concurrency=4,
+        )
+        await actor.start()
+        await mock_coordinator.start()
+
+        async def slow_fetch(url):
+            await asyncio.sleep(0.2)
+            return sample_document_html
+
+        loop = asyncio.get_running_loop()
+        with patch.object(actor, '_fetch_html', side_effect=slow_fetch), \
+                patch('src.infrastructure.actors.scjn_scraper_actor.parse_document_detail'), \
+                patch.object(actor, '_build_document', return_value=MagicMock(id="doc")):
+            started = loop.time()
+            results = await asyncio.gather(*(
+                actor.ask(DescargarDocumento(
+                    q_param=f"doc{i}==",
+                    include_pdf=False,
+                    include_reforms=False,
+                ))
+                for i in range(4)
+            ))
+            elapsed = loop.time() - started
+
+        assert all(isinstance(r, DocumentoDescargado) for r in results)
+        # Serial processing would take 0.8s
+        assert elapsed < 0.6
+
+        await actor.stop()
+        await mock_coordinator.stop()
+
+
 class TestSCJNScraperActorPDF:
     """PDF download tests."""
 
@@ -332,6 +376,53 @@ class TestSCJNScraperActorPDF:
         await mock_coordinator.stop()
 
 
+class TestSCJNScraperActorPDFBackpressure:
+    """PDFs go straight into the processor's bounded mailbox."""
+
+    class SlowProcessor(BaseActor):
+        def __init__(self, release: asyncio.Event):
+            super().__init__(mailbox_size=1)
+            self.release = release
+            self.processed = []
+
+        async def handle_message(self, message):
+            await self.release.wait()
+            self.processed.append(message.source_url)
+
+    @pytest.mark.asyncio
+    async def test_slow_pdf_processor_makes_tell_wait(
+        self, mock_coordinator, instant_rate_limiter, sample_pdf_bytes
+    ):
+        """A full processor mailbox holds the scraper back."""
+        release = asyncio.Event()
+        processor = self.SlowProcessor(release)
+        await processor.start()
+        actor = SCJNScraperActor(
+            coordinator=mock_coordinator,
+            rate_limiter=instant_rate_limiter,
+            pdf_processor=processor,
+        )
+
+        with patch.object(actor, '_fetch_pdf', new_callable=AsyncMock) as mock_pdf:
+            mock_pdf.return_value = sample_pdf_bytes
+            await actor._download_pdf("ref1", "doc-1", "corr-1")
+            await asyncio.sleep(0.01)  # processor picks it up and stalls
+            await actor._download_pdf("ref2", "doc-1", "corr-1")
+            blocked = asyncio.create_task(actor._download_pdf("ref3", "doc-1", "corr-1"))
+            await asyncio.sleep(0.01)
+
+            assert not blocked.done()
+            assert processor.mailbox_stats()["blocked_puts"] == 1
+
+            release.set()
+            await asyncio.wait_for(blocked, timeout=1)
+        await asyncio.sleep(0.01)
+
+        assert len(processor.processed) == 3
+        assert not any(isinstance(m, ProcesarPDF) for m in mock_coordinator.received)
+        await processor.stop()
+
+
 class TestSCJNScraperActorRateLimit:
     """Rate limiting tests."""
 
@@ -0,0 +1,292 @@
+"""
+Tests for the worker-level browser pool shared by the scraper adapters.
+"""
+import asyncio
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.infrastructure.adapters import browser_pool
+from src.infrastructure.adapters.browser_pool import BrowserPool
+
+
+class _FakePage:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeContext:
+    def __init__(self, options):
+        self.options = options
+        self.route_handler = None
+        self._page_handlers = []
+        self.pages = []
+
+    async def route(self, pattern, handler):
+        self.route_handler = handler
+
+    def on(self, event, handler):
+        if event == "page":
+            self._page_handlers.append(handler)
+
+    async def new_page(self):
+        page = _FakePage()
+        self.pages.append(page)
+        for handler in self._page_handlers:
+            handler(page)
+        return page
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    async def new_context(self, **options):
+        context = _FakeContext(options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeChromium:
+    def __init__(self):
+        self.launched = []
+
+    async def launch(self, **kwargs):
+        browser = _FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+
+def _pool(**kwargs) -> tuple[BrowserPool, _FakeChromium]:
+    pool = BrowserPool(**kwargs)
+    chromium = _FakeChromium()
+    pool._playwright = SimpleNamespace(chromium=chromium)
+    return pool, chromium
+
+
+class _FakeRoute:
+    def __init__(self, resource_type):
+        self.request = SimpleNamespace(resource_type=resource_type)
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "abort"
+
+    async def continue_(self):
+        self.outcome = "continue"
+
+
+class TestPages:
+    @pytest.mark.asyncio
+    async def test_sequential_leases_reuse_browser_and_context(self):
+        pool, chromium = _pool(size=2)
+
+        async with pool.page("cas") as first:
+            pass
+        async with pool.page("cas") as second:
+            pass
+
+        assert len(chromium.launched) == 1
+        assert len(chromium.launched[0].contexts) == 1
+        assert first.closed and second.closed
+
+    @pytest.mark.asyncio
+    async def test_sources_get_separate_contexts(self):
+        pool, chromium = _pool(size=2)
+
+        async with pool.page("cas"):
+            pass
+        async with pool.page("scjn", user_agent="test"):
+            pass
+
+        contexts = chromium.launched[0].contexts
+        assert len(contexts) == 2
+        assert contexts[1].options == {"user_agent": "test"}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_leases_launch_up_to_pool_size(self):
+        pool, chromium = _pool(size=2)
+
+        async with pool.page("cas"):
+            async with pool.page("cas"):
+                async with pool.page("cas"):
+                    pass
+
+        assert len(chromium.launched) == 2
+
+    @pytest.mark.asyncio
+    async def test_browser_is_recycled_after_max_pages(self):
+        pool, chromium = _pool(size=1, max_pages_per_browser=2)
+
+        for _ in range(3):
+            async with pool.page("cas"):
+                pass
+
+        assert len(chromium.launched) == 2
+        assert chromium.launched[0].closed
+        assert not chromium.launched[1].closed
+
+    @pytest.mark.asyncio
+    async def test_blocked_resources_are_aborted(self):
+        pool, chromium = _pool(blocked_resource_types=frozenset({"image", "font"}))
+
+        async with pool.page("cas"):
+            pass
+
+        handler = chromium.launched[0].contexts[0].route_handler
+        image, document = _FakeRoute("image"), _FakeRoute("document")
+        await handler(image)
+        await handler(document)
+        assert image.outcome == "abort"
+        assert document.outcome == "continue"
+
+    @pytest.mark.asyncio
+    async def test_no_route_when_nothing_is_blocked(self):
+        pool, chromium = _pool(blocked_resource_types=frozenset())
+
+        async with pool.page("cas"):
+            pass
+
+        assert chromium.launched[0].contexts[0].route_handler is None
+
+    @pytest.mark.asyncio
+    async def test_close_closes_browsers(self):
+        pool, chromium = _pool()
+        pool._playwright = SimpleNamespace(chromium=chromium, stop=_async_noop)
+
+        async with pool.page("cas"):
+            pass
+        await pool.close()
+
+        assert chromium.launched[0].closed
+
+
+async def _async_noop():
+    return None
+
+
+class _FakeCrawler:
+    instances = []
+
+    def __init__(self, config=None):
+        self.config = config
+        self.started = False
+        self.closed = False
+        _FakeCrawler.instances.append(self)
+
+    async def start(self):
+        self.started = True
+
+    async def close(self):
+        self.closed = True
+
+
+class TestCrawlers:
+    @pytest.fixture(autouse=True)
+    def fake_crawl4ai(self, monkeypatch):
+        _FakeCrawler.instances = []
+        monkeypatch.setitem(
+            sys.modules,
+            "crawl4ai",
+            SimpleNamespace(
+                AsyncWebCrawler=_FakeCrawler,
+                BrowserConfig=lambda **kwargs: kwargs,
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_crawler_is_started_once_and_reused(self):
+        pool = BrowserPool(max_pages_per_browser=10)
+
+        async with pool.crawler() as first:
+            pass
+        async with pool.crawler() as second:
+            pass
+
+        assert first is second
+        assert first.started and not first.closed
+        assert "--blink-settings=imagesEnabled=false" in first.config["extra_args"]
+
+    @pytest.mark.asyncio
+    async def test_crawler_is_recycled_after_max_pages(self):
+        pool = BrowserPool(max_pages_per_browser=2)
+
+        for _ in range(3):
+            async with pool.crawler():
+                pass
+
+        assert len(_FakeCrawler.instances) == 2
+        assert _FakeCrawler.instances[0].closed
+        assert not _FakeCrawler.instances[1].closed
+
+
+@pytest.mark.asyncio
+async def test_cas_browser_adapter_leases_pooled_context():
+    from src.infrastructure.adapters.cas_browser_adapter import CASBrowserAdapter
+
+    pool, chromium = _pool()
+    adapter = CASBrowserAdapter(pool=pool)
+
+    await adapter.start()
+    assert adapter.is_started
+    await adapter.stop()
+    await adapter.start()
+    await adapter.stop()
+
+    assert len(chromium.launched) == 1
+    assert len(chromium.launched[0].contexts) == 1
+    assert not chromium.launched[0].closed
+
+
+def _use_loop_pool(pools: list) -> None:
+    async def _lease():
+        pool = browser_pool.get_browser_pool()
+        chromium = _FakeChromium()
+        pool._playwright = SimpleNamespace(chromium=chromium, stop=AsyncMock())
+        async with pool.page("cas"):
+            pass
+        pools.append((pool, chromium))
+
+    asyncio.run(_lease())
+
+
+def test_each_asyncio_run_gets_a_pool_closed_with_its_loop():
+    pools = []
+
+    _use_loop_pool(pools)
+    _use_loop_pool(pools)
+
+    (first, first_chromium), (second, second_chromium) = pools
+    assert first is not second
+    assert all(
+        browser.closed for browser in first_chromium.launched + second_chromium.launched
+    )
+    assert browser_pool._browser_pools == {}
+
+
+@pytest.mark.asyncio
+async def test_close_browser_pool_closes_the_running_loops_pool():
+    pool = browser_pool.get_browser_pool()
+    assert browser_pool.get_browser_pool() is pool
+    chromium = _FakeChromium()
+    pool._playwright = SimpleNamespace(chromium=chromium, stop=AsyncMock())
+    async with pool.page("scjn"):
+        pass
+
+    await browser_pool.close_browser_pool()
+
+    assert chromium.launched and all(browser.closed for browser in chromium.launched)
+    assert browser_pool.get_browser_pool() is not pool
+    await browser_pool.close_browser_pool()
@@ -13,9 +13,18 @@ The adapter should:
 """
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
+import base64
+import functools
 import hashlib
+import threading
 
-from src.infrastructure.adapters.supabase_storage import SupabaseStorageAdapter
+import httpx
+
+from src.infrastructure.adapters import supabase_storage
+from src.infrastructure.adapters.supabase_storage import (
+    ResumableUploadError,
+    SupabaseStorageAdapter,
+)
 
 
 @pytest.fixture
@@ -166,6 +175,193 @@ class TestSupabaseStorageAdapterUpload:
         parts = path.split("/")
         assert len(parts) >= 3  # At least: source/hash/filename
 
+    @pytest.mark.asyncio
+    async def test_upload_streams_local_file_path(
+        self, mock_supabase_client, sample_pdf_content, tmp_path
+    ):
+        """A Path is passed to the bucket as an open file handle, not bytes."""
+        client, storage, bucket = mock_supabase_client
+        local_file = tmp_path / "doc-123.pdf"
+        local_file.write_bytes(sample_pdf_content)
+        uploaded = {}
+        bucket.upload.side_effect = lambda path, fh, options: uploaded.update(
+            body=fh.read(), closed=fh.closed
+        )
+
+        adapter = SupabaseStorageAdapter(client=client)
+        await adapter.upload(content=local_file, source_type="scjn", doc_id="doc-123")
+
+        assert uploaded == {"body": sample_pdf_content, "closed": False}
+
+
+    @pytest.mark.asyncio
+    async def test_upload_runs_off_the_event_loop_thread(
+        self, mock_supabase_client, sample_pdf_content
+    ):
+        """The blocking storage3 call runs in a worker thread."""
+        client, storage, bucket = mock_supabase_client
+        threads = []
+        bucket.upload.side_effect = lambda *args: threads.append(threading.get_ident())
+
+        adapter = SupabaseStorageAdapter(client=client)
+        await adapter.upload(content=sample_pdf_content, source_type="scjn", doc_id="doc-123")
+
+        assert threads and threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_large_local_file_uses_resumable_upload(
+        self, mock_supabase_client, sample_pdf_content, tmp_path
+    ):
+        """Local files over the threshold go through the resumable endpoint."""
+        client, storage, bucket = mock_supabase_client
+        client.supabase_url = "https://project.supabase.co"
+        client.supabase_key = "service-key"
+        local_file = tmp_path / "book.pdf"
+        local_file.write_bytes(sample_pdf_content * 200_000)
+
+        adapter = SupabaseStorageAdapter(client=client, resumable_threshold_bytes=1024)
+        adapter._upload_resumable = AsyncMock()
+        path = await adapter.upload(content=local_file, source_type="bjv", doc_id="book")
+
+        adapter._upload_resumable.assert_awaited_once_with(
+            path, local_file, local_file.stat().st_size, "application/pdf"
+        )
+        bucket.upload.assert_not_called()
+
+
+class _FakeTusServer:
+    """In-memory TUS endpoint; ``broken_patches`` maps PATCH numbers to failures."""
+
+    def __init__(self, broken_patches=None, create_status=201):
+        self.broken_patches = broken_patches or {}
+        self.create_status = create_status
+        self.received = bytearray()
+        self.requests = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method == "POST":
+            if self.create_status != 201:
+                return httpx.Response(self.create_status, text="denied")
+            return httpx.Response(
+                201, headers={"location": "/storage/v1/upload/resumable/upload-1"}
+            )
+        if request.method == "HEAD":
+            return httpx.Response(200, headers={"upload-offset": str(len(self.received))})
+        patch_number = sum(1 for seen in self.requests if seen.method == "PATCH")
+        failure = self.broken_patches.get(patch_number)
+        if failure == "reset":
+            # Half the part lands before the connection drops.
+            self.received.extend(request.content[: len(request.content) // 2])
+            raise httpx.ReadError("connection reset", request=request)
+        if failure == "error":
+            return httpx.Response(500, text="storage unavailable")
+        if int(request.headers["upload-offset"]) != len(self.received):
+            return httpx.Response(409, text="offset mismatch")
+        self.received.extend(request.content)
+        return httpx.Response(204, headers={"upload-offset": str(len(self.received))})
+
+    def calls(self, method):
+        return [request for request in self.requests if request.method == method]
+
+
+class TestSupabaseStorageAdapterResumableUpload:
+    """Tests for the TUS upload path, against an httpx mock transport."""
+
+    CONTENT = b"0123456789"
+
+    @pytest.fixture
+    def tus_server(self, monkeypatch):
+        def _install(**kwargs):
+            server = _FakeTusServer(**kwargs)
+            monkeypatch.setattr(
+                httpx,
+                "AsyncClient",
+                functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(server.handle)),
+            )
+            return server
+
+        monkeypatch.setattr(supabase_storage, "RESUMABLE_CHUNK_BYTES", 4)
+        return _install
+
+    @pytest.fixture
+    def upload_file(self, mock_supabase_client, tmp_path):
+        client, storage, bucket = mock_supabase_client
+        client.supabase_url = "https://project.supabase.co"
+        client.supabase_key = "service-key"
+        local_file = tmp_path / "book.pdf"
+        local_file.write_bytes(self.CONTENT)
+        adapter = SupabaseStorageAdapter(client=client, resumable_threshold_bytes=1)
+
+        async def _upload():
+            return await adapter.upload(content=local_file, source_type="bjv", doc_id="book")
+
+        return _upload
+
+    @pytest.mark.asyncio
+    async def test_creates_upload_then_patches_each_part(self, tus_server, upload_file):
+        server = tus_server()
+
+        path = await upload_file()
+
+        assert bytes(server.received) == self.CONTENT
+        [created] = server.calls("POST")
+        assert str(created.url) == "https://project.supabase.co/storage/v1/upload/resumable"
+        assert created.headers["tus-resumable"] == "1.0.0"
+        assert created.headers["authorization"] == "Bearer service-key"
+        assert created.headers["upload-length"] == str(len(self.CONTENT))
+        assert created.headers["x-upsert"] == "false"
+        metadata = {
+            name: base64.b64decode(value).decode()
+            for name, value in (
+                item.split(" ") for item in created.headers["upload-metadata"].split(",")
+            )
+        }
+        assert metadata["bucketName"] == "legal-scraper-pdfs"
+        assert metadata["objectName"] == path
+        assert metadata["contentType"] == "application/pdf"
+        patches = server.calls("PATCH")
+        assert [request.headers["upload-offset"] for request in patches] == ["0", "4", "8"]
+        assert all(
+            str(request.url).endswith("/storage/v1/upload/resumable/upload-1")
+            and request.headers["content-type"] == "application/offset+octet-stream"
+            for request in patches
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_part_resumes_from_server_offset(self, tus_server, upload_file):
+        server = tus_server(broken_patches={2: "reset"})
+
+        await upload_file()
+
+        assert bytes(server.received) == self.CONTENT
+        assert [request.method for request in server.requests] == [
+            "POST", "PATCH", "PATCH", "HEAD", "PATCH",
+        ]
+        assert [request.headers["upload-offset"] for request in server.calls("PATCH")] == [
+            "0", "4", "6",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, tus_server, upload_file):
+        retries = supabase_storage.RESUMABLE_MAX_RETRIES
+        server = tus_server(broken_patches={n: "error" for n in range(1, retries + 2)})
+
+        with pytest.raises(ResumableUploadError):
+            await upload_file()
+
+        assert len(server.calls("PATCH")) == retries + 1
+        assert len(server.calls("HEAD")) == retries
+
+    @pytest.mark.asyncio
+    async def test_rejected_creation_raises_without_patching(self, tus_server, upload_file):
+        server = tus_server(create_status=403)
+
+        with pytest.raises(ResumableUploadError):
+            await upload_file()
+
+        assert server.calls("PATCH") == []
+
 
 class TestSupabaseStorageAdapterDownload:
     """Tests for file download operations."""
@@ -246,24 +442,39 @@ class TestSupabaseStorageAdapterExists:
     async def test_exists_returns_true_when_file_present(self, mock_supabase_client):
         """exists() returns True when file exists in bucket."""
         client, storage, bucket = mock_supabase_client
-        bucket.list.return_value = [{"name": "doc-123.pdf"}]
+        bucket.exists.return_value = True
 
         adapter = SupabaseStorageAdapter(client=client)
         exists = await adapter.exists("public/scjn/ab/doc-123.pdf")
 
         assert exists is True
+        bucket.exists.assert_called_once_with("public/scjn/ab/doc-123.pdf")
+        bucket.list.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_exists_returns_false_when_file_missing(self, mock_supabase_client):
         """exists() returns False when file not in bucket."""
         client, storage, bucket = mock_supabase_client
-        bucket.list.return_value = []
+        bucket.exists.return_value = False
 
         adapter = SupabaseStorageAdapter(client=client)
         exists = await adapter.exists("public/scjn/ab/nonexistent.pdf")
 
         assert exists is False
 
+    @pytest.mark.asyncio
+    async def test_exists_falls_back_to_directory_search(self, mock_supabase_client):
+        """Older storage3 buckets without exists() search the prefix directory."""
+        client, storage, bucket = mock_supabase_client
+        del bucket.exists
+        bucket.list.return_value = [{"name": "doc-123.pdf"}]
+
+        adapter = SupabaseStorageAdapter(client=client)
+        exists = await adapter.exists("public/scjn/ab/doc-123.pdf")
+
+        assert exists is True
+        bucket.list.assert_called_once_with("public/scjn/ab", {"search": "doc-123.pdf"})
+
 
 class TestSupabaseStorageAdapterDelete:
     """Tests for file deletion."""
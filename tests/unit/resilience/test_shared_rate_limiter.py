@@ -0,0 +1,202 @@
+"""
+Tests for the shared per-domain rate limiter.
+"""
+import time
+from email.utils import formatdate
+
+import pytest
+
+from src.infrastructure.actors.bjv_rate_limiter import BJVRateLimiter, RateLimiterConfig
+from src.infrastructure.actors.rate_limiter import RateLimiter
+from src.infrastructure.resilience import shared_rate_limiter
+from src.infrastructure.resilience.shared_rate_limiter import (
+    DomainState,
+    MemoryBackend,
+    RateBudget,
+    SharedRateLimiter,
+    SQLiteBackend,
+    budgets_from_env,
+    domain_key,
+    gcra_reserve,
+    get_shared_rate_limiter,
+    parse_retry_after,
+)
+
+
+class TestGCRA:
+    """Tests for the reservation arithmetic shared by all backends."""
+
+    def test_burst_then_one_per_interval(self):
+        state = DomainState()
+        waits = []
+        for _ in range(5):
+            state, wait = gcra_reserve(state, now=100.0, interval=1.0, burst=3)
+            waits.append(wait)
+
+        assert waits == [0.0, 0.0, 0.0, 1.0, 2.0]
+
+    def test_idle_time_refills_up_to_burst_only(self):
+        state = DomainState()
+        for _ in range(3):
+            state, _ = gcra_reserve(state, now=100.0, interval=1.0, burst=2)
+
+        waits = []
+        for _ in range(3):
+            state, wait = gcra_reserve(state, now=1000.0, interval=1.0, burst=2)
+            waits.append(wait)
+
+        assert waits == [0.0, 0.0, 1.0]
+
+    def test_pause_and_slowdown_stretch_the_schedule(self):
+        state = DomainState(blocked_until=110.0, slowdown=2.0)
+
+        state, first = gcra_reserve(state, now=100.0, interval=1.0, burst=1)
+        state, second = gcra_reserve(state, now=100.0, interval=1.0, burst=1)
+
+        assert first == 10.0
+        assert second == 12.0
+
+
+class TestSharedRateLimiter:
+    """Tests for SharedRateLimiter over the memory backend."""
+
+    @pytest.mark.asyncio
+    async def test_limiters_for_one_domain_share_the_budget(self):
+        shared = SharedRateLimiter()
+        scraper = RateLimiter(requests_per_second=10.0, domain="https://legislacion.scjn.gob.mx/a", shared=shared)
+        discovery = RateLimiter(requests_per_second=10.0, domain="legislacion.scjn.gob.mx", shared=shared)
+
+        start = time.monotonic()
+        await scraper.acquire()
+        await discovery.acquire()
+        await scraper.acquire()
+        elapsed = time.monotonic() - start
+
+        assert elapsed >= 0.18
+        assert shared.stats_dict()["legislacion.scjn.gob.mx"]["acquired"] == 3
+
+    @pytest.mark.asyncio
+    async def test_bjv_limiter_draws_from_shared_budget_with_burst(self):
+        shared = SharedRateLimiter()
+        config = RateLimiterConfig(requests_per_second=10.0, burst_size=2, domain="biblio.juridicas.unam.mx")
+        limiter = BJVRateLimiter(config=config, shared=shared)
+
+        waited = [await shared.acquire("biblio.juridicas.unam.mx", RateBudget(10.0, 2))]
+        start = time.monotonic()
+        await limiter.acquire()
+        await limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        assert waited == [0.0]
+        assert elapsed >= 0.08
+
+    @pytest.mark.asyncio
+    async def test_429_pauses_domain_and_success_recovers(self):
+        shared = SharedRateLimiter(max_slowdown=4.0)
+
+        await shared.report("https://dof.gob.mx/index.php", 429, "1")
+        await shared.report("https://dof.gob.mx/index.php", 429, "0")
+        start = time.monotonic()
+        await shared.acquire("dof.gob.mx", RateBudget(1000.0))
+        elapsed = time.monotonic() - start
+
+        assert elapsed >= 0.9
+        stats = shared.stats_dict()["dof.gob.mx"]
+        assert stats["throttled"] == 2
+        assert stats["slowdown"] == 4.0
+
+        await shared.report("dof.gob.mx", 200)
+        await shared.acquire("dof.gob.mx", RateBudget(1000.0))
+        assert shared.stats_dict()["dof.gob.mx"]["slowdown"] == pytest.approx(3.2)
+
+    @pytest.mark.asyncio
+    async def test_503_without_retry_after_is_not_treated_as_throttling(self):
+        shared = SharedRateLimiter()
+
+        await shared.report("dof.gob.mx", 503)
+        waited = await shared.acquire("dof.gob.mx", RateBudget(0.0))
+
+        assert waited == 0.0
+        assert shared.stats_dict()["dof.gob.mx"]["throttled"] == 0
+
+    @pytest.mark.asyncio
+    async def test_configured_budget_overrides_caller_default(self):
+        shared = SharedRateLimiter(budgets={"dof.gob.mx": RateBudget(5.0, burst=1)})
+
+        await shared.acquire("https://www.dof.gob.mx/x", RateBudget(1000.0))
+        waited = await shared.acquire("dof.gob.mx", RateBudget(1000.0))
+
+        assert waited == pytest.approx(0.2, abs=0.05)
+
+
+class TestSQLiteBackend:
+    """Tests for the host-wide SQLite backend."""
+
+    @pytest.mark.asyncio
+    async def test_connections_to_one_file_share_domain_state(self, tmp_path):
+        path = tmp_path / "limits.sqlite3"
+        first = SQLiteBackend(path)
+        second = SQLiteBackend(path)
+        now = time.time()
+
+        waits = [
+            await first.reserve("dof.gob.mx", now, 1.0, 1),
+            await second.reserve("dof.gob.mx", now, 1.0, 1),
+            await first.reserve("scjn.gob.mx", now, 1.0, 1),
+        ]
+
+        assert [wait for wait, _slowdown in waits] == [0.0, 1.0, 0.0]
+
+        await second.penalize("dof.gob.mx", now + 30, max_slowdown=8.0)
+        wait, slowdown = await first.reserve("dof.gob.mx", now, 1.0, 1)
+        assert wait == pytest.approx(30.0)
+        assert slowdown == 2.0
+
+        await first.reset("dof.gob.mx")
+        assert (await second.reserve("dof.gob.mx", now, 1.0, 1))[0] == 0.0
+        first.close()
+        second.close()
+
+
+class TestHelpers:
+    """Tests for parsing helpers and environment configuration."""
+
+    def test_domain_key_normalizes_urls_and_hosts(self):
+        assert domain_key("https://WWW.DOF.gob.mx/nota.php?x=1") == "dof.gob.mx"
+        assert domain_key("legislacion.scjn.gob.mx/Buscador") == "legislacion.scjn.gob.mx"
+
+    def test_parse_retry_after_seconds_and_http_date(self):
+        now = time.time()
+
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after(formatdate(now + 60, usegmt=True), now=now) == pytest.approx(60, abs=1)
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_budgets_from_env(self, monkeypatch):
+        monkeypatch.setenv("SCRAPER_RATE_LIMIT_DOF_GOB_MX", "2:4")
+        monkeypatch.setenv("SCRAPER_RATE_LIMIT_BACKEND", "sqlite")
+        monkeypatch.setenv("SCRAPER_RATE_LIMIT_BAD_EXAMPLE", "fast")
+
+        budgets = budgets_from_env()
+
+        assert budgets["DOF_GOB_MX"] == RateBudget(2.0, burst=4)
+        assert "BACKEND" not in budgets
+        assert "BAD_EXAMPLE" not in budgets
+
+    def test_get_shared_rate_limiter_uses_sqlite_from_env(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(shared_rate_limiter, "_shared_limiter", None)
+        monkeypatch.setenv("SCRAPER_RATE_LIMIT_BACKEND", "sqlite")
+        monkeypatch.setenv("SCRAPER_RATE_LIMIT_PATH", str(tmp_path / "limits.sqlite3"))
+
+        limiter = get_shared_rate_limiter()
+
+        assert isinstance(limiter.backend, SQLiteBackend)
+        assert get_shared_rate_limiter() is limiter
+
+    def test_get_shared_rate_limiter_falls_back_to_memory(self, monkeypatch):
+        monkeypatch.setattr(shared_rate_limiter, "_shared_limiter", None)
+        monkeypatch.setattr(shared_rate_limiter, "redis_asyncio", None)
+        monkeypatch.setenv("SCRAPER_RATE_LIMIT_BACKEND", "redis")
+
+        assert isinstance(get_shared_rate_limiter().backend, MemoryBackend)
@@ -0,0 +1,117 @@
+"""
+Tests for the pooled AsyncFetcher and its on-disk response cache.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from src.infrastructure.async_fetcher import AsyncFetcher
+from src.infrastructure.http_response_cache import CachedResponse, ResponseCache
+from src.infrastructure.resilience.shared_rate_limiter import SharedRateLimiter
+
+URL = "https://legislacion.scjn.gob.mx/Buscador/Paginas/Buscar.aspx"
+
+
+def _fetcher(handler, **kwargs) -> AsyncFetcher:
+    kwargs.setdefault("cache", None)
+    return AsyncFetcher(
+        rate_limit_delay=0,
+        rate_limiter=SharedRateLimiter(),
+        transport=httpx.MockTransport(handler),
+        http2=False,
+        **kwargs,
+    )
+
+
+class TestResponseCache:
+    def test_store_and_load_round_trip(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        entry = CachedResponse(url=URL, text="<html>catalogo</html>", etag='"v1"')
+
+        cache.store(entry)
+
+        assert cache.load(URL) == entry
+        assert cache.load(URL + "?pagina=2") is None
+        assert entry.conditional_headers() == {"If-None-Match": '"v1"'}
+
+    def test_store_replaces_entry_without_leaving_temp_files(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+
+        cache.store(CachedResponse(url=URL, text="v1", etag='"v1"'))
+        cache.store(CachedResponse(url=URL, text="v2", etag='"v2"'))
+
+        assert cache.load(URL).text == "v2"
+        assert [path.suffix for path in tmp_path.rglob("*") if path.is_file()] == [".json"]
+
+    def test_from_env_requires_cache_dir(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("SCRAPER_FETCH_CACHE_DIR", raising=False)
+        assert ResponseCache.from_env() is None
+
+        monkeypatch.setenv("SCRAPER_FETCH_CACHE_DIR", str(tmp_path))
+        assert ResponseCache.from_env().cache_dir == tmp_path
+
+
+class TestAsyncFetcher:
+    @pytest.mark.asyncio
+    async def test_reuses_one_pooled_client(self):
+        fetcher = _fetcher(lambda request: httpx.Response(200, text="ok"))
+
+        await fetcher.fetch(URL)
+        client = fetcher._client
+        await fetcher.fetch(URL + "?pagina=2")
+
+        assert fetcher._client is client
+        assert fetcher.stats.requests == 2
+        await fetcher.aclose()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_revalidates_cached_page_and_counts_hits(self, tmp_path):
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text="<html>v1</html>", headers={"ETag": '"v1"'})
+
+        async with _fetcher(handler, cache=ResponseCache(tmp_path)) as fetcher:
+            first = await fetcher.fetch(URL)
+            second = await fetcher.fetch(URL)
+            text, status = await fetcher.fetch_with_status(URL)
+
+        assert first == second == text == "<html>v1</html>"
+        assert status == 200
+        assert seen == [None, '"v1"', '"v1"']
+        stats = fetcher.stats.to_dict()
+        assert stats["cache_hits"] == 2
+        assert stats["cache_misses"] == 1
+        assert stats["cache_stores"] == 1
+        assert stats["cache_hit_ratio"] == pytest.approx(0.667)
+
+    @pytest.mark.asyncio
+    async def test_pages_without_validators_are_not_stored(self, tmp_path):
+        async with _fetcher(lambda request: httpx.Response(200, text="x"), cache=ResponseCache(tmp_path)) as fetcher:
+            await fetcher.fetch(URL)
+
+        assert fetcher.stats.cache_misses == 1
+        assert fetcher.stats.cache_stores == 0
+        assert ResponseCache(tmp_path).load(URL) is None
+
+    @pytest.mark.asyncio
+    async def test_caps_open_requests_per_domain(self):
+        open_requests = {"now": 0, "peak": 0}
+
+        async def handler(request):
+            open_requests["now"] += 1
+            open_requests["peak"] = max(open_requests["peak"], open_requests["now"])
+            await asyncio.sleep(0.02)
+            open_requests["now"] -= 1
+            return httpx.Response(200, text="ok")
+
+        async with _fetcher(handler, max_connections_per_domain=2) as fetcher:
+            await asyncio.gather(*(fetcher.fetch(f"{URL}?pagina={page}") for page in range(6)))
+
+        assert open_requests["peak"] == 2
+        assert fetcher.stats.requests == 6
@@ -0,0 +1,218 @@
+"""
+Tests for the Crawlab spiders' Legal Scraper API client (event stream and
+job completion).
+"""
+import json
+from urllib.parse import urlparse
+
+import pytest
+import requests
+
+from crawlab_spiders.common.api_client import LegalScraperAPIClient, LegalScraperAPIError
+
+
+def _sse(*events) -> list[str]:
+    lines = []
+    for event in events:
+        if event.get("kind") != "snapshot":
+            lines.append(f"id: {event['seq']}")
+        lines.extend([f"event: {event['kind']}", f"data: {json.dumps(event)}", ""])
+    return lines
+
+
+class _JsonResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._payload
+
+
+class _StreamResponse:
+    def __init__(self, lines, status_code=200):
+        self._lines = lines
+        self.status_code = status_code
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return None
+
+    def iter_lines(self, decode_unicode=False):
+        for line in self._lines:
+            if isinstance(line, Exception):
+                raise line
+            yield line
+
+
+class _FakeSession:
+    """``requests.Session`` stand-in serving status polls and SSE streams."""
+
+    def __init__(self, statuses, streams=()):
+        self.headers = {}
+        self._statuses = list(statuses)
+        self._streams = list(streams)
+        self.status_calls = 0
+        self.stream_headers = []
+
+    def request(self, method, url, json=None, params=None, timeout=None):
+        path = urlparse(url).path
+        if path.startswith("/api/embedding-status/"):
+            return _JsonResponse({"status": "completed"})
+        self.status_calls += 1
+        return _JsonResponse(self._statuses[min(self.status_calls, len(self._statuses)) - 1])
+
+    def get(self, url, headers=None, stream=False, timeout=None):
+        self.stream_headers.append(dict(headers or {}))
+        response = self._streams.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(
+        "crawlab_spiders.common.api_client.time.sleep", lambda seconds: sleeps.append(seconds)
+    )
+    return sleeps
+
+
+def _client(session) -> LegalScraperAPIClient:
+    client = LegalScraperAPIClient(base_url="http://api.test", auth_token="")
+    client._session = session
+    return client
+
+
+def test_wait_ignores_final_state_of_previous_job():
+    previous = {"status": "completed", "job_id": "old", "progress": {"downloaded": 9}}
+    finished = {"status": "completed", "job_id": "new", "progress": {"downloaded": 2}}
+    session = _FakeSession(
+        statuses=[previous, finished],
+        streams=[
+            _StreamResponse(
+                _sse(
+                    {"seq": 4, "source": "dof", "kind": "snapshot", "data": {"status": previous}},
+                    {"seq": 5, "source": "dof", "kind": "status", "data": {"status": "running", "job_id": "new"}},
+                    {"seq": 6, "source": "dof", "kind": "status", "data": finished},
+                )
+            )
+        ],
+    )
+
+    result = _client(session).wait_for_completion("dof", "new", poll_interval=1, max_attempts=5)
+
+    assert result.status == "completed"
+    assert result.downloaded_count == 2
+    assert session.status_calls == 2
+
+
+def test_stream_events_resumes_from_last_seq_after_a_drop(no_sleep):
+    session = _FakeSession(
+        statuses=[],
+        streams=[
+            _StreamResponse(
+                _sse(
+                    {"seq": 7, "source": "dof", "kind": "snapshot", "data": {}},
+                    {"seq": 8, "source": "dof", "kind": "log", "data": {"message": "a"}},
+                )
+                + [requests.exceptions.ConnectionError("reset")]
+            ),
+            _StreamResponse(
+                _sse({"seq": 9, "source": "dof", "kind": "log", "data": {"message": "b"}})
+            ),
+        ],
+    )
+    stream = _client(session).stream_events("dof")
+
+    events = [next(stream) for _ in range(3)]
+
+    assert [event["seq"] for event in events] == [7, 8, 9]
+    assert "Last-Event-ID" not in session.stream_headers[0]
+    assert session.stream_headers[1]["Last-Event-ID"] == "8"
+    assert no_sleep == [1]
+
+
+def test_stream_events_snapshot_does_not_move_the_cursor():
+    session = _FakeSession(
+        statuses=[],
+        streams=[
+            _StreamResponse(_sse({"seq": 30, "source": "dof", "kind": "snapshot", "data": {}})),
+            _StreamResponse(_sse({"seq": 31, "source": "dof", "kind": "log", "data": {}})),
+        ],
+    )
+    stream = _client(session).stream_events("dof", since=12)
+
+    assert [next(stream)["seq"], next(stream)["seq"]] == [30, 31]
+    assert [headers["Last-Event-ID"] for headers in session.stream_headers] == ["12", "12"]
+
+
+def test_stream_events_raises_when_the_endpoint_is_missing():
+    session = _FakeSession(statuses=[], streams=[_StreamResponse([], status_code=404)])
+
+    with pytest.raises(LegalScraperAPIError) as excinfo:
+        next(_client(session).stream_events("dof"))
+
+    assert excinfo.value.status_code == 404
+
+
+def test_wait_returns_on_terminal_stream_event():
+    running = {"status": "running", "job_id": "job-1"}
+    failed = {"status": "failed", "job_id": "job-1", "progress": {"errors": 4}}
+    session = _FakeSession(
+        statuses=[running, failed],
+        streams=[
+            _StreamResponse(
+                _sse(
+                    {"seq": 2, "source": "dof", "kind": "snapshot", "data": {"status": running}},
+                    {"seq": 3, "source": "dof", "kind": "progress", "data": {"errors": 4}},
+                    {"seq": 4, "source": "dof", "kind": "status", "data": {"status": "failed"}},
+                )
+            )
+        ],
+    )
+
+    result = _client(session).wait_for_completion("dof", "job-1", poll_interval=1, max_attempts=5)
+
+    assert result.status == "failed"
+    assert result.error_count == 4
+    assert result.embedding_status == "completed"
+
+
+def test_wait_falls_back_to_polling_without_event_stream(no_sleep):
+    session = _FakeSession(
+        statuses=[
+            {"status": "running", "job_id": "job-1"},
+            {"status": "running", "job_id": "job-1"},
+            {"status": "completed", "job_id": "job-1", "progress": {"downloaded": 5}},
+        ],
+        streams=[_StreamResponse([], status_code=404)],
+    )
+
+    result = _client(session).wait_for_completion("dof", "job-1", poll_interval=2, max_attempts=5)
+
+    assert result.status == "completed"
+    assert result.downloaded_count == 5
+    assert session.status_calls == 3
+    assert no_sleep == [2]
+
+
+def test_polling_fallback_times_out(monkeypatch, no_sleep):
+    clock = iter(range(0, 1000, 5))
+    monkeypatch.setattr(
+        "crawlab_spiders.common.api_client.time.monotonic", lambda: next(clock)
+    )
+    session = _FakeSession(
+        statuses=[{"status": "running", "job_id": "job-1"}],
+        streams=[_StreamResponse([], status_code=404)],
+    )
+
+    with pytest.raises(TimeoutError):
+        _client(session).wait_for_completion("dof", "job-1", poll_interval=1, max_attempts=20)
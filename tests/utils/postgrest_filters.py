@@ -0,0 +1,101 @@
+"""
+Test utilities for evaluating PostgREST filters in fake Supabase clients.
+
+Covers the subset used by the scraper scans: ``or``/``and`` groups of
+``column.op.value`` terms (eq, neq, lt, lte, gt, gte, is, not.is) and
+multi-column ``order`` with Postgres null placement.
+"""
+from typing import Any, Iterable, List, Tuple
+
+
+def _split_terms(expression: str) -> List[str]:
+    terms, depth, quoted, current = [], 0, False, []
+    escaped = False
+    for char in expression:
+        if escaped:
+            current.append(char)
+            escaped = False
+            continue
+        if char == "\\":
+            current.append(char)
+            escaped = True
+            continue
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char == "(":
+            depth += 1
+        elif not quoted and char == ")":
+            depth -= 1
+        elif not quoted and depth == 0 and char == ",":
+            terms.append("".join(current))
+            current = []
+            continue
+        current.append(char)
+    if current:
+        terms.append("".join(current))
+    return [term.strip() for term in terms if term.strip()]
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        value = value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+    return value
+
+
+def _coerce(row_value: Any, raw_value: str) -> Any:
+    if isinstance(row_value, bool):
+        return raw_value.lower() == "true"
+    if isinstance(row_value, int):
+        return int(raw_value)
+    if isinstance(row_value, float):
+        return float(raw_value)
+    return raw_value
+
+
+def _compare(row_value: Any, op: str, raw_value: str) -> bool:
+    if op == "is":
+        if raw_value == "null":
+            return row_value is None
+        return row_value is (raw_value == "true")
+    if row_value is None:
+        return False
+    value = _coerce(row_value, raw_value)
+    row_value = row_value if not isinstance(value, str) else str(row_value)
+    return {
+        "eq": row_value == value,
+        "neq": row_value != value,
+        "lt": row_value < value,
+        "lte": row_value <= value,
+        "gt": row_value > value,
+        "gte": row_value >= value,
+    }[op]
+
+
+def _matches_term(row: dict, term: str) -> bool:
+    for group in ("and", "or"):
+        if term.startswith(f"{group}(") and term.endswith(")"):
+            results = (_matches_term(row, sub) for sub in _split_terms(term[len(group) + 1 : -1]))
+            return all(results) if group == "and" else any(results)
+    column, rest = term.split(".", 1)
+    negate = rest.startswith("not.")
+    if negate:
+        rest = rest[len("not.") :]
+    op, raw_value = rest.split(".", 1)
+    matched = _compare(row.get(column), op, _unquote(raw_value))
+    return not matched if negate else matched
+
+
+def matches_or_filter(row: dict, expression: str) -> bool:
+    """Evaluate ``query.or_(expression)`` against ``row``."""
+    return any(_matches_term(row, term) for term in _split_terms(expression))
+
+
+def sort_rows(rows: Iterable[dict], orders: List[Tuple[str, bool]]) -> List[dict]:
+    """Sort like ``.order(column, desc=...)`` calls applied in sequence."""
+    ordered = list(rows)
+    for column, descending in reversed(orders):
+        present = [row for row in ordered if row.get(column) is not None]
+        missing = [row for row in ordered if row.get(column) is None]
+        present.sort(key=lambda row: row[column], reverse=descending)
+        ordered = missing + present if descending else present + missing
+    return ordered